@@ -3,7 +3,7 @@
  * Connects to Flask backend at /api/*
  */
 
-import type { Account, Contact, AccountsResponse, AccountDetailResponse, PartnerRankingsResponse } from '../types';
+import type { Account, Contact, AccountsResponse, AccountDetailResponse, PartnerRankingsResponse, ResearchJob } from '../types';
 
 export const API_BASE = import.meta.env.VITE_API_URL || 'http://localhost:5001/api';
 
@@ -24,6 +24,68 @@ async function fetchJson<T>(endpoint: string, options?: RequestInit): Promise<T>
   return response.json();
 }
 
+export interface StreamEvent {
+  event: string;
+  data: Record<string, unknown>;
+}
+
+/**
+ * POST to an endpoint in Server-Sent Events mode and hand each event to onEvent.
+ * Resolves with the data of the final 'result' event; rejects on an 'error' event.
+ */
+export async function streamEvents<T>(
+  endpoint: string,
+  body: unknown,
+  onEvent: (event: StreamEvent) => void,
+): Promise<T> {
+  const response = await fetch(`${API_BASE}${endpoint}`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', Accept: 'text/event-stream' },
+    body: JSON.stringify(body ?? {}),
+  });
+
+  if (!response.ok || !response.body) {
+    const error = await response.json().catch(() => ({ message: 'Unknown error' }));
+    throw new Error(error.message || error.error || `HTTP ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary = buffer.indexOf('\n\n');
+    while (boundary !== -1) {
+      const frame = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+      boundary = buffer.indexOf('\n\n');
+
+      let event = 'message';
+      const dataLines: string[] = [];
+      for (const line of frame.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7);
+        else if (line.startsWith('data: ')) dataLines.push(line.slice(6));
+      }
+      if (dataLines.length === 0) continue; // keepalive comment
+
+      const data = JSON.parse(dataLines.join('\n'));
+      if (event === 'result') {
+        const statusCode = data.status_code as number;
+        if (statusCode >= 400) throw new Error(data.message || data.error || `HTTP ${statusCode}`);
+        return data as T;
+      }
+      if (event === 'error') throw new Error(data.message || 'Stream failed');
+      onEvent({ event, data });
+    }
+  }
+
+  throw new Error('Stream ended before a result was received');
+}
+
 export const api = {
   // Accounts
   async getAccounts(params?: {
@@ -91,21 +153,25 @@ export const api = {
   },
 
   // Run research pipeline for an account (POST)
+  // Starts a background research job; poll getResearchJob for progress
   async runResearch(accountId: string, options?: {
     phases?: string[];
     force?: boolean;
-  }): Promise<{
-    status: string;
-    account_id: string;
-    phases_completed: string[];
-    message: string;
-  }> {
+  }): Promise<ResearchJob> {
     return fetchJson(`/accounts/${accountId}/research`, {
       method: 'POST',
       body: JSON.stringify(options || {}),
     });
   },
 
+  async getResearchJob(jobId: string): Promise<ResearchJob> {
+    return fetchJson(`/research/jobs/${jobId}`);
+  },
+
+  async getResearchJobResult<T = unknown>(jobId: string): Promise<T> {
+    return fetchJson(`/research/jobs/${jobId}/result`);
+  },
+
   // Discover trigger events for an account (POST)
   async discoverEvents(accountId: string, options?: {
     event_types?: string[];
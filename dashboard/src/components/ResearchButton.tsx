@@ -1,6 +1,6 @@
 import { useState, useRef, useEffect } from 'react';
-import type { Account } from '../types';
-import { API_BASE } from '../api/client';
+import type { Account, ResearchJob, ResearchPhase } from '../types';
+import { api } from '../api/client';
 
 interface Props {
   account: Account;
@@ -9,6 +9,23 @@ interface Props {
 
 type ResearchStatus = 'idle' | 'loading' | 'success' | 'error';
 
+const POLL_INTERVAL_MS = 2000;
+
+const PHASE_LABELS: Record<ResearchPhase, string> = {
+  phase_1: 'Phase 1: Gathering account intelligence...',
+  phase_2: 'Phase 2: Discovering contacts...',
+  phase_3: 'Phase 3: Enriching data...',
+  phase_4: 'Phase 4: Analyzing engagement signals...',
+  phase_5: 'Phase 5: Identifying partnership opportunities...',
+  persistence: 'Syncing to Notion...'
+};
+
+function describeJob(job: ResearchJob): string {
+  if (job.status === 'queued') return 'Waiting for a research worker...';
+  if (!job.current_phase) return 'Initializing research pipeline...';
+  return PHASE_LABELS[job.current_phase] ?? job.current_phase;
+}
+
 interface ResearchResult {
   status: string;
   message: string;
@@ -44,78 +61,67 @@ export function ResearchButton({ account, onResearchComplete }: Props) {
   const [result, setResult] = useState<ResearchResult | null>(null);
   const [error, setError] = useState<string | null>(null);
   const [progress, setProgress] = useState<string>('');
+  const [percent, setPercent] = useState<number>(0);
 
-  // Ref to track interval for cleanup on unmount
-  const progressIntervalRef = useRef<ReturnType<typeof setInterval> | null>(null);
+  // Ref to track the job poll timer for cleanup on unmount
+  const pollTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+  const unmountedRef = useRef(false);
 
-  // Cleanup interval on unmount to prevent memory leaks
+  // Stop polling on unmount to prevent memory leaks and state updates
   useEffect(() => {
     return () => {
-      if (progressIntervalRef.current) {
-        clearInterval(progressIntervalRef.current);
-        progressIntervalRef.current = null;
+      unmountedRef.current = true;
+      if (pollTimeoutRef.current) {
+        clearTimeout(pollTimeoutRef.current);
+        pollTimeoutRef.current = null;
       }
     };
   }, []);
 
+  const waitForJob = (jobId: string) =>
+    new Promise<ResearchJob>((resolve, reject) => {
+      const poll = async () => {
+        if (unmountedRef.current) return;
+        try {
+          const job = await api.getResearchJob(jobId);
+          setProgress(describeJob(job));
+          setPercent(job.percent_complete);
+          if (job.status === 'queued' || job.status === 'running') {
+            pollTimeoutRef.current = setTimeout(poll, POLL_INTERVAL_MS);
+          } else {
+            resolve(job);
+          }
+        } catch (err) {
+          reject(err);
+        }
+      };
+      poll();
+    });
+
   const handleRunResearch = async () => {
     setStatus('loading');
     setError(null);
     setResult(null);
+    setPercent(0);
     setProgress('Initializing research pipeline...');
 
-    // Clear any existing interval before starting new one
-    if (progressIntervalRef.current) {
-      clearInterval(progressIntervalRef.current);
-    }
-
     try {
-      // Simulate progress updates
-      const progressSteps = [
-        'Phase 1: Gathering account intelligence...',
-        'Phase 2: Discovering contacts...',
-        'Phase 3: Enriching data...',
-        'Phase 4: Analyzing engagement signals...',
-        'Phase 5: Identifying partnership opportunities...',
-        'Syncing to Notion...'
-      ];
-
-      let stepIndex = 0;
-      progressIntervalRef.current = setInterval(() => {
-        if (stepIndex < progressSteps.length) {
-          setProgress(progressSteps[stepIndex]);
-          stepIndex++;
-        }
-      }, 2000);
-
-      const response = await fetch(`${API_BASE}/accounts/${account.id}/research`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ force: false })
-      });
-
-      // Clear interval after fetch completes
-      if (progressIntervalRef.current) {
-        clearInterval(progressIntervalRef.current);
-        progressIntervalRef.current = null;
-      }
-
-      const data = await response.json();
+      const job = await waitForJob((await api.runResearch(account.id, { force: false })).job_id);
+      if (unmountedRef.current) return;
 
-      if (!response.ok) {
-        throw new Error(data.message || 'Research failed');
+      if (job.status === 'failed') {
+        throw new Error(job.error?.message || 'Research failed');
       }
 
+      const data = await api.getResearchJobResult<ResearchResult>(job.job_id);
+      if (unmountedRef.current) return;
+
       setResult(data);
       setStatus('success');
       setProgress('');
       onResearchComplete?.();
     } catch (err) {
-      // Clear interval on error as well
-      if (progressIntervalRef.current) {
-        clearInterval(progressIntervalRef.current);
-        progressIntervalRef.current = null;
-      }
+      if (unmountedRef.current) return;
       setError(err instanceof Error ? err.message : 'Unknown error');
       setStatus('error');
       setProgress('');
@@ -211,7 +217,7 @@ export function ResearchButton({ account, onResearchComplete }: Props) {
               {progress}
             </p>
           </div>
-          <ProgressBar />
+          <ProgressBar percent={percent} />
         </div>
       )}
 
@@ -495,9 +501,17 @@ function LoadingSpinner() {
   );
 }
 
-function ProgressBar() {
+function ProgressBar({ percent }: { percent: number }) {
   return (
-    <div className="mt-3 h-1.5 progress-bar-animated" />
+    <div className="mt-3 h-1.5 progress-bar-animated">
+      <div
+        className="h-full rounded-full transition-all duration-500"
+        style={{
+          width: `${percent}%`,
+          backgroundColor: 'var(--color-accent-primary)'
+        }}
+      />
+    </div>
   );
 }
 
@@ -1,6 +1,7 @@
 import { useState, useRef, useEffect } from 'react';
 import type { Account } from '../types';
-import { API_BASE } from '../api/client';
+import { streamEvents } from '../api/client';
+import type { StreamEvent } from '../api/client';
 
 interface Props {
   account: Account;
@@ -20,6 +21,12 @@ interface DiscoveredVendor {
   is_new: boolean;
 }
 
+const PHASE_LABELS: Record<string, string> = {
+  search: 'Searching news and web for vendor mentions...',
+  extraction: 'Extracting vendor names with AI...',
+  classification: 'Categorizing discovered vendors...'
+};
+
 interface DiscoveryResult {
   status: string;
   account_name: string;
@@ -39,81 +46,53 @@ export function VendorDiscoveryButton({ account, onDiscoveryComplete }: Props) {
   const [result, setResult] = useState<DiscoveryResult | null>(null);
   const [error, setError] = useState<string | null>(null);
   const [progress, setProgress] = useState<string>('');
+  const [foundVendors, setFoundVendors] = useState<string[]>([]);
 
-  // Ref to track interval for cleanup on unmount
-  const progressIntervalRef = useRef<ReturnType<typeof setInterval> | null>(null);
+  // Ignore stream events that arrive after unmount
+  const unmountedRef = useRef(false);
 
-  // Cleanup interval on unmount to prevent memory leaks
   useEffect(() => {
     return () => {
-      if (progressIntervalRef.current) {
-        clearInterval(progressIntervalRef.current);
-        progressIntervalRef.current = null;
-      }
+      unmountedRef.current = true;
     };
   }, []);
 
+  const handleStreamEvent = ({ event, data }: StreamEvent) => {
+    if (unmountedRef.current) return;
+    const phase = String(data.phase ?? '');
+
+    if (event === 'phase_start') {
+      setProgress(PHASE_LABELS[phase] ?? `${phase}...`);
+    } else if (event === 'partial' && phase === 'search') {
+      setProgress(`Searching... ${data.results ?? 0} results for "${data.query}"`);
+    } else if (event === 'partial' && phase === 'classification') {
+      const vendor = data.vendor as { vendor_name: string } | undefined;
+      if (vendor) setFoundVendors(prev => [...prev, vendor.vendor_name]);
+    }
+  };
+
   const handleDiscoverVendors = async () => {
     setStatus('loading');
     setError(null);
     setResult(null);
+    setFoundVendors([]);
     setProgress('Searching for vendors...');
 
-    // Clear any existing interval before starting new one
-    if (progressIntervalRef.current) {
-      clearInterval(progressIntervalRef.current);
-    }
-
     try {
-      // Simulate progress updates
-      const progressSteps = [
-        'Searching news and web for vendor mentions...',
-        'Analyzing partnerships and collaborations...',
-        'Extracting vendor names with AI...',
-        'Categorizing discovered vendors...',
-        'Saving to Notion...'
-      ];
-
-      let stepIndex = 0;
-      progressIntervalRef.current = setInterval(() => {
-        if (stepIndex < progressSteps.length) {
-          setProgress(progressSteps[stepIndex]);
-          stepIndex++;
-        }
-      }, 3000);
-
-      const response = await fetch(`${API_BASE}/accounts/${account.id}/discover-unknown-vendors`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          save_to_notion: true,
-          min_confidence: 0.6
-        })
-      });
-
-      // Clear interval after fetch completes
-      if (progressIntervalRef.current) {
-        clearInterval(progressIntervalRef.current);
-        progressIntervalRef.current = null;
-      }
-
-      const data = await response.json();
-
-      if (!response.ok) {
-        throw new Error(data.message || 'Vendor discovery failed');
-      }
+      const data = await streamEvents<DiscoveryResult>(
+        `/accounts/${account.id}/discover-unknown-vendors`,
+        { save_to_notion: true, min_confidence: 0.6 },
+        handleStreamEvent
+      );
+      if (unmountedRef.current) return;
 
       setResult(data);
       setStatus('success');
       setProgress('');
       onDiscoveryComplete?.();
     } catch (err) {
-      // Clear interval on error as well
-      if (progressIntervalRef.current) {
-        clearInterval(progressIntervalRef.current);
-        progressIntervalRef.current = null;
-      }
-      setError(err instanceof Error ? err.message : 'Unknown error');
+      if (unmountedRef.current) return;
+      setError(err instanceof Error ? err.message : 'Vendor discovery failed');
       setStatus('error');
       setProgress('');
     }
@@ -204,6 +183,14 @@ export function VendorDiscoveryButton({ account, onDiscoveryComplete }: Props) {
               {progress}
             </p>
           </div>
+          {foundVendors.length > 0 && (
+            <p
+              className="text-xs mt-2"
+              style={{ color: 'var(--color-text-muted)' }}
+            >
+              Found so far: {foundVendors.join(', ')}
+            </p>
+          )}
           <ProgressBar />
         </div>
       )}
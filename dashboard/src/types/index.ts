@@ -175,6 +175,35 @@ export interface TriggerEvent {
   detected_date: string;
 }
 
+// ============================================================================
+// Research Job Types
+// ============================================================================
+
+export type ResearchJobStatus = 'queued' | 'running' | 'succeeded' | 'failed';
+export type ResearchPhase = 'phase_1' | 'phase_2' | 'phase_3' | 'phase_4' | 'phase_5' | 'persistence';
+
+export interface ResearchPhaseProgress {
+  status: 'pending' | 'running' | 'completed';
+  updated_at?: string;
+  [detail: string]: unknown;
+}
+
+export interface ResearchJob {
+  job_id: string;
+  status: ResearchJobStatus;
+  account_id: string;
+  company_name?: string;
+  current_phase: ResearchPhase | null;
+  phases: Record<ResearchPhase, ResearchPhaseProgress>;
+  percent_complete: number;
+  created_at: string;
+  started_at: string | null;
+  finished_at: string | null;
+  error: { message: string; type: string } | null;
+  status_url: string;
+  result_url: string;
+}
+
 // ============================================================================
 // UI State Types
 // ============================================================================
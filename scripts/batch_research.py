@@ -4,10 +4,16 @@ Batch Research Script - Run research pipeline on all accounts.
 
 This script:
 1. Fetches all accounts from Notion
-2. Runs the 5-phase research pipeline on each
+2. Runs the 5-phase research pipeline on several accounts at once,
+   highest account score first
 3. Updates Notion with enriched data (employee count, infrastructure, etc.)
 
-Uses the same API endpoint as the dashboard's "Deep Research" button.
+Uses the same API endpoint as the dashboard's "Deep Research" button, so the
+server's shared Apollo/Brave/OpenAI/Notion budgets apply; raise the server's
+ABM_RESEARCH_WORKERS to match --workers. With --local the pipeline runs in
+this process instead.
+
+Usage: python scripts/batch_research.py [--force] [--yes] [--workers N] [--local]
 """
 import os
 import time
@@ -15,6 +21,10 @@ import sys
 
 import requests
 
+# Import the package from the project root, as the server runs it (PYTHONPATH=.)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.abm_research.core.batch_research import BatchResearchEngine  # noqa: E402
+
 # Load env manually
 with open(".env") as f:
     for line in f:
@@ -24,6 +34,8 @@ with open(".env") as f:
             os.environ[key] = val
 
 API_BASE = "http://localhost:5001"
+JOB_POLL_SECONDS = 5
+JOB_TIMEOUT_SECONDS = 1800  # research runs server-side; this only bounds how long we poll
 
 
 def get_accounts():
@@ -35,42 +47,90 @@ def get_accounts():
     return response.json().get("accounts", [])
 
 
-def run_research(account_id: str, account_name: str, force: bool = False):
-    """Run research pipeline for a single account."""
+def wait_for_job(job: dict, timeout: float = JOB_TIMEOUT_SECONDS):
+    """Poll a research job until it finishes, printing phase changes."""
+    status_url = f"{API_BASE}{job['status_url']}"
+    deadline = time.monotonic() + timeout
+    last_phase = None
+
+    while time.monotonic() < deadline:
+        job = requests.get(status_url, timeout=30).json()
+        phase = job.get("current_phase")
+        if phase and phase != last_phase:
+            print(f"   ⏳ {phase} ({job.get('percent_complete', 0)}%)")
+            last_phase = phase
+        if job.get("status") not in ("queued", "running"):
+            return job
+        time.sleep(JOB_POLL_SECONDS)
+
+    raise requests.exceptions.Timeout(f"job {job.get('job_id')} still {job.get('status')}")
+
+
+def run_research(account_id: str, account_name: str, force: bool = False) -> dict:
+    """Run research pipeline for a single account; returns {"success", "error"?, ...}."""
     print(f"\n🔬 Researching: {account_name}")
-    print("-" * 50)
 
     try:
         response = requests.post(
             f"{API_BASE}/api/accounts/{account_id}/research",
             json={"force": force},
-            timeout=300,  # 5 minute timeout per account
+            timeout=30,
         )
+        if response.status_code != 202:
+            error = response.json().get("error", "Unknown error")
+            print(f"   ❌ {account_name}: failed to start: {error}")
+            return {"success": False, "error": error}
+
+        job = wait_for_job(response.json())
+        response = requests.get(f"{API_BASE}{job['result_url']}", timeout=30)
 
         if response.status_code == 200:
             data = response.json()
             summary = data.get("research_summary", {})
             account_data = data.get("account_data", {})
 
-            print(f"   ✅ Research completed")
-            print(f"   📊 Contacts: {summary.get('contacts_discovered', 0)}")
-            print(f"   📅 Events: {summary.get('trigger_events_found', 0)}")
-            print(f"   🤝 Partnerships: {summary.get('partnerships_identified', 0)}")
-            print(f"   👥 Employees: {account_data.get('employee_count', 'N/A')}")
-            print(f"   🏢 Industry: {account_data.get('industry', 'N/A')}")
-            print(f"   📈 ICP Score: {account_data.get('icp_fit_score', 'N/A')}")
-            return True
+            # One line per account: output from concurrent accounts interleaves
+            print(
+                f"   ✅ {account_name}: "
+                f"{summary.get('contacts_discovered', 0)} contacts, "
+                f"{summary.get('trigger_events_found', 0)} events, "
+                f"{summary.get('partnerships_identified', 0)} partnerships | "
+                f"employees {account_data.get('employee_count', 'N/A')}, "
+                f"industry {account_data.get('industry', 'N/A')}, "
+                f"ICP {account_data.get('icp_fit_score', 'N/A')}"
+            )
+            return {"success": True, "research_summary": summary}
         else:
-            error = response.json().get("error", "Unknown error")
-            print(f"   ❌ Failed: {error}")
-            return False
+            error = response.json().get("message") or "Unknown error"
+            print(f"   ❌ {account_name}: {error}")
+            return {"success": False, "error": error}
 
     except requests.exceptions.Timeout:
-        print(f"   ⏰ Timeout - research took too long")
-        return False
+        print(f"   ⏰ {account_name}: timeout - research took too long")
+        return {"success": False, "error": "timeout"}
     except Exception as e:
-        print(f"   ❌ Error: {str(e)}")
-        return False
+        print(f"   ❌ {account_name}: {str(e)}")
+        return {"success": False, "error": str(e)}
+
+
+def print_report(report: dict):
+    """Print the batch summary report."""
+    print("\n" + "=" * 60)
+    print(
+        f"COMPLETE: {report['succeeded']} succeeded, {report['failed']} failed "
+        f"in {report['duration_seconds']:.0f}s "
+        f"({report['accounts_per_minute']} accounts/min, {report['max_workers']} workers)"
+    )
+    for provider, usage in report["provider_usage"].items():
+        if usage["requests"]:
+            print(
+                f"   {provider:8} {usage['requests']:5} requests, "
+                f"{usage['wait_seconds']:.0f}s waiting on its {usage['rate']}/s budget"
+            )
+    for result in report["results"]:
+        if result["status"] != "succeeded":
+            print(f"   ❌ {result['name']}: {result['error']}")
+    print("=" * 60)
 
 
 def main():
@@ -109,6 +169,8 @@ def main():
     # Ask for confirmation
     force = "--force" in sys.argv
     auto_yes = "--yes" in sys.argv or "-y" in sys.argv
+    local = "--local" in sys.argv
+    workers = int(sys.argv[sys.argv.index("--workers") + 1]) if "--workers" in sys.argv else None
     if force:
         print("\n⚠️ Force mode enabled - will re-research ALL accounts")
     else:
@@ -122,33 +184,26 @@ def main():
     else:
         print("\n✓ Auto-confirmed via --yes flag")
 
-    # Run research
-    print("\n3. Running research pipeline...")
-    success = 0
-    failed = 0
-    skipped = 0
-
-    for acc in accounts:
-        # Skip accounts that already have employee data (unless force mode)
-        if not force and acc.get("employee_count", 0) > 0:
-            print(f"\n⏭️ Skipping {acc['name']} - already has data")
-            skipped += 1
-            continue
+    # Skip accounts that already have employee data (unless force mode)
+    to_research = [acc for acc in accounts if force or not acc.get("employee_count", 0) > 0]
+    skipped = len(accounts) - len(to_research)
+    if skipped:
+        print(f"\n⏭️ Skipping {skipped} accounts that already have data")
 
+    # Run research - several accounts at a time, highest account score first
+    print("\n3. Running research pipeline...")
+    if local:
+        engine = BatchResearchEngine(max_workers=workers)
+    else:
         # Use the synthetic ID format (acc_XXXXXXXX) that the API expects
-        account_id = acc.get("id", "")
-
-        if run_research(account_id, acc["name"], force=force):
-            success += 1
-        else:
-            failed += 1
-
-        # Rate limiting - wait between accounts
-        time.sleep(2)
+        engine = BatchResearchEngine(
+            lambda acc: run_research(acc.get("id", ""), acc["name"], force=force),
+            max_workers=workers,
+        )
+    report = engine.run(to_research)
 
-    print("\n" + "=" * 60)
-    print(f"COMPLETE: {success} succeeded, {failed} failed, {skipped} skipped")
-    print("=" * 60)
+    print_report(report)
+    print(f"   ⏭️ {skipped} skipped")
 
 
 if __name__ == "__main__":
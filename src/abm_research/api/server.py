@@ -8,17 +8,54 @@ for the React frontend.
 Run: python -m src.abm_research.api.server
 """
 
+import copy
 import json
 import logging
 import os
 import sys
+import threading
+import time
+import uuid
 from datetime import datetime
 from typing import Optional
 
 import requests
-from flask import Flask, jsonify, request
+from flask import Flask, Response, g, jsonify, request
 from flask_cors import CORS
 
+from ..core.batch_research import BatchResearchEngine
+from ..utils.brave_client import get_brave_client
+from ..utils.event_stream import (
+    HEARTBEAT_FRAME,
+    HEARTBEAT_SECONDS,
+    SSE_HEADERS,
+    EventStream,
+    format_sse,
+    progress_event,
+)
+from ..utils.instrumentation import process_instrumentation, span
+from ..utils.job_queue import (
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    JobQueue,
+    JobQueueFull,
+)
+from ..utils.llm_gateway import get_llm_gateway
+from ..utils.metrics import (
+    APOLLO_CREDITS,
+    CONTENT_TYPE,
+    HTTP_LATENCY_BUCKETS,
+    counter,
+    format_family,
+    histogram,
+    render_registered,
+    render_spans,
+)
+from ..utils.rate_limiter import all_rate_limiter_stats, provider_rate_limiter
+from ..utils.ttl_cache import TTLCache
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -42,40 +79,22 @@ if os.path.exists(env_file):
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-# Import Notion client and scorer directly (avoid package __init__ chain)
+# Import Notion client and scorer through the package, so their rate limiters and
+# spans register in the same abm_research modules as the rest of the server
 NOTION_AVAILABLE = False
 account_scorer = None
 
 try:
-    # Direct imports to avoid triggering full package initialization
-    import importlib.util
-
-    # Load notion_client directly
-    notion_spec = importlib.util.spec_from_file_location(
-        "notion_client",
-        os.path.join(project_root, "src/abm_research/integrations/notion_client.py"),
-    )
-    notion_module = importlib.util.module_from_spec(notion_spec)
-    notion_spec.loader.exec_module(notion_module)
-    NotionClient = notion_module.NotionClient
-    get_notion_client = notion_module.get_notion_client
-
-    # Import exception types for proper error handling
-    NotionError = notion_module.NotionError
-    NotionConfigError = notion_module.NotionConfigError
-    NotionAPIError = notion_module.NotionAPIError
-    NotionValidationError = notion_module.NotionValidationError
-    NotionParseError = notion_module.NotionParseError
-
-    # Load unified_lead_scorer directly
-    scorer_spec = importlib.util.spec_from_file_location(
-        "unified_lead_scorer",
-        os.path.join(project_root, "src/abm_research/core/unified_lead_scorer.py"),
+    from ..core.unified_lead_scorer import account_scorer, meddic_contact_scorer
+    from ..integrations.notion_client import (
+        NotionAPIError,
+        NotionConfigError,
+        NotionError,
+        NotionParseError,
+        NotionValidationError,
+        PageMirror,
+        get_notion_client,
     )
-    scorer_module = importlib.util.module_from_spec(scorer_spec)
-    scorer_spec.loader.exec_module(scorer_module)
-    account_scorer = scorer_module.account_scorer
-    meddic_contact_scorer = scorer_module.meddic_contact_scorer
 
     NOTION_AVAILABLE = True
     logger.info("✅ Notion client available - using real data")
@@ -105,20 +124,203 @@ CORS(app)  # Enable CORS for frontend
 
 
 # ============================================================================
-# Data Layer - Real Notion Integration
+# Request Metrics (exported on /metrics)
+# ============================================================================
+
+HTTP_REQUEST_DURATION = histogram(
+    "abm_http_request_duration_seconds",
+    "API request latency by route",
+    ("method", "route"),
+    HTTP_LATENCY_BUCKETS,
+)
+HTTP_REQUESTS = counter(
+    "abm_http_requests_total", "API requests by route and status", ("method", "route", "status")
+)
+
+
+@app.before_request
+def _start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def _record_request_metrics(response):
+    """Observe latency per route template (streamed bodies: time to first byte)"""
+    started = g.pop("request_started", None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - started, method=request.method, route=route
+        )
+        HTTP_REQUESTS.inc(method=request.method, route=route, status=str(response.status_code))
+    return response
+
+
+# ============================================================================
+# Read-Through Cache - Transformed Notion Collections
 # ============================================================================
 
+# TTLs in seconds; set to 0 to effectively disable caching for a collection
+CACHE_TTL_ACCOUNTS = float(os.environ.get("ABM_CACHE_TTL_ACCOUNTS", "300"))
+CACHE_TTL_CONTACTS = float(os.environ.get("ABM_CACHE_TTL_CONTACTS", "300"))
+CACHE_TTL_TRIGGER_EVENTS = float(os.environ.get("ABM_CACHE_TTL_TRIGGER_EVENTS", "600"))
+CACHE_TTL_PARTNERSHIPS = float(os.environ.get("ABM_CACHE_TTL_PARTNERSHIPS", "600"))
+
+# Shared by all handlers; only real Notion data is cached, never mock fallbacks
+notion_cache = TTLCache(default_ttl=CACHE_TTL_ACCOUNTS)
+
+ACCOUNTS_CACHE_KEY = "accounts"
+
+# Accounts and contact->account links are mirrored in memory and refreshed with
+# last_edited_time delta queries; a full scan every ABM_NOTION_FULL_SYNC_INTERVAL
+# seconds (or on ?refresh=true) drops pages deleted in Notion
+NOTION_FULL_SYNC_INTERVAL = float(os.environ.get("ABM_NOTION_FULL_SYNC_INTERVAL", "3600"))
+
 
-def get_notion_accounts(raise_on_error: bool = False) -> list[dict]:
+def _contact_account_id(page: dict) -> str:
+    """First Account relation of a contact page ('' if unlinked)"""
+    account_rel = page.get("properties", {}).get("Account", {}).get("relation", [])
+    return account_rel[0].get("id", "") if account_rel else ""
+
+
+if NOTION_AVAILABLE:
+    account_mirror = PageMirror(full_sync_interval=NOTION_FULL_SYNC_INTERVAL)
+    # Only the Account relation is needed to count contacts per account
+    contact_account_mirror = PageMirror(
+        full_sync_interval=NOTION_FULL_SYNC_INTERVAL,
+        transform=_contact_account_id,
+        filter_properties=["Account"],
+    )
+
+
+def _account_cache_keys(account_notion_id: str) -> list[str]:
+    """Cache keys holding data scoped to a single account"""
+    return [
+        f"contacts:{account_notion_id}",
+        f"trigger_events:{account_notion_id}",
+        f"partnerships:{account_notion_id}",
+    ]
+
+
+def invalidate_account_cache(
+    account_notion_id: Optional[str] = None,
+    accounts: bool = True,
+    contacts: bool = False,
+    trigger_events: bool = False,
+    partnerships: bool = False,
+) -> None:
     """
-    Fetch accounts from Notion and transform for API.
+    Drop cached collections affected by a write.
 
     Args:
-        raise_on_error: If True, raise exceptions instead of falling back to mock data.
-                       Use True for debugging and health checks.
+        account_notion_id: Account whose scoped entries should be dropped
+        accounts: Drop the account list (scores, contact counts, names)
+        contacts: Drop the account's contacts
+        trigger_events: Drop the account's events and the all-events list
+        partnerships: Drop the account's partnerships and the all-partnerships list
+    """
+    keys = []
+    if accounts:
+        keys.append(ACCOUNTS_CACHE_KEY)
+    if account_notion_id:
+        contacts_key, events_key, partnerships_key = _account_cache_keys(account_notion_id)
+        if contacts:
+            keys.append(contacts_key)
+        if trigger_events:
+            keys.append(events_key)
+        if partnerships:
+            keys.append(partnerships_key)
+    if trigger_events:
+        keys.append("trigger_events:*")
+    if partnerships:
+        keys.append("partnerships:*")
+
+    if keys:
+        removed = notion_cache.invalidate(*keys)
+        logger.debug(f"🧹 Invalidated {removed} cache entries: {keys}")
+
+
+# ============================================================================
+# Account Index - O(1) lookups by id, Notion UUID, domain, or name
+# ============================================================================
+
+
+def normalize_domain(domain: str) -> str:
+    """Normalize a domain/URL for matching ("https://www.Acme.com/" -> "acme.com")"""
+    domain = (domain or "").strip().lower()
+    for prefix in ("http://", "https://"):
+        if domain.startswith(prefix):
+            domain = domain[len(prefix) :]
+    domain = domain.split("/", 1)[0]
+    if domain.startswith("www."):
+        domain = domain[4:]
+    return domain
 
-    Returns:
-        List of account dictionaries
+
+class AccountIndex:
+    """
+    Immutable lookup table over a transformed account list.
+
+    Built once per account-collection refresh and cached together with the
+    list it indexes, so handlers never see an index that disagrees with the
+    accounts they were served.
+    """
+
+    def __init__(self, accounts: list[dict]):
+        self.accounts = accounts
+        self._by_id: dict[str, dict] = {}
+        self._by_domain: dict[str, dict] = {}
+        self._by_name: dict[str, dict] = {}
+
+        for account in accounts:
+            # First occurrence wins when two accounts share a key
+            if account.get("id"):
+                self._by_id.setdefault(account["id"], account)
+            notion_id = account.get("notion_id")
+            if notion_id:
+                self._by_id.setdefault(notion_id, account)
+                self._by_id.setdefault(notion_id.replace("-", ""), account)
+            domain = normalize_domain(account.get("domain", ""))
+            if domain:
+                self._by_domain.setdefault(domain, account)
+            name = (account.get("name") or "").strip().lower()
+            if name:
+                self._by_name.setdefault(name, account)
+
+    def __len__(self) -> int:
+        return len(self.accounts)
+
+    def get(self, identifier: str) -> Optional[dict]:
+        """
+        Resolve an account by synthetic id (acc_xxxxxxxx), Notion UUID (with or
+        without dashes), domain, or case-insensitive name.
+        """
+        if not identifier:
+            return None
+        identifier = identifier.strip()
+
+        account = self._by_id.get(identifier)
+        if account is None and not identifier.startswith("acc_") and len(identifier) == 8:
+            # Bare 8-char prefix of the Notion UUID
+            account = self._by_id.get(f"acc_{identifier}")
+        if account is None:
+            account = self._by_domain.get(normalize_domain(identifier))
+        if account is None:
+            account = self._by_name.get(identifier.lower())
+        return account
+
+
+def get_account_index(raise_on_error: bool = False, use_cache: bool = True) -> AccountIndex:
+    """
+    Get the account index (and the account list it wraps).
+
+    Served from the shared read-through cache for CACHE_TTL_ACCOUNTS seconds.
+    Mock fallback data is indexed on the fly and never cached.
+
+    Args:
+        raise_on_error: If True, raise exceptions instead of falling back to mock data.
+                       Use True for debugging and health checks (always reads Notion).
+        use_cache: If False, bypass the cache and rebuild it from a full Notion scan.
 
     Raises:
         NotionError: If raise_on_error=True and Notion operation fails
@@ -130,49 +332,25 @@ def get_notion_accounts(raise_on_error: bool = False) -> list[dict]:
                 missing_config="NOTION_API_KEY",
                 operation="get_notion_accounts",
             )
-        return get_mock_accounts()
+        return AccountIndex(get_mock_accounts())
 
     try:
-        notion = get_notion_client()
-        raw_accounts = notion.query_all_accounts()
-
-        # Build contact count map (query once, use for all accounts)
-        contact_counts: dict[str, int] = {}
-        try:
-            all_contacts = notion.query_all_contacts()
-            for contact in all_contacts:
-                props = contact.get("properties", {})
-                account_rel = props.get("Account", {}).get("relation", [])
-                if account_rel:
-                    account_id = account_rel[0].get("id", "")
-                    contact_counts[account_id] = contact_counts.get(account_id, 0) + 1
-            logger.info(
-                f"📊 Contact counts: {len(all_contacts)} contacts across {len(contact_counts)} accounts"
-            )
-        except NotionConfigError:
-            # Contacts DB not configured is acceptable, continue without counts
-            logger.warning("⚠️ Contacts database not configured, skipping contact counts")
-        except NotionError as e:
-            # Log but continue - contact counts are not critical
-            logger.warning(f"⚠️ Could not fetch contact counts: {e}")
-            if raise_on_error:
-                raise
-
-        accounts = []
-        for idx, page in enumerate(raw_accounts):
-            account = transform_notion_account(page, idx, contact_counts)
-            if account:
-                accounts.append(account)
-
-        logger.info(f"✅ Loaded {len(accounts)} accounts from Notion")
-        return accounts
+        if raise_on_error or not use_cache:
+            index = AccountIndex(_load_notion_accounts(raise_on_error, full_sync=not use_cache))
+            notion_cache.set(ACCOUNTS_CACHE_KEY, index, CACHE_TTL_ACCOUNTS)
+            return index
+        return notion_cache.get_or_load(
+            ACCOUNTS_CACHE_KEY,
+            lambda: AccountIndex(_load_notion_accounts()),
+            CACHE_TTL_ACCOUNTS,
+        )
 
     except NotionConfigError as e:
         # Configuration error - fall back to mock if allowed, otherwise raise
         logger.error(f"❌ Notion configuration error: {e}")
         if raise_on_error:
             raise
-        return get_mock_accounts()
+        return AccountIndex(get_mock_accounts())
 
     except NotionAPIError as e:
         # API error - this is a real failure, log and optionally raise
@@ -181,14 +359,14 @@ def get_notion_accounts(raise_on_error: bool = False) -> list[dict]:
             raise
         # Fall back to mock data but log that we're doing so
         logger.warning("⚠️ Falling back to mock data due to API error")
-        return get_mock_accounts()
+        return AccountIndex(get_mock_accounts())
 
     except NotionError as e:
         # Other Notion errors
         logger.error(f"❌ Notion error fetching accounts: {e}")
         if raise_on_error:
             raise
-        return get_mock_accounts()
+        return AccountIndex(get_mock_accounts())
 
     except Exception as e:
         # Unexpected error - always log with full traceback
@@ -200,7 +378,80 @@ def get_notion_accounts(raise_on_error: bool = False) -> list[dict]:
             raise NotionError(
                 f"Unexpected error: {str(e)}", operation="get_notion_accounts", cause=e
             )
-        return get_mock_accounts()
+        return AccountIndex(get_mock_accounts())
+
+
+def find_account(account_id: str) -> Optional[dict]:
+    """
+    Look up one account by id, Notion UUID, domain, or name.
+
+    The returned dict is shared with the cache; copy it before mutating.
+    """
+    return get_account_index().get(account_id)
+
+
+# ============================================================================
+# Data Layer - Real Notion Integration
+# ============================================================================
+
+
+def get_notion_accounts(raise_on_error: bool = False, use_cache: bool = True) -> list[dict]:
+    """
+    Fetch accounts from Notion and transform for API.
+
+    Args:
+        raise_on_error: If True, raise exceptions instead of falling back to mock data.
+                       Use True for debugging and health checks.
+        use_cache: If False, bypass the read-through cache and refresh it.
+
+    Returns:
+        List of account dictionaries (a new list; the dicts are shared with
+        the cache, so callers must copy before mutating them)
+
+    Raises:
+        NotionError: If raise_on_error=True and Notion operation fails
+    """
+    return list(get_account_index(raise_on_error, use_cache).accounts)
+
+
+def _load_notion_accounts(raise_on_error: bool = False, full_sync: bool = False) -> list[dict]:
+    """
+    Refresh the account and contact mirrors from Notion and transform the accounts.
+
+    Only pages edited since the last sync are downloaded, except for the
+    periodic (or full_sync=True) full reconciliation.
+    """
+    notion = get_notion_client()
+
+    # Build contact count map from the contact -> account mirror
+    contact_counts: dict[str, int] = {}
+    try:
+        contact_account_mirror.sync(notion, notion.contacts_db, force_full=full_sync)
+        account_ids = contact_account_mirror.values()
+        for account_id in account_ids:
+            if account_id:
+                contact_counts[account_id] = contact_counts.get(account_id, 0) + 1
+        logger.info(
+            f"📊 Contact counts: {len(account_ids)} contacts across {len(contact_counts)} accounts"
+        )
+    except NotionConfigError:
+        # Contacts DB not configured is acceptable, continue without counts
+        logger.warning("⚠️ Contacts database not configured, skipping contact counts")
+    except NotionError as e:
+        # Log but continue - contact counts are not critical
+        logger.warning(f"⚠️ Could not fetch contact counts: {e}")
+        if raise_on_error:
+            raise
+
+    account_mirror.sync(notion, notion.accounts_db, force_full=full_sync)
+    accounts = []
+    for idx, page in enumerate(account_mirror.values()):
+        account = transform_notion_account(page, idx, contact_counts)
+        if account:
+            accounts.append(account)
+
+    logger.info(f"✅ Loaded {len(accounts)} accounts from Notion")
+    return accounts
 
 
 def transform_notion_account(
@@ -329,70 +580,109 @@ def extract_select(prop: dict) -> str:
 
 
 def get_notion_contacts(account_notion_id: str) -> list[dict]:
-    """Fetch contacts for account from Notion"""
+    """Fetch contacts for account from Notion (cached for CACHE_TTL_CONTACTS)"""
     if not NOTION_AVAILABLE:
         return get_mock_contacts(account_notion_id)
 
     try:
-        notion = get_notion_client()
-        raw_contacts = notion.query_all_contacts(account_notion_id)
-
-        contacts = []
-        for page in raw_contacts:
-            contact = transform_notion_contact(page)
-            if contact:
-                contacts.append(contact)
-
-        logger.info(
-            f"✅ Loaded {len(contacts)} contacts from Notion for account {account_notion_id}"
+        return list(
+            notion_cache.get_or_load(
+                f"contacts:{account_notion_id}",
+                lambda: _load_notion_contacts(account_notion_id),
+                CACHE_TTL_CONTACTS,
+            )
         )
-        return contacts
 
     except Exception as e:
         logger.error(f"❌ Error fetching contacts from Notion: {e}")
         return get_mock_contacts(account_notion_id)
 
 
+def _load_notion_contacts(account_notion_id: str) -> list[dict]:
+    """Query and transform contacts for one account"""
+    notion = get_notion_client()
+    raw_contacts = notion.query_all_contacts(account_notion_id)
+
+    contacts = []
+    for page in raw_contacts:
+        contact = transform_notion_contact(page)
+        if contact:
+            contacts.append(contact)
+
+    logger.info(f"✅ Loaded {len(contacts)} contacts from Notion for account {account_notion_id}")
+    return contacts
+
+
 def get_notion_trigger_events(account_notion_id: str = None) -> list[dict]:
-    """Fetch trigger events from Notion, optionally for a specific account"""
+    """Fetch trigger events from Notion, optionally for a specific account
+
+    Cached for CACHE_TTL_TRIGGER_EVENTS; errors return [] and are not cached.
+    """
     if not NOTION_AVAILABLE:
         return []
 
     try:
-        notion = get_notion_client()
-        raw_events = notion.query_all_trigger_events(account_notion_id)
-
-        events = []
-        for page in raw_events:
-            event = transform_notion_trigger_event(page)
-            if event:
-                events.append(event)
-
-        logger.info(f"✅ Loaded {len(events)} trigger events from Notion")
-        return events
+        return list(
+            notion_cache.get_or_load(
+                f"trigger_events:{account_notion_id or '*'}",
+                lambda: _load_notion_trigger_events(account_notion_id),
+                CACHE_TTL_TRIGGER_EVENTS,
+            )
+        )
 
     except Exception as e:
         logger.error(f"❌ Error fetching trigger events from Notion: {e}")
         return []
 
 
+def _load_notion_trigger_events(account_notion_id: str = None) -> list[dict]:
+    """Query and transform trigger events, optionally for one account"""
+    notion = get_notion_client()
+    raw_events = notion.query_all_trigger_events(account_notion_id)
+
+    events = []
+    for page in raw_events:
+        event = transform_notion_trigger_event(page)
+        if event:
+            events.append(event)
+
+    logger.info(f"✅ Loaded {len(events)} trigger events from Notion")
+    return events
+
+
 def get_notion_partnerships(account_notion_id: str = None) -> list[dict]:
     """Fetch partnerships from Notion, optionally for a specific account
 
     This function also resolves account names from account relations by building
-    a lookup map from the accounts database.
+    a lookup map from the accounts database. Cached for CACHE_TTL_PARTNERSHIPS;
+    errors return [] and are not cached.
     """
     if not NOTION_AVAILABLE:
         return []
 
     try:
-        notion = get_notion_client()
+        return list(
+            notion_cache.get_or_load(
+                f"partnerships:{account_notion_id or '*'}",
+                lambda: _load_notion_partnerships(account_notion_id),
+                CACHE_TTL_PARTNERSHIPS,
+            )
+        )
 
-        # Build account ID → name lookup map for resolving relations
-        account_lookup = {}
-        try:
-            raw_accounts = notion.query_all_accounts()
-            for acc_page in raw_accounts:
+    except Exception as e:
+        logger.error(f"❌ Error fetching partnerships from Notion: {e}")
+        return []
+
+
+def _load_notion_partnerships(account_notion_id: str = None) -> list[dict]:
+    """Query and transform partnerships, resolving account names"""
+    notion = get_notion_client()
+
+    # Build account ID → name lookup map for resolving relations (title only)
+    account_lookup = {}
+    try:
+        for batch in notion.iter_all_accounts(filter_properties=["Name", "Account Name"]):
+            for acc_page in batch:
                 acc_id = acc_page.get("id")
                 props = acc_page.get("properties", {})
                 name_prop = props.get("Name", {}) or props.get("Account Name", {})
@@ -401,32 +691,28 @@ def get_notion_partnerships(account_notion_id: str = None) -> list[dict]:
                     name = name_prop["title"][0]["text"]["content"] if name_prop["title"] else ""
                 if acc_id and name:
                     account_lookup[acc_id] = name
-        except Exception as e:
-            logger.warning(f"Could not build account lookup map: {e}")
-
-        raw_partnerships = notion.query_all_partnerships(account_notion_id)
-
-        partnerships = []
-        for page in raw_partnerships:
-            partnership = transform_notion_partnership(page)
-            if partnership:
-                # Resolve account name from account_notion_id using lookup map
-                acc_notion_id = partnership.get("account_notion_id")
-                if acc_notion_id and acc_notion_id in account_lookup:
-                    partnership["account_name"] = account_lookup[acc_notion_id]
-                else:
-                    # Fall back to the fallback field or "N/A"
-                    partnership["account_name"] = partnership.get("account_name_fallback") or "N/A"
-                partnerships.append(partnership)
-
-        logger.info(
-            f"✅ Loaded {len(partnerships)} partnerships from Notion (resolved {len(account_lookup)} account names)"
-        )
-        return partnerships
-
     except Exception as e:
-        logger.error(f"❌ Error fetching partnerships from Notion: {e}")
-        return []
+        logger.warning(f"Could not build account lookup map: {e}")
+
+    raw_partnerships = notion.query_all_partnerships(account_notion_id)
+
+    partnerships = []
+    for page in raw_partnerships:
+        partnership = transform_notion_partnership(page)
+        if partnership:
+            # Resolve account name from account_notion_id using lookup map
+            acc_notion_id = partnership.get("account_notion_id")
+            if acc_notion_id and acc_notion_id in account_lookup:
+                partnership["account_name"] = account_lookup[acc_notion_id]
+            else:
+                # Fall back to the fallback field or "N/A"
+                partnership["account_name"] = partnership.get("account_name_fallback") or "N/A"
+            partnerships.append(partnership)
+
+    logger.info(
+        f"✅ Loaded {len(partnerships)} partnerships from Notion (resolved {len(account_lookup)} account names)"
+    )
+    return partnerships
 
 
 def transform_notion_contact(page: dict) -> Optional[dict]:
@@ -1061,6 +1347,88 @@ def health_check():
     )
 
 
+@app.route("/metrics", methods=["GET"])
+def prometheus_metrics():
+    """
+    Prometheus text-format metrics.
+
+    Request latency per route, external call latency/errors/429s per
+    provider, research phase durations, Notion cache hit ratio, rate-limiter
+    waits, research jobs in flight and Apollo credits consumed.
+    """
+    cache = notion_cache.stats()
+    cache_labels = {"cache": "notion"}
+    limiters = all_rate_limiter_stats()
+
+    families = [
+        render_registered(),
+        render_spans(process_instrumentation()),
+        format_family(
+            "abm_cache_hits_total",
+            "counter",
+            "Read-through cache hits",
+            [("abm_cache_hits_total", cache_labels, cache["hits"])],
+        ),
+        format_family(
+            "abm_cache_misses_total",
+            "counter",
+            "Read-through cache misses",
+            [("abm_cache_misses_total", cache_labels, cache["misses"])],
+        ),
+        format_family(
+            "abm_cache_hit_ratio",
+            "gauge",
+            "Read-through cache hits / lookups since start",
+            [("abm_cache_hit_ratio", cache_labels, cache["hit_ratio"])],
+        ),
+        format_family(
+            "abm_rate_limiter_wait_seconds_total",
+            "counter",
+            "Seconds callers waited on a provider rate limiter",
+            [
+                (
+                    "abm_rate_limiter_wait_seconds_total",
+                    {"limiter": name},
+                    stats["wait_seconds_total"],
+                )
+                for name, stats in sorted(limiters.items())
+            ],
+        ),
+        format_family(
+            "abm_rate_limiter_acquired_total",
+            "counter",
+            "Requests admitted by a provider rate limiter",
+            [
+                ("abm_rate_limiter_acquired_total", {"limiter": name}, stats["acquired"])
+                for name, stats in sorted(limiters.items())
+            ],
+        ),
+        format_family(
+            "abm_research_jobs",
+            "gauge",
+            "Research jobs queued or running",
+            [
+                ("abm_research_jobs", {"status": status}, get_research_jobs().count(status))
+                for status in (JOB_QUEUED, JOB_RUNNING)
+            ],
+        ),
+    ]
+    return Response("".join(families), content_type=CONTENT_TYPE)
+
+
+@app.route("/api/health/instrumentation", methods=["GET"])
+def instrumentation_snapshot():
+    """
+    Process-wide timing spans since the server started.
+
+    Per span (phase.*, brave.search, apollo.*, openai.chat, notion.*,
+    website.fetch): count, errors, throttled, bytes and latency percentiles.
+    """
+    return jsonify(
+        {"timestamp": datetime.now().isoformat(), "spans": process_instrumentation().snapshot()}
+    )
+
+
 @app.route("/api/health/pipeline", methods=["GET"])
 def pipeline_health_check():
     """
@@ -1345,9 +1713,11 @@ def get_accounts():
     - priority: Filter by priority levels (comma-separated)
     - gpu_only: Only show GPU infrastructure accounts
     - search: Search by name/domain
+    - refresh: Bypass the read-through cache and reload from Notion
     """
     # Use real Notion data if available, otherwise mock data
-    accounts = get_notion_accounts()
+    refresh = request.args.get("refresh", "").lower() == "true"
+    accounts = get_notion_accounts(use_cache=not refresh)
 
     # Search filter
     search = request.args.get("search", "").lower()
@@ -1510,6 +1880,7 @@ def create_account():
         account_id = f"acc_{notion_id[:8]}"
 
         logger.info(f"✅ Created new account: {name} (ID: {account_id})")
+        invalidate_account_cache()
 
         # Return response
         response = {
@@ -1537,14 +1908,14 @@ def create_account():
 @app.route("/api/accounts/<account_id>", methods=["GET"])
 def get_account(account_id: str):
     """Get single account with contacts, events, and partnerships"""
-    accounts = get_notion_accounts()
-    account = next(
-        (a for a in accounts if a["id"] == account_id or a.get("notion_id") == account_id), None
-    )
+    account = find_account(account_id)
 
     if not account:
         return jsonify({"error": "Account not found"}), 404
 
+    # The breakdown below is merged into the account, so don't touch the cached dict
+    account = copy.deepcopy(account)
+
     # Use notion_id for querying related data
     notion_id = account.get("notion_id", "")
 
@@ -1605,10 +1976,7 @@ def get_account(account_id: str):
 @app.route("/api/accounts/<account_id>/contacts", methods=["GET"])
 def get_account_contacts(account_id: str):
     """Get contacts for a specific account"""
-    accounts = get_notion_accounts()
-    account = next(
-        (a for a in accounts if a["id"] == account_id or a.get("notion_id") == account_id), None
-    )
+    account = find_account(account_id)
 
     if not account:
         return jsonify({"contacts": []})
@@ -1655,10 +2023,8 @@ def get_trusted_paths():
     - account_vendors: Map of account_id -> vendors they use
     """
     partnerships = get_notion_partnerships()
-    accounts = get_notion_accounts()
-
-    # Build account ID -> name lookup
-    account_lookup = {acc.get("notion_id"): acc for acc in accounts}
+    account_index = get_account_index()
+    accounts = account_index.accounts
 
     # Separate partnerships into two categories:
     # 1. Verdigris Partners (is_verdigris_partner=True)
@@ -1701,7 +2067,7 @@ def get_trusted_paths():
     # Find trusted paths: accounts that use vendors we're partnered with
     trusted_paths = []
     for account_notion_id, vendors in account_vendors.items():
-        account = account_lookup.get(account_notion_id)
+        account = account_index.get(account_notion_id)
         if not account:
             continue
 
@@ -2179,10 +2545,7 @@ def enrich_account(account_id: str):
         )
 
     # Get account details
-    accounts = get_notion_accounts()
-    account = next(
-        (a for a in accounts if a["id"] == account_id or a.get("notion_id") == account_id), None
-    )
+    account = find_account(account_id)
 
     if not account:
         return jsonify({"error": "Account not found"}), 404
@@ -2234,6 +2597,7 @@ def enrich_account(account_id: str):
         if NOTION_AVAILABLE and discovered_contacts:
             notion = get_notion_client()
             save_results = notion.save_contacts(discovered_contacts, company_name)
+            invalidate_account_cache(notion_id, contacts=True)
 
             successful = sum(1 for v in save_results.values() if v)
 
@@ -2289,17 +2653,14 @@ def rescore_account_contacts(account_id: str):
         )
 
     # Get account details
-    accounts = get_notion_accounts()
-    account = next(
-        (a for a in accounts if a["id"] == account_id or a.get("notion_id") == account_id), None
-    )
+    account = find_account(account_id)
 
     if not account:
         return jsonify({"error": "Account not found"}), 404
 
-    # Get existing contacts
+    # Get existing contacts (copied: scores are applied in place and not persisted)
     notion_id = account.get("notion_id", "")
-    existing_contacts = get_notion_contacts(notion_id) if notion_id else []
+    existing_contacts = copy.deepcopy(get_notion_contacts(notion_id)) if notion_id else []
 
     if not existing_contacts:
         return jsonify(
@@ -2503,11 +2864,14 @@ def reveal_contact_email(contact_id: str):
 
         logger.info(f"🔍 Apollo enrichment for {name} at {company}")
 
-        apollo_response = requests.post(
-            apollo_url,
-            headers={"Content-Type": "application/json", "X-Api-Key": apollo_api_key},
-            json=apollo_payload,
-        )
+        provider_rate_limiter("apollo").acquire()
+        with span("apollo.people_match") as call:
+            apollo_response = requests.post(
+                apollo_url,
+                headers={"Content-Type": "application/json", "X-Api-Key": apollo_api_key},
+                json=apollo_payload,
+            )
+            call.record_response(apollo_response)
 
         if apollo_response.status_code != 200:
             logger.error(
@@ -2524,6 +2888,7 @@ def reveal_contact_email(contact_id: str):
                 500,
             )
 
+        APOLLO_CREDITS.inc(operation="people_match")
         apollo_data = apollo_response.json()
         person = apollo_data.get("person", {})
         revealed_email = person.get("email", "")
@@ -2558,6 +2923,7 @@ def reveal_contact_email(contact_id: str):
         # CRITICAL: Actually persist to Notion - this was silently failing before!
         try:
             notion.update_page(contact_page["id"], update_props)
+            notion_cache.invalidate_prefix("contacts:")
             logger.info(f"✅ Email persisted to Notion for contact {contact_id}")
         except NotionError as e:
             # Log the error but still return the email to the user
@@ -2740,18 +3106,14 @@ def discover_account_trigger_events(account_id: str):
         # Get Notion client
         notion = get_notion_client()
 
-        # Get account from Notion by ID
-        # Account IDs are formatted as "acc_<first8chars>"
-        notion_account_id = account_id.replace("acc_", "")
-
-        # Query accounts to find the one with matching ID prefix
-        all_accounts = notion.query_all_accounts()
+        # Resolve the account via the index, then fetch only its page
+        account = find_account(account_id)
         account_page = None
-
-        for page in all_accounts:
-            if page["id"].startswith(notion_account_id) or page["id"][:8] == notion_account_id:
-                account_page = page
-                break
+        if account and account.get("notion_id"):
+            try:
+                account_page = notion.get_page(account["notion_id"])
+            except NotionError as e:
+                logger.warning(f"⚠️ Could not fetch account page {account['notion_id']}: {e}")
 
         if not account_page:
             return (
@@ -2816,6 +3178,8 @@ def discover_account_trigger_events(account_id: str):
                     logger.info(f"Saved {saved_count} events to Notion")
             except Exception as e:
                 logger.warning(f"Could not save events to Notion: {e}")
+            if saved_count:
+                invalidate_account_cache(account_page["id"], accounts=False, trigger_events=True)
 
         logger.info(f"✅ Discovered {len(events)} trigger events for {account_name}")
 
@@ -2877,18 +3241,14 @@ def classify_account_partnership(account_id: str):
         # Get Notion client
         notion = get_notion_client()
 
-        # Get account from Notion by ID
-        # Account IDs are formatted as "acc_<first8chars>"
-        notion_account_id = account_id.replace("acc_", "")
-
-        # Query accounts to find the one with matching ID prefix
-        all_accounts = notion.query_all_accounts()
+        # Resolve the account via the index, then fetch only its page
+        account = find_account(account_id)
         account_page = None
-
-        for page in all_accounts:
-            if page["id"].startswith(notion_account_id) or page["id"][:8] == notion_account_id:
-                account_page = page
-                break
+        if account and account.get("notion_id"):
+            try:
+                account_page = notion.get_page(account["notion_id"])
+            except NotionError as e:
+                logger.warning(f"⚠️ Could not fetch account page {account['notion_id']}: {e}")
 
         if not account_page:
             return (
@@ -2974,58 +3334,108 @@ def classify_account_partnership(account_id: str):
 
 
 # ============================================================================
-# Full Account Research Pipeline (WS5 - Phase D)
+# Streaming Responses (Server-Sent Events)
 # ============================================================================
 
-# Note: ABM System imports are done earlier in "Enrichment Endpoints" section
-# ComprehensiveABMSystem and ABM_SYSTEM_AVAILABLE are already defined
+RESEARCH_STREAM_POLL_SECONDS = float(os.environ.get("ABM_RESEARCH_STREAM_POLL_SECONDS", "1"))
 
 
-@app.route("/api/accounts/<account_id>/research", methods=["POST"])
-def run_account_research(account_id: str):
+def _no_progress(phase: str, status: str, **details) -> None:
+    """Progress callback used when nobody is listening"""
+
+
+def _wants_event_stream() -> bool:
+    """True if the client asked for SSE (Accept header or ?stream=1)"""
+    if request.args.get("stream", "").lower() in ("1", "true"):
+        return True
+    return "text/event-stream" in request.headers.get("Accept", "")
+
+
+def _event_stream_response(work) -> Response:
     """
-    Run complete 5-phase ABM research pipeline for an account
+    Stream work(stream) as Server-Sent Events.
 
-    Phases:
-    1. Account Intelligence Baseline (trigger events, ICP scoring)
-    2. Contact Discovery & Segmentation (Apollo API)
-    3. High-Priority Contact Enrichment (LinkedIn)
-    4. Engagement Intelligence
-    5. Strategic Partnership Intelligence
+    work runs on a background thread outside the request context and
+    returns (payload, status_code), sent as the final 'result' event.
+    """
+    return Response(EventStream().run(work), mimetype="text/event-stream", headers=SSE_HEADERS)
 
-    All results are saved back to Notion.
 
-    POST body (optional):
-    {
-        "force": false  // Set true to force re-research even if already completed
-    }
+def _research_job_frames(job_id: str):
     """
-    if not ABM_SYSTEM_AVAILABLE:
-        return (
-            jsonify(
-                {
-                    "error": "Research pipeline unavailable",
-                    "message": "ABM Research System not configured. Check server logs.",
-                    "fallback": True,
-                }
-            ),
-            503,
-        )
+    SSE frames for a research job, read from the job table.
 
-    # Get account from Notion - support both synthetic ID and Notion UUID
-    accounts = get_notion_accounts()
-    account = next(
-        (a for a in accounts if a["id"] == account_id or a.get("notion_id") == account_id), None
-    )
+    Phase transitions recorded by the worker become phase_start /
+    phase_complete events (with their counts and durations); the stream ends
+    with the job result or error. Reading the table rather than the worker
+    means any server process can stream any job, including after a restart.
+    """
+    sent: dict[str, str] = {}
+    event_id = 0
+    last_frame = time.monotonic()
+
+    while True:
+        job = get_research_jobs().get(job_id)
+        if not job:
+            yield format_sse("error", {"message": "Job not found"})
+            return
+
+        status = _job_status_payload(job)
+        for phase in RESEARCH_PHASES:
+            entry = job["progress"].get(phase)
+            if not entry or sent.get(phase) == entry.get("status"):
+                continue
+            sent[phase] = entry.get("status")
+            event_id += 1
+            data = {**entry, "phase": phase, "percent_complete": status["percent_complete"]}
+            yield format_sse(progress_event(entry.get("status")), data, event_id)
+            last_frame = time.monotonic()
+
+        if job["status"] == JOB_SUCCEEDED:
+            yield format_sse("result", {**(job["result"] or {}), "status_code": 200}, event_id + 1)
+            return
+        if job["status"] == JOB_FAILED:
+            yield format_sse("error", {**(status["error"] or {}), "job": status}, event_id + 1)
+            return
+
+        if time.monotonic() - last_frame >= HEARTBEAT_SECONDS:
+            yield HEARTBEAT_FRAME
+            last_frame = time.monotonic()
+        time.sleep(RESEARCH_STREAM_POLL_SECONDS)
+
+
+# ============================================================================
+# Full Account Research Pipeline (WS5 - Phase D)
+# ============================================================================
+
+# Note: ABM System imports are done earlier in "Enrichment Endpoints" section
+# ComprehensiveABMSystem and ABM_SYSTEM_AVAILABLE are already defined
+
+
+RESEARCH_JOBS_DB = os.environ.get(
+    "ABM_RESEARCH_JOBS_DB", os.path.join(project_root, "research_jobs.db")
+)
+RESEARCH_MAX_WORKERS = int(os.environ.get("ABM_RESEARCH_WORKERS", "2"))
+RESEARCH_PHASES = ["phase_1", "phase_2", "phase_3", "phase_4", "phase_5", "persistence"]
 
+
+def _resolve_research_target(account_id: str):
+    """
+    Look up an account and the name/domain to research.
+
+    Returns:
+        (account, company_name, company_domain, error) - error is a
+        (payload, status) tuple when the account can't be researched
+    """
+    account = find_account(account_id)
     if not account:
-        return jsonify({"error": "Account not found"}), 404
+        return None, "", "", ({"error": "Account not found"}, 404)
 
     company_name = account.get("name", "")
     company_domain = account.get("domain", "")
 
     if not company_name:
-        return jsonify({"error": "Account name is required for research"}), 400
+        return account, "", "", ({"error": "Account name is required for research"}, 400)
 
     # If no domain, try to infer from company name
     if not company_domain:
@@ -3033,6 +3443,29 @@ def run_account_research(account_id: str):
         company_domain = company_name.lower().replace(" ", "") + ".com"
         logger.warning(f"⚠️ No domain for {company_name}, using inferred: {company_domain}")
 
+    return account, company_name, company_domain, None
+
+
+def _research_account(
+    account: dict,
+    account_id: str,
+    company_name: str,
+    company_domain: str,
+    progress=None,
+    run_id: Optional[str] = None,
+    resume: bool = False,
+) -> tuple[dict, int]:
+    """
+    Run the 5-phase pipeline for one account and back up key fields to Notion.
+
+    Args:
+        progress: Optional progress(phase, status, **details) callback
+        run_id: Checkpoint key for the run
+        resume: Reuse the run's (or the domain's latest run's) phase checkpoints
+
+    Returns:
+        (response payload, HTTP status)
+    """
     try:
         logger.info(f"🔬 Starting full research pipeline for {company_name} ({company_domain})")
 
@@ -3040,20 +3473,26 @@ def run_account_research(account_id: str):
         system = ComprehensiveABMSystem()
 
         # Run complete 5-phase research
-        research_results = system.conduct_complete_account_research(company_name, company_domain)
+        research_results = system.conduct_complete_account_research(
+            company_name, company_domain, progress_callback=progress, run_id=run_id, resume=resume
+        )
+
+        # The pipeline persists contacts, events, and partnerships for this account
+        invalidate_account_cache(
+            account.get("notion_id"), contacts=True, trigger_events=True, partnerships=True
+        )
 
         if not research_results.get("success"):
             return (
-                jsonify(
-                    {
-                        "status": "failed",
-                        "message": "Research pipeline encountered errors",
-                        "summary": research_results.get("research_summary", {}),
-                        "error": research_results.get("research_summary", {}).get(
-                            "error", "Unknown error"
-                        ),
-                    }
-                ),
+                {
+                    "status": "failed",
+                    "message": "Research pipeline encountered errors",
+                    "run_id": research_results.get("run_id"),
+                    "summary": research_results.get("research_summary", {}),
+                    "error": research_results.get("research_summary", {}).get(
+                        "error", "Unknown error"
+                    ),
+                },
                 500,
             )
 
@@ -3084,6 +3523,7 @@ def run_account_research(account_id: str):
 
                 if update_fields:
                     notion.update_page(account["notion_id"], update_fields)
+                    invalidate_account_cache()
                     logger.info(
                         f"✅ Backup persistence: Updated {len(update_fields)} fields in Notion"
                     )
@@ -3096,11 +3536,13 @@ def run_account_research(account_id: str):
                 persistence_error = {"message": str(e), "type": type(e).__name__}
                 logger.error(f"❌ Backup Notion persistence failed unexpectedly: {e}")
 
-        return jsonify(
+        return (
             {
                 "status": "success",
                 "message": f"Research completed for {company_name}",
                 "account_id": account_id,
+                "run_id": research_results.get("run_id"),
+                "resumed_phases": research_results.get("resumed_phases", []),
                 "research_summary": {
                     "contacts_discovered": summary.get("contacts_discovered", 0),
                     "trigger_events_found": summary.get("trigger_events_found", 0),
@@ -3131,7 +3573,8 @@ def run_account_research(account_id: str):
                         "buying_signals_score"
                     ),
                 },
-            }
+            },
+            200,
         )
 
     except Exception as e:
@@ -3139,7 +3582,228 @@ def run_account_research(account_id: str):
         import traceback
 
         traceback.print_exc()
-        return jsonify({"error": "Research failed", "message": str(e)}), 500
+        return {"error": "Research failed", "message": str(e)}, 500
+
+
+def _run_research_job(params: dict, progress) -> dict:
+    """
+    JobQueue runner for 'account_research' jobs.
+
+    Always resumes from the job's checkpoints, so a job re-queued after a
+    restart continues from its last completed phase.
+    """
+    account_id = params["account_id"]
+    account, company_name, company_domain, error = _resolve_research_target(account_id)
+    if error:
+        raise LookupError(error[0]["error"])
+
+    payload, status_code = _research_account(
+        account,
+        account_id,
+        company_name,
+        company_domain,
+        progress=progress,
+        run_id=params.get("run_id"),
+        resume=True,
+    )
+    if status_code >= 400:
+        raise RuntimeError(payload.get("error") or payload.get("message") or "Research failed")
+    return payload
+
+
+_research_jobs: Optional[JobQueue] = None
+_research_jobs_lock = threading.Lock()
+
+
+def get_research_jobs() -> JobQueue:
+    """The research job queue, opened on first use (importing the server does no work)"""
+    global _research_jobs
+    with _research_jobs_lock:
+        if _research_jobs is None:
+            _research_jobs = JobQueue(RESEARCH_JOBS_DB, max_workers=RESEARCH_MAX_WORKERS)
+            _research_jobs.register("account_research", _run_research_job)
+        return _research_jobs
+
+
+def start_research_jobs() -> int:
+    """
+    Re-queue jobs that were queued or running when the previous process stopped.
+
+    Called on startup by main(); WSGI servers, which import app without
+    calling main(), opt in with ABM_RESEARCH_RECOVER_JOBS=true.
+
+    Returns:
+        Number of jobs re-scheduled
+    """
+    if not ABM_SYSTEM_AVAILABLE:
+        return 0
+    return get_research_jobs().recover()
+
+
+if os.environ.get("ABM_RESEARCH_RECOVER_JOBS", "false").lower() == "true":
+    start_research_jobs()
+
+
+def _job_status_payload(job: dict) -> dict:
+    """Public view of a research job with per-phase progress"""
+    phases = job["progress"]
+    completed = sum(
+        1 for phase in RESEARCH_PHASES if phases.get(phase, {}).get("status") == "completed"
+    )
+    return {
+        "job_id": job["id"],
+        "status": job["status"],
+        "account_id": job["params"].get("account_id"),
+        "company_name": job["params"].get("company_name"),
+        "current_phase": job["current_phase"],
+        "phases": {phase: phases.get(phase, {"status": "pending"}) for phase in RESEARCH_PHASES},
+        "percent_complete": (
+            100 if job["status"] == JOB_SUCCEEDED else int(100 * completed / len(RESEARCH_PHASES))
+        ),
+        "created_at": job["created_at"],
+        "started_at": job["started_at"],
+        "finished_at": job["finished_at"],
+        "error": json.loads(job["error"]) if job["error"] else None,
+        "status_url": f"/api/research/jobs/{job['id']}",
+        "result_url": f"/api/research/jobs/{job['id']}/result",
+    }
+
+
+@app.route("/api/accounts/<account_id>/research", methods=["POST"])
+def run_account_research(account_id: str):
+    """
+    Run complete 5-phase ABM research pipeline for an account
+
+    Phases:
+    1. Account Intelligence Baseline (trigger events, ICP scoring)
+    2. Contact Discovery & Segmentation (Apollo API)
+    3. High-Priority Contact Enrichment (LinkedIn)
+    4. Engagement Intelligence
+    5. Strategic Partnership Intelligence
+
+    All results are saved back to Notion.
+
+    Research runs as a background job: the response is 202 with a job id, and
+    progress is polled from GET /api/research/jobs/<job_id>. A job already
+    queued or running for the account is returned instead of starting another.
+    With "Accept: text/event-stream" (or ?stream=1) the job's phase events and
+    result are streamed as Server-Sent Events instead.
+
+    POST body (optional):
+    {
+        "force": false,   // Set true to force re-research even if already completed
+        "wait": false,    // Set true to run synchronously and return the result
+        "resume": false,  // Reuse checkpointed phases of a failed run instead of re-running them
+        "run_id": null    // Run to resume (default: the account's latest checkpointed run)
+    }
+    """
+    if not ABM_SYSTEM_AVAILABLE:
+        return (
+            jsonify(
+                {
+                    "error": "Research pipeline unavailable",
+                    "message": "ABM Research System not configured. Check server logs.",
+                    "fallback": True,
+                }
+            ),
+            503,
+        )
+
+    # Get account from Notion - support both synthetic ID and Notion UUID
+    account, company_name, company_domain, error = _resolve_research_target(account_id)
+    if error:
+        return jsonify(error[0]), error[1]
+
+    data = request.get_json(silent=True) or {}
+    resume = bool(data.get("resume"))
+    if data.get("wait"):
+        payload, status_code = _research_account(
+            account,
+            account_id,
+            company_name,
+            company_domain,
+            run_id=data.get("run_id"),
+            resume=resume,
+        )
+        return jsonify(payload), status_code
+
+    # A resumed job picks up the given run (or the domain's latest one);
+    # otherwise it starts a fresh run keyed by its own id
+    run_id = data.get("run_id") if resume else uuid.uuid4().hex
+    try:
+        job = get_research_jobs().submit(
+            "account_research",
+            {
+                "account_id": account_id,
+                # The resolved page, so its id, UUID, domain or name share one job
+                "account_key": account.get("notion_id") or account.get("id") or account_id,
+                "company_name": company_name,
+                "run_id": run_id,
+            },
+            dedup_key="account_key",
+        )
+    except JobQueueFull as e:
+        return jsonify({"error": "Research queue is full", "message": str(e)}), 429
+
+    if _wants_event_stream():
+        return Response(
+            _research_job_frames(job["id"]), mimetype="text/event-stream", headers=SSE_HEADERS
+        )
+    return jsonify(_job_status_payload(job)), 202
+
+
+@app.route("/api/research/jobs", methods=["GET"])
+def list_research_jobs():
+    """Recent research jobs, newest first (?limit=50)"""
+    limit = min(request.args.get("limit", 50, type=int), 500)
+    jobs = get_research_jobs().list_jobs("account_research", limit=limit)
+    return jsonify({"jobs": [_job_status_payload(job) for job in jobs], "count": len(jobs)})
+
+
+@app.route("/api/research/jobs/<job_id>", methods=["GET"])
+def get_research_job(job_id: str):
+    """Status and per-phase progress of a research job"""
+    job = get_research_jobs().get(job_id)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(_job_status_payload(job))
+
+
+@app.route("/api/research/jobs/<job_id>/events", methods=["GET"])
+def stream_research_job(job_id: str):
+    """Server-Sent Events for a research job (usable with EventSource)"""
+    if not get_research_jobs().get(job_id):
+        return jsonify({"error": "Job not found"}), 404
+    return Response(_research_job_frames(job_id), mimetype="text/event-stream", headers=SSE_HEADERS)
+
+
+@app.route("/api/research/jobs/<job_id>/result", methods=["GET"])
+def get_research_job_result(job_id: str):
+    """
+    Result of a finished research job.
+
+    Returns the same payload as a synchronous research call once the job has
+    succeeded, 202 with the job status while it is still running, and 500
+    with the error if it failed.
+    """
+    job = get_research_jobs().get(job_id)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+    if job["status"] == JOB_SUCCEEDED:
+        return jsonify(job["result"])
+    if job["status"] == JOB_FAILED:
+        status = _job_status_payload(job)
+        return (
+            jsonify(
+                {
+                    "error": "Research failed",
+                    "message": (status["error"] or {}).get("message"),
+                    "job": status,
+                }
+            ),
+            500,
+        )
+    return jsonify(_job_status_payload(job)), 202
 
 
 # ============================================================================
@@ -3346,7 +4010,7 @@ def generate_ai_outreach():
             f"🤖 Generating {outreach_type} outreach for {contact.get('name')} at {account.get('name')}"
         )
 
-        response = openai_client.chat.completions.create(
+        reply = get_llm_gateway().complete(
             model="gpt-4o-mini",
             messages=[
                 {
@@ -3357,9 +4021,12 @@ def generate_ai_outreach():
             ],
             temperature=0.8,  # Slightly creative but not too random
             max_tokens=1500,
+            client=lambda: openai_client,
+            # Each click should draft something new, so creative drafts are never replayed
+            bypass_cache=True,
         )
 
-        content = response.choices[0].message.content.strip()
+        content = reply.strip()
 
         # Clean up potential markdown formatting
         if content.startswith("```"):
@@ -3407,20 +4074,24 @@ VENDOR_DISCOVERY_AVAILABLE = False
 vendor_discovery = None
 
 try:
-    discovery_spec = importlib.util.spec_from_file_location(
-        "vendor_relationship_discovery",
-        os.path.join(
-            project_root, "src/abm_research/intelligence/vendor_relationship_discovery.py"
-        ),
-    )
-    discovery_module = importlib.util.module_from_spec(discovery_spec)
-    discovery_spec.loader.exec_module(discovery_module)
+    # Imported through the package: the module uses relative imports of the shared utils
+    from ..intelligence.vendor_relationship_discovery import VendorRelationshipDiscovery
+
     # Create instance with notion_client for Notion persistence support
     # Previously used module singleton without notion_client, causing save_to_notion to silently fail
-    VendorRelationshipDiscovery = discovery_module.VendorRelationshipDiscovery
-    vendor_discovery = VendorRelationshipDiscovery(notion_client=get_notion_client())
+    vendor_notion_client = None
+    if NOTION_AVAILABLE:
+        try:
+            vendor_notion_client = get_notion_client()
+        except Exception as e:
+            # Discovery still works without Notion; discovered vendors just aren't saved
+            logger.warning(f"⚠️ Vendor discovery running without Notion persistence: {e}")
+    vendor_discovery = VendorRelationshipDiscovery(notion_client=vendor_notion_client)
     VENDOR_DISCOVERY_AVAILABLE = True
-    logger.info("✅ Vendor Relationship Discovery module available (with Notion persistence)")
+    persistence = "with" if vendor_notion_client else "without"
+    logger.info(
+        f"✅ Vendor Relationship Discovery module available ({persistence} Notion persistence)"
+    )
 except Exception as e:
     logger.warning(f"⚠️ Vendor Relationship Discovery not available: {e}")
 
@@ -3467,10 +4138,7 @@ def discover_account_vendors(account_id: str):
         )
 
     # Get account from Notion - support both synthetic ID and Notion UUID
-    accounts = get_notion_accounts()
-    account = next(
-        (a for a in accounts if a["id"] == account_id or a.get("notion_id") == account_id), None
-    )
+    account = find_account(account_id)
 
     if not account:
         return jsonify({"error": "Account not found"}), 404
@@ -3551,6 +4219,10 @@ def discover_account_vendors(account_id: str):
             except Exception as e:
                 logger.error(f"❌ Failed to save partnerships to Notion: {e}")
                 save_errors.append({"error": str(e), "type": "unknown"})
+            if saved_count:
+                invalidate_account_cache(
+                    account.get("notion_id"), accounts=False, partnerships=True
+                )
 
         # Convert dataclasses to dicts for JSON response
         signals_json = []
@@ -3593,6 +4265,7 @@ def discover_account_vendors(account_id: str):
                 "vendor_scores": vendor_scores_json,
                 "total_vendors_with_signals": len(vendor_scores_json),
                 "search_failures": search_failures,
+                "search_cache": results.get("search_cache", {}),
                 "notion_persistence": {
                     "saved_to_notion": saved_count,
                     "save_errors": save_errors,
@@ -3638,6 +4311,9 @@ def discover_unknown_vendors(account_id: str):
     - saved_to_notion: Number saved to Notion
     - added_to_runtime: Number added to runtime vendor list
     - category_summary: Count of vendors by category
+
+    Send "Accept: text/event-stream" (or ?stream=1) to receive progress as
+    Server-Sent Events instead of a single JSON response.
     """
     if not VENDOR_DISCOVERY_AVAILABLE:
         return (
@@ -3651,10 +4327,7 @@ def discover_unknown_vendors(account_id: str):
         )
 
     # Get account from Notion - support both synthetic ID and Notion UUID
-    accounts = get_notion_accounts()
-    account = next(
-        (a for a in accounts if a["id"] == account_id or a.get("notion_id") == account_id), None
-    )
+    account = find_account(account_id)
 
     if not account:
         return jsonify({"error": "Account not found"}), 404
@@ -3668,25 +4341,44 @@ def discover_unknown_vendors(account_id: str):
     save_to_notion = body.get("save_to_notion", True)
     min_confidence = body.get("min_confidence", 0.6)
 
+    if _wants_event_stream():
+        return _event_stream_response(
+            lambda stream: _discover_unknown_vendors(
+                account, account_name, save_to_notion, min_confidence, progress=stream.progress
+            )
+        )
+    payload, status_code = _discover_unknown_vendors(
+        account, account_name, save_to_notion, min_confidence
+    )
+    return jsonify(payload), status_code
+
+
+def _discover_unknown_vendors(
+    account: dict, account_name: str, save_to_notion: bool, min_confidence: float, progress=None
+) -> tuple[dict, int]:
+    """Run Workflow 3 for one account; returns (response payload, HTTP status)"""
     try:
         logger.info(f"🔍 WORKFLOW 3: Discovering unknown vendors for {account_name}")
 
         # Run LLM-powered discovery
         results = vendor_discovery.discover_unknown_vendors(
-            account_name=account_name, save_to_notion=save_to_notion, min_confidence=min_confidence
+            account_name=account_name,
+            save_to_notion=save_to_notion,
+            min_confidence=min_confidence,
+            progress_callback=progress,
         )
+        if save_to_notion:
+            invalidate_account_cache(account.get("notion_id"), accounts=False, partnerships=True)
 
         # Check for errors
         if "error" in results:
             return (
-                jsonify(
-                    {
-                        "status": "error",
-                        "account_name": account_name,
-                        "workflow": "discover_unknown_vendors",
-                        "error": results["error"],
-                    }
-                ),
+                {
+                    "status": "error",
+                    "account_name": account_name,
+                    "workflow": "discover_unknown_vendors",
+                    "error": results["error"],
+                },
                 400,
             )
 
@@ -3709,7 +4401,7 @@ def discover_unknown_vendors(account_id: str):
                 }
             )
 
-        return jsonify(
+        return (
             {
                 "status": "success",
                 "account_name": account_name,
@@ -3722,10 +4414,12 @@ def discover_unknown_vendors(account_id: str):
                 "added_to_runtime": results.get("added_to_runtime", 0),
                 "search_results_analyzed": results.get("search_results_analyzed", 0),
                 "category_summary": results.get("category_summary", {}),
+                "search_cache": results.get("search_cache", {}),
                 "total_vendors_in_system": vendor_discovery.get_vendor_count(),
                 "llm_model": "gpt-4o-mini",
                 "cost_estimate": f"~${0.02 + (results.get('search_results_analyzed', 0) * 0.002):.3f}",
-            }
+            },
+            200,
         )
 
     except Exception as e:
@@ -3733,7 +4427,7 @@ def discover_unknown_vendors(account_id: str):
         import traceback
 
         traceback.print_exc()
-        return jsonify({"error": "Unknown vendor discovery failed", "message": str(e)}), 500
+        return {"error": "Unknown vendor discovery failed", "message": str(e)}, 500
 
 
 @app.route("/api/vendor-intro-power", methods=["POST"])
@@ -3748,10 +4442,13 @@ def calculate_vendor_intro_power():
     {
         "vendors": ["Schneider Electric", "Vertiv", "NVIDIA"],
         "accounts": ["CoreWeave", "Lambda Labs", "Together AI"],  // Optional, defaults to all accounts
-        "fit_weights": {"NVIDIA": 1.5, "Schneider Electric": 1.2}  // Optional vendor weights
+        "fit_weights": {"NVIDIA": 1.5, "Schneider Electric": 1.2},  // Optional vendor weights
+        "deadline_seconds": 60  // Optional search time budget; unsearched pairs are returned
+                                // as pending_pairs
     }
 
-    Returns vendors ranked by IntroScore = CoverageCount * AvgSignalStrength * FitWeight
+    Returns vendors ranked by IntroScore = CoverageCount * AvgSignalStrength * FitWeight.
+    Pairs are searched highest account score first.
     """
     if not VENDOR_DISCOVERY_AVAILABLE:
         return (
@@ -3780,13 +4477,36 @@ def calculate_vendor_intro_power():
         )
 
     # Get accounts (default to all)
+    account_index = get_account_index()
     account_names = body.get("accounts", [])
     if not account_names:
-        accounts = get_notion_accounts()
-        account_names = [a.get("name") for a in accounts if a.get("name")]
+        account_names = [a.get("name") for a in account_index.accounts if a.get("name")]
+
+    # Account scores decide which accounts are searched first
+    customer_scores = {}
+    for name in account_names:
+        account = account_index.get(name)
+        if account:
+            customer_scores[name] = account.get("account_score") or 0
 
     # Get fit weights
     fit_weights = body.get("fit_weights", {})
+    deadline_seconds = body.get("deadline_seconds")
+    if deadline_seconds is not None:
+        try:
+            deadline_seconds = float(deadline_seconds)
+        except (TypeError, ValueError):
+            deadline_seconds = 0.0
+        if not 0 < deadline_seconds < float("inf"):
+            return (
+                jsonify(
+                    {
+                        "error": "Invalid deadline_seconds",
+                        "message": "deadline_seconds must be a positive number of seconds",
+                    }
+                ),
+                400,
+            )
 
     try:
         logger.info(
@@ -3795,7 +4515,11 @@ def calculate_vendor_intro_power():
 
         # Run discovery
         results = vendor_discovery.discover_relationships(
-            vendors=vendors, customers=account_names, fit_weights=fit_weights
+            vendors=vendors,
+            customers=account_names,
+            fit_weights=fit_weights,
+            customer_scores=customer_scores,
+            deadline_seconds=deadline_seconds,
         )
 
         vendor_scores = results.get("vendor_scores", [])
@@ -3838,6 +4562,8 @@ def calculate_vendor_intro_power():
                 "total_accounts_analyzed": len(account_names),
                 "total_signals_found": total_signals,
                 "search_failures": results.get("search_failures", []),
+                "search_cache": results.get("search_cache", {}),
+                "pending_pairs": results.get("pending_pairs", []),
                 "methodology": {
                     "formula": "IntroScore = CoverageCount * AvgSignalStrength * FitWeight",
                     "coverage_count": "Number of target accounts with documented relationships",
@@ -3891,10 +4617,7 @@ def discover_account_vendors_endpoint(account_id: str):
         )
 
     # Get account from Notion - support both synthetic ID and Notion UUID
-    accounts = get_notion_accounts()
-    account = next(
-        (a for a in accounts if a["id"] == account_id or a.get("notion_id") == account_id), None
-    )
+    account = find_account(account_id)
 
     if not account:
         return jsonify({"error": f"Account not found: {account_id}"}), 404
@@ -3961,6 +4684,10 @@ def discover_account_vendors_endpoint(account_id: str):
 
             except Exception as e:
                 logger.warning(f"⚠️ Failed to save some vendors to Notion: {e}")
+            if saved_count:
+                invalidate_account_cache(
+                    account.get("notion_id"), accounts=False, partnerships=True
+                )
 
         # Convert dataclasses to dicts for JSON response
         vendors_json = []
@@ -4002,6 +4729,7 @@ def discover_account_vendors_endpoint(account_id: str):
                 "vendors_by_category": category_json,
                 "category_summary": {cat: len(vendors) for cat, vendors in category_json.items()},
                 "search_results_analyzed": search_results_analyzed,
+                "search_cache": results.get("search_cache", {}),
                 "saved_to_notion": saved_count,
                 "methodology": {
                     "description": "Account-centric search discovers partners mentioned in content about the target account",
@@ -4067,12 +4795,12 @@ def detect_dc_signals(account_id: str):
     - signals: List of detected DC power signals with urgency levels
     - vendor_mentions: DC rectifier vendors found in search results
     - urgency_breakdown: Signals grouped by urgency (Critical, High, Medium)
+
+    Send "Accept: text/event-stream" (or ?stream=1) to receive progress as
+    Server-Sent Events instead of a single JSON response.
     """
     # Get account from Notion - support both synthetic ID and Notion UUID
-    accounts = get_notion_accounts()
-    account = next(
-        (a for a in accounts if a["id"] == account_id or a.get("notion_id") == account_id), None
-    )
+    account = find_account(account_id)
 
     if not account:
         return jsonify({"error": "Account not found"}), 404
@@ -4098,6 +4826,21 @@ def detect_dc_signals(account_id: str):
             503,
         )
 
+    if _wants_event_stream():
+        return _event_stream_response(
+            lambda stream: _detect_dc_signals(
+                account, account_name, save_to_notion, brave_api_key, progress=stream.progress
+            )
+        )
+    payload, status_code = _detect_dc_signals(account, account_name, save_to_notion, brave_api_key)
+    return jsonify(payload), status_code
+
+
+def _detect_dc_signals(
+    account: dict, account_name: str, save_to_notion: bool, brave_api_key: str, progress=None
+) -> tuple[dict, int]:
+    """Search and score DC power signals; returns (response payload, HTTP status)"""
+    progress = progress or _no_progress
     try:
         logger.info(f"⚡ Detecting DC rectifier signals for {account_name}")
 
@@ -4144,9 +4887,6 @@ def detect_dc_signals(account_id: str):
             ],
         }
 
-        # Brave Search base URL
-        brave_url = "https://api.search.brave.com/res/v1/web/search"
-
         all_signals = []
         vendor_mentions = set()
         search_results_count = 0
@@ -4163,29 +4903,19 @@ def detect_dc_signals(account_id: str):
             "Rectifier Technologies",
         ]
 
+        progress("search", "running", queries=len(dc_queries))
         for query in dc_queries:
             try:
-                # Rate limit
-                import time
-
-                time.sleep(1.0)
-
-                response = requests.get(
-                    brave_url,
-                    params={"q": query, "count": 10, "freshness": "pm"},
-                    headers={"X-Subscription-Token": brave_api_key, "Accept": "application/json"},
-                    timeout=15,
-                )
-
-                if response.status_code != 200:
+                data = get_brave_client().search(query, {"count": 10, "freshness": "pm"})
+                if data is None:
                     logger.warning(f"Brave search failed for query: {query[:50]}...")
                     continue
 
-                data = response.json()
                 web_results = data.get("web", {}).get("results", [])
                 news_results = data.get("news", {}).get("results", [])
 
                 search_results_count += len(web_results) + len(news_results)
+                query_signals = []
 
                 # Process results
                 for result in web_results + news_results:
@@ -4225,15 +4955,25 @@ def detect_dc_signals(account_id: str):
                             "source_type": "News" if "age" in result else "Web",
                         }
                         all_signals.append(signal)
+                        query_signals.append(signal)
 
                     # Check for vendor mentions
                     for vendor in dc_vendors:
                         if vendor.lower() in combined_text:
                             vendor_mentions.add(vendor)
 
+                progress(
+                    "search",
+                    "partial",
+                    query=query,
+                    signals=query_signals,
+                    vendor_mentions=sorted(vendor_mentions),
+                )
+
             except Exception as e:
                 logger.warning(f"Error searching: {e}")
                 continue
+        progress("search", "completed", results=search_results_count, signals=len(all_signals))
 
         # Deduplicate signals by URL
         seen_urls = set()
@@ -4260,6 +5000,7 @@ def detect_dc_signals(account_id: str):
         # Save to Notion as trigger events if requested
         saved_count = 0
         if save_to_notion and unique_signals and NOTION_AVAILABLE:
+            progress("persistence", "running")
             try:
                 notion = get_notion_client()
                 account_notion_id = account.get("notion_id")
@@ -4286,10 +5027,15 @@ def detect_dc_signals(account_id: str):
 
             except Exception as e:
                 logger.warning(f"⚠️ Failed to save DC signals to Notion: {e}")
+            if saved_count:
+                invalidate_account_cache(
+                    account.get("notion_id"), accounts=False, trigger_events=True
+                )
+            progress("persistence", "completed", saved=saved_count)
 
         logger.info(f"⚡ Found {len(unique_signals)} DC signals, score: {dc_fit_score}")
 
-        return jsonify(
+        return (
             {
                 "status": "success",
                 "account_name": account_name,
@@ -4311,7 +5057,8 @@ def detect_dc_signals(account_id: str):
                     ],
                     "talk_track": "As you transition to DC power, visibility into per-rack efficiency becomes critical...",
                 },
-            }
+            },
+            200,
         )
 
     except Exception as e:
@@ -4319,7 +5066,7 @@ def detect_dc_signals(account_id: str):
         import traceback
 
         traceback.print_exc()
-        return jsonify({"error": "DC signal detection failed", "message": str(e)}), 500
+        return {"error": "DC signal detection failed", "message": str(e)}, 500
 
 
 # ============================================================================
@@ -4344,13 +5091,13 @@ def enrich_account_fields(account_id: str):
     {
         "force": false  // Force re-enrichment even if fields already populated
     }
+
+    Send "Accept: text/event-stream" (or ?stream=1) to receive progress as
+    Server-Sent Events instead of a single JSON response.
     """
     # Get account from Notion
     # Support both synthetic IDs (acc_xxxx) and full Notion UUIDs
-    accounts = get_notion_accounts()
-    account = next(
-        (a for a in accounts if a["id"] == account_id or a.get("notion_id") == account_id), None
-    )
+    account = find_account(account_id)
 
     if not account:
         return jsonify({"error": "Account not found"}), 404
@@ -4391,6 +5138,24 @@ def enrich_account_fields(account_id: str):
     if not openai_api_key:
         return jsonify({"error": "OPENAI_API_KEY not configured"}), 503
 
+    if _wants_event_stream():
+        return _event_stream_response(
+            lambda stream: _enrich_account_fields(
+                account, account_id, brave_api_key, progress=stream.progress
+            )
+        )
+    payload, status_code = _enrich_account_fields(account, account_id, brave_api_key)
+    return jsonify(payload), status_code
+
+
+def _enrich_account_fields(
+    account: dict, account_id: str, brave_api_key: str, progress=None
+) -> tuple[dict, int]:
+    """Search, extract and write back account fields; returns (response payload, HTTP status)"""
+    progress = progress or _no_progress
+    account_name = account.get("name", "")
+    notion_id = account.get("notion_id")
+
     try:
         logger.info(f"🔬 Enriching account fields for {account_name}")
         import time
@@ -4398,7 +5163,6 @@ def enrich_account_fields(account_id: str):
         start_time = time.time()
 
         # Step 1: Search for infrastructure information
-        brave_url = "https://api.search.brave.com/res/v1/web/search"
         search_queries = [
             f'"{account_name}" datacenter infrastructure GPU',
             f'"{account_name}" cloud computing hardware servers',
@@ -4406,17 +5170,11 @@ def enrich_account_fields(account_id: str):
         ]
 
         all_results = []
+        progress("search", "running", queries=len(search_queries))
         for query in search_queries:
             try:
-                time.sleep(0.5)  # Rate limit
-                response = requests.get(
-                    brave_url,
-                    params={"q": query, "count": 10},
-                    headers={"X-Subscription-Token": brave_api_key, "Accept": "application/json"},
-                    timeout=15,
-                )
-                if response.status_code == 200:
-                    data = response.json()
+                data = get_brave_client().search(query, {"count": 10})
+                if data:
                     web_results = data.get("web", {}).get("results", [])
                     for r in web_results:
                         all_results.append(
@@ -4426,8 +5184,10 @@ def enrich_account_fields(account_id: str):
                                 "url": r.get("url", ""),
                             }
                         )
+                    progress("search", "partial", query=query, results=len(web_results))
             except Exception as e:
                 logger.warning(f"Search failed for query: {query[:50]}... - {e}")
+        progress("search", "completed", results=len(all_results))
 
         # Step 2: Use GPT-4o-mini to extract infrastructure details
         search_context = "\n".join(
@@ -4454,14 +5214,16 @@ Respond ONLY with valid JSON:
 {{"physical_infrastructure": "...", "industry": "...", "employee_count_estimate": 500, "headquarters_location": "San Francisco, CA, USA", "confidence": "medium", "key_findings": ["NVIDIA H100 GPUs (from company website)", "~500 employees (from LinkedIn)"], "reasoning": "..."}}
 """
 
+        progress("extraction", "running")
         try:
-            ai_response = openai_client.chat.completions.create(
+            reply = get_llm_gateway().complete(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": extraction_prompt}],
                 max_tokens=500,
                 temperature=0.3,
+                client=lambda: openai_client,
             )
-            content = ai_response.choices[0].message.content.strip()
+            content = reply.strip()
 
             # Clean up JSON if wrapped in markdown
             if content.startswith("```"):
@@ -4484,6 +5246,13 @@ Respond ONLY with valid JSON:
         physical_infra = extracted.get("physical_infrastructure", "")[:2000]
         industry = extracted.get("industry", "Technology")
         headquarters = extracted.get("headquarters_location", "")
+        progress(
+            "extraction",
+            "completed",
+            industry=industry,
+            headquarters=headquarters,
+            confidence=extracted.get("confidence"),
+        )
 
         # Extract employee count - use AI estimate if Notion doesn't have it
         employee_estimate = extracted.get("employee_count_estimate", 0)
@@ -4492,16 +5261,20 @@ Respond ONLY with valid JSON:
                 employee_estimate = int(employee_estimate.replace(",", ""))
             except (ValueError, TypeError):
                 employee_estimate = 0
-        existing_employee_count = props.get("Employee Count", {}).get("number", 0) or 0
+        existing_employee_count = account.get("employee_count", 0) or 0
         employee_count = existing_employee_count if existing_employee_count > 0 else employee_estimate
 
+        current_biz_model = account.get("business_model", "")
+        if current_biz_model == "Unknown":
+            current_biz_model = ""
+
         # Calculate ICP score from components (Infrastructure × 35% + Business Fit × 35% + Buying Signals × 30%)
         # This ensures Notion's ICP Fit Score matches the component breakdown shown in UI
         account_data_for_scoring = {
             "name": account_name,
-            "domain": props.get("Domain", {}).get("rich_text", [{}])[0].get("text", {}).get("content", ""),
+            "domain": account.get("domain", ""),
             "Physical Infrastructure": physical_infra,
-            "business_model": props.get("Business Model", {}).get("rich_text", [{}])[0].get("text", {}).get("content", ""),
+            "business_model": current_biz_model,
             "employee_count": employee_count,
             "industry": industry,
             "data_center_locations": [headquarters] if headquarters else [],
@@ -4520,6 +5293,7 @@ Respond ONLY with valid JSON:
             # Fallback to AI-extracted score if scorer unavailable
             icp_score = min(100, max(0, extracted.get("icp_fit_score", 60)))
 
+        progress("persistence", "running", icp_fit_score=icp_score)
         try:
             notion = get_notion_client()
 
@@ -4536,7 +5310,6 @@ Respond ONLY with valid JSON:
 
             # Add headquarters to Business Model if available (for geography display)
             if headquarters:
-                current_biz_model = props.get("Business Model", {}).get("rich_text", [{}])[0].get("text", {}).get("content", "")
                 if headquarters.lower() not in current_biz_model.lower():
                     new_biz_model = f"{current_biz_model}\n\nHeadquarters: {headquarters}".strip()
                     update_properties["Business Model"] = {"rich_text": [{"text": {"content": new_biz_model[:2000]}}]}
@@ -4554,13 +5327,15 @@ Respond ONLY with valid JSON:
                 logger.warning(f"Notion update warning: {response.text[:200]}")
             else:
                 logger.info(f"✅ Updated Notion: {account_name} - ICP={icp_score}")
+                invalidate_account_cache()
 
         except Exception as e:
             logger.error(f"Notion update failed: {e}")
+        progress("persistence", "completed")
 
         duration = time.time() - start_time
 
-        return jsonify(
+        return (
             {
                 "status": "success",
                 "account_name": account_name,
@@ -4582,7 +5357,8 @@ Respond ONLY with valid JSON:
                     "model": "gpt-4o-mini",
                     "sources_count": len(source_urls),
                 },
-            }
+            },
+            200,
         )
 
     except Exception as e:
@@ -4590,7 +5366,7 @@ Respond ONLY with valid JSON:
         import traceback
 
         traceback.print_exc()
-        return jsonify({"error": "Enrichment failed", "message": str(e)}), 500
+        return {"error": "Enrichment failed", "message": str(e)}, 500
 
 
 @app.route("/api/accounts/enrich-all", methods=["POST"])
@@ -4604,12 +5380,28 @@ def enrich_all_accounts():
     POST body (optional):
     {
         "force": false,  // Force re-enrichment of all accounts
-        "max_accounts": 10  // Limit number of accounts to enrich (default: all)
+        "max_accounts": 10,  // Limit number of accounts to enrich (default: all)
+        "workers": 4  // Accounts enriched concurrently (default: ABM_BATCH_WORKERS)
     }
+
+    Highest-scored accounts are enriched first.
     """
     body = request.get_json(silent=True) or {}
     force = body.get("force", False)
     max_accounts = body.get("max_accounts", 100)
+    workers = body.get("workers")
+    if workers is not None and (
+        isinstance(workers, bool) or not isinstance(workers, int) or workers < 1
+    ):
+        return (
+            jsonify(
+                {
+                    "error": "Invalid workers",
+                    "message": "workers must be a positive integer",
+                }
+            ),
+            400,
+        )
 
     # Get all accounts
     accounts = get_notion_accounts()
@@ -4628,8 +5420,11 @@ def enrich_all_accounts():
                 {
                     "id": acc["id"],
                     "name": acc["name"],
+                    "domain": acc.get("domain", ""),
                     "notion_id": acc["notion_id"],
                     "current_icp": current_icp,
+                    "account_score": acc.get("account_score", 0),
+                    "account": acc,
                 }
             )
 
@@ -4646,59 +5441,45 @@ def enrich_all_accounts():
             }
         )
 
-    logger.info(f"🔬 Bulk enriching {len(accounts_to_enrich)} accounts")
-
-    results = []
-    success_count = 0
-    error_count = 0
-
-    for acc in accounts_to_enrich:
-        try:
-            # Make internal request to enrich-fields endpoint
-            with app.test_client() as client:
-                response = client.post(
-                    f'/api/accounts/{acc["id"]}/enrich-fields',
-                    json={"force": force},
-                    content_type="application/json",
-                )
+    brave_api_key = os.getenv("BRAVE_API_KEY")
+    if not brave_api_key:
+        return jsonify({"error": "BRAVE_API_KEY not configured"}), 503
+    if not os.getenv("OPENAI_API_KEY"):
+        return jsonify({"error": "OPENAI_API_KEY not configured"}), 503
 
-                if response.status_code == 200:
-                    data = response.get_json()
-                    success_count += 1
-                    results.append(
-                        {
-                            "account_name": acc["name"],
-                            "status": "success",
-                            "new_icp_score": data.get("enrichment_results", {}).get(
-                                "icp_fit_score", 0
-                            ),
-                        }
-                    )
-                else:
-                    error_count += 1
-                    results.append(
-                        {
-                            "account_name": acc["name"],
-                            "status": "error",
-                            "error": response.get_json().get("error", "Unknown error"),
-                        }
-                    )
+    logger.info(f"🔬 Bulk enriching {len(accounts_to_enrich)} accounts")
 
-        except Exception as e:
-            error_count += 1
-            results.append({"account_name": acc["name"], "status": "error", "error": str(e)})
+    def enrich(acc: dict) -> dict:
+        payload, status_code = _enrich_account_fields(acc["account"], acc["id"], brave_api_key)
+        if status_code != 200:
+            return {"success": False, "error": payload.get("error", "Unknown error")}
+        return {
+            "research_summary": {
+                "new_icp_score": payload.get("enrichment_results", {}).get("icp_fit_score", 0)
+            }
+        }
 
-        # Rate limit between accounts
-        import time
+    # Accounts are enriched concurrently; Brave and OpenAI calls share the
+    # process-wide provider budgets instead of a fixed sleep between accounts
+    report = BatchResearchEngine(enrich, max_workers=workers).run(accounts_to_enrich)
 
-        time.sleep(2)
+    results = []
+    for result in report["results"]:
+        entry = {"account_name": result["name"], "status": "success"}
+        if result["status"] == "succeeded":
+            entry["new_icp_score"] = result["summary"]["new_icp_score"]
+        else:
+            entry.update(status="error", error=result["error"])
+        results.append(entry)
 
     return jsonify(
         {
             "status": "completed",
             "total_accounts": len(accounts),
-            "accounts_enriched": success_count,
-            "accounts_failed": error_count,
+            "accounts_enriched": report["succeeded"],
+            "accounts_failed": report["failed"],
+            "duration_seconds": report["duration_seconds"],
+            "provider_usage": report["provider_usage"],
             "results": results,
         }
     )
@@ -4718,6 +5499,9 @@ def main():
     logger.info(f"   Debug mode: {debug}")
     logger.info("   CORS enabled for frontend development")
 
+    if not debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        # In debug mode only the reloader's child serves requests and runs jobs
+        start_research_jobs()
     app.run(host="0.0.0.0", port=port, debug=debug)
 
 
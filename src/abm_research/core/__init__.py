@@ -1,5 +1,6 @@
 """Core ABM research system components."""
 
 from .abm_system import ComprehensiveABMSystem
+from .batch_research import BatchResearchEngine
 
-__all__ = ["ComprehensiveABMSystem"]
+__all__ = ["ComprehensiveABMSystem", "BatchResearchEngine"]
@@ -9,8 +9,15 @@ Updated imports: notion_client.py (replacing notion_persistence_manager.py)
 """
 
 import logging
+import os
+import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
+
+from ..utils.brave_client import get_brave_client
+from ..utils.instrumentation import Instrumentation, span, start_collecting, stop_collecting
+from ..utils.phase_graph import Phase, run_phase_graph
+from ..utils.research_checkpoints import DEFAULT_CHECKPOINT_TTL_SECONDS, ResearchCheckpointStore
 
 # Import all phase engines from package structure
 try:
@@ -102,6 +109,11 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Project root (the same anchor the API server uses for its job-queue database)
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
 
 class ComprehensiveABMSystem:
     """
@@ -149,6 +161,23 @@ class ComprehensiveABMSystem:
             except Exception as e:
                 logger.warning(f"⚠️  Vendor discovery initialization failed: {e}")
 
+        # Phases with no dependency between them (e.g. Phase 2 and Phase 5) run concurrently
+        self.phase_workers = int(os.environ.get("ABM_PHASE_WORKERS", "2"))
+
+        # Phase outputs are checkpointed so a failed run can resume without re-spending credits
+        self.checkpoints = None
+        try:
+            self.checkpoints = ResearchCheckpointStore(
+                os.environ.get(
+                    "ABM_CHECKPOINT_DB", os.path.join(project_root, "research_checkpoints.db")
+                ),
+                ttl_seconds=float(
+                    os.environ.get("ABM_CHECKPOINT_TTL_SECONDS", DEFAULT_CHECKPOINT_TTL_SECONDS)
+                ),
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  Research checkpoints unavailable: {e}")
+
         # Initialize consolidated Notion client (UPDATED)
         self.notion_client = None
         if NOTION_CLIENT_AVAILABLE:
@@ -178,17 +207,37 @@ class ComprehensiveABMSystem:
             status = "✅ Available" if available else "❌ Not Available"
             logger.info(f"  {component}: {status}")
 
-    def conduct_complete_account_research(self, company_name: str, company_domain: str) -> dict:
+    def conduct_complete_account_research(
+        self,
+        company_name: str,
+        company_domain: str,
+        progress_callback: Optional[Callable[..., None]] = None,
+        run_id: Optional[str] = None,
+        resume: bool = False,
+    ) -> dict:
         """
         Complete 5-phase ABM research per specification
 
         Args:
             company_name: Target company name
             company_domain: Company domain for research
+            progress_callback: Optional progress(phase, status, **details), called
+                               as each phase starts/completes (e.g. for job polling)
+            run_id: Checkpoint key for this run (generated if omitted)
+            resume: Reuse unexpired checkpoints of run_id (or of the domain's
+                    latest run) and only execute the phases that are missing
 
         Returns:
             Comprehensive account intelligence dictionary
         """
+
+        def progress(phase: str, status: str, **details) -> None:
+            if progress_callback:
+                try:
+                    progress_callback(phase, status, **details)
+                except Exception as e:
+                    logger.warning(f"⚠️  Progress callback failed: {e}")
+
         logger.info(f"\n🎯 Starting ABM research for {company_name}")
         logger.info("=" * 60)
 
@@ -204,39 +253,119 @@ class ComprehensiveABMSystem:
 
         start_time = datetime.now()
 
+        checkpoints = {}
+        if resume and self.checkpoints:
+            run_id = run_id or self.checkpoints.latest_run(company_domain)
+            if run_id:
+                checkpoints = self.checkpoints.load(company_domain, run_id)
+        run_id = run_id or uuid.uuid4().hex
+        research_results["run_id"] = run_id
+        research_results["resumed_phases"] = list(checkpoints)
+        if checkpoints:
+            logger.info(f"♻️  Resuming run {run_id}: reusing {', '.join(checkpoints)}")
+
+        def checkpoint(name: str, result) -> None:
+            if self.checkpoints:
+                try:
+                    self.checkpoints.save(company_domain, run_id, name, result)
+                except Exception as e:
+                    logger.warning(f"⚠️  Could not checkpoint {name}: {e}")
+
+        def phase(name: str, title: str, work: Callable[[dict], object], summarize=None):
+            """Wrap a phase's work with its log banner, progress events and checkpoint"""
+
+            def run(results: dict):
+                logger.info(f"\n{title}")
+                if name in checkpoints:
+                    result = checkpoints[name]
+                    if name == "phase_1":
+                        # Phase 5 reads the account profile Phase 1 normally leaves behind
+                        self._current_account_data = result[0]
+                    summary = summarize(result) if summarize else {}
+                    progress(name, "completed", resumed=True, **summary)
+                    return result
+
+                progress(name, "running")
+                with span(f"phase.{name}"):
+                    result = work(results)
+                checkpoint(name, result)
+                progress(name, "completed", **(summarize(result) if summarize else {}))
+                return result
+
+            return run
+
+        # Spans of this run's phases and external calls, attached to the results
+        instrumentation = Instrumentation()
+        collecting = start_collecting(instrumentation)
+
         try:
-            # PHASE 1: Account Intelligence Baseline
-            logger.info("\n📊 PHASE 1: Account Intelligence Baseline")
-            account_data, trigger_events = self._phase_1_account_intelligence(
-                company_name, company_domain
-            )
+            # Phases as a dependency graph. Each phase reads the results of the
+            # phases it depends on; Phase 2 (contacts) and Phase 5 (partnerships)
+            # only need Phase 1, so they run side by side.
+            phases = [
+                Phase(
+                    "phase_1",
+                    phase(
+                        "phase_1",
+                        "📊 PHASE 1: Account Intelligence Baseline",
+                        lambda r: self._phase_1_account_intelligence(company_name, company_domain),
+                        lambda result: {"trigger_events": len(result[1])},
+                    ),
+                ),
+                Phase(
+                    "phase_2",
+                    phase(
+                        "phase_2",
+                        "👥 PHASE 2: Contact Discovery & Segmentation",
+                        lambda r: self._phase_2_contact_discovery(
+                            company_name, company_domain, r["phase_1"][0]
+                        ),
+                        lambda contacts: {"contacts": len(contacts)},
+                    ),
+                    depends_on=("phase_1",),
+                ),
+                Phase(
+                    "phase_3",
+                    phase(
+                        "phase_3",
+                        "🔍 PHASE 3: High-Priority Contact Enrichment",
+                        lambda r: self._phase_3_contact_enrichment(r["phase_2"]),
+                        lambda contacts: {"contacts": len(contacts)},
+                    ),
+                    depends_on=("phase_2",),
+                ),
+                Phase(
+                    "phase_4",
+                    phase(
+                        "phase_4",
+                        "🧠 PHASE 4: Engagement Intelligence",
+                        lambda r: self._phase_4_engagement_intelligence(
+                            r["phase_3"], r["phase_1"][1], r["phase_1"][0]
+                        ),
+                    ),
+                    depends_on=("phase_1", "phase_3"),
+                ),
+                Phase(
+                    "phase_5",
+                    phase(
+                        "phase_5",
+                        "🤝 PHASE 5: Strategic Partnership Intelligence",
+                        lambda r: self._phase_5_partnership_intelligence(
+                            company_name, company_domain, r["phase_1"][1]
+                        ),
+                        lambda data: {"partnerships": len(data.get("strategic_partnerships", []))},
+                    ),
+                    depends_on=("phase_1",),
+                ),
+            ]
+            phase_results = run_phase_graph(phases, max_workers=self.phase_workers)
+
+            # Merge in a fixed order, independent of which phase finished first
+            account_data, trigger_events = phase_results["phase_1"]
             research_results["account"] = account_data
             research_results["events"] = trigger_events
-
-            # PHASE 2: Contact Discovery & Segmentation
-            logger.info("\n👥 PHASE 2: Contact Discovery & Segmentation")
-            discovered_contacts = self._phase_2_contact_discovery(
-                company_name, company_domain, account_data
-            )
-            research_results["contacts"] = discovered_contacts
-
-            # PHASE 3: High-Priority Contact Enrichment
-            logger.info("\n🔍 PHASE 3: High-Priority Contact Enrichment")
-            enriched_contacts = self._phase_3_contact_enrichment(discovered_contacts)
-            research_results["contacts"] = enriched_contacts
-
-            # PHASE 4: Engagement Intelligence
-            logger.info("\n🧠 PHASE 4: Engagement Intelligence")
-            intelligence_enhanced_contacts = self._phase_4_engagement_intelligence(
-                enriched_contacts, trigger_events, account_data
-            )
-            research_results["contacts"] = intelligence_enhanced_contacts
-
-            # PHASE 5: Strategic Partnership Intelligence
-            logger.info("\n🤝 PHASE 5: Strategic Partnership Intelligence")
-            partnership_data = self._phase_5_partnership_intelligence(
-                company_name, company_domain, trigger_events
-            )
+            research_results["contacts"] = phase_results["phase_4"]
+            partnership_data = phase_results["phase_5"]
 
             # FIXED: Integrate account classification into account data
             if partnership_data.get("account_classification"):
@@ -273,14 +402,21 @@ class ComprehensiveABMSystem:
 
             # Generate comprehensive research summary
             research_results["research_summary"] = self._generate_research_summary(
-                research_results, start_time
+                research_results, start_time, instrumentation
             )
 
             # STEP 6: Persist research data to Notion (UPDATED)
             logger.info("\n💾 STEP 6: Persisting Research to Notion")
-            if self.notion_client:
+            progress("persistence", "running")
+            if "persistence" in checkpoints:
+                logger.info("♻️  Research already persisted in this run, skipping")
+                research_results["notion_persistence"] = checkpoints["persistence"]
+            elif self.notion_client:
                 try:
-                    persistence_results = self._save_complete_research_to_notion(research_results)
+                    with span("phase.persistence"):
+                        persistence_results = self._save_complete_research_to_notion(
+                            research_results
+                        )
                     research_results["notion_persistence"] = persistence_results
                     logger.info("✅ Notion persistence complete:")
                     logger.info(
@@ -290,12 +426,15 @@ class ComprehensiveABMSystem:
                     logger.info(
                         f"   🏢 Account saved: {persistence_results.get('account_saved', False)}"
                     )
+                    if "error" not in persistence_results:
+                        checkpoint("persistence", persistence_results)
                 except Exception as e:
                     logger.error(f"⚠️  Notion persistence failed: {e}")
                     research_results["notion_persistence"] = {"error": str(e)}
             else:
                 logger.warning("⚠️  Notion client not available, skipping persistence")
                 research_results["notion_persistence"] = {"skipped": "Notion client not available"}
+            progress("persistence", "completed")
 
             duration = (datetime.now() - start_time).total_seconds()
             logger.info(f"\n✅ ABM research completed in {duration:.1f} seconds")
@@ -310,6 +449,9 @@ class ComprehensiveABMSystem:
                 "research_duration_seconds": (datetime.now() - start_time).total_seconds(),
             }
             return research_results
+        finally:
+            stop_collecting(collecting)
+            research_results["instrumentation"] = instrumentation.snapshot()
 
     def _phase_1_account_intelligence(self, company_name: str, company_domain: str) -> tuple:
         """Phase 1: Account Intelligence Baseline"""
@@ -950,16 +1092,8 @@ class ComprehensiveABMSystem:
             try:
                 # Search for recent partnership/relationship news
                 query = f'"{account_name}" "{vendor_name}" partnership OR collaboration OR integration 2024'
-                headers = {"Accept": "application/json", "X-Subscription-Token": brave_api_key}
-                response = requests.get(
-                    "https://api.search.brave.com/res/v1/web/search",
-                    params={"q": query, "count": 5},
-                    headers=headers,
-                    timeout=10,
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
+                data = get_brave_client().search(query, {"count": 5}, timeout=10)
+                if data:
                     for result in data.get("web", {}).get("results", [])[:3]:
                         search_context.append(
                             {
@@ -1138,21 +1272,21 @@ Format: Start with the partnership type in caps, then provide the actionable gui
                 contact_results = self.notion_client.save_contacts(
                     research_results["contacts"], research_results["account"].get("name", "")
                 )
-                results["contacts_saved"] = sum(contact_results.values())
+                results["contacts_saved"] = contact_results["saved"]
 
             # Save trigger events
             if research_results.get("events"):
                 event_results = self.notion_client.save_trigger_events(
                     research_results["events"], research_results["account"].get("name", "")
                 )
-                results["events_saved"] = sum(event_results.values())
+                results["events_saved"] = event_results["saved"]
 
             # Save partnerships
             if research_results.get("partnerships"):
                 partnership_results = self.notion_client.save_partnerships(
                     research_results["partnerships"], research_results["account"].get("name", "")
                 )
-                results["partnerships_saved"] = sum(partnership_results.values())
+                results["partnerships_saved"] = partnership_results["saved"]
 
         except Exception as e:
             logger.error(f"Error saving to Notion: {e}")
@@ -1240,13 +1374,22 @@ Format: Start with the partnership type in caps, then provide the actionable gui
         """Determine company industry (simplified)"""
         return "Technology"  # Default industry
 
-    def _generate_research_summary(self, results: dict, start_time: datetime) -> dict:
+    def _generate_research_summary(
+        self, results: dict, start_time: datetime, instrumentation: Optional[Instrumentation] = None
+    ) -> dict:
         """Generate comprehensive research summary"""
         duration = (datetime.now() - start_time).total_seconds()
+        spans = instrumentation.snapshot() if instrumentation else {}
 
         return {
             "status": "completed",
             "research_duration_seconds": duration,
+            # Wall-clock seconds per executed phase (phases 2 and 5 overlap)
+            "phase_seconds": {
+                name.split(".", 1)[1]: stats["total_seconds"]
+                for name, stats in spans.items()
+                if name.startswith("phase.")
+            },
             "account_name": results.get("account", {}).get("name", "Unknown"),
             "contacts_discovered": len(results.get("contacts", [])),
             "trigger_events_found": len(results.get("events", [])),
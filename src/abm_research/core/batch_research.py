@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Batch research engine - research many accounts concurrently
+
+Runs up to `max_workers` accounts at a time, highest account score first.
+External calls made by the research (Apollo, Brave, OpenAI, Notion) draw
+from the process-wide provider budgets in utils.rate_limiter, so adding
+workers raises throughput only until a provider's budget is saturated and
+never exceeds it. The buckets serve waiters in arrival order, so accounts in
+flight share each provider fairly instead of one account draining it.
+
+The run ends with a summary report: per-account outcome and duration,
+throughput, and how long each provider budget made the batch wait.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Optional
+
+from ..utils.rate_limiter import PROVIDER_RATE_LIMITS, provider_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_WORKERS = 4
+
+# Account fields checked (in order) for the scheduling priority
+PRIORITY_FIELDS = ("account_score", "icp_fit_score", "priority_score")
+
+
+@dataclass
+class BatchAccountResult:
+    """Outcome of researching one account in a batch"""
+
+    name: str
+    domain: str
+    priority: float
+    status: str  # succeeded / failed
+    duration_seconds: float = 0.0
+    error: Optional[str] = None
+    summary: Optional[dict] = None
+
+
+def account_priority(account: dict) -> float:
+    """Scheduling priority of an account: its first available score, else 0"""
+    for field in PRIORITY_FIELDS:
+        value = account.get(field)
+        if isinstance(value, (int, float)):
+            return float(value)
+    return 0.0
+
+
+class BatchResearchEngine:
+    """Researches a list of accounts with bounded concurrency and shared provider budgets"""
+
+    def __init__(
+        self,
+        research_fn: Optional[Callable[[dict], dict]] = None,
+        max_workers: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            research_fn: research_fn(account) -> result dict for one account.
+                         Raising, or returning {"success": False} (with the
+                         reason in 'error' or research_summary['error']),
+                         marks the account failed. Defaults to the 5-phase
+                         pipeline of ComprehensiveABMSystem.
+            max_workers: Accounts researched at the same time
+                         (default ABM_BATCH_WORKERS or 4)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.research_fn = research_fn or self._research_with_pipeline
+        self.max_workers = max(
+            1, max_workers or int(os.environ.get("ABM_BATCH_WORKERS", DEFAULT_BATCH_WORKERS))
+        )
+        self._clock = clock
+        # The research system keeps per-account state between phases, so each
+        # worker thread gets its own instance
+        self._local = threading.local()
+
+    def _research_with_pipeline(self, account: dict) -> dict:
+        system = getattr(self._local, "system", None)
+        if system is None:
+            from .abm_system import ComprehensiveABMSystem
+
+            system = ComprehensiveABMSystem()
+            self._local.system = system
+        return system.conduct_complete_account_research(account["name"], account["domain"])
+
+    def run(
+        self, accounts: list[dict], progress_callback: Optional[Callable[..., None]] = None
+    ) -> dict[str, Any]:
+        """
+        Research accounts, highest priority first.
+
+        Args:
+            accounts: Account dicts with at least 'name' and 'domain'; accounts
+                      repeating an earlier domain are skipped
+            progress_callback: Optional progress(account_name, status, **details),
+                               'running' when an account starts and 'completed'
+                               or 'failed' when it ends
+
+        Returns:
+            Summary report (see _report)
+        """
+        progress = progress_callback or (lambda *args, **kwargs: None)
+
+        queue, seen = [], set()
+        for account in accounts:
+            key = (account.get("domain") or account.get("name") or "").strip().lower()
+            if key in seen:
+                logger.info(f"⏭️  Skipping duplicate account {account.get('name')}")
+                continue
+            seen.add(key)
+            queue.append(account)
+        # Stable sort: equal priorities keep their input order
+        queue.sort(key=account_priority, reverse=True)
+
+        usage_before = self._provider_usage()
+        started = self._clock()
+        logger.info(f"🚀 Batch research: {len(queue)} accounts, {self.max_workers} at a time")
+
+        def research(account: dict) -> BatchAccountResult:
+            name = account.get("name", "")
+            result = BatchAccountResult(
+                name=name,
+                domain=account.get("domain", ""),
+                priority=account_priority(account),
+                status="failed",
+            )
+            progress(name, "running", priority=result.priority)
+            account_started = self._clock()
+            try:
+                outcome = self.research_fn(account) or {}
+                if outcome.get("success") is False:
+                    summary = outcome.get("research_summary") or {}
+                    result.error = outcome.get("error") or summary.get("error") or "Research failed"
+                else:
+                    result.status = "succeeded"
+                    result.summary = outcome.get("research_summary")
+            except Exception as e:
+                logger.error(f"❌ Batch research failed for {name}: {e}")
+                result.error = str(e)
+            result.duration_seconds = round(self._clock() - account_started, 3)
+
+            if result.status == "succeeded":
+                progress(name, "completed", duration=result.duration_seconds)
+            else:
+                progress(name, "failed", error=result.error)
+            return result
+
+        # Accounts are submitted in priority order and the pool's queue is FIFO,
+        # so higher-scored accounts always start first
+        with ThreadPoolExecutor(self.max_workers, thread_name_prefix="batch") as executor:
+            results = list(executor.map(research, queue))
+
+        return self._report(
+            results,
+            duration=self._clock() - started,
+            skipped=len(accounts) - len(queue),
+            usage_before=usage_before,
+        )
+
+    @staticmethod
+    def _provider_usage() -> dict[str, dict[str, Any]]:
+        return {
+            provider: provider_rate_limiter(provider).stats() for provider in PROVIDER_RATE_LIMITS
+        }
+
+    def _report(
+        self,
+        results: list[BatchAccountResult],
+        duration: float,
+        skipped: int,
+        usage_before: dict[str, dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Summary of a batch: counts, throughput, provider waits and per-account results"""
+        succeeded = sum(1 for result in results if result.status == "succeeded")
+        usage_after = self._provider_usage()
+        provider_usage = {
+            provider: {
+                "rate": usage_after[provider]["rate"],
+                "requests": usage_after[provider]["acquired"] - usage_before[provider]["acquired"],
+                "wait_seconds": round(
+                    usage_after[provider]["wait_seconds_total"]
+                    - usage_before[provider]["wait_seconds_total"],
+                    3,
+                ),
+            }
+            for provider in usage_after
+        }
+        durations = [result.duration_seconds for result in results]
+
+        report = {
+            "total_accounts": len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "skipped": skipped,
+            "max_workers": self.max_workers,
+            "duration_seconds": round(duration, 3),
+            "accounts_per_minute": round(len(results) / duration * 60, 2) if duration else 0.0,
+            "avg_account_seconds": round(sum(durations) / len(durations), 3) if durations else 0.0,
+            "provider_usage": provider_usage,
+            "results": [asdict(result) for result in results],
+        }
+        logger.info(
+            f"✅ Batch research complete: {succeeded}/{len(results)} succeeded "
+            f"in {report['duration_seconds']}s ({report['accounts_per_minute']} accounts/min)"
+        )
+        return report
@@ -7,6 +7,7 @@ Prevents duplicates, ensures data consistency, and maintains clean databases
 import json
 import logging
 from collections import defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
@@ -15,6 +16,7 @@ import requests
 import schedule
 
 from ..config.manager import config_manager
+from ..utils.rate_limiter import provider_rate_limiter
 
 
 @dataclass
@@ -116,46 +118,46 @@ class ABMDataQualitySystem:
         print("🔄 BUILDING DEDUPLICATION CACHE")
         print("=" * 40)
 
-        # Cache accounts by domain and name
-        accounts = self._fetch_all_accounts()
-        for account in accounts:
-            props = account.get("properties", {})
-            domain = self._extract_rich_text(props.get("Domain", {}))
-            name = self._extract_title(props.get("Name", {}))
+        # Cache accounts by domain and name (streamed page by page)
+        for accounts in self._iter_database_pages("accounts"):
+            for account in accounts:
+                props = account.get("properties", {})
+                domain = self._extract_rich_text(props.get("Domain", {}))
+                name = self._extract_title(props.get("Name", {}))
 
-            if domain:
-                self.dedup_cache["accounts"][domain.lower()] = account["id"]
-            if name:
-                self.dedup_cache["accounts"][name.lower()] = account["id"]
+                if domain:
+                    self.dedup_cache["accounts"][domain.lower()] = account["id"]
+                if name:
+                    self.dedup_cache["accounts"][name.lower()] = account["id"]
 
         # Cache contacts by email, LinkedIn URL, and name+title combination
-        contacts = self._fetch_all_contacts()
-        for contact in contacts:
-            props = contact.get("properties", {})
-            email = self._extract_email(props.get("Email", {}))
-            linkedin_url = self._extract_url(props.get("LinkedIn URL", {}))
-            name = self._extract_title(props.get("Name", {}))
-            title = self._extract_rich_text(props.get("Title", {}))
+        for contacts in self._iter_database_pages("contacts"):
+            for contact in contacts:
+                props = contact.get("properties", {})
+                email = self._extract_email(props.get("Email", {}))
+                linkedin_url = self._extract_url(props.get("LinkedIn URL", {}))
+                name = self._extract_title(props.get("Name", {}))
+                title = self._extract_rich_text(props.get("Title", {}))
 
-            if email and email != "email_not_unlocked@domain.com":
-                self.dedup_cache["contacts"][email.lower()] = contact["id"]
-            if linkedin_url:
-                self.dedup_cache["contacts"][linkedin_url] = contact["id"]
-            if name and title:
-                name_title_key = f"{name.lower()}|{title.lower()}"
-                self.dedup_cache["contacts"][name_title_key] = contact["id"]
+                if email and email != "email_not_unlocked@domain.com":
+                    self.dedup_cache["contacts"][email.lower()] = contact["id"]
+                if linkedin_url:
+                    self.dedup_cache["contacts"][linkedin_url] = contact["id"]
+                if name and title:
+                    name_title_key = f"{name.lower()}|{title.lower()}"
+                    self.dedup_cache["contacts"][name_title_key] = contact["id"]
 
         # Cache trigger events by description + account combination
-        events = self._fetch_all_trigger_events()
-        for event in events:
-            props = event.get("properties", {})
-            description = self._extract_title(props.get("Name", {}))
-            account_relations = props.get("Account", {}).get("relation", [])
-            account_id = account_relations[0]["id"] if account_relations else "no_account"
+        for events in self._iter_database_pages("trigger_events"):
+            for event in events:
+                props = event.get("properties", {})
+                description = self._extract_title(props.get("Name", {}))
+                account_relations = props.get("Account", {}).get("relation", [])
+                account_id = account_relations[0]["id"] if account_relations else "no_account"
 
-            if description:
-                event_key = f"{description.lower()}|{account_id}"
-                self.dedup_cache["trigger_events"][event_key] = event["id"]
+                if description:
+                    event_key = f"{description.lower()}|{account_id}"
+                    self.dedup_cache["trigger_events"][event_key] = event["id"]
 
         print(f"   ✅ Cached {len(self.dedup_cache['accounts'])} account keys")
         print(f"   ✅ Cached {len(self.dedup_cache['contacts'])} contact keys")
@@ -536,26 +538,54 @@ class ABMDataQualitySystem:
         print(f"   📊 Quality report saved: {report_filename}")
 
     # Helper methods (reuse from cleanup script)
+    def _iter_database_pages(
+        self, db_key: str, max_pages: Optional[int] = None
+    ) -> Iterator[list[dict]]:
+        """
+        Yield each page of rows from a database, following Notion's next_cursor.
+
+        Requests draw from the shared "notion" rate limiter.
+
+        Raises:
+            requests.HTTPError: If Notion answers a page request with an error
+        """
+        url = f"https://api.notion.com/v1/databases/{self.database_ids[db_key]}/query"
+        body = {"page_size": 100}
+        pages_fetched = 0
+
+        while True:
+            provider_rate_limiter("notion").acquire()
+            response = requests.post(url, headers=self.headers, json=body, timeout=30)
+            # An error body has no results; yielding it would look like an empty database
+            response.raise_for_status()
+            data = response.json()
+            pages_fetched += 1
+            yield data.get("results", [])
+
+            if not data.get("has_more") or not data.get("next_cursor"):
+                return
+            if max_pages is not None and pages_fetched >= max_pages:
+                self.logger.info(f"Stopped {db_key} query after {max_pages} pages")
+                return
+            body["start_cursor"] = data["next_cursor"]
+
+    def _fetch_all(self, db_key: str, max_pages: Optional[int] = None) -> list[dict]:
+        return [row for batch in self._iter_database_pages(db_key, max_pages) for row in batch]
+
     def _fetch_all_accounts(self):
-        url = f"https://api.notion.com/v1/databases/{self.database_ids['accounts']}/query"
-        response = requests.post(url, headers=self.headers, json={"page_size": 100})
-        return response.json().get("results", [])
+        return self._fetch_all("accounts")
 
     def _fetch_all_contacts(self):
-        url = f"https://api.notion.com/v1/databases/{self.database_ids['contacts']}/query"
-        response = requests.post(url, headers=self.headers, json={"page_size": 100})
-        return response.json().get("results", [])
+        return self._fetch_all("contacts")
 
     def _fetch_all_trigger_events(self):
-        url = f"https://api.notion.com/v1/databases/{self.database_ids['trigger_events']}/query"
-        response = requests.post(url, headers=self.headers, json={"page_size": 100})
-        return response.json().get("results", [])
+        return self._fetch_all("trigger_events")
 
     def _get_total_record_count(self):
-        return (
-            len(self._fetch_all_accounts())
-            + len(self._fetch_all_contacts())
-            + len(self._fetch_all_trigger_events())
+        return sum(
+            len(batch)
+            for db_key in ("accounts", "contacts", "trigger_events")
+            for batch in self._iter_database_pages(db_key)
         )
 
     def _get_primary_account_id(self):
@@ -14,8 +14,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
-# Import existing Notion service
-from ..dashboard.dashboard_data_service import NotionDataService
+from ..integrations.notion_client import NotionClient, flatten_page_properties
 
 
 @dataclass
@@ -41,10 +40,17 @@ class HybridDataManager:
     - Bi-directional Sync: Keep both systems consistent with conflict resolution
     """
 
-    def __init__(self, db_path: str = "abm_research.db", sync_interval: int = 300):
+    def __init__(
+        self,
+        db_path: str = "abm_research.db",
+        sync_interval: int = 300,
+        full_sync_interval: int = 86400,
+    ):
         self.db_path = db_path
         self.sync_interval = sync_interval  # 5 minutes default
-        self.notion_service = NotionDataService()
+        # Delta syncs can't see deletions; reconcile with a full scan this often
+        self.full_sync_interval = full_sync_interval  # 24 hours default
+        self.notion_client = NotionClient()
 
         # Initialize database
         self._init_database()
@@ -175,6 +181,17 @@ class HybridDataManager:
             """
             )
 
+            # Delta sync high-water marks (max Notion last_edited_time seen per table)
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sync_watermarks (
+                    table_name TEXT PRIMARY KEY,
+                    high_water_mark TEXT,
+                    last_full_sync TEXT
+                )
+            """
+            )
+
             # Sync Metadata table
             cursor.execute(
                 """
@@ -589,7 +606,14 @@ class HybridDataManager:
     # ═══════════════════════════════════════════════════════════════════════════════════
 
     def sync_from_notion(self, force: bool = False) -> dict[str, SyncStatus]:
-        """Sync data from Notion to local database"""
+        """
+        Sync data from Notion to local database
+
+        Each table is synced incrementally: only pages edited on or after the
+        table's high-water mark are fetched (oldest first) and upserted. A full
+        scan runs on the first sync, every full_sync_interval seconds, or when
+        force=True; it also deletes local rows whose Notion page is gone.
+        """
         print("🔄 Starting Notion → Database sync...")
 
         tables = ["accounts", "contacts", "trigger_events", "partnerships"]
@@ -597,28 +621,55 @@ class HybridDataManager:
 
         for table_name in tables:
             try:
-                print(f"📥 Syncing {table_name}...")
-
-                # Get data from Notion
-                if table_name == "accounts":
-                    notion_data = self.notion_service.fetch_accounts()
-                elif table_name == "contacts":
-                    notion_data = self.notion_service.fetch_contacts()
-                elif table_name == "trigger_events":
-                    notion_data = self.notion_service.fetch_trigger_events()
-                elif table_name == "partnerships":
-                    notion_data = self.notion_service.fetch_partnerships()
+                high_water_mark, last_full_sync = self._get_watermark(table_name)
+                full_sync = (
+                    force
+                    or high_water_mark is None
+                    or last_full_sync is None
+                    or datetime.now() - last_full_sync >= timedelta(seconds=self.full_sync_interval)
+                )
+                print(f"📥 Syncing {table_name} ({'full' if full_sync else 'delta'})...")
+
+                # Get changed pages from Notion (every page for a full sync)
+                db_id = getattr(self.notion_client, f"{table_name}_db")
+                since = None if full_sync else high_water_mark
+                notion_data = [
+                    flatten_page_properties(page)
+                    for batch in self.notion_client.iter_changed_pages(
+                        db_id, since, operation=f"sync_{table_name}"
+                    )
+                    for page in batch
+                ]
 
                 # Update local database
                 conflicts = self._update_local_table(table_name, notion_data)
+                removed = (
+                    self._delete_missing_rows(table_name, [item["id"] for item in notion_data])
+                    if full_sync
+                    else 0
+                )
+
+                # Rows that failed to write must be fetched again, so a sync with
+                # conflicts keeps the old mark rather than skipping past them
+                edited_times = [i["last_edited_time"] for i in notion_data if i["last_edited_time"]]
+                if conflicts == 0:
+                    high_water_mark = max(
+                        edited_times + ([high_water_mark] if high_water_mark else []), default=None
+                    )
+                self._save_watermark(
+                    table_name,
+                    high_water_mark,
+                    datetime.now() if full_sync else last_full_sync,
+                )
 
                 # Update sync status
+                local_count = self._get_local_record_count(table_name)
                 sync_status = SyncStatus(
                     table_name=table_name,
                     last_notion_sync=datetime.now(),
                     last_db_update=datetime.now(),
-                    record_count_notion=len(notion_data),
-                    record_count_db=self._get_local_record_count(table_name),
+                    record_count_notion=len(notion_data) if full_sync else local_count,
+                    record_count_db=local_count,
                     sync_conflicts=conflicts,
                     sync_status="synced" if conflicts == 0 else "drift",
                 )
@@ -626,7 +677,10 @@ class HybridDataManager:
                 self._save_sync_status(sync_status)
                 sync_results[table_name] = sync_status
 
-                print(f"✅ {table_name}: {len(notion_data)} records, {conflicts} conflicts")
+                print(
+                    f"✅ {table_name}: {len(notion_data)} changed records, "
+                    f"{removed} removed, {conflicts} conflicts"
+                )
 
             except Exception as e:
                 print(f"❌ Error syncing {table_name}: {e}")
@@ -644,6 +698,60 @@ class HybridDataManager:
         self.sync_status = sync_results
         return sync_results
 
+    def _get_watermark(self, table_name: str) -> tuple:
+        """Return (high_water_mark, last_full_sync datetime) for a table"""
+        with self.get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT high_water_mark, last_full_sync FROM sync_watermarks WHERE table_name = ?",
+                (table_name,),
+            )
+            row = cursor.fetchone()
+
+        if not row:
+            return None, None
+        last_full_sync = (
+            datetime.fromisoformat(row["last_full_sync"]) if row["last_full_sync"] else None
+        )
+        return row["high_water_mark"], last_full_sync
+
+    def _save_watermark(self, table_name: str, high_water_mark, last_full_sync):
+        """Persist the high-water mark and last full sync time for a table"""
+        with self.get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO sync_watermarks
+                (table_name, high_water_mark, last_full_sync)
+                VALUES (?, ?, ?)
+            """,
+                (
+                    table_name,
+                    high_water_mark,
+                    last_full_sync.isoformat() if last_full_sync else None,
+                ),
+            )
+            conn.commit()
+
+    def _delete_missing_rows(self, table_name: str, notion_ids: list[str]) -> int:
+        """Delete rows whose Notion page wasn't in a full scan, return number removed"""
+        with self.get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("CREATE TEMP TABLE seen_notion_ids (notion_id TEXT PRIMARY KEY)")
+            cursor.executemany(
+                "INSERT OR IGNORE INTO seen_notion_ids VALUES (?)", [(i,) for i in notion_ids]
+            )
+            cursor.execute(
+                f"""
+                DELETE FROM {table_name}
+                WHERE notion_id IS NOT NULL
+                AND notion_id NOT IN (SELECT notion_id FROM seen_notion_ids)
+            """
+            )
+            removed = cursor.rowcount
+            conn.commit()
+            return removed
+
     def _update_local_table(self, table_name: str, notion_data: list[dict]) -> int:
         """Update local table with Notion data, return number of conflicts"""
         conflicts = 0
@@ -698,6 +806,8 @@ class HybridDataManager:
 
         with self.get_db_connection() as conn:
             cursor = conn.cursor()
+            cursor.execute(f"PRAGMA table_info({table_name})")
+            table_columns = [row[1] for row in cursor.fetchall()]
 
             for item in notion_data:
                 try:
@@ -711,6 +821,8 @@ class HybridDataManager:
 
                     # Map fields
                     for notion_field, value in item.items():
+                        if notion_field == "last_edited_time":
+                            continue
                         if notion_field in mapping:
                             local_field = mapping[notion_field]
                             mapped_item[local_field] = value
@@ -723,7 +835,9 @@ class HybridDataManager:
                     current_time = datetime.now().isoformat()
                     mapped_item["created_date"] = current_time
                     mapped_item["last_updated"] = current_time
-                    mapped_item["notion_last_modified"] = current_time
+                    mapped_item["notion_last_modified"] = (
+                        item.get("last_edited_time") or current_time
+                    )
 
                     # Check for existing record by notion_id
                     notion_id = mapped_item["notion_id"]
@@ -736,7 +850,7 @@ class HybridDataManager:
                         update_values = []
 
                         for key, value in mapped_item.items():
-                            if key not in ["id", "created_date"]:  # Don't update id or created_date
+                            if key not in ["id", "created_date"] and key in table_columns:
                                 update_fields.append(f"{key} = ?")
                                 update_values.append(value)
 
@@ -752,9 +866,6 @@ class HybridDataManager:
                             )
                     else:
                         # Insert new record - only insert fields that exist in the table
-                        cursor.execute(f"PRAGMA table_info({table_name})")
-                        table_columns = [row[1] for row in cursor.fetchall()]
-
                         insert_item = {k: v for k, v in mapped_item.items() if k in table_columns}
 
                         if insert_item:  # Only insert if we have valid columns
@@ -16,12 +16,22 @@ Provides unified interface for:
 import json
 import logging
 import os
+import random
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..utils.instrumentation import span
+from ..utils.rate_limiter import provider_rate_limiter
 
 # ═══════════════════════════════════════════════════════════════════════════════════
 # EXCEPTION HIERARCHY - No more silent failures!
@@ -152,6 +162,26 @@ except ImportError:
     NOTION_CLIENT_AVAILABLE = False
     logging.warning("notion-client not available, using direct API calls")
 
+# Optional HTTP/2 transport (httpx[http2]); requests.Session is the default
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+    _CONNECT_ERRORS: tuple = (
+        requests.exceptions.ConnectTimeout,
+        httpx.ConnectError,
+        httpx.ConnectTimeout,
+    )
+    _TIMEOUT_ERRORS: tuple = (requests.exceptions.Timeout, httpx.TimeoutException)
+    _CONNECTION_ERRORS: tuple = (requests.exceptions.ConnectionError, httpx.TransportError)
+    _REQUEST_ERRORS: tuple = (requests.exceptions.RequestException, httpx.HTTPError)
+except ImportError:
+    HTTPX_AVAILABLE = False
+    _CONNECT_ERRORS = (requests.exceptions.ConnectTimeout,)
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+    _CONNECTION_ERRORS = (requests.exceptions.ConnectionError,)
+    _REQUEST_ERRORS = (requests.exceptions.RequestException,)
+
 # Try to import models for type validation
 try:
     from src.models.account import Account
@@ -166,6 +196,271 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Process-wide retry counters (all NotionClient instances)
+_retry_counters = {
+    "retries": 0,
+    "rate_limited": 0,
+    "server_errors": 0,
+    "network_errors": 0,
+    "gave_up": 0,
+}
+_retry_counters_lock = threading.Lock()
+
+
+def _record_retry_event(name: str) -> None:
+    with _retry_counters_lock:
+        _retry_counters[name] += 1
+
+
+def get_retry_stats() -> dict[str, int]:
+    """Snapshot of retry counters for monitoring"""
+    with _retry_counters_lock:
+        return dict(_retry_counters)
+
+
+# Outcome placeholder for bulk-write items never started (see NotionClient._run_writes)
+_NOT_RUN = object()
+
+# Emails that Apollo returns for locked/unknown contacts - never used for matching
+PLACEHOLDER_EMAIL_MARKERS = ["unknown", "not_unlocked", "no_email", "@domain.com"]
+
+
+class ContactDedupIndex:
+    """
+    In-memory map from contact identifiers to Notion page IDs.
+
+    Built once per save_contacts batch so each contact is matched without its
+    own round of Notion queries. Keys are checked in the same order of
+    reliability as _find_existing_contact: Apollo Person ID, LinkedIn URL,
+    email, then name. The first page seen for a key wins.
+    """
+
+    KEY_ORDER = ("apollo_person_id", "linkedin_url", "email", "name")
+
+    def __init__(self):
+        self._keys: dict[str, dict[str, str]] = {key: {} for key in self.KEY_ORDER}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(kind: str, value: Optional[str]) -> str:
+        """Normalize an identifier for matching ('' means unusable)"""
+        value = (value or "").strip()
+        if not value:
+            return ""
+        if kind == "email":
+            value = value.lower()
+            if any(marker in value for marker in PLACEHOLDER_EMAIL_MARKERS):
+                return ""
+        elif kind == "linkedin_url":
+            value = value.lower().rstrip("/")
+        elif kind == "name":
+            value = " ".join(value.split()).lower()
+        return value
+
+    @classmethod
+    def identifiers(cls, contact: dict) -> dict[str, str]:
+        """Raw identifiers of an enriched contact dict"""
+        return {
+            "apollo_person_id": contact.get("apollo_person_id", "") or contact.get("id", ""),
+            "linkedin_url": contact.get("linkedin_url", ""),
+            "email": contact.get("email", ""),
+            "name": contact.get("name", ""),
+        }
+
+    @staticmethod
+    def identifiers_from_page(page: dict) -> dict[str, str]:
+        """Raw identifiers of a Notion contact page"""
+        props = page.get("properties", {})
+
+        def text(prop_name: str, prop_type: str) -> str:
+            parts = props.get(prop_name, {}).get(prop_type) or []
+            return "".join(part.get("plain_text", "") for part in parts)
+
+        return {
+            "apollo_person_id": text("Apollo Person ID", "rich_text"),
+            "linkedin_url": props.get("LinkedIn URL", {}).get("url") or "",
+            "email": props.get("Email", {}).get("email") or "",
+            "name": text("Name", "title"),
+        }
+
+    @classmethod
+    def match_keys(cls, identifiers: dict[str, str]) -> list[str]:
+        """Normalized 'kind:value' keys, for grouping contacts that may collide"""
+        keys = []
+        for kind in cls.KEY_ORDER:
+            key = cls.normalize(kind, identifiers.get(kind))
+            if key:
+                keys.append(f"{kind}:{key}")
+        return keys
+
+    def add(self, page_id: str, identifiers: dict[str, str]) -> None:
+        """Register a page under each of its usable identifiers"""
+        with self._lock:
+            for kind in self.KEY_ORDER:
+                key = self.normalize(kind, identifiers.get(kind))
+                if key:
+                    self._keys[kind].setdefault(key, page_id)
+
+    def add_page(self, page: dict) -> None:
+        """Register a Notion contact page"""
+        if page.get("id"):
+            self.add(page["id"], self.identifiers_from_page(page))
+
+    def find(self, identifiers: dict[str, str]) -> Optional[str]:
+        """Page ID of the best match, or None"""
+        with self._lock:
+            for kind in self.KEY_ORDER:
+                key = self.normalize(kind, identifiers.get(kind))
+                if key and key in self._keys[kind]:
+                    return self._keys[kind][key]
+        return None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(set().union(*(keys.values() for keys in self._keys.values())))
+
+
+def flatten_page_properties(page: dict) -> dict[str, Any]:
+    """
+    Flatten a Notion page into {"id", "last_edited_time", <property name>: value}.
+
+    Text-like properties become strings, selects their option name, relations
+    and multi-selects comma-joined strings, so rows fit scalar table columns.
+    """
+    flat: dict[str, Any] = {"id": page.get("id"), "last_edited_time": page.get("last_edited_time")}
+    for name, prop in page.get("properties", {}).items():
+        prop_type = prop.get("type") or next((k for k in prop if k not in ("id", "type")), None)
+        value = prop.get(prop_type) if prop_type else None
+
+        if prop_type in ("title", "rich_text"):
+            value = "".join(part.get("plain_text", "") for part in value or [])
+        elif prop_type in ("select", "status"):
+            value = value.get("name") if value else None
+        elif prop_type == "multi_select":
+            value = ", ".join(option.get("name", "") for option in value or [])
+        elif prop_type == "relation":
+            value = ",".join(rel.get("id", "") for rel in value or [])
+        elif prop_type == "date":
+            value = value.get("start") if value else None
+        elif prop_type == "formula":
+            value = value.get(value.get("type")) if value else None
+        elif prop_type == "people":
+            value = ", ".join(
+                person.get("name", "") or person.get("id", "") for person in value or []
+            )
+        elif isinstance(value, (dict, list)):
+            value = json.dumps(value)
+        flat[name] = value
+    return flat
+
+
+class PageMirror:
+    """
+    In-memory copy of one Notion database kept current with delta queries.
+
+    Each sync fetches only pages edited since the high-water mark and upserts
+    them. Deleted or archived pages never show up in a delta query, so every
+    full_sync_interval seconds (or on force_full) the mirror is rebuilt from a
+    full scan instead.
+    """
+
+    def __init__(
+        self,
+        full_sync_interval: float = 3600.0,
+        transform: Optional[Callable[[dict], Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        filter_properties: Optional[list[str]] = None,
+    ):
+        """
+        Args:
+            full_sync_interval: Seconds between full reconciliations
+            transform: Optional page -> stored value function (default: the raw page)
+            clock: Monotonic time source (injectable for tests)
+            filter_properties: Only fetch the properties transform needs
+        """
+        self.full_sync_interval = full_sync_interval
+        self.transform = transform or (lambda page: page)
+        self.filter_properties = filter_properties
+        self.items: dict[str, Any] = {}
+        self.high_water_mark: Optional[str] = None
+        self._clock = clock
+        self._last_full_sync: Optional[float] = None
+        # _sync_lock serializes syncs; _lock guards items and is held only to read or apply
+        self._sync_lock = threading.Lock()
+        self._lock = threading.Lock()
+
+    def values(self) -> list[Any]:
+        """Snapshot of the mirrored values, safe to iterate while a sync runs"""
+        with self._lock:
+            return list(self.items.values())
+
+    def needs_full_sync(self) -> bool:
+        return (
+            self._last_full_sync is None
+            or self._clock() - self._last_full_sync >= self.full_sync_interval
+        )
+
+    def sync(
+        self,
+        client: "NotionClient",
+        db_id: str,
+        query: Optional[dict[str, Any]] = None,
+        force_full: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Bring the mirror up to date.
+
+        Returns:
+            Dict with 'mode' ('full' or 'delta'), 'fetched' and 'removed' counts
+
+        Raises:
+            NotionError: If a query fails (the mirror is left unchanged)
+        """
+        with self._sync_lock:
+            with self._lock:
+                full = force_full or self.needs_full_sync()
+                since = None if full else self.high_water_mark
+            high_water_mark = since
+            upserts: dict[str, Any] = {}
+            archived: set[str] = set()
+            fetched = removed = 0
+
+            # Fetch without holding _lock, so readers aren't blocked by Notion round trips
+            for batch in client.iter_changed_pages(
+                db_id, since, query, filter_properties=self.filter_properties
+            ):
+                for page in batch:
+                    fetched += 1
+                    page_id = page.get("id")
+                    if not page_id:
+                        continue
+                    if page.get("archived") or page.get("in_trash"):
+                        upserts.pop(page_id, None)
+                        archived.add(page_id)
+                    else:
+                        upserts[page_id] = self.transform(page)
+                        archived.discard(page_id)
+                    edited = page.get("last_edited_time")
+                    if edited and (high_water_mark is None or edited > high_water_mark):
+                        high_water_mark = edited
+
+            with self._lock:
+                if full:
+                    removed = len(set(self.items) - set(upserts))
+                    self.items = upserts
+                    self._last_full_sync = self._clock()
+                else:
+                    for page_id in archived:
+                        removed += int(self.items.pop(page_id, None) is not None)
+                    self.items.update(upserts)
+                self.high_water_mark = high_water_mark
+
+        logger.info(
+            f"🔄 {'Full' if full else 'Delta'} sync: {fetched} pages fetched, "
+            f"{removed} removed, {len(self.items)} mirrored"
+        )
+        return {"mode": "full" if full else "delta", "fetched": fetched, "removed": removed}
+
 
 class NotionClient:
     """
@@ -173,13 +468,24 @@ class NotionClient:
     Handles both workspace setup and data operations
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        use_http2: Optional[bool] = None,
+    ):
         """
         Initialize Notion client with unified API key handling
 
         Resolves API key naming confusion by checking multiple environment variables:
         - NOTION_API_KEY (preferred standard)
         - NOTION_ABM_API_KEY (legacy from abm_config)
+
+        Args:
+            api_key: Notion integration token (falls back to environment)
+            pool_size: Max keep-alive connections (NOTION_HTTP_POOL_SIZE, default 10)
+            use_http2: Send requests over an httpx HTTP/2 client instead of
+                       requests (NOTION_HTTP2=true, requires httpx[http2])
         """
         self.setup_logging()
 
@@ -206,10 +512,31 @@ class NotionClient:
 
         # Database configuration
         self.database_ids = self._load_database_config()
-
-        # Rate limiting
+        # Property name -> ID per database, for filter_properties
+        self._property_ids: dict[str, dict[str, str]] = {}
+
+        # HTTP transport - pooled keep-alive connections shared by all requests
+        self.pool_size = pool_size or int(os.getenv("NOTION_HTTP_POOL_SIZE", "10"))
+        self.session = self._build_session(self.pool_size)
+        if use_http2 is None:
+            use_http2 = os.getenv("NOTION_HTTP2", "").lower() in ("1", "true", "yes")
+        self.http2_client = self._build_http2_client(self.pool_size) if use_http2 else None
+
+        # Rate limiting - one token bucket shared by every client in the process.
+        # Notion allows an average of 3 requests/second per integration, with short bursts.
+        # Budget: NOTION_RATE_LIMIT / NOTION_RATE_BURST (see provider_rate_limiter)
+        self.rate_limiter = provider_rate_limiter("notion")
         self.last_request_time = 0
-        self.request_delay = 0.5  # 500ms between requests
+
+        # Concurrent page writes for bulk saves; the shared rate limiter still
+        # governs the overall request rate (see _run_writes)
+        self.write_workers = max(1, int(os.getenv("NOTION_WRITE_WORKERS", "4")))
+
+        # Retry policy for transient failures (see _make_request)
+        self.max_retries = int(os.getenv("NOTION_MAX_RETRIES", "3"))
+        self.retry_budget = float(os.getenv("NOTION_RETRY_BUDGET_SECONDS", "60"))
+        self.retry_base_delay = 0.5
+        self.retry_max_delay = 20.0
 
         # Operation tracking for debugging
         self._last_operation = None
@@ -329,19 +656,124 @@ class NotionClient:
             level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
 
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # HTTP TRANSPORT - Connection pooling and transport-level retries
+    # ═══════════════════════════════════════════════════════════════════════════════════
+
+    def _build_session(self, pool_size: int) -> requests.Session:
+        """
+        Create a pooled requests.Session.
+
+        The adapter only retries failed connection attempts (nothing was sent,
+        so it's safe for POST/PATCH), e.g. a stale pooled socket. Backoff for
+        HTTP statuses and repeated failures lives in _make_request.
+        """
+        retries = Retry(
+            total=int(os.getenv("NOTION_HTTP_RETRIES", "1")),
+            connect=int(os.getenv("NOTION_HTTP_RETRIES", "1")),
+            read=0,
+            status=0,
+            backoff_factor=0.3,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retries)
+
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _build_http2_client(self, pool_size: int) -> Optional["httpx.Client"]:
+        """Create an HTTP/2 httpx client, or None if httpx/h2 aren't installed"""
+        if not HTTPX_AVAILABLE:
+            logger.warning("⚠️  NOTION_HTTP2 requested but httpx is not installed, using requests")
+            return None
+
+        try:
+            import h2  # noqa: F401 - httpx only checks for it on first connection
+
+            # Connection retries mirror the requests adapter; limits live on the transport
+            transport = httpx.HTTPTransport(
+                http2=True,
+                retries=int(os.getenv("NOTION_HTTP_RETRIES", "1")),
+                limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            )
+            client = httpx.Client(headers=self.headers, timeout=30, transport=transport)
+            logger.info("✅ Notion HTTP/2 transport enabled")
+            return client
+        except ImportError as e:
+            logger.warning(f"⚠️  HTTP/2 unavailable ({e}); install httpx[http2]. Using requests")
+            return None
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+        if self.http2_client is not None:
+            self.http2_client.close()
+
     def _rate_limit(self):
-        """Implement rate limiting for API requests"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.request_delay:
-            time.sleep(self.request_delay - elapsed)
+        """Wait for a token from the shared Notion rate budget"""
+        self.rate_limiter.acquire()
         self.last_request_time = time.time()
 
+    @staticmethod
+    def _is_idempotent(method: str, url: str) -> bool:
+        """True if repeating the request can't create duplicate data"""
+        return method.upper() in ("GET", "PATCH", "DELETE") or url.rstrip("/").endswith("/query")
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _send(self, method: str, url: str, **kwargs):
+        """Send one HTTP request over the configured transport, timed as a notion.* span"""
+        with span(self._span_name(method, url)) as call:
+            if self.http2_client is not None:
+                response = self.http2_client.request(method, url, **kwargs)
+            else:
+                response = self.session.request(method, url, **kwargs)
+            call.record_response(response)
+        return response
+
+    @staticmethod
+    def _span_name(method: str, url: str) -> str:
+        """Instrumentation name of a request: notion.query/create/update/retrieve/<method>"""
+        path = url.split("?", 1)[0].rstrip("/")
+        if path.endswith("/query"):
+            return "notion.query"
+        if method == "POST" and path.endswith("/pages"):
+            return "notion.create"
+        if method == "PATCH":
+            return "notion.update"
+        if method == "GET":
+            return "notion.retrieve"
+        return f"notion.{method.lower()}"
+
     def _make_request(
         self, method: str, url: str, operation: str = "api_request", **kwargs
     ) -> requests.Response:
         """
         Make rate-limited request to Notion API with proper error handling.
 
+        Transient failures are retried with decorrelated-jitter backoff:
+        429s (honouring Retry-After, which also pauses the shared rate limiter),
+        failures to connect, and - for idempotent requests only - 502/503/504s,
+        timeouts and dropped connections, since a create may already have been
+        applied. Retries stop after max_retries or once the next
+        wait would exceed retry_budget seconds for this call.
+
         Args:
             method: HTTP method (GET, POST, PATCH, DELETE)
             url: Full URL to request
@@ -355,61 +787,108 @@ class NotionClient:
             NotionAPIError: If the API returns an error response
             NotionError: For network errors or other failures
         """
-        self._rate_limit()
         self._last_operation = operation
         self._operation_count += 1
 
         kwargs.setdefault("headers", self.headers)
         kwargs.setdefault("timeout", 30)  # 30 second timeout
 
-        try:
-            response = requests.request(method, url, **kwargs)
-        except requests.exceptions.Timeout as e:
-            raise NotionError(
-                "Request timed out after 30 seconds",
-                code=NotionErrorCode.NETWORK_ERROR,
-                operation=operation,
-                details={"url": url, "method": method},
-                cause=e,
-            )
-        except requests.exceptions.ConnectionError as e:
-            raise NotionError(
-                "Failed to connect to Notion API",
-                code=NotionErrorCode.NETWORK_ERROR,
-                operation=operation,
-                details={"url": url},
-                cause=e,
-            )
-        except requests.exceptions.RequestException as e:
-            raise NotionError(
-                f"Request failed: {str(e)}",
-                code=NotionErrorCode.NETWORK_ERROR,
-                operation=operation,
-                cause=e,
-            )
+        idempotent = self._is_idempotent(method, url)
+        deadline = time.monotonic() + self.retry_budget
+        backoff = self.retry_base_delay
+        attempt = 0
 
-        # Check for rate limiting
-        if response.status_code == 429:
-            retry_after = response.headers.get("Retry-After", "60")
-            raise NotionError(
-                f"Rate limited. Retry after {retry_after} seconds",
-                code=NotionErrorCode.RATE_LIMITED,
-                operation=operation,
-                details={"retry_after": retry_after},
-            )
+        while True:
+            attempt += 1
+            self._rate_limit()
+            retry_after = None
+            response = None
 
-        # Check for API errors
-        if not response.ok:
-            error_msg = f"Notion API returned {response.status_code}"
-            logger.error(f"❌ {operation}: {error_msg} - {response.text[:500]}")
-            raise NotionAPIError(
-                error_msg,
-                status_code=response.status_code,
-                response_text=response.text,
-                operation=operation,
-            )
+            try:
+                response = self._send(method, url, **kwargs)
+            except _CONNECT_ERRORS as e:
+                # No connection was made, so nothing was sent
+                error = NotionError(
+                    "Failed to connect to Notion API",
+                    code=NotionErrorCode.NETWORK_ERROR,
+                    operation=operation,
+                    details={"url": url, "attempts": attempt},
+                    cause=e,
+                )
+                reason, retryable = "network_errors", True
+            except _TIMEOUT_ERRORS as e:
+                error = NotionError(
+                    "Request timed out after 30 seconds",
+                    code=NotionErrorCode.NETWORK_ERROR,
+                    operation=operation,
+                    details={"url": url, "method": method, "attempts": attempt},
+                    cause=e,
+                )
+                reason, retryable = "network_errors", idempotent
+            except _CONNECTION_ERRORS as e:
+                error = NotionError(
+                    "Failed to connect to Notion API",
+                    code=NotionErrorCode.NETWORK_ERROR,
+                    operation=operation,
+                    details={"url": url, "attempts": attempt},
+                    cause=e,
+                )
+                reason, retryable = "network_errors", idempotent
+            except _REQUEST_ERRORS as e:
+                raise NotionError(
+                    f"Request failed: {str(e)}",
+                    code=NotionErrorCode.NETWORK_ERROR,
+                    operation=operation,
+                    cause=e,
+                )
 
-        return response
+            if response is not None:
+                status = response.status_code
+                if status < 400:
+                    return response
+
+                if status == 429:
+                    retry_after_header = response.headers.get("Retry-After", "60")
+                    retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+                    error = NotionError(
+                        f"Rate limited. Retry after {retry_after_header} seconds",
+                        code=NotionErrorCode.RATE_LIMITED,
+                        operation=operation,
+                        details={"retry_after": retry_after_header, "attempts": attempt},
+                    )
+                    reason, retryable = "rate_limited", True
+                else:
+                    error = NotionAPIError(
+                        f"Notion API returned {status}",
+                        status_code=status,
+                        response_text=response.text,
+                        operation=operation,
+                    )
+                    reason = "server_errors"
+                    retryable = status in (502, 503, 504) and idempotent
+
+            # Decorrelated jitter: sleep = min(cap, uniform(base, previous * 3))
+            backoff = min(self.retry_max_delay, random.uniform(self.retry_base_delay, backoff * 3))
+            wait = max(backoff, retry_after or 0.0)
+            if retryable:
+                _record_retry_event(reason)
+
+            if not retryable or attempt > self.max_retries or time.monotonic() + wait > deadline:
+                if retryable:
+                    _record_retry_event("gave_up")
+                if isinstance(error, NotionAPIError):
+                    logger.error(f"❌ {operation}: {error.message} - {error.response_text[:500]}")
+                raise error
+
+            _record_retry_event("retries")
+            logger.warning(
+                f"🔁 {operation}: {error.message}; retry {attempt}/{self.max_retries} "
+                f"in {wait:.1f}s"
+            )
+            if retry_after:
+                # Every thread sharing the bucket backs off, not just this one
+                self.rate_limiter.pause(retry_after)
+            time.sleep(wait)
 
     def _parse_json_response(
         self, response: requests.Response, operation: str = "parse_response"
@@ -439,7 +918,10 @@ class NotionClient:
         silently returning empty list.
         """
         data = self._parse_json_response(response, operation)
+        return self._results_from_data(data, operation)
 
+    def _results_from_data(self, data: dict[str, Any], operation: str) -> list[dict]:
+        """Validate and return the 'results' array from a parsed response body"""
         if "results" not in data:
             # Log warning but don't fail - some endpoints don't return results
             logger.warning(
@@ -805,6 +1287,50 @@ class NotionClient:
 
         results = {"results": {}, "saved": 0, "failed": 0, "skipped": 0, "errors": []}
 
+        to_save = [c for c in contacts if c.get("final_lead_score") or c.get("lead_score")]
+        # One batched lookup for the whole batch instead of up to 4 queries per contact
+        try:
+            dedup_index = self._build_contact_index(to_save)
+            indexed = True
+        except Exception as e:
+            if fail_fast:
+                raise
+            # Fall back to per-contact lookups; failures are then reported per contact
+            logger.warning(f"⚠️ Contact index unavailable, looking up contacts singly: {e}")
+            dedup_index, indexed = ContactDedupIndex(), False
+        # Resolve the Account relation once rather than once per created contact
+        account_id = self._find_existing_account(account_name) if to_save and account_name else None
+
+        def write(contact: dict) -> str:
+            contact_name = contact.get("name", "unknown")
+            # Check for existing contact using multiple identifiers
+            # Apollo Person ID is most reliable, followed by LinkedIn URL
+            identifiers = ContactDedupIndex.identifiers(contact)
+            existing_id = dedup_index.find(identifiers)
+            if not existing_id and not indexed:
+                existing_id = self._find_existing_contact(account_name=account_name, **identifiers)
+
+            if existing_id:
+                logger.info(f"📝 Updating existing contact: {contact_name}")
+                page_id = self._update_contact(existing_id, contact)
+            else:
+                page_id = self._create_contact(contact, account_name, account_id=account_id)
+
+            if not page_id:
+                raise NotionError(
+                    f"No page ID returned for {contact_name}", operation="save_contacts"
+                )
+            # Later duplicates in this batch update this page instead
+            dedup_index.add(page_id, identifiers)
+            return page_id
+
+        # Contacts sharing an identifier run in order on one worker, so the
+        # first creates the page and the rest update it
+        groups = self._group_by_keys(
+            [ContactDedupIndex.match_keys(ContactDedupIndex.identifiers(c)) for c in to_save]
+        )
+        outcomes = iter(self._run_writes(to_save, write, groups=groups, fail_fast=fail_fast))
+
         for contact in contacts:
             contact_name = contact.get("name", "unknown")
             try:
@@ -818,29 +1344,14 @@ class NotionClient:
                     }
                     continue
 
-                # Check for existing contact using multiple identifiers
-                # Apollo Person ID is most reliable, followed by LinkedIn URL
-                existing_id = self._find_existing_contact(
-                    apollo_person_id=contact.get("apollo_person_id", "") or contact.get("id", ""),
-                    linkedin_url=contact.get("linkedin_url", ""),
-                    email=contact.get("email", ""),
-                    name=contact.get("name", ""),
-                    account_name=account_name,
-                )
+                page_id = next(outcomes)
+                if page_id is _NOT_RUN:
+                    continue  # fail_fast stopped the pipeline before this one
+                if isinstance(page_id, Exception):
+                    raise page_id
 
-                if existing_id:
-                    logger.info(f"📝 Updating existing contact: {contact_name}")
-                    page_id = self._update_contact(existing_id, contact)
-                else:
-                    page_id = self._create_contact(contact, account_name)
-
-                if page_id:
-                    results["saved"] += 1
-                    results["results"][contact_name] = {"status": "saved", "page_id": page_id}
-                else:
-                    raise NotionError(
-                        f"No page ID returned for {contact_name}", operation="save_contacts"
-                    )
+                results["saved"] += 1
+                results["results"][contact_name] = {"status": "saved", "page_id": page_id}
 
             except NotionError as e:
                 results["failed"] += 1
@@ -895,17 +1406,26 @@ class NotionClient:
 
         results = {"results": {}, "saved": 0, "failed": 0, "errors": []}
 
-        for event in events:
+        account_id = self._find_existing_account(account_name) if events and account_name else None
+
+        def write(event: dict) -> str:
+            page_id = self._create_trigger_event(event, account_name, account_id=account_id)
+            if not page_id:
+                raise NotionError("No page ID returned for event", operation="save_trigger_events")
+            return page_id
+
+        outcomes = self._run_writes(events, write, fail_fast=fail_fast)
+
+        for event, page_id in zip(events, outcomes):
             event_desc = event.get("description", event.get("event_description", "unknown"))[:50]
             try:
-                page_id = self._create_trigger_event(event, account_name)
-                if page_id:
-                    results["saved"] += 1
-                    results["results"][event_desc] = {"status": "saved", "page_id": page_id}
-                else:
-                    raise NotionError(
-                        "No page ID returned for event", operation="save_trigger_events"
-                    )
+                if page_id is _NOT_RUN:
+                    continue  # fail_fast stopped the pipeline before this one
+                if isinstance(page_id, Exception):
+                    raise page_id
+
+                results["saved"] += 1
+                results["results"][event_desc] = {"status": "saved", "page_id": page_id}
 
             except NotionError as e:
                 results["failed"] += 1
@@ -950,17 +1470,37 @@ class NotionClient:
 
         results = {"results": {}, "saved": 0, "failed": 0, "errors": []}
 
-        for partnership in partnerships:
+        account_id = (
+            self._find_existing_account(account_name) if partnerships and account_name else None
+        )
+
+        def write(partnership: dict) -> str:
+            page_id = self._create_partnership(partnership, account_name, account_id=account_id)
+            if not page_id:
+                raise NotionError(
+                    "No page ID returned for partnership", operation="save_partnerships"
+                )
+            return page_id
+
+        # _create_partnership dedups by vendor name, so one vendor's rows run in order
+        groups = self._group_by_keys(
+            [
+                [str(p.get("partner_name", p.get("name", p.get("account_name", "")))).lower()]
+                for p in partnerships
+            ]
+        )
+        outcomes = self._run_writes(partnerships, write, groups=groups, fail_fast=fail_fast)
+
+        for partnership, page_id in zip(partnerships, outcomes):
             partner_name = partnership.get("partner_name", partnership.get("name", "unknown"))
             try:
-                page_id = self._create_partnership(partnership, account_name)
-                if page_id:
-                    results["saved"] += 1
-                    results["results"][partner_name] = {"status": "saved", "page_id": page_id}
-                else:
-                    raise NotionError(
-                        "No page ID returned for partnership", operation="save_partnerships"
-                    )
+                if page_id is _NOT_RUN:
+                    continue  # fail_fast stopped the pipeline before this one
+                if isinstance(page_id, Exception):
+                    raise page_id
+
+                results["saved"] += 1
+                results["results"][partner_name] = {"status": "saved", "page_id": page_id}
 
             except NotionError as e:
                 results["failed"] += 1
@@ -990,30 +1530,203 @@ class NotionClient:
         return results
 
     # ═══════════════════════════════════════════════════════════════════════════════════
-    # DEDUPLICATION HELPERS
+    # BULK WRITES - Bounded concurrent page creates/updates
     # ═══════════════════════════════════════════════════════════════════════════════════
 
-    def _find_existing_account(self, company_name: str) -> Optional[str]:
-        """Find existing account by company name"""
-        if not self.database_ids.get("accounts") or not company_name:
-            return None
+    @staticmethod
+    def _group_by_keys(keys_per_item: list[list[str]]) -> list[list[int]]:
+        """
+        Group item indexes that share any key (transitively), keeping input order.
 
-        try:
-            query = {"filter": {"property": "Name", "title": {"equals": company_name}}}
+        Items with no keys get a group of their own.
+        """
+        parent = list(range(len(keys_per_item)))
+
+        def root(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        first_with_key: dict[str, int] = {}
+        for i, keys in enumerate(keys_per_item):
+            for key in keys:
+                if not key:
+                    continue
+                if key in first_with_key:
+                    a, b = root(first_with_key[key]), root(i)
+                    parent[max(a, b)] = min(a, b)
+                else:
+                    first_with_key[key] = i
 
-            url = f"https://api.notion.com/v1/databases/{self.database_ids['accounts']}/query"
-            response = self._make_request("POST", url, json=query)
+        groups: dict[int, list[int]] = {}
+        for i in range(len(keys_per_item)):
+            groups.setdefault(root(i), []).append(i)
+        return list(groups.values())
 
-            results = response.json().get("results", [])
-            return results[0]["id"] if results else None
+    def _run_writes(
+        self,
+        items: list[dict],
+        write,
+        groups: Optional[list[list[int]]] = None,
+        fail_fast: bool = False,
+    ) -> list[Any]:
+        """
+        Run write(item) for every item on a pool of write_workers threads.
 
-        except Exception as e:
-            logger.error(f"Error finding existing account: {e}")
-            return None
+        Each group of item indexes runs sequentially on one worker (for items
+        that must not race, e.g. duplicates); groups run concurrently. Request
+        pacing comes from the shared rate limiter in _make_request, so more
+        workers only overlap request latency, never exceed the Notion budget.
+
+        Returns:
+            One outcome per item, in input order: the write's return value,
+            the exception it raised, or _NOT_RUN if fail_fast stopped the
+            pipeline before the item started.
+        """
+        outcomes: list[Any] = [_NOT_RUN] * len(items)
+        if groups is None:
+            groups = [[i] for i in range(len(items))]
+        stop = threading.Event()
+
+        def run_group(group: list[int]) -> None:
+            for i in group:
+                if stop.is_set():
+                    return
+                try:
+                    outcomes[i] = write(items[i])
+                except Exception as e:
+                    outcomes[i] = e
+                    if fail_fast:
+                        stop.set()
+
+        workers = min(self.write_workers, len(groups))
+        if workers <= 1:
+            for group in groups:
+                run_group(group)
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notion-write") as pool:
+                list(pool.map(run_group, groups))
+        return outcomes
+
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # DATABASE QUERIES - Cursor pagination (Notion returns at most 100 rows per call)
+    # ═══════════════════════════════════════════════════════════════════════════════════
 
-    def query_all_accounts(self) -> list[dict]:
+    MAX_PAGE_SIZE = 100
+
+    def iter_database_pages(
+        self,
+        db_id: str,
+        query: Optional[dict[str, Any]] = None,
+        operation: str = "query_database",
+        page_size: int = MAX_PAGE_SIZE,
+        max_pages: Optional[int] = None,
+        filter_properties: Optional[list[str]] = None,
+    ) -> Iterator[list[dict]]:
         """
-        Query all accounts from Notion database.
+        Query a database and yield each page of results as it arrives.
+
+        Follows next_cursor until has_more is False, so callers can process
+        large databases without holding every row in memory.
+
+        Args:
+            db_id: Database ID to query
+            query: Query body (filter, sorts); start_cursor/page_size are managed here
+            operation: Operation name for error context and logs
+            page_size: Rows per request (capped at 100)
+            max_pages: Stop after this many requests (None = all pages)
+            filter_properties: Only return these properties (names or IDs) on
+                               each row; None returns every property
+
+        Raises:
+            NotionAPIError: If any page request fails
+            NotionParseError: If a response is malformed
+        """
+        url = f"https://api.notion.com/v1/databases/{db_id}/query"
+        body = dict(query or {})
+        body["page_size"] = max(1, min(page_size, self.MAX_PAGE_SIZE))
+        body.pop("start_cursor", None)
+        params = None
+        if filter_properties is not None:
+            params = [
+                ("filter_properties", prop_id)
+                for prop_id in self.resolve_property_ids(db_id, filter_properties)
+            ]
+
+        pages_fetched = 0
+        while True:
+            response = self._make_request(
+                "POST", url, json=dict(body), params=params, operation=operation
+            )
+            data = self._parse_json_response(response, operation)
+            pages_fetched += 1
+
+            yield self._results_from_data(data, operation)
+
+            next_cursor = data.get("next_cursor")
+            if not data.get("has_more") or not next_cursor:
+                return
+            if max_pages is not None and pages_fetched >= max_pages:
+                logger.info(
+                    f"⏹️ {operation}: stopped after max_pages={max_pages}, more rows remain"
+                )
+                return
+            body["start_cursor"] = next_cursor
+
+    def query_database(
+        self,
+        db_id: str,
+        query: Optional[dict[str, Any]] = None,
+        operation: str = "query_database",
+        page_size: int = MAX_PAGE_SIZE,
+        max_pages: Optional[int] = None,
+        filter_properties: Optional[list[str]] = None,
+    ) -> list[dict]:
+        """Collect every row from iter_database_pages() into one list"""
+        results = []
+        for batch in self.iter_database_pages(
+            db_id, query, operation, page_size, max_pages, filter_properties
+        ):
+            results.extend(batch)
+        return results
+
+    def resolve_property_ids(self, db_id: str, names: list[str]) -> list[str]:
+        """
+        Map property names to the property IDs that filter_properties expects.
+
+        The database schema is fetched once per client and cached. Values
+        that are neither a property name nor ID in the schema are dropped, so
+        callers can list alternative names (e.g. "Name" and "Account Name").
+        """
+        property_ids = self._property_ids.get(db_id)
+        if property_ids is None:
+            url = f"https://api.notion.com/v1/databases/{db_id}"
+            response = self._make_request("GET", url, operation="get_database_schema")
+            schema = self._parse_json_response(response, "get_database_schema")
+            property_ids = {
+                name: prop.get("id", name) for name, prop in schema.get("properties", {}).items()
+            }
+            self._property_ids[db_id] = property_ids
+        known_ids = set(property_ids.values())
+        return [
+            property_ids.get(name, name)
+            for name in names
+            if name in property_ids or name in known_ids
+        ]
+
+    @staticmethod
+    def _account_relation_query(account_id: Optional[str]) -> dict[str, Any]:
+        """Query body filtering on the Account relation (empty when no account)"""
+        if not account_id:
+            return {}
+        return {"filter": {"property": "Account", "relation": {"contains": account_id}}}
+
+    def iter_all_accounts(
+        self, max_pages: Optional[int] = None, filter_properties: Optional[list[str]] = None
+    ) -> Iterator[list[dict]]:
+        """
+        Yield pages of account rows (only filter_properties, if given).
 
         Raises:
             NotionConfigError: If accounts database not configured
@@ -1021,63 +1734,150 @@ class NotionClient:
         """
         # Use property accessor to ensure config - raises if not configured
         db_id = self.accounts_db
+        return self.iter_database_pages(
+            db_id,
+            {},
+            "query_all_accounts",
+            max_pages=max_pages,
+            filter_properties=filter_properties,
+        )
 
-        url = f"https://api.notion.com/v1/databases/{db_id}/query"
-        response = self._make_request("POST", url, json={}, operation="query_all_accounts")
-
-        results = self._extract_results(response, "query_all_accounts")
-        logger.info(f"✅ Retrieved {len(results)} accounts from Notion")
-        return results
-
-    def query_all_contacts(self, account_id: Optional[str] = None) -> list[dict]:
+    def iter_all_contacts(
+        self,
+        account_id: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        filter_properties: Optional[list[str]] = None,
+    ) -> Iterator[list[dict]]:
         """
-        Query all contacts from Notion database, optionally filtered by account.
+        Yield pages of contact rows, optionally filtered by account and
+        projected to filter_properties.
 
         Raises:
             NotionConfigError: If contacts database not configured
             NotionAPIError: If API call fails
         """
-        # Use property accessor to ensure config - raises if not configured
         db_id = self.contacts_db
+        query = self._account_relation_query(account_id)
+        return self.iter_database_pages(
+            db_id,
+            query,
+            "query_all_contacts",
+            max_pages=max_pages,
+            filter_properties=filter_properties,
+        )
 
-        url = f"https://api.notion.com/v1/databases/{db_id}/query"
-        query = {}
+    def iter_all_trigger_events(
+        self,
+        account_id: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        filter_properties: Optional[list[str]] = None,
+    ) -> Iterator[list[dict]]:
+        """
+        Yield pages of trigger event rows, optionally filtered by account and
+        projected to filter_properties.
 
-        # Filter by account relation if provided
-        if account_id:
-            query = {"filter": {"property": "Account", "relation": {"contains": account_id}}}
+        Raises:
+            NotionConfigError: If trigger_events database not configured
+            NotionAPIError: If API call fails
+        """
+        db_id = self.trigger_events_db
+        query = self._account_relation_query(account_id)
+        return self.iter_database_pages(
+            db_id,
+            query,
+            "query_all_trigger_events",
+            max_pages=max_pages,
+            filter_properties=filter_properties,
+        )
 
-        response = self._make_request("POST", url, json=query, operation="query_all_contacts")
+    def iter_all_partnerships(
+        self,
+        account_id: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        filter_properties: Optional[list[str]] = None,
+    ) -> Iterator[list[dict]]:
+        """
+        Yield pages of partnership rows, optionally filtered by account and
+        projected to filter_properties.
 
-        results = self._extract_results(response, "query_all_contacts")
-        logger.info(f"✅ Retrieved {len(results)} contacts from Notion")
-        return results
+        Raises:
+            NotionConfigError: If partnerships database not configured
+            NotionAPIError: If API call fails
+        """
+        db_id = self.partnerships_db
+        query = self._account_relation_query(account_id)
+        return self.iter_database_pages(
+            db_id,
+            query,
+            "query_all_partnerships",
+            max_pages=max_pages,
+            filter_properties=filter_properties,
+        )
 
-    def query_all_trigger_events(self, account_id: Optional[str] = None) -> list[dict]:
+    def query_all_accounts(
+        self, max_pages: Optional[int] = None, filter_properties: Optional[list[str]] = None
+    ) -> list[dict]:
         """
-        Query all trigger events from Notion database, optionally filtered by account.
+        Query all accounts from Notion database (every page unless max_pages is set).
 
         Raises:
-            NotionConfigError: If trigger_events database not configured
+            NotionConfigError: If accounts database not configured
             NotionAPIError: If API call fails
         """
-        # Use property accessor to ensure config - raises if not configured
-        db_id = self.trigger_events_db
+        results = [
+            row for batch in self.iter_all_accounts(max_pages, filter_properties) for row in batch
+        ]
+        logger.info(f"✅ Retrieved {len(results)} accounts from Notion")
+        return results
 
-        url = f"https://api.notion.com/v1/databases/{db_id}/query"
-        query = {}
+    def query_all_contacts(
+        self,
+        account_id: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        filter_properties: Optional[list[str]] = None,
+    ) -> list[dict]:
+        """
+        Query all contacts from Notion database, optionally filtered by account.
 
-        # Filter by account relation if provided
-        if account_id:
-            query = {"filter": {"property": "Account", "relation": {"contains": account_id}}}
+        Raises:
+            NotionConfigError: If contacts database not configured
+            NotionAPIError: If API call fails
+        """
+        results = [
+            row
+            for batch in self.iter_all_contacts(account_id, max_pages, filter_properties)
+            for row in batch
+        ]
+        logger.info(f"✅ Retrieved {len(results)} contacts from Notion")
+        return results
 
-        response = self._make_request("POST", url, json=query, operation="query_all_trigger_events")
+    def query_all_trigger_events(
+        self,
+        account_id: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        filter_properties: Optional[list[str]] = None,
+    ) -> list[dict]:
+        """
+        Query all trigger events from Notion database, optionally filtered by account.
 
-        results = self._extract_results(response, "query_all_trigger_events")
+        Raises:
+            NotionConfigError: If trigger_events database not configured
+            NotionAPIError: If API call fails
+        """
+        results = [
+            row
+            for batch in self.iter_all_trigger_events(account_id, max_pages, filter_properties)
+            for row in batch
+        ]
         logger.info(f"✅ Retrieved {len(results)} trigger events from Notion")
         return results
 
-    def query_all_partnerships(self, account_id: Optional[str] = None) -> list[dict]:
+    def query_all_partnerships(
+        self,
+        account_id: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        filter_properties: Optional[list[str]] = None,
+    ) -> list[dict]:
         """
         Query all partnerships from Notion database, optionally filtered by account.
 
@@ -1085,21 +1885,114 @@ class NotionClient:
             NotionConfigError: If partnerships database not configured
             NotionAPIError: If API call fails
         """
-        # Use property accessor to ensure config - raises if not configured
-        db_id = self.partnerships_db
+        results = [
+            row
+            for batch in self.iter_all_partnerships(account_id, max_pages, filter_properties)
+            for row in batch
+        ]
+        logger.info(f"✅ Retrieved {len(results)} partnerships from Notion")
+        return results
 
-        url = f"https://api.notion.com/v1/databases/{db_id}/query"
-        query = {}
+    def get_page(self, page_id: str) -> dict:
+        """
+        Retrieve a single page by ID.
 
-        # Filter by account relation if provided
-        if account_id:
-            query = {"filter": {"property": "Account", "relation": {"contains": account_id}}}
+        Raises:
+            NotionValidationError: If page_id is empty
+            NotionNotFoundError: If the page doesn't exist or isn't shared
+            NotionAPIError: If API call fails
+        """
+        if not page_id:
+            raise NotionValidationError(
+                "Cannot retrieve page without page_id",
+                field="page_id",
+                value=page_id,
+                operation="get_page",
+            )
 
-        response = self._make_request("POST", url, json=query, operation="query_all_partnerships")
+        url = f"https://api.notion.com/v1/pages/{page_id}"
+        try:
+            response = self._make_request("GET", url, operation=f"get_page({page_id[:8]}...)")
+        except NotionAPIError as e:
+            if e.status_code == 404:
+                raise NotionNotFoundError(
+                    f"Page {page_id} not found",
+                    resource_type="page",
+                    resource_id=page_id,
+                    operation="get_page",
+                    cause=e,
+                )
+            raise
 
-        results = self._extract_results(response, "query_all_partnerships")
-        logger.info(f"✅ Retrieved {len(results)} partnerships from Notion")
-        return results
+        return self._parse_json_response(response, "get_page")
+
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # DELTA SYNC - Only pages edited since a high-water mark
+    # ═══════════════════════════════════════════════════════════════════════════════════
+
+    def iter_changed_pages(
+        self,
+        db_id: str,
+        since: Optional[str] = None,
+        query: Optional[dict[str, Any]] = None,
+        operation: str = "query_changed_pages",
+        max_pages: Optional[int] = None,
+        filter_properties: Optional[list[str]] = None,
+    ) -> Iterator[list[dict]]:
+        """
+        Yield pages edited on or after `since`, oldest edit first.
+
+        Notion rounds last_edited_time to the minute, so the boundary minute
+        is re-read on the next call; callers should upsert idempotently.
+        With since=None every page is returned (a full scan, same order).
+
+        Args:
+            db_id: Database ID to query
+            since: ISO timestamp high-water mark from a previous sync
+            query: Extra query body; its filter is AND-ed with the time filter
+            operation: Operation name for error context and logs
+            max_pages: Stop after this many requests (None = all pages)
+            filter_properties: Only return these properties on each page
+        """
+        body = dict(query or {})
+        if since:
+            time_filter = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": since},
+            }
+            body["filter"] = (
+                {"and": [body["filter"], time_filter]} if body.get("filter") else time_filter
+            )
+        body["sorts"] = [{"timestamp": "last_edited_time", "direction": "ascending"}]
+        return self.iter_database_pages(
+            db_id,
+            body,
+            operation=operation,
+            max_pages=max_pages,
+            filter_properties=filter_properties,
+        )
+
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # DEDUPLICATION HELPERS
+    # ═══════════════════════════════════════════════════════════════════════════════════
+
+    def _find_existing_account(self, company_name: str) -> Optional[str]:
+        """Find existing account by company name"""
+        if not self.database_ids.get("accounts") or not company_name:
+            return None
+
+        try:
+            query = {"filter": {"property": "Name", "title": {"equals": company_name}}}
+
+            url = f"https://api.notion.com/v1/databases/{self.database_ids['accounts']}/query"
+            response = self._make_request("POST", url, json=query)
+
+            results = response.json().get("results", [])
+            return results[0]["id"] if results else None
+
+        except Exception as e:
+            logger.error(f"Error finding existing account: {e}")
+            return None
 
     def _find_existing_contact(
         self,
@@ -1153,9 +2046,7 @@ class NotionClient:
                 return results[0]["id"]
 
         # Try email next (excluding placeholder emails)
-        if email and not any(
-            p in email.lower() for p in ["unknown", "not_unlocked", "no_email", "@domain.com"]
-        ):
+        if email and not any(p in email.lower() for p in PLACEHOLDER_EMAIL_MARKERS):
             query = {"filter": {"property": "Email", "email": {"equals": email}}}
             response = self._make_request(
                 "POST", url, json=query, operation="find_existing_contact"
@@ -1179,6 +2070,55 @@ class NotionClient:
 
         return None
 
+    # Conditions per OR query when building the contact index
+    CONTACT_INDEX_FILTER_CHUNK = 50
+
+    def _build_contact_index(self, contacts: list[dict]) -> ContactDedupIndex:
+        """
+        Load every existing contact that could match this batch into an index.
+
+        Instead of _find_existing_contact's up-to-four queries per contact, the
+        batch's identifiers are combined into a few paginated OR queries
+        (CONTACT_INDEX_FILTER_CHUNK conditions each).
+
+        Raises for API failures, like _find_existing_contact.
+        """
+        index = ContactDedupIndex()
+        conditions = []
+        seen = set()
+        for contact in contacts:
+            for kind, value in ContactDedupIndex.identifiers(contact).items():
+                value = (value or "").strip()
+                if not ContactDedupIndex.normalize(kind, value) or (kind, value) in seen:
+                    continue
+                seen.add((kind, value))
+                if kind == "apollo_person_id":
+                    conditions.append(
+                        {"property": "Apollo Person ID", "rich_text": {"equals": value}}
+                    )
+                elif kind == "linkedin_url":
+                    conditions.append({"property": "LinkedIn URL", "url": {"equals": value}})
+                elif kind == "email":
+                    conditions.append({"property": "Email", "email": {"equals": value}})
+                else:
+                    conditions.append({"property": "Name", "title": {"equals": value}})
+
+        if not conditions:
+            return index
+
+        db_id = self.contacts_db
+        chunk_size = self.CONTACT_INDEX_FILTER_CHUNK
+        for start in range(0, len(conditions), chunk_size):
+            query = {"filter": {"or": conditions[start : start + chunk_size]}}
+            for batch in self.iter_database_pages(db_id, query, operation="build_contact_index"):
+                for page in batch:
+                    index.add_page(page)
+
+        logger.debug(
+            f"Contact dedup index: {len(index)} existing pages for {len(contacts)} contacts"
+        )
+        return index
+
     # ═══════════════════════════════════════════════════════════════════════════════════
     # CREATE OPERATIONS
     # ═══════════════════════════════════════════════════════════════════════════════════
@@ -1209,14 +2149,15 @@ class NotionClient:
         response = self._make_request("POST", "https://api.notion.com/v1/pages", json=data)
         return response.json().get("id")
 
-    def _create_contact(self, contact: dict, account_name: str = "") -> Optional[str]:
+    def _create_contact(
+        self, contact: dict, account_name: str = "", account_id: Optional[str] = None
+    ) -> Optional[str]:
         """Create new contact record with proper Account relation and enhanced fields"""
         # Handle URL field properly - use null instead of empty string
         linkedin_url = contact.get("linkedin_url", "") or None
 
         # CRITICAL FIX: Find the actual account to create proper relation
-        account_id = None
-        if account_name:
+        if account_id is None and account_name:
             account_id = self._find_existing_account(account_name)
 
         properties = {
@@ -1254,14 +2195,15 @@ class NotionClient:
         response = self._make_request("POST", "https://api.notion.com/v1/pages", json=data)
         return response.json().get("id")
 
-    def _create_trigger_event(self, event: dict, account_name: str = "") -> Optional[str]:
+    def _create_trigger_event(
+        self, event: dict, account_name: str = "", account_id: Optional[str] = None
+    ) -> Optional[str]:
         """Create new trigger event record with proper Account relation and enhanced multi-dimensional intelligence"""
         # Handle URL field properly - use null instead of empty string
         source_url = event.get("source_url", "") or None
 
         # CRITICAL FIX: Find the actual account to create proper relation
-        account_id = None
-        if account_name:
+        if account_id is None and account_name:
             account_id = self._find_existing_account(account_name)
 
         properties = {
@@ -1328,7 +2270,9 @@ class NotionClient:
         response = self._make_request("POST", "https://api.notion.com/v1/pages", json=data)
         return response.json().get("id")
 
-    def _create_partnership(self, partnership: dict, account_name: str = "") -> Optional[str]:
+    def _create_partnership(
+        self, partnership: dict, account_name: str = "", account_id: Optional[str] = None
+    ) -> Optional[str]:
         """Create or update partnership record with automatic deduplication.
 
         If a partnership with the same vendor name already exists, adds the new account
@@ -1350,13 +2294,13 @@ class NotionClient:
         source_url = partnership.get("source_url", partnership.get("evidence_url", "")) or None
 
         # Find the account to create proper relation
-        account_id = None
         partner_name = partnership.get(
             "partner_name",
             partnership.get("name", partnership.get("account_name", "Unknown Partner")),
         )
         if account_name:
-            account_id = self._find_existing_account(account_name)
+            if account_id is None:
+                account_id = self._find_existing_account(account_name)
             if account_id:
                 logger.info(f"🔗 Linking partnership '{partner_name}' to account '{account_name}'")
             else:
@@ -1832,6 +2776,10 @@ class NotionClient:
             "operation_count": self._operation_count,
             "last_operation": self._last_operation,
             "last_request_time": self.last_request_time,
+            "http_transport": "httpx/http2" if self.http2_client is not None else "requests",
+            "rate_limiter": self.rate_limiter.stats(),
+            "retry_stats": get_retry_stats(),
+            "http_pool_size": self.pool_size,
         }
 
     def get_pipeline_status(self) -> dict[str, Any]:
@@ -8,16 +8,20 @@ Identifies "trusted paths" into target accounts via shared vendor relationships.
 Based on the strategy: inputs → actions → outputs with deterministic scoring.
 """
 
+import contextvars
 import json
 import logging
 import os
 import re
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 
-import requests
+from ..utils.brave_client import BraveSearchError, get_brave_client
+from ..utils.llm_gateway import get_llm_gateway
+from ..utils.search_cache import DEFAULT_SEARCH_CACHE_TTL_SECONDS, PersistentSearchCache
 
 # OpenAI for LLM-powered vendor extraction
 try:
@@ -29,6 +33,39 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Project root, where the default search cache database lives (like the job-queue database)
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+# Vendor x customer pairs searched at once by discover_relationships. Brave
+# requests still draw from the shared "brave" rate limiter, which sets the pace.
+RELATIONSHIP_SEARCH_WORKERS = 8
+
+# Default time budget (seconds) for discover_relationships; pairs not searched
+# by then are reported as pending and left out of the scores
+RELATIONSHIP_SEARCH_DEADLINE = 120.0
+
+# Batched LLM vendor extraction: texts per request, estimated prompt tokens of
+# text packed into one request, and requests in flight at once (all requests
+# still draw from the shared "openai" rate limiter)
+VENDOR_EXTRACTION_BATCH_SIZE = 10
+VENDOR_EXTRACTION_TOKEN_BUDGET = 4000
+VENDOR_EXTRACTION_WORKERS = 4
+
+# Characters of each text sent for extraction, and output tokens allowed per text
+VENDOR_EXTRACTION_TEXT_CHARS = 1500
+VENDOR_EXTRACTION_OUTPUT_TOKENS = 400
+
+# Tries for a batch request that fails outright. Its texts are not extracted
+# singly afterwards: during an outage that would only multiply the failing calls.
+VENDOR_EXTRACTION_BATCH_ATTEMPTS = 2
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count for English text (about four characters per token)"""
+    return len(text) // 4 + 1
+
 
 @dataclass
 class VendorCustomerSignal:
@@ -108,6 +145,75 @@ class DiscoveredVendor:
     discovery_source_label: str = "AI-Discovered"  # Human-readable label for UI
 
 
+class VendorMatcher:
+    """
+    Finds every catalog vendor mentioned in a text in one regex pass.
+
+    Vendors match case-insensitively as whole words, by name or by normalized
+    name. The catalog maps each vendor to its first category. add() only
+    extends the alias table; the combined pattern is recompiled on the next
+    search, so a run of additions costs one compile.
+    """
+
+    def __init__(
+        self,
+        vendors: Optional[dict[str, list[str]]] = None,
+        normalize: Callable[[str], str] = str.lower,
+    ):
+        """
+        Args:
+            vendors: Initial catalog, category -> vendor names
+            normalize: Alternative matching form of a vendor name
+                       (e.g. without a legal suffix)
+        """
+        self._normalize = normalize
+        self._categories: dict[str, str] = {}  # vendor -> category
+        self._aliases: dict[str, str] = {}  # lowercase name or normalized name -> vendor
+        self._pattern: Optional[re.Pattern] = None
+        self._lock = threading.Lock()
+        for category, names in (vendors or {}).items():
+            for name in names:
+                self.add(name, category)
+
+    def __len__(self) -> int:
+        return len(self._categories)
+
+    def add(self, vendor: str, category: str) -> bool:
+        """Add a vendor to the catalog; False if it is already there"""
+        with self._lock:
+            if vendor in self._categories:
+                return False
+            self._categories[vendor] = category
+            for alias in (vendor.lower().strip(), self._normalize(vendor)):
+                if alias:
+                    self._aliases.setdefault(alias, vendor)
+            self._pattern = None
+            return True
+
+    def category(self, name: str) -> Optional[str]:
+        """Category of the catalog vendor called name (by name or normalized name)"""
+        vendor = self._aliases.get(name.lower().strip()) or self._aliases.get(self._normalize(name))
+        return self._categories.get(vendor) if vendor else None
+
+    def find(self, text: str) -> dict[str, str]:
+        """Vendors mentioned in text, with their categories, in order of first mention"""
+        hits: dict[str, str] = {}
+        for match in self._compiled().finditer(text):
+            vendor = self._aliases.get(match.group(0).lower())
+            if vendor and vendor not in hits:
+                hits[vendor] = self._categories[vendor]
+        return hits
+
+    def _compiled(self) -> re.Pattern:
+        with self._lock:
+            if self._pattern is None:
+                # Longest alias first, so "Schneider Electric" wins over "Schneider"
+                aliases = sorted(self._aliases, key=len, reverse=True)
+                alternation = "|".join(re.escape(alias) for alias in aliases) or "(?!)"
+                self._pattern = re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+            return self._pattern
+
+
 class VendorRelationshipDiscovery:
     """
     Discovers vendor-customer relationships using public data (Brave Search).
@@ -132,6 +238,18 @@ class VendorRelationshipDiscovery:
         '"{vendor}" "{customer}" success story',
     ]
 
+    # How long a template's search results stay cached (default 7 days).
+    # Case studies and integrations rarely change; event-driven results go stale.
+    SEARCH_CACHE_TTLS = {
+        '"{vendor}" "{customer}" case study': 30 * 24 * 3600,
+        '"{vendor}" "{customer}" integration': 30 * 24 * 3600,
+        '"{vendor}" "{customer}" customer story': 30 * 24 * 3600,
+        '"{vendor}" "{customer}" success story': 30 * 24 * 3600,
+        '"{vendor}" "{customer}" webinar': 2 * 24 * 3600,
+        '"{vendor}" "{customer}" contract awarded': 2 * 24 * 3600,
+        '"{customer}" "selects" "{vendor}"': 2 * 24 * 3600,
+    }
+
     # Signal type detection patterns
     SIGNAL_PATTERNS = {
         "case_study": [
@@ -363,21 +481,13 @@ class VendorRelationshipDiscovery:
         },
     }
 
-    def __init__(self, notion_client=None):
+    def __init__(self, notion_client=None, search_cache: Optional[PersistentSearchCache] = None):
         self.brave_api_key = os.getenv("BRAVE_API_KEY")
         if not self.brave_api_key:
             logger.warning("BRAVE_API_KEY not set - vendor discovery disabled")
 
-        self.brave_base_url = "https://api.search.brave.com/res/v1/web/search"
-
-        # Rate limiting - Brave free tier allows 1 req/sec
-        self.last_request_time = 0
-        self.request_delay = 1.1  # Slightly over 1 req/sec for safety margin
-        self.jitter_range = 0.3  # Random 0-0.3s jitter to prevent thundering herd
-        self.max_retries = 3  # Max retries on rate limit
-
-        # Cache to avoid duplicate searches
-        self._search_cache: dict[str, list[dict]] = {}
+        # Search results persist across instances and processes (see search_cache)
+        self._search_cache = search_cache
 
         # OpenAI client for LLM-powered extraction
         self.openai_client = None
@@ -411,6 +521,11 @@ class VendorRelationshipDiscovery:
             else:
                 self._dynamic_vendors[category] = list(vendors)
 
+        # One compiled matcher over the whole catalog, extended as vendors are discovered
+        self._vendor_matcher = VendorMatcher(
+            self._dynamic_vendors, normalize=self._normalize_company
+        )
+
         total_vendors = sum(len(v) for v in self._dynamic_vendors.values())
         logger.info(
             f"Dynamic vendor list initialized with {total_vendors} vendors across {len(self._dynamic_vendors)} categories"
@@ -508,7 +623,7 @@ Text to analyze:
 Return JSON array only, no markdown:"""
 
         try:
-            response = self.openai_client.chat.completions.create(
+            reply = get_llm_gateway().complete(
                 model="gpt-4o-mini",
                 messages=[
                     {
@@ -519,9 +634,10 @@ Return JSON array only, no markdown:"""
                 ],
                 temperature=0.1,
                 max_tokens=1000,
+                client=lambda: self.openai_client,
             )
 
-            content = response.choices[0].message.content.strip()
+            content = reply.strip()
 
             # Handle potential markdown code blocks
             if content.startswith("```"):
@@ -533,19 +649,7 @@ Return JSON array only, no markdown:"""
             vendors = json.loads(content)
 
             # Validate structure
-            validated = []
-            for v in vendors:
-                if isinstance(v, dict) and "name" in v:
-                    validated.append(
-                        {
-                            "name": v.get("name", ""),
-                            "category": v.get("category", "discovered_unknown"),
-                            "confidence": float(v.get("confidence", 0.5)),
-                            "evidence": v.get("evidence", "")[:200],
-                        }
-                    )
-
-            return validated
+            return self._validate_extracted_vendors(vendors) or []
 
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse LLM response as JSON: {e}")
@@ -558,17 +662,28 @@ Return JSON array only, no markdown:"""
         self,
         texts: list[dict[str, str]],  # List of {text, url} dicts
         account_name: str,
-        batch_size: int = 5,
+        batch_size: Optional[int] = None,
+        token_budget: Optional[int] = None,
+        max_workers: Optional[int] = None,
     ) -> dict[str, list[dict]]:
         """
-        Extract vendors from multiple texts in a single LLM call (batch processing).
+        Extract vendors from many texts with batched, concurrent LLM calls.
 
-        This reduces API calls from N to N/batch_size, providing ~80% cost reduction.
+        Texts are packed in order into requests of up to batch_size texts and
+        token_budget estimated prompt tokens, and up to max_workers requests
+        run at once. Each response follows a JSON schema with one entry per
+        text; texts missing from or malformed in a response are extracted
+        again one at a time, so a partial failure only costs the texts it
+        affected. A request that fails outright (or returns unparseable JSON)
+        is retried as a batch, and its texts get no vendors if that fails too.
 
         Args:
             texts: List of dicts with 'text' and 'url' keys
             account_name: Target account name
-            batch_size: Number of texts per LLM call
+            batch_size: Max texts per LLM call (default VENDOR_EXTRACTION_BATCH_SIZE)
+            token_budget: Max estimated text tokens per LLM call
+                          (default VENDOR_EXTRACTION_TOKEN_BUDGET)
+            max_workers: LLM calls in flight at once (default VENDOR_EXTRACTION_WORKERS)
 
         Returns:
             Dict mapping url -> List of extracted vendors
@@ -576,27 +691,113 @@ Return JSON array only, no markdown:"""
         if not self.openai_client or not texts:
             return {}
 
+        batches = self._pack_extraction_batches(
+            texts,
+            batch_size or VENDOR_EXTRACTION_BATCH_SIZE,
+            token_budget or VENDOR_EXTRACTION_TOKEN_BUDGET,
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers or VENDOR_EXTRACTION_WORKERS, len(batches)),
+            thread_name_prefix="vendor-extract",
+        ) as pool:
+            futures = [
+                pool.submit(
+                    contextvars.copy_context().run,
+                    self._extract_vendors_batch,
+                    batch,
+                    account_name,
+                )
+                for batch in batches
+            ]
+
         results: dict[str, list[dict]] = {}
+        for batch, future in zip(batches, futures):
+            for item, vendors in zip(batch, future.result()):
+                results[item["url"]] = vendors
+        return results
+
+    @staticmethod
+    def _pack_extraction_batches(
+        texts: list[dict[str, str]], batch_size: int, token_budget: int
+    ) -> list[list[dict[str, str]]]:
+        """Split texts, in order, into batches within the size and token limits"""
+        batches: list[list[dict[str, str]]] = []
+        current: list[dict[str, str]] = []
+        current_tokens = 0
+        for item in texts:
+            tokens = _estimate_tokens(item["text"][:VENDOR_EXTRACTION_TEXT_CHARS])
+            if current and (len(current) >= batch_size or current_tokens + tokens > token_budget):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(item)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _extraction_schema(self) -> dict:
+        """Structured output schema: the vendors found in each numbered text"""
+        vendor = {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "category": {
+                    "type": "string",
+                    "enum": [*self.CATEGORY_METADATA, "discovered_unknown"],
+                },
+                "confidence": {"type": "number"},
+                "evidence": {"type": "string"},
+            },
+            "required": ["name", "category", "confidence", "evidence"],
+            "additionalProperties": False,
+        }
+        return {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "vendor_extraction",
+                "strict": True,
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "texts": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "index": {"type": "integer"},
+                                    "vendors": {"type": "array", "items": vendor},
+                                },
+                                "required": ["index", "vendors"],
+                                "additionalProperties": False,
+                            },
+                        }
+                    },
+                    "required": ["texts"],
+                    "additionalProperties": False,
+                },
+            },
+        }
 
+    def _extract_vendors_batch(
+        self, batch: list[dict[str, str]], account_name: str
+    ) -> list[list[dict]]:
+        """Vendors for each text in one batch, in order"""
         # Build category descriptions once
         category_descriptions = []
         for cat, meta in self.CATEGORY_METADATA.items():
             category_descriptions.append(f"- {cat}: {meta['description']}")
         categories_text = chr(10).join(category_descriptions)
 
-        # Process in batches
-        for batch_start in range(0, len(texts), batch_size):
-            batch = texts[batch_start : batch_start + batch_size]
+        # Build numbered batch prompt
+        batch_texts = []
+        for i, item in enumerate(batch):
+            text_preview = item["text"][:VENDOR_EXTRACTION_TEXT_CHARS]  # Smaller per item in batch
+            batch_texts.append(f"[TEXT_{i}]\n{text_preview}\n[/TEXT_{i}]")
 
-            # Build numbered batch prompt
-            batch_texts = []
-            for i, item in enumerate(batch):
-                text_preview = item["text"][:1500]  # Smaller per item in batch
-                batch_texts.append(f"[TEXT_{i}]\n{text_preview}\n[/TEXT_{i}]")
+        combined = "\n\n".join(batch_texts)
 
-            combined = "\n\n".join(batch_texts)
-
-            prompt = f"""Extract company names from these {len(batch)} text snippets that are vendors, partners,
+        prompt = f"""Extract company names from these {len(batch)} text snippets that are vendors, partners,
 or service providers related to {account_name}'s data center or IT infrastructure.
 
 Do NOT include:
@@ -608,74 +809,88 @@ For each company found, classify into ONE of these categories:
 {categories_text}
 - discovered_unknown: Cannot determine category
 
-Return a JSON object where keys are TEXT_0, TEXT_1, etc. and values are arrays of vendors.
-Each vendor must have: name, category, confidence (0-1), evidence (brief quote).
+Return one entry in "texts" per snippet, with its index (0 for TEXT_0, 1 for TEXT_1, etc.)
+and its vendors. Each vendor must have: name, category, confidence (0-1), evidence (brief quote).
 
 Texts to analyze:
 ---
 {combined}
----
-
-Return JSON object only, no markdown:"""
+---"""
 
+        by_index: dict[int, list[dict]] = {}
+        for attempt in range(1, VENDOR_EXTRACTION_BATCH_ATTEMPTS + 1):
             try:
-                response = self.openai_client.chat.completions.create(
+                reply = get_llm_gateway().complete(
                     model="gpt-4o-mini",
                     messages=[
                         {
                             "role": "system",
-                            "content": "You are a B2B sales intelligence analyst extracting vendor relationships from text. Return only valid JSON objects.",
+                            "content": "You are a B2B sales intelligence analyst extracting vendor relationships from text.",
                         },
                         {"role": "user", "content": prompt},
                     ],
                     temperature=0.1,
-                    max_tokens=2000,  # Larger for batch
+                    max_tokens=VENDOR_EXTRACTION_OUTPUT_TOKENS * len(batch),
+                    response_format=self._extraction_schema(),
+                    client=lambda: self.openai_client,
+                    # A cached reply that didn't parse would only fail again
+                    bypass_cache=attempt > 1,
                 )
-
-                content = response.choices[0].message.content.strip()
-
-                # Handle markdown code blocks
-                if content.startswith("```"):
-                    content = content.split("```")[1]
-                    if content.startswith("json"):
-                        content = content[4:]
-                    content = content.strip()
-
-                batch_results = json.loads(content)
-
-                # Map results back to URLs
-                for i, item in enumerate(batch):
-                    key = f"TEXT_{i}"
-                    vendors_raw = batch_results.get(key, [])
-
-                    validated = []
-                    for v in vendors_raw:
-                        if isinstance(v, dict) and "name" in v:
-                            validated.append(
-                                {
-                                    "name": v.get("name", ""),
-                                    "category": v.get("category", "discovered_unknown"),
-                                    "confidence": float(v.get("confidence", 0.5)),
-                                    "evidence": v.get("evidence", "")[:200],
-                                }
-                            )
-
-                    results[item["url"]] = validated
-
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse batch LLM response as JSON: {e}")
-                # Fallback: mark all as empty
-                for item in batch:
-                    results[item["url"]] = []
+                entries = json.loads(reply.strip())["texts"]
+                if not isinstance(entries, list):
+                    raise ValueError("'texts' is not a list")
             except Exception as e:
-                logger.warning(f"Error in batch LLM vendor extraction: {e}")
-                for item in batch:
-                    results[item["url"]] = []
+                logger.warning(
+                    f"Error in batch LLM vendor extraction "
+                    f"(attempt {attempt}/{VENDOR_EXTRACTION_BATCH_ATTEMPTS}): {e}"
+                )
+                continue
 
-        return results
+            for entry in entries:
+                if isinstance(entry, dict) and isinstance(entry.get("index"), int):
+                    vendors = self._validate_extracted_vendors(entry.get("vendors"))
+                    if vendors is not None:
+                        by_index.setdefault(entry["index"], vendors)
+            break
+        else:
+            return [[] for _ in batch]
+
+        # Texts the parsed reply didn't answer are retried on their own
+        extracted = []
+        for i, item in enumerate(batch):
+            if i not in by_index:
+                by_index[i] = self.extract_vendors_from_text(item["text"], account_name)
+            extracted.append(by_index[i])
+        return extracted
+
+    @staticmethod
+    def _validate_extracted_vendors(vendors) -> Optional[list[dict]]:
+        """Well-formed vendor dicts from an LLM reply, or None if it isn't a list"""
+        if not isinstance(vendors, list):
+            return None
+        validated = []
+        for v in vendors:
+            if isinstance(v, dict) and "name" in v:
+                try:
+                    confidence = float(v.get("confidence", 0.5))
+                except (TypeError, ValueError):
+                    continue
+                validated.append(
+                    {
+                        "name": v.get("name", ""),
+                        "category": v.get("category", "discovered_unknown"),
+                        "confidence": confidence,
+                        "evidence": str(v.get("evidence", ""))[:200],
+                    }
+                )
+        return validated
 
     def discover_unknown_vendors(
-        self, account_name: str, save_to_notion: bool = True, min_confidence: float = 0.6
+        self,
+        account_name: str,
+        save_to_notion: bool = True,
+        min_confidence: float = 0.6,
+        progress_callback: Optional[Callable[..., None]] = None,
     ) -> dict:
         """
         WORKFLOW 3: Discover NEW vendors not in KNOWN_VENDORS using LLM extraction.
@@ -690,6 +905,8 @@ Return JSON object only, no markdown:"""
             account_name: The target account to research
             save_to_notion: Whether to persist discovered vendors to Notion
             min_confidence: Minimum confidence threshold (0-1)
+            progress_callback: Optional progress(phase, status, **details), called
+                               per search query and for each vendor as it is found
 
         Returns:
             {
@@ -705,6 +922,13 @@ Return JSON object only, no markdown:"""
         """
         logger.info(f"WORKFLOW 3: Discovering unknown vendors for {account_name}")
 
+        def progress(phase: str, status: str, **details) -> None:
+            if progress_callback:
+                try:
+                    progress_callback(phase, status, **details)
+                except Exception as e:
+                    logger.warning(f"Progress callback failed: {e}")
+
         if not self.brave_api_key:
             return {
                 "account": account_name,
@@ -722,40 +946,22 @@ Return JSON object only, no markdown:"""
         # Collect all search results
         all_results: list[dict] = []
         search_errors: list[dict] = []  # Track any API errors
+        cache_stats = {"hits": 0, "misses": 0}
 
         # Run account-centric searches
+        progress("search", "running", queries=len(self.VENDOR_DISCOVERY_TEMPLATES))
         for template in self.VENDOR_DISCOVERY_TEMPLATES:
             query = template.format(account=account_name)
 
-            # Check cache
-            cache_key = f"discovery:{query.lower()}"
-            if cache_key in self._search_cache:
-                results = self._search_cache[cache_key]
-            else:
-                response = self._brave_search(query)
-                results = response.get("results", [])
-                self._search_cache[cache_key] = results
-                # Track errors for surfacing to dashboard
-                if response.get("error"):
-                    search_errors.append(
-                        {
-                            "query": query,
-                            "error": response["error"],
-                            "error_code": response.get("error_code"),
-                            "retry_after": response.get("retry_after"),
-                        }
-                    )
+            results = self._cached_search(
+                query, f"discovery:{query.lower()}", template, cache_stats, search_errors
+            )
 
             for r in results:
                 r["_search_query"] = query
             all_results.extend(results)
-
-        # Build list of all known vendor names for filtering
-        known_vendor_names: set[str] = set()
-        for category, vendors in self._dynamic_vendors.items():
-            for v in vendors:
-                known_vendor_names.add(v.lower())
-                known_vendor_names.add(self._normalize_company(v))
+            progress("search", "partial", query=query, results=len(results))
+        progress("search", "completed", results=len(all_results), errors=len(search_errors))
 
         # Extract vendors via LLM from each result (using BATCH processing)
         llm_extracted: dict[
@@ -778,22 +984,20 @@ Return JSON object only, no markdown:"""
 
             texts_to_process.append({"text": text, "url": url})
 
-        # Step 2: Extract vendors via BATCH LLM call (reduces 20 calls to 4)
+        # Step 2: Extract vendors via batched, concurrent LLM calls
+        progress("extraction", "running", texts=len(texts_to_process))
         batch_results = self.extract_vendors_from_texts_batch(
-            texts=texts_to_process, account_name=account_name, batch_size=5
+            texts=texts_to_process, account_name=account_name
         )
+        progress("extraction", "completed", sources=len(batch_results))
 
         # Step 3: Process batched results
         for url, extracted in batch_results.items():
             for vendor in extracted:
                 vendor_name = vendor["name"]
-                vendor_lower = vendor_name.lower()
-                vendor_normalized = self._normalize_company(vendor_name)
 
                 # Check if this is a known vendor
-                is_known = (
-                    vendor_lower in known_vendor_names or vendor_normalized in known_vendor_names
-                )
+                is_known = self._vendor_matcher.category(vendor_name) is not None
 
                 target_dict = known_vendors_found if is_known else llm_extracted
 
@@ -820,6 +1024,7 @@ Return JSON object only, no markdown:"""
                     target_dict[vendor_name]["confidence"] = vendor["confidence"]
 
         # Convert to DiscoveredVendor objects
+        progress("classification", "running", candidates=len(llm_extracted))
         discovered_vendors: list[DiscoveredVendor] = []
         saved_to_notion = 0
         added_to_runtime = 0
@@ -847,6 +1052,16 @@ Return JSON object only, no markdown:"""
             )
 
             discovered_vendors.append(vendor)
+            progress(
+                "classification",
+                "partial",
+                vendor={
+                    "vendor_name": vendor.vendor_name,
+                    "category": vendor.category,
+                    "confidence": vendor.confidence,
+                    "mention_count": vendor.mention_count,
+                },
+            )
 
             # Save to Notion if requested
             if save_to_notion and self._notion_client:
@@ -861,10 +1076,17 @@ Return JSON object only, no markdown:"""
                 self._dynamic_vendors[data["category"]] = []
             if vendor_name not in self._dynamic_vendors[data["category"]]:
                 self._dynamic_vendors[data["category"]].append(vendor_name)
+                self._vendor_matcher.add(vendor_name, data["category"])
                 added_to_runtime += 1
 
         # Sort by confidence
         discovered_vendors.sort(key=lambda x: x.confidence, reverse=True)
+        progress(
+            "classification",
+            "completed",
+            new_vendors=len(discovered_vendors),
+            known_vendors=len(known_vendors_found),
+        )
 
         logger.info(
             f"Workflow 3 complete: {len(discovered_vendors)} new vendors discovered, "
@@ -882,6 +1104,7 @@ Return JSON object only, no markdown:"""
             "added_to_runtime": added_to_runtime,
             "search_results_analyzed": len(all_results),
             "category_summary": self._summarize_by_category(discovered_vendors),
+            "search_cache": self._cache_summary(cache_stats),
         }
 
     def _summarize_by_category(self, vendors: list[DiscoveredVendor]) -> dict[str, int]:
@@ -930,20 +1153,32 @@ Return JSON object only, no markdown:"""
         vendors: list[str],
         customers: list[str],
         fit_weights: Optional[dict[str, float]] = None,
+        customer_scores: Optional[dict[str, float]] = None,
+        deadline_seconds: Optional[float] = None,
     ) -> dict:
         """
         Discover vendor-customer relationships from public data.
 
+        Pairs whose searches are all cached are answered immediately; the rest
+        are searched concurrently, highest scoring customers first. Pairs still
+        unsearched after deadline_seconds are returned as pending_pairs and the
+        scores are computed from the signals found so far.
+
         Args:
             vendors: List of vendor company names to check
             customers: List of target account (customer) names
             fit_weights: Optional per-vendor weights (0.5-1.5), default=1.0
+            customer_scores: Optional account score per customer, for search order
+            deadline_seconds: Time budget for searching
+                              (default RELATIONSHIP_SEARCH_DEADLINE)
 
         Returns:
             {
                 "signals": List[VendorCustomerSignal],
                 "vendor_scores": List[VendorIntroScore],
-                "search_failures": List[Dict]  # Failed searches
+                "search_failures": List[Dict],  # Failed searches
+                "search_cache": Dict,  # Persistent cache hits/misses/hit_ratio
+                "pending_pairs": List[Dict]  # Pairs not searched before the deadline
             }
         """
         logger.info(
@@ -958,31 +1193,82 @@ Return JSON object only, no markdown:"""
             }
 
         fit_weights = fit_weights or {}
+        customer_scores = customer_scores or {}
         all_signals: list[VendorCustomerSignal] = []
         search_failures: list[dict] = []
+        cache_stats = {"hits": 0, "misses": 0}
+        pending_pairs: list[dict] = []
+
+        # Highest scoring customers first (stable, so input order breaks ties)
+        pairs = sorted(
+            ((vendor, customer) for vendor in vendors for customer in customers),
+            key=lambda pair: -(customer_scores.get(pair[1]) or 0),
+        )
 
-        # Search for each vendor-customer pair
-        for vendor in vendors:
-            for customer in customers:
+        # Pairs fully answered by the cache need no search slot
+        answered: dict[tuple[str, str], dict] = {}
+        to_search: list[tuple[str, str]] = []
+        for pair in pairs:
+            cached = self._search_vendor_customer(*pair, cache_only=True)
+            if cached is None:
+                to_search.append(pair)
+            else:
+                answered[pair] = cached
+
+        futures = {}
+        if to_search:
+            # Submission order is run order; unfinished pairs are abandoned at the deadline
+            executor = ThreadPoolExecutor(
+                max_workers=min(RELATIONSHIP_SEARCH_WORKERS, len(to_search)),
+                thread_name_prefix="vendor-search",
+            )
+            futures = {
+                pair: executor.submit(
+                    contextvars.copy_context().run, self._search_vendor_customer, *pair
+                )
+                for pair in to_search
+            }
+            wait(
+                futures.values(),
+                timeout=(
+                    RELATIONSHIP_SEARCH_DEADLINE if deadline_seconds is None else deadline_seconds
+                ),
+            )
+            executor.shutdown(wait=False, cancel_futures=True)
+            if not all(future.done() for future in futures.values()):
+                logger.warning("Relationship search deadline reached, returning partial results")
+
+        for pair in pairs:
+            vendor, customer = pair
+            result = answered.get(pair)
+            if result is None:
+                future = futures[pair]
+                if not future.done() or future.cancelled():
+                    pending_pairs.append({"vendor": vendor, "customer": customer})
+                    continue
                 try:
-                    result = self._search_vendor_customer(vendor, customer)
-                    all_signals.extend(result.get("signals", []))
-                    # Track any Brave API errors
-                    for err in result.get("errors", []):
-                        search_failures.append(
-                            {
-                                "vendor": vendor,
-                                "customer": customer,
-                                "error": err.get("error"),
-                                "error_code": err.get("error_code"),
-                                "retry_after": err.get("retry_after"),
-                            }
-                        )
+                    result = future.result()
                 except Exception as e:
                     logger.warning(f"Search failed for {vendor}/{customer}: {e}")
                     search_failures.append(
                         {"vendor": vendor, "customer": customer, "error": str(e)}
                     )
+                    continue
+
+            all_signals.extend(result.get("signals", []))
+            for stat, count in result.get("search_cache", {}).items():
+                cache_stats[stat] += count
+            # Track any Brave API errors
+            for err in result.get("errors", []):
+                search_failures.append(
+                    {
+                        "vendor": vendor,
+                        "customer": customer,
+                        "error": err.get("error"),
+                        "error_code": err.get("error_code"),
+                        "retry_after": err.get("retry_after"),
+                    }
+                )
 
         # Deduplicate signals by URL
         unique_signals = self._deduplicate_signals(all_signals)
@@ -998,6 +1284,8 @@ Return JSON object only, no markdown:"""
             "signals": unique_signals,
             "vendor_scores": vendor_scores,
             "search_failures": search_failures,
+            "search_cache": self._cache_summary(cache_stats),
+            "pending_pairs": pending_pairs,
         }
 
     def discover_for_account(
@@ -1055,29 +1343,15 @@ Return JSON object only, no markdown:"""
         # Collect all search results
         all_results: list[dict] = []
         search_errors: list[dict] = []  # Track any API errors
+        cache_stats = {"hits": 0, "misses": 0}
 
         # Run account-centric searches
         for template in self.VENDOR_DISCOVERY_TEMPLATES:
             query = template.format(account=account_name)
 
-            # Check cache
-            cache_key = f"discovery:{query.lower()}"
-            if cache_key in self._search_cache:
-                results = self._search_cache[cache_key]
-            else:
-                response = self._brave_search(query)
-                results = response.get("results", [])
-                self._search_cache[cache_key] = results
-                # Track errors for surfacing to dashboard
-                if response.get("error"):
-                    search_errors.append(
-                        {
-                            "query": query,
-                            "error": response["error"],
-                            "error_code": response.get("error_code"),
-                            "retry_after": response.get("retry_after"),
-                        }
-                    )
+            results = self._cached_search(
+                query, f"discovery:{query.lower()}", template, cache_stats, search_errors
+            )
 
             # Tag results with the search query
             for r in results:
@@ -1099,29 +1373,23 @@ Return JSON object only, no markdown:"""
             if account_lower not in text and account_normalized not in text:
                 continue
 
-            # Extract vendors from known vendor list
-            for category, vendors in self.KNOWN_VENDORS.items():
-                for vendor in vendors:
-                    vendor_lower = vendor.lower()
-                    vendor_normalized = self._normalize_company(vendor)
-
-                    # Check if vendor is mentioned
-                    if vendor_lower in text or vendor_normalized in text:
-                        if vendor not in vendor_mentions:
-                            vendor_mentions[vendor] = {
-                                "count": 0,
-                                "urls": [],
-                                "snippets": [],
-                                "category": category,
-                            }
-
-                        vendor_mentions[vendor]["count"] += 1
-                        if url and url not in vendor_mentions[vendor]["urls"]:
-                            vendor_mentions[vendor]["urls"].append(url)
-                        if description:
-                            snippet = description[:200]
-                            if snippet not in vendor_mentions[vendor]["snippets"]:
-                                vendor_mentions[vendor]["snippets"].append(snippet)
+            # Extract vendors from the known + discovered vendor catalog
+            for vendor, category in self._vendor_matcher.find(text).items():
+                if vendor not in vendor_mentions:
+                    vendor_mentions[vendor] = {
+                        "count": 0,
+                        "urls": [],
+                        "snippets": [],
+                        "category": category,
+                    }
+
+                vendor_mentions[vendor]["count"] += 1
+                if url and url not in vendor_mentions[vendor]["urls"]:
+                    vendor_mentions[vendor]["urls"].append(url)
+                if description:
+                    snippet = description[:200]
+                    if snippet not in vendor_mentions[vendor]["snippets"]:
+                        vendor_mentions[vendor]["snippets"].append(snippet)
 
         # Convert to DiscoveredVendor objects
         discovered_vendors: list[DiscoveredVendor] = []
@@ -1179,6 +1447,7 @@ Return JSON object only, no markdown:"""
             "discovered_vendors": discovered_vendors,
             "vendors_by_category": vendors_by_category,
             "search_results_analyzed": len(all_results),
+            "search_cache": self._cache_summary(cache_stats),
             "raw_evidence": [
                 {"url": r.get("url"), "title": r.get("title")}
                 for r in all_results[:20]  # Top 20 for transparency
@@ -1298,17 +1567,24 @@ Return JSON object only, no markdown:"""
             "Microsoft Sustainability",
         ]
 
-    def _search_vendor_customer(self, vendor: str, customer: str) -> dict:
+    def _search_vendor_customer(
+        self, vendor: str, customer: str, cache_only: bool = False
+    ) -> Optional[dict]:
         """
         Search for relationship signals between a vendor and customer.
 
+        With cache_only=True nothing is searched: None is returned unless
+        every query for the pair is cached.
+
         Returns:
             Dict with:
                 - 'signals': List[VendorCustomerSignal] - discovered signals
                 - 'errors': List[Dict] - any search errors encountered
+                - 'search_cache': Dict - persistent cache hits/misses for these searches
         """
         signals = []
         search_errors = []
+        cache_stats = {"hits": 0, "misses": 0}
 
         # Try multiple search templates
         templates_to_try = self.SEARCH_TEMPLATES[:4]  # Limit to avoid rate limiting
@@ -1316,24 +1592,11 @@ Return JSON object only, no markdown:"""
         for template in templates_to_try:
             query = template.format(vendor=vendor, customer=customer)
 
-            # Check cache
-            cache_key = query.lower()
-            if cache_key in self._search_cache:
-                results = self._search_cache[cache_key]
-            else:
-                response = self._brave_search(query)
-                results = response.get("results", [])
-                self._search_cache[cache_key] = results
-                # Track errors
-                if response.get("error"):
-                    search_errors.append(
-                        {
-                            "query": query,
-                            "error": response["error"],
-                            "error_code": response.get("error_code"),
-                            "retry_after": response.get("retry_after"),
-                        }
-                    )
+            results = self._cached_search(
+                query, query.lower(), template, cache_stats, search_errors, cache_only
+            )
+            if results is None:
+                return None
 
             # Parse results into signals
             for result in results:
@@ -1341,13 +1604,79 @@ Return JSON object only, no markdown:"""
                 if signal:
                     signals.append(signal)
 
-        return {"signals": signals, "errors": search_errors}
+        return {"signals": signals, "errors": search_errors, "search_cache": cache_stats}
 
-    def _brave_search(self, query: str) -> dict:
+    @property
+    def search_cache(self) -> Optional[PersistentSearchCache]:
+        """The persistent search cache, opened on first use (None if unavailable)"""
+        if self._search_cache is None:
+            try:
+                self._search_cache = PersistentSearchCache(
+                    os.environ.get(
+                        "ABM_SEARCH_CACHE_DB", os.path.join(project_root, "search_cache.db")
+                    )
+                )
+            except Exception as e:
+                logger.warning(f"Search cache unavailable, searching uncached: {e}")
+        return self._search_cache
+
+    def _cached_search(
+        self,
+        query: str,
+        cache_key: str,
+        template: str,
+        cache_stats: dict[str, int],
+        search_errors: list[dict],
+        cache_only: bool = False,
+    ) -> Optional[list[dict]]:
         """
-        Execute Brave Search API request with retry logic for rate limiting.
+        Search results for query, from the persistent cache when fresh.
 
-        Uses exponential backoff when rate limited (429 errors).
+        Successful searches are stored for the template's TTL; failed ones are
+        recorded in search_errors (for the dashboard) and never cached. With
+        cache_only=True a cache miss returns None instead of searching.
+        """
+        cache = self.search_cache
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                cache_stats["hits"] += 1
+                return cached
+        if cache_only:
+            return None
+        cache_stats["misses"] += 1
+
+        response = self._brave_search(query)
+        results = response.get("results", [])
+        if response.get("error"):
+            search_errors.append(
+                {
+                    "query": query,
+                    "error": response["error"],
+                    "error_code": response.get("error_code"),
+                    "retry_after": response.get("retry_after"),
+                }
+            )
+        elif cache is not None:
+            cache.set(
+                cache_key,
+                results,
+                self.SEARCH_CACHE_TTLS.get(template, DEFAULT_SEARCH_CACHE_TTL_SECONDS),
+            )
+        return results
+
+    @staticmethod
+    def _cache_summary(cache_stats: dict[str, int]) -> dict:
+        lookups = cache_stats["hits"] + cache_stats["misses"]
+        return {
+            **cache_stats,
+            "hit_ratio": round(cache_stats["hits"] / lookups, 3) if lookups else 0.0,
+        }
+
+    def _brave_search(self, query: str) -> dict:
+        """
+        Execute a Brave Search API request through the shared Brave client
+        (process-wide rate limit, response cache and 429 retries).
 
         Returns:
             Dict with keys:
@@ -1356,91 +1685,24 @@ Return JSON object only, no markdown:"""
                 - 'error_code': Optional[str] - error code for dashboard display
                 - 'retry_after': Optional[int] - seconds to wait before retry (for rate limits)
         """
-        last_error = None
-        last_error_code = None
-
-        for attempt in range(self.max_retries):
-            self._apply_rate_limit()
-
-            try:
-                response = requests.get(
-                    self.brave_base_url,
-                    params={"q": query, "count": 10, "freshness": "py"},  # Past year
-                    headers={
-                        "X-Subscription-Token": self.brave_api_key,
-                        "Accept": "application/json",
-                    },
-                    timeout=15,
-                )
-
-                if response.status_code == 429:
-                    # Rate limited - use Retry-After header if available, else exponential backoff
-                    retry_after = response.headers.get("Retry-After")
-                    if retry_after:
-                        try:
-                            backoff_time = int(retry_after)
-                            logger.warning(
-                                f"Brave API rate limited (429). Server requested {backoff_time}s wait"
-                            )
-                        except ValueError:
-                            backoff_time = (2**attempt) * 3  # Fallback: 3s, 6s, 12s
-                    else:
-                        backoff_time = (2**attempt) * 3  # Fallback: 3s, 6s, 12s
-                    logger.warning(
-                        f"Brave API rate limited. Waiting {backoff_time}s before retry {attempt + 1}/{self.max_retries}"
-                    )
-                    last_error = f"Rate limited by Brave API. Retried {attempt + 1}/{self.max_retries} times."
-                    last_error_code = "BRAVE_RATE_LIMITED"
-                    time.sleep(backoff_time)
-                    continue
-
-                if response.status_code != 200:
-                    logger.warning(f"Brave search failed: {response.status_code}")
-                    return {
-                        "results": [],
-                        "error": f"Brave API returned status {response.status_code}",
-                        "error_code": f"BRAVE_HTTP_{response.status_code}",
-                    }
-
-                data = response.json()
-
-                # Combine news and web results
-                results = []
-                results.extend(data.get("news", {}).get("results", []))
-                results.extend(data.get("web", {}).get("results", []))
-
-                return {"results": results, "error": None, "error_code": None}
+        try:
+            data = get_brave_client().search(
+                query, {"count": 10, "freshness": "py"}, raise_errors=True  # Past year
+            )
+        except BraveSearchError as e:
+            return {
+                "results": [],
+                "error": str(e),
+                "error_code": e.error_code,
+                "retry_after": e.retry_after,
+            }
 
-            except requests.exceptions.Timeout:
-                logger.warning(f"Brave search timeout for query: {query[:50]}...")
-                return {
-                    "results": [],
-                    "error": "Brave API request timed out after 15 seconds",
-                    "error_code": "BRAVE_TIMEOUT",
-                }
-            except requests.exceptions.ConnectionError as e:
-                logger.warning(f"Brave search connection error: {e}")
-                return {
-                    "results": [],
-                    "error": "Could not connect to Brave API",
-                    "error_code": "BRAVE_CONNECTION_ERROR",
-                }
-            except Exception as e:
-                logger.warning(f"Brave search error: {e}")
-                return {
-                    "results": [],
-                    "error": f"Unexpected error: {str(e)}",
-                    "error_code": "BRAVE_UNKNOWN_ERROR",
-                }
+        # Combine news and web results
+        results = []
+        results.extend(data.get("news", {}).get("results", []))
+        results.extend(data.get("web", {}).get("results", []))
 
-        # If we exhausted all retries due to rate limiting
-        logger.warning(f"Brave search failed after {self.max_retries} retries due to rate limiting")
-        return {
-            "results": [],
-            "error": last_error or f"Search failed after {self.max_retries} retries",
-            "error_code": last_error_code or "BRAVE_MAX_RETRIES",
-            "retry_after": 60,  # Suggest waiting 60 seconds before trying again
-        }
+        return {"results": results, "error": None, "error_code": None}
 
     def _parse_result_to_signal(
         self, result: dict, vendor: str, customer: str
@@ -1704,18 +1966,6 @@ Return JSON object only, no markdown:"""
 
         return scores
 
-    def _apply_rate_limit(self):
-        """Apply rate limiting between API requests with jitter."""
-        import random
-
-        elapsed = time.time() - self.last_request_time
-        # Add random jitter to prevent thundering herd
-        jitter = random.uniform(0, self.jitter_range)
-        total_delay = self.request_delay + jitter
-        if elapsed < total_delay:
-            time.sleep(total_delay - elapsed)
-        self.last_request_time = time.time()
-
     def to_partnership_properties(
         self,
         signal: VendorCustomerSignal,
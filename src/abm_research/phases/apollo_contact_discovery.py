@@ -6,13 +6,16 @@ Optimized for credit-efficient ABM research with batch enrichment
 
 import logging
 import os
-import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
 import requests
 
+from ..utils.instrumentation import span
+from ..utils.metrics import APOLLO_CREDITS
+from ..utils.rate_limiter import provider_rate_limiter
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -73,11 +76,10 @@ class ApolloContactDiscovery:
             }
         )
 
-        # Rate limiting tracking
-        self.last_search_time = 0
-        self.last_enrichment_time = 0
-        self.search_delay = 1.0  # 1 second between searches
-        self.enrichment_delay = 2.0  # 2 seconds between enrichments
+        # Rate limiting - one Apollo budget shared by every instance in the process,
+        # so concurrent account research doesn't multiply the request rate.
+        # An enrichment costs two tokens (twice the spacing of a search).
+        self.rate_limiter = provider_rate_limiter("apollo")
 
         logger.info("🚀 Apollo Contact Discovery initialized")
 
@@ -182,7 +184,11 @@ class ApolloContactDiscovery:
 
         try:
             logger.info(f"🔍 Searching Apollo for contacts at {company_domain}")
-            response = self.session.post(f"{self.base_url}/mixed_people/search", json=search_params)
+            with span("apollo.search") as call:
+                response = self.session.post(
+                    f"{self.base_url}/mixed_people/search", json=search_params
+                )
+                call.record_response(response)
             response.raise_for_status()
 
             data = response.json()
@@ -327,9 +333,11 @@ class ApolloContactDiscovery:
         }
 
         try:
-            response = self.session.post(
-                f"{self.base_url}/people/bulk_match", json=enrichment_params
-            )
+            with span("apollo.bulk_match") as call:
+                response = self.session.post(
+                    f"{self.base_url}/people/bulk_match", json=enrichment_params
+                )
+                call.record_response(response)
             response.raise_for_status()
 
             data = response.json()
@@ -337,6 +345,10 @@ class ApolloContactDiscovery:
 
             # Match enriched data back to original contacts
             matches = data.get("matches", [])
+            APOLLO_CREDITS.inc(
+                data.get("credits_consumed", sum(1 for m in matches if m and m.get("person"))),
+                operation="bulk_match",
+            )
             for i, (original_contact, match_data) in enumerate(zip(contacts, matches)):
                 if match_data and match_data.get("person"):
                     enriched_contact = self._parse_enrichment_result(
@@ -420,27 +432,15 @@ class ApolloContactDiscovery:
 
     def _rate_limit_search(self):
         """Rate limiting for search API calls"""
-        current_time = time.time()
-        elapsed = current_time - self.last_search_time
-
-        if elapsed < self.search_delay:
-            sleep_time = self.search_delay - elapsed
-            logger.debug(f"⏱️ Rate limiting: sleeping {sleep_time:.1f}s")
-            time.sleep(sleep_time)
-
-        self.last_search_time = time.time()
+        waited = self.rate_limiter.acquire()
+        if waited:
+            logger.debug(f"⏱️ Rate limiting: waited {waited:.1f}s")
 
     def _rate_limit_enrichment(self):
         """Rate limiting for enrichment API calls"""
-        current_time = time.time()
-        elapsed = current_time - self.last_enrichment_time
-
-        if elapsed < self.enrichment_delay:
-            sleep_time = self.enrichment_delay - elapsed
-            logger.debug(f"⏱️ Rate limiting: sleeping {sleep_time:.1f}s")
-            time.sleep(sleep_time)
-
-        self.last_enrichment_time = time.time()
+        waited = self.rate_limiter.acquire(tokens=2)
+        if waited:
+            logger.debug(f"⏱️ Rate limiting: waited {waited:.1f}s")
 
     def get_api_credits_remaining(self) -> Optional[dict]:
         """
@@ -11,6 +11,8 @@ from dataclasses import dataclass
 
 import openai
 
+from ..utils.llm_gateway import get_llm_gateway
+
 
 @dataclass
 class EngagementIntelligence:
@@ -439,14 +441,15 @@ class EnhancedEngagementIntelligence:
             Format each idea as: "Action: Specific thing to do - Why: Value it provides"
             """
 
-            response = self.openai_client.chat.completions.create(
+            reply = get_llm_gateway().complete(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=400,
                 temperature=0.7,
+                client=lambda: self.openai_client,
             )
 
-            ai_ideas = response.choices[0].message.content.strip().split("\n")
+            ai_ideas = reply.strip().split("\n")
             filtered_ideas = [
                 idea.strip() for idea in ai_ideas if idea.strip() and len(idea.strip()) > 20
             ]
@@ -4,8 +4,11 @@ Enhanced Trigger Event Detection Engine
 Implements Phase 1 requirements from skill specification with real source URLs
 """
 
+import contextvars
+import json
 import os
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
@@ -13,8 +16,33 @@ from typing import Optional
 import openai
 import requests
 
+from ..utils.brave_client import get_brave_client
+from ..utils.instrumentation import span
+from ..utils.llm_gateway import get_llm_gateway
+
 # Removed serpapi dependency - using Brave Search API instead
 
+# News results scored per batched LLM call
+NEWS_ANALYSIS_BATCH_SIZE = 20
+
+# Overall time budget (seconds) for detect_trigger_events across all sources
+TRIGGER_DETECTION_DEADLINE = 45.0
+
+# Concurrent requests allowed to one company website
+WEBSITE_HOST_CONCURRENCY = 3
+
+_host_semaphores: dict[str, threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def _host_slots(host: str) -> threading.BoundedSemaphore:
+    """Process-wide semaphore capping concurrent requests to one host"""
+    key = (host or "").strip().lower()
+    with _host_semaphores_lock:
+        if key not in _host_semaphores:
+            _host_semaphores[key] = threading.BoundedSemaphore(WEBSITE_HOST_CONCURRENCY)
+        return _host_semaphores[key]
+
 
 @dataclass
 class TriggerEvent:
@@ -212,11 +240,18 @@ class EnhancedTriggerEventDetector:
         }
 
     def detect_trigger_events(
-        self, company_name: str, company_domain: str, lookback_days: int = 90
+        self,
+        company_name: str,
+        company_domain: str,
+        lookback_days: int = 90,
+        deadline_seconds: Optional[float] = None,
     ) -> list[TriggerEvent]:
         """
         Main entry point for trigger event detection
         Returns list of events with real source URLs and complete metadata
+
+        All sources are searched concurrently; events from sources still running
+        after deadline_seconds (default TRIGGER_DETECTION_DEADLINE) are dropped.
         """
         print(f"🔍 Detecting trigger events for {company_name} (past {lookback_days} days)")
 
@@ -230,11 +265,32 @@ class EnhancedTriggerEventDetector:
             self._search_job_postings,
         ]
 
-        for search_func in sources:
+        # Sources run concurrently; Brave and OpenAI calls still draw from the
+        # shared provider rate limiters, so no fixed sleep is needed between them.
+        # Whatever hasn't finished by the deadline is abandoned.
+        executor = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="trigger")
+        futures = {
+            executor.submit(
+                contextvars.copy_context().run,
+                search_func,
+                company_name,
+                company_domain,
+                lookback_days,
+            ): search_func
+            for search_func in sources
+        }
+        done, not_done = wait(
+            futures,
+            timeout=TRIGGER_DETECTION_DEADLINE if deadline_seconds is None else deadline_seconds,
+        )
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        for future, search_func in futures.items():
+            if future in not_done:
+                print(f"⏱️ {search_func.__name__} missed the detection deadline, skipping")
+                continue
             try:
-                events = search_func(company_name, company_domain, lookback_days)
-                all_events.extend(events)
-                time.sleep(1)  # Rate limiting
+                all_events.extend(future.result())
             except Exception as e:
                 print(f"⚠️ Error in {search_func.__name__}: {e}")
                 continue
@@ -255,44 +311,46 @@ class EnhancedTriggerEventDetector:
             return []
 
         events = []
+        news_items = []  # (Brave result, event type)
 
         # Search for each event category
         for event_type, config in self.event_categories.items():
             query = f'"{company_name}" ({" OR ".join(config["keywords"][:5])})'
 
             try:
-                headers = {"X-Subscription-Token": self.brave_api_key, "Accept": "application/json"}
-
                 params = {
-                    "q": query,
                     "result_filter": "news",  # News search filter
                     "count": 10,
                     "offset": 0,
                     "freshness": f"pd{lookback_days}" if lookback_days <= 30 else "pm",  # Past days
                 }
 
-                response = requests.get(
-                    "https://api.search.brave.com/res/v1/web/search",
-                    headers=headers,
-                    params=params,
-                    timeout=10,
-                )
-
-                if response.status_code == 200:
-                    results = response.json()
+                results = get_brave_client().search(query, params, timeout=10)
 
+                if results:
                     if "news" in results and "results" in results["news"]:
                         for result in results["news"]["results"]:
-                            event = self._create_event_from_brave_result(
-                                result, event_type, company_name
-                            )
-                            if event:
-                                events.append(event)
+                            news_items.append((result, event_type))
 
             except Exception as e:
                 print(f"⚠️ Error searching Brave News for {event_type}: {e}")
                 continue
 
+        # Score every result with a few batched LLM calls instead of one per result
+        analyses = self._analyze_news_batch(
+            [
+                (result.get("title", ""), result.get("description", ""), event_type)
+                for result, event_type in news_items
+            ],
+            company_name,
+        )
+        for (result, event_type), analysis in zip(news_items, analyses):
+            event = self._create_event_from_brave_result(
+                result, event_type, company_name, analysis=analysis
+            )
+            if event:
+                events.append(event)
+
         return events
 
     def _search_company_website(
@@ -313,25 +371,46 @@ class EnhancedTriggerEventDetector:
             "/about/news",
         ]
 
-        for path in news_paths:
-            try:
-                url = f"https://{company_domain}{path}"
-                response = requests.get(
-                    url,
-                    timeout=10,
-                    headers={"User-Agent": "Mozilla/5.0 (compatible; VerdigrisABM/1.0)"},
+        host_slots = _host_slots(company_domain)
+        unreachable = threading.Event()
+
+        def fetch(path: str) -> list[TriggerEvent]:
+            url = f"https://{company_domain}{path}"
+            with host_slots:
+                # One connection failure means the host is down; skip the other paths
+                if unreachable.is_set():
+                    return []
+                try:
+                    with span("website.fetch") as call:
+                        response = requests.get(
+                            url,
+                            timeout=10,
+                            headers={"User-Agent": "Mozilla/5.0 (compatible; VerdigrisABM/1.0)"},
+                        )
+                        call.record_response(response)
+                except (requests.ConnectionError, requests.Timeout):
+                    unreachable.set()
+                    return []
+
+            if response.status_code == 200:
+                # Use AI to extract recent announcements
+                return self._extract_events_from_webpage(
+                    response.text, url, company_name, lookback_days
                 )
+            return []
 
-                if response.status_code == 200:
-                    # Use AI to extract recent announcements
-                    events.extend(
-                        self._extract_events_from_webpage(
-                            response.text, url, company_name, lookback_days
-                        )
-                    )
+        with ThreadPoolExecutor(max_workers=len(news_paths), thread_name_prefix="website") as pool:
+            futures = [
+                pool.submit(contextvars.copy_context().run, fetch, path) for path in news_paths
+            ]
+            for future in futures:
+                try:
+                    events.extend(future.result())
+                except Exception:
+                    continue  # Try next path
 
-            except Exception:
-                continue  # Try next path
+        if unreachable.is_set():
+            print(f"⚠️ {company_domain} is unreachable, skipped remaining news paths")
 
         return events
 
@@ -439,9 +518,18 @@ class EnhancedTriggerEventDetector:
             return None
 
     def _create_event_from_brave_result(
-        self, result: dict, event_type: str, company_name: str
+        self,
+        result: dict,
+        event_type: str,
+        company_name: str,
+        analysis: Optional[tuple[str, int, int]] = None,
     ) -> Optional[TriggerEvent]:
-        """Convert Brave search result to TriggerEvent"""
+        """
+        Convert Brave search result to TriggerEvent
+
+        analysis is the (description, confidence, relevance) already produced by
+        _analyze_news_batch; without it the result is analyzed on its own.
+        """
         try:
             title = result.get("title", "")
             description = result.get("description", "")
@@ -458,9 +546,9 @@ class EnhancedTriggerEventDetector:
                 source = "Unknown Source"
 
             # Use AI to generate detailed description and scoring
-            description_text, confidence_score, relevance_score = self._analyze_news_content(
-                title, description, event_type, company_name
-            )
+            if analysis is None:
+                analysis = self._analyze_news_content(title, description, event_type, company_name)
+            description_text, confidence_score, relevance_score = analysis
 
             # Determine confidence level based on source
             confidence = self._determine_confidence_level(source, url)
@@ -469,15 +557,16 @@ class EnhancedTriggerEventDetector:
             urgency = self._calculate_urgency(confidence_score, relevance_score, age)
 
             return TriggerEvent(
-                event_type=event_type,
-                title=title,
                 description=description_text,
+                event_type=event_type,
+                confidence=confidence,
+                confidence_score=confidence_score,
+                relevance_score=relevance_score,
                 source_url=url,
-                discovery_date=datetime.now().isoformat(),
-                confidence_level=confidence,
+                source_type="News Article",
+                detected_date=datetime.now().isoformat(),
+                occurred_date=datetime.now().isoformat(),
                 urgency_level=urgency,
-                company_name=company_name,
-                source_name=source,
             )
 
         except Exception as e:
@@ -506,14 +595,15 @@ class EnhancedTriggerEventDetector:
             Format: Description|Confidence|Relevance
             """
 
-            response = self.openai_client.chat.completions.create(
+            reply = get_llm_gateway().complete(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=200,
                 temperature=0.3,
+                client=lambda: self.openai_client,
             )
 
-            result = response.choices[0].message.content.strip()
+            result = reply.strip()
             parts = result.split("|")
 
             if len(parts) >= 3:
@@ -530,6 +620,79 @@ class EnhancedTriggerEventDetector:
             print(f"⚠️ Error in AI content analysis: {e}")
             return f"{company_name} {event_type} event detected", 70, 60
 
+    def _analyze_news_batch(
+        self, items: list[tuple[str, str, str]], company_name: str
+    ) -> list[tuple[str, int, int]]:
+        """
+        Analyze many (title, snippet, event_type) news items with batched AI calls
+
+        Items are sent NEWS_ANALYSIS_BATCH_SIZE at a time in one JSON-mode request.
+        Returns a (description, confidence, relevance) tuple per item, in order;
+        items missing from or malformed in a batch response (or a whole failed
+        batch) fall back to _analyze_news_content one at a time.
+        """
+        analyses: list[tuple[str, int, int]] = []
+
+        for start in range(0, len(items), NEWS_ANALYSIS_BATCH_SIZE):
+            batch = items[start : start + NEWS_ANALYSIS_BATCH_SIZE]
+            parsed: dict = {}
+
+            try:
+                news_text = "\n\n".join(
+                    f"ITEM_{i}\nTitle: {title}\nContent: {snippet}\nEvent Type: {event_type}"
+                    for i, (title, snippet, event_type) in enumerate(batch)
+                )
+                prompt = f"""
+            Analyze these {len(batch)} news items about {company_name} for Verdigris ABM intelligence.
+
+            For each item generate:
+            1. A clear, actionable description (1 sentence)
+            2. Confidence score (0-100): How certain is this information?
+            3. Relevance score (0-100): How relevant to power monitoring/data center infrastructure?
+
+            Focus on power, energy, capacity, monitoring, reliability aspects.
+
+            News items:
+            ---
+            {news_text}
+            ---
+
+            Return a JSON object where keys are ITEM_0, ITEM_1, etc. and each value is
+            {{"description": str, "confidence": int, "relevance": int}}
+            """
+
+                reply = get_llm_gateway().complete(
+                    model="gpt-4o-mini",
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=120 * len(batch),
+                    temperature=0.3,
+                    response_format={"type": "json_object"},
+                    client=lambda: self.openai_client,
+                )
+
+                parsed = json.loads(reply.strip())
+                if not isinstance(parsed, dict):
+                    parsed = {}
+            except Exception as e:
+                print(f"⚠️ Error in batched AI news analysis, analyzing items individually: {e}")
+
+            for i, (title, snippet, event_type) in enumerate(batch):
+                item = parsed.get(f"ITEM_{i}")
+                try:
+                    analyses.append(
+                        (
+                            str(item["description"]).strip(),
+                            int(item["confidence"]),
+                            int(item["relevance"]),
+                        )
+                    )
+                except (TypeError, KeyError, ValueError):
+                    analyses.append(
+                        self._analyze_news_content(title, snippet, event_type, company_name)
+                    )
+
+        return analyses
+
     def _determine_confidence_level(self, source: str, url: str) -> str:
         """Determine confidence level based on source"""
         source_lower = source.lower() if source else ""
@@ -594,15 +757,16 @@ class EnhancedTriggerEventDetector:
             Focus on power, energy, infrastructure, capacity topics.
             """
 
-            response = self.openai_client.chat.completions.create(
+            reply = get_llm_gateway().complete(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=300,
                 temperature=0.3,
+                client=lambda: self.openai_client,
             )
 
             events = []
-            lines = response.choices[0].message.content.strip().split("\n")
+            lines = reply.strip().split("\n")
 
             for line in lines:
                 parts = line.split("|")
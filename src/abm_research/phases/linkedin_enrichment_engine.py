@@ -12,6 +12,9 @@ from datetime import datetime, timedelta
 
 import openai
 
+from ..utils.instrumentation import span
+from ..utils.rate_limiter import provider_rate_limiter
+
 
 @dataclass
 class LinkedInEnrichmentData:
@@ -377,12 +380,14 @@ class LinkedInEnrichmentEngine:
             Return format: Theme1,Theme2,Theme3|RelevanceLevel|Points
             """
 
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=150,
-                temperature=0.3,
-            )
+            provider_rate_limiter("openai").acquire()
+            with span("openai.chat"):
+                response = self.openai_client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=150,
+                    temperature=0.3,
+                )
 
             result = response.choices[0].message.content.strip()
             parts = result.split("|")
@@ -13,6 +13,9 @@ from datetime import datetime
 import openai
 import requests
 
+from ..utils.instrumentation import span
+from ..utils.llm_gateway import get_llm_gateway
+
 
 @dataclass
 class StrategicPartnership:
@@ -253,11 +256,13 @@ class StrategicPartnershipIntelligence:
         for page_path in target_pages:
             try:
                 url = f"https://{company_domain}{page_path}"
-                response = requests.get(
-                    url,
-                    timeout=10,
-                    headers={"User-Agent": "Mozilla/5.0 (compatible; VerdigrisABM/1.0)"},
-                )
+                with span("website.fetch") as call:
+                    response = requests.get(
+                        url,
+                        timeout=10,
+                        headers={"User-Agent": "Mozilla/5.0 (compatible; VerdigrisABM/1.0)"},
+                    )
+                    call.record_response(response)
 
                 if response.status_code == 200:
                     partnerships.extend(
@@ -283,11 +288,13 @@ class StrategicPartnershipIntelligence:
         for path in pr_paths:
             try:
                 url = f"https://{company_domain}{path}"
-                response = requests.get(
-                    url,
-                    timeout=10,
-                    headers={"User-Agent": "Mozilla/5.0 (compatible; VerdigrisABM/1.0)"},
-                )
+                with span("website.fetch") as call:
+                    response = requests.get(
+                        url,
+                        timeout=10,
+                        headers={"User-Agent": "Mozilla/5.0 (compatible; VerdigrisABM/1.0)"},
+                    )
+                    call.record_response(response)
 
                 if response.status_code == 200:
                     # Look for partnership keywords in press releases
@@ -310,11 +317,13 @@ class StrategicPartnershipIntelligence:
 
         try:
             careers_url = f"https://{company_domain}/careers"
-            response = requests.get(
-                careers_url,
-                timeout=10,
-                headers={"User-Agent": "Mozilla/5.0 (compatible; VerdigrisABM/1.0)"},
-            )
+            with span("website.fetch") as call:
+                response = requests.get(
+                    careers_url,
+                    timeout=10,
+                    headers={"User-Agent": "Mozilla/5.0 (compatible; VerdigrisABM/1.0)"},
+                )
+                call.record_response(response)
 
             if response.status_code == 200:
                 # Use AI to extract technology mentions from job descriptions
@@ -375,14 +384,15 @@ class StrategicPartnershipIntelligence:
             Only return partnerships with clear evidence of relationship.
             """
 
-            response = self.openai_client.chat.completions.create(
+            reply = get_llm_gateway().complete(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=400,
                 temperature=0.3,
+                client=lambda: self.openai_client,
             )
 
-            lines = response.choices[0].message.content.strip().split("\n")
+            lines = reply.strip().split("\n")
 
             for line in lines:
                 parts = line.split("|")
@@ -435,14 +445,15 @@ class StrategicPartnershipIntelligence:
             Only return if there's clear evidence of technology usage.
             """
 
-            response = self.openai_client.chat.completions.create(
+            reply = get_llm_gateway().complete(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=300,
                 temperature=0.3,
+                client=lambda: self.openai_client,
             )
 
-            lines = response.choices[0].message.content.strip().split("\n")
+            lines = reply.strip().split("\n")
 
             for line in lines:
                 parts = line.split("|")
@@ -22,6 +22,8 @@ from typing import Optional
 
 import requests
 
+from .instrumentation import span
+
 logger = logging.getLogger(__name__)
 
 
@@ -312,7 +314,9 @@ class AccountIntelligenceEngine:
 
             for url in pages_to_check:
                 try:
-                    response = self.session.get(url, timeout=10, allow_redirects=True)
+                    with span("website.fetch") as call:
+                        response = self.session.get(url, timeout=10, allow_redirects=True)
+                        call.record_response(response)
                     if response.status_code == 200:
                         content = response.text.lower()
 
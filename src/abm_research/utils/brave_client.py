@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Shared Brave Search client
+
+Every Brave web search in the process goes through one client that:
+- draws from the process-wide "brave" rate limiter (our plan quota),
+- serves repeated (query, params) searches from a SQLite TTL cache,
+- coalesces identical searches already in flight on other threads into a
+  single request (single-flight), and
+- backs every caller off on HTTP 429, honouring Retry-After, before retrying.
+
+search() returns the parsed JSON body, or None when the search can't be
+made (no API key, non-200 status, network error); failures are logged here
+and never cached. Callers that report the reason pass raise_errors=True to
+get a BraveSearchError with an error code instead.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+
+import requests
+
+from .instrumentation import span
+from .metrics import counter
+from .rate_limiter import TokenBucket, provider_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# Project root, where the default cache database lives (like the job-queue database)
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+BRAVE_WEB_SEARCH_URL = "https://api.search.brave.com/res/v1/web/search"
+
+DEFAULT_BRAVE_CACHE_TTL_SECONDS = 6 * 3600
+DEFAULT_BRAVE_MAX_RETRIES = 3
+
+BRAVE_SEARCHES = counter("abm_brave_searches_total", "Brave searches by cache result", ("result",))
+
+
+def search_key(query: str, params: Optional[dict] = None) -> str:
+    """Content hash identifying a search"""
+    payload = json.dumps({"q": query, "params": params or {}}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class BraveResponseCache:
+    """SQLite store of Brave response bodies with a TTL"""
+
+    def __init__(
+        self,
+        db_path: str,
+        ttl_seconds: float = DEFAULT_BRAVE_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            db_path: SQLite file for the cache table
+            ttl_seconds: Age after which a response is ignored and purged
+            clock: Wall-clock source (injectable for tests)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._init_db()
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS brave_cache (
+                    key TEXT PRIMARY KEY,
+                    query TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_brave_cache_created ON brave_cache(created_at)"
+            )
+
+    def get(self, key: str) -> Optional[dict]:
+        """Cached response body, or None if missing or expired"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload FROM brave_cache WHERE key = ? AND created_at >= ?",
+                (key, self._clock() - self.ttl_seconds),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, query: str, data: dict) -> None:
+        """Store a response body and purge expired ones"""
+        now = self._clock()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO brave_cache VALUES (?, ?, ?, ?)",
+                (key, query, json.dumps(data), now),
+            )
+            conn.execute("DELETE FROM brave_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM brave_cache").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM brave_cache")
+
+
+class BraveSearchError(Exception):
+    """A Brave search that failed, with a code for dashboards and an optional retry hint"""
+
+    def __init__(self, message: str, error_code: str, retry_after: Optional[int] = None):
+        super().__init__(message)
+        self.error_code = error_code
+        self.retry_after = retry_after
+
+
+class _Flight:
+    """A search in progress that other callers can wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[dict] = None
+        self.error: Optional[BraveSearchError] = None
+
+
+class BraveSearchClient:
+    """Rate-limited, cached and coalesced Brave web search"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[BraveResponseCache] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        max_retries: int = DEFAULT_BRAVE_MAX_RETRIES,
+    ):
+        """
+        Args:
+            api_key: Brave subscription token (default BRAVE_API_KEY, read per search)
+            cache: Response cache; None disables caching
+            rate_limiter: Request budget (default the process-wide "brave" limiter)
+            max_retries: Retries after HTTP 429 before giving up
+        """
+        self._api_key = api_key
+        self.cache = cache
+        self.rate_limiter = rate_limiter or provider_rate_limiter("brave")
+        self.max_retries = max_retries
+        self._lock = threading.Lock()
+        self._inflight: dict[str, _Flight] = {}
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0, "bypassed": 0, "throttled": 0}
+
+    @property
+    def api_key(self) -> Optional[str]:
+        return self._api_key or os.getenv("BRAVE_API_KEY")
+
+    def search(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+        timeout: float = 15,
+        bypass_cache: bool = False,
+        raise_errors: bool = False,
+    ) -> Optional[dict]:
+        """
+        Run a web search.
+
+        Args:
+            query: Search query (the q parameter)
+            params: Other query parameters (count, freshness, result_filter, ...);
+                    part of the cache key
+            timeout: Per-request timeout in seconds
+            bypass_cache: Skip the cache lookup (a successful response is still stored)
+            raise_errors: Raise BraveSearchError on failure instead of returning None
+
+        Returns:
+            The parsed response body, or None if the search failed
+        """
+        params = params or {}
+        key = search_key(query, params)
+
+        if self.cache is not None and not bypass_cache:
+            try:
+                cached = self.cache.get(key)
+            except Exception as e:
+                logger.warning(f"⚠️  Brave cache lookup failed, searching uncached: {e}")
+                cached = None
+            if cached is not None:
+                self._count("hits", "hit")
+                return cached
+
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+
+        if leader:
+            if bypass_cache:
+                self._count("bypassed", "bypass")
+            else:
+                self._count("misses", "miss")
+            try:
+                flight.result = self._fetch(query, params, timeout)
+            except BraveSearchError as e:
+                logger.warning(f"Brave search failed: {e}")
+                flight.error = e
+            except Exception as e:
+                # Anything else still reaches every waiting caller as a coded error
+                logger.warning(f"Brave search failed: {e}")
+                flight.error = BraveSearchError(f"Unexpected error: {e}", "BRAVE_UNKNOWN_ERROR")
+            else:
+                if self.cache is not None:
+                    try:
+                        self.cache.set(key, query, flight.result)
+                    except Exception as e:
+                        logger.warning(f"⚠️  Brave cache write failed, response not cached: {e}")
+            finally:
+                with self._lock:
+                    del self._inflight[key]
+                flight.done.set()
+        else:
+            # Same search already running on another thread; share its outcome
+            self._count("coalesced", "coalesced")
+            flight.done.wait()
+
+        if flight.error is not None:
+            if raise_errors:
+                raise flight.error
+            return None
+        return copy.deepcopy(flight.result)
+
+    def _fetch(self, query: str, params: dict, timeout: float) -> dict:
+        """One search against the API, retrying on 429; raises BraveSearchError"""
+        api_key = self.api_key
+        if not api_key:
+            raise BraveSearchError("BRAVE_API_KEY not set", "BRAVE_NOT_CONFIGURED")
+
+        headers = {"X-Subscription-Token": api_key, "Accept": "application/json"}
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                with span("brave.search") as call:
+                    response = requests.get(
+                        BRAVE_WEB_SEARCH_URL,
+                        params={"q": query, **params},
+                        headers=headers,
+                        timeout=timeout,
+                    )
+                    call.record_response(response)
+            except requests.exceptions.Timeout as e:
+                raise BraveSearchError(
+                    f"Brave API request timed out after {timeout:g} seconds", "BRAVE_TIMEOUT"
+                ) from e
+            except requests.exceptions.ConnectionError as e:
+                raise BraveSearchError(
+                    "Could not connect to Brave API", "BRAVE_CONNECTION_ERROR"
+                ) from e
+            except requests.RequestException as e:
+                raise BraveSearchError(f"Unexpected error: {e}", "BRAVE_UNKNOWN_ERROR") from e
+
+            if response.status_code == 200:
+                try:
+                    return response.json()
+                except ValueError as e:
+                    raise BraveSearchError(
+                        "Brave API returned an invalid JSON body", "BRAVE_INVALID_RESPONSE"
+                    ) from e
+
+            if response.status_code != 429:
+                raise BraveSearchError(
+                    f"Brave API returned status {response.status_code}",
+                    f"BRAVE_HTTP_{response.status_code}",
+                )
+
+            with self._lock:
+                self._stats["throttled"] += 1
+            if attempt < self.max_retries:
+                wait = _retry_after(response) or 2**attempt
+                logger.warning(
+                    f"🔁 Brave rate limited; retry {attempt + 1}/{self.max_retries} in {wait:.1f}s"
+                )
+                # Every thread sharing the budget backs off; the next acquire() waits it out
+                self.rate_limiter.pause(wait)
+
+        raise BraveSearchError(
+            f"Rate limited by Brave API. Retried {self.max_retries} times.",
+            "BRAVE_RATE_LIMITED",
+            retry_after=60,  # Suggest waiting a minute before trying again
+        )
+
+    def _count(self, stat: str, result: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+        BRAVE_SEARCHES.inc(result=result)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        stats["entries"] = len(self.cache) if self.cache is not None else 0
+        return stats
+
+
+def _retry_after(response: Any) -> Optional[float]:
+    """Seconds from a Retry-After header, if present and numeric"""
+    try:
+        return float(response.headers.get("Retry-After"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+_client: Optional[BraveSearchClient] = None
+_client_lock = threading.Lock()
+
+
+def get_brave_client() -> BraveSearchClient:
+    """
+    The process-wide client, created on first use from the environment:
+    ABM_BRAVE_CACHE_DB (default brave_cache.db in the project root) and
+    ABM_BRAVE_CACHE_TTL (seconds).
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            cache = None
+            try:
+                cache = BraveResponseCache(
+                    os.environ.get(
+                        "ABM_BRAVE_CACHE_DB", os.path.join(project_root, "brave_cache.db")
+                    ),
+                    ttl_seconds=float(
+                        os.environ.get("ABM_BRAVE_CACHE_TTL", DEFAULT_BRAVE_CACHE_TTL_SECONDS)
+                    ),
+                )
+            except Exception as e:
+                logger.warning(f"⚠️  Brave response cache unavailable: {e}")
+            _client = BraveSearchClient(cache=cache)
+        return _client
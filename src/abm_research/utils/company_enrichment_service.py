@@ -8,13 +8,17 @@ Replaces hardcoded lookup tables with scalable API-based enrichment
 import logging
 import os
 import re
-import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
 import requests
 
+from .brave_client import get_brave_client
+from .instrumentation import span
+from .metrics import APOLLO_CREDITS
+from .rate_limiter import provider_rate_limiter
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -55,7 +59,6 @@ class CompanyEnrichmentService:
             logger.warning("BRAVE_API_KEY not set - Brave fallback will be disabled")
 
         self.apollo_base_url = "https://api.apollo.io/v1"
-        self.brave_base_url = "https://api.search.brave.com/res/v1/web/search"
 
         self.session = requests.Session()
         self.session.headers.update(
@@ -66,10 +69,6 @@ class CompanyEnrichmentService:
             }
         )
 
-        # Rate limiting
-        self.last_request_time = 0
-        self.request_delay = 1.0  # 1 second between requests
-
         # Cache for enriched companies (in-memory cache for session)
         self.company_cache = {}
 
@@ -126,17 +125,20 @@ class CompanyEnrichmentService:
             return None
 
         try:
-            self._apply_rate_limit()
+            self._apply_rate_limit("apollo")
 
             logger.info(f"🔍 Apollo Organization Enrichment for {domain}")
 
-            response = self.session.post(
-                f"{self.apollo_base_url}/organizations/enrich", json={"domain": domain}
-            )
+            with span("apollo.organization_enrich") as call:
+                response = self.session.post(
+                    f"{self.apollo_base_url}/organizations/enrich", json={"domain": domain}
+                )
+                call.record_response(response)
 
             logger.debug(f"Apollo enrich response status: {response.status_code}")
 
             if response.status_code == 200:
+                APOLLO_CREDITS.inc(operation="organization_enrich")
                 data = response.json()
                 org = data.get("organization", {})
 
@@ -216,7 +218,7 @@ class CompanyEnrichmentService:
         Fallback: Extract organization data from Apollo people search
         """
         try:
-            self._apply_rate_limit()
+            self._apply_rate_limit("apollo")
 
             # Search for any person at this organization to get org data
             search_params = {
@@ -227,9 +229,11 @@ class CompanyEnrichmentService:
             logger.info(f"🔍 Searching Apollo people for org data at {domain}")
             logger.debug(f"People search params: {search_params}")
 
-            response = self.session.post(
-                f"{self.apollo_base_url}/mixed_people/search", json=search_params
-            )
+            with span("apollo.search") as call:
+                response = self.session.post(
+                    f"{self.apollo_base_url}/mixed_people/search", json=search_params
+                )
+                call.record_response(response)
 
             logger.debug(f"People search response status: {response.status_code}")
 
@@ -412,24 +416,14 @@ class CompanyEnrichmentService:
             return None
 
         try:
-            self._apply_rate_limit()
-
             # Search for company information
             query = f"{company_name} company employees headquarters funding"
             logger.info(f"🔍 Searching Brave for company data: {company_name}")
 
-            response = requests.get(
-                self.brave_base_url,
-                params={"q": query, "count": 5},
-                headers={"X-Subscription-Token": self.brave_api_key, "Accept": "application/json"},
-                timeout=15,
-            )
-
-            if response.status_code != 200:
-                logger.warning(f"Brave search failed: {response.status_code}")
+            data = get_brave_client().search(query, {"count": 5})
+            if data is None:
                 return None
 
-            data = response.json()
             web_results = data.get("web", {}).get("results", [])
 
             if not web_results:
@@ -524,12 +518,9 @@ class CompanyEnrichmentService:
             enriched_at=datetime.now(),
         )
 
-    def _apply_rate_limit(self):
-        """Apply rate limiting between API requests"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.request_delay:
-            time.sleep(self.request_delay - elapsed)
-        self.last_request_time = time.time()
+    def _apply_rate_limit(self, provider: str):
+        """Wait for the process-wide budget of the provider about to be called"""
+        provider_rate_limiter(provider).acquire()
 
     def get_enrichment_stats(self) -> dict:
         """Get statistics about enriched companies"""
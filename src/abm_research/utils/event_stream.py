@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Server-Sent Events helpers for long-running endpoints
+
+An EventStream runs an endpoint's work on a background thread and yields
+its progress as SSE frames while it runs: phase_start / phase_complete
+(with per-phase duration), partial results, then a final result or error.
+Every event carries the seconds elapsed since the stream started. Comment
+frames are sent while the work is quiet so proxies don't close the
+connection as idle.
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_SECONDS = 15
+HEARTBEAT_FRAME = ": keepalive\n\n"
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+_DONE = object()
+
+
+def format_sse(event: str, data: Any, event_id: Optional[int] = None) -> str:
+    """Encode one SSE frame with a JSON data payload"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    for line in json.dumps(data, default=str).splitlines():
+        lines.append(f"data: {line}")
+    return "\n".join(lines) + "\n\n"
+
+
+def progress_event(status: str) -> str:
+    """Map a progress(phase, status) status to its SSE event name"""
+    if status == "running":
+        return "phase_start"
+    if status == "completed":
+        return "phase_complete"
+    return "partial"
+
+
+class EventStream:
+    """Runs work on a thread and yields the events it emits as SSE frames"""
+
+    def __init__(
+        self,
+        heartbeat: float = HEARTBEAT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.heartbeat = heartbeat
+        self._clock = clock
+        self._started = clock()
+        self._queue: queue.Queue = queue.Queue()
+        self._phase_started: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def elapsed(self) -> float:
+        return round(self._clock() - self._started, 3)
+
+    def emit(self, event: str, data: Optional[dict] = None) -> None:
+        """Queue an event; 'elapsed' is added to its data"""
+        payload = dict(data or {})
+        payload.setdefault("elapsed", self.elapsed())
+        self._queue.put((event, payload))
+
+    def progress(self, phase: str, status: str, **details: Any) -> None:
+        """
+        progress_callback adapter.
+
+        'running' emits phase_start, 'completed' emits phase_complete with the
+        phase duration, and any other status emits a partial result.
+        """
+        now = self._clock()
+        with self._lock:
+            if status == "running":
+                self._phase_started[phase] = now
+            elif status == "completed" and phase in self._phase_started:
+                details["duration"] = round(now - self._phase_started.pop(phase), 3)
+        if status not in ("running", "completed"):
+            details["status"] = status
+        self.emit(progress_event(status), {"phase": phase, **details})
+
+    def run(self, work: Callable[["EventStream"], tuple[dict, int]]) -> Iterator[str]:
+        """
+        Start work(stream) on a thread and return the frame iterator.
+
+        work returns (payload, status_code), which is sent as the 'result'
+        event; an exception is sent as the 'error' event.
+        """
+
+        def target() -> None:
+            try:
+                payload, status_code = work(self)
+                self.emit("result", {**payload, "status_code": status_code})
+            except Exception as e:
+                logger.error(f"❌ Streamed work failed: {e}")
+                self.emit("error", {"message": str(e), "type": type(e).__name__})
+            finally:
+                self._queue.put(_DONE)
+
+        threading.Thread(target=target, name="event-stream", daemon=True).start()
+        return self.frames()
+
+    def frames(self) -> Iterator[str]:
+        """Yield queued events as SSE frames until the work finishes"""
+        event_id = 0
+        while True:
+            try:
+                item = self._queue.get(timeout=self.heartbeat)
+            except queue.Empty:
+                yield HEARTBEAT_FRAME
+                continue
+            if item is _DONE:
+                return
+            event, data = item
+            event_id += 1
+            yield format_sse(event, data, event_id)
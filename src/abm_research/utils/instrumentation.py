@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Timing spans for research phases and external calls
+
+Wrap a unit of work in span("provider.operation") to record its latency,
+response bytes and errors. Every span is aggregated into a process-wide
+Instrumentation; a research run can also collect its own spans by
+activating a run-level Instrumentation, which then receives the spans of
+every call made in that context (including phases the run starts on other
+threads with contextvars.copy_context()).
+
+Snapshots report per span name: count, errors, throttled (HTTP 429), bytes,
+total/average/max seconds and p50/p90/p99 latency over the most recent
+samples.
+"""
+
+import contextvars
+import logging
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Latency samples kept per span name for percentiles
+DEFAULT_RESERVOIR_SIZE = 1024
+
+# Histogram bucket upper bounds (seconds), as exported by /metrics
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+_run_recorders: contextvars.ContextVar[tuple["Instrumentation", ...]] = contextvars.ContextVar(
+    "run_instrumentation", default=()
+)
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[rank]
+
+
+class SpanStats:
+    """Aggregated measurements for one span name"""
+
+    def __init__(self, reservoir_size: int = DEFAULT_RESERVOIR_SIZE):
+        self.count = 0
+        self.errors = 0
+        self.throttled = 0
+        self.bytes = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.latencies: deque[float] = deque(maxlen=reservoir_size)
+        self.bucket_counts = [0] * len(LATENCY_BUCKETS)  # cumulative, all samples
+
+    def add(self, seconds: float, nbytes: int, error: bool, status_code: Optional[int]) -> None:
+        self.count += 1
+        self.errors += int(error)
+        self.throttled += int(status_code == 429)
+        self.bytes += nbytes
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.latencies.append(seconds)
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.bucket_counts[index] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        ordered = sorted(self.latencies)
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "throttled": self.throttled,
+            "bytes": self.bytes,
+            "total_seconds": round(self.total_seconds, 3),
+            "avg_seconds": round(self.total_seconds / self.count, 3) if self.count else 0.0,
+            "p50_seconds": round(_percentile(ordered, 50), 3),
+            "p90_seconds": round(_percentile(ordered, 90), 3),
+            "p99_seconds": round(_percentile(ordered, 99), 3),
+            "max_seconds": round(self.max_seconds, 3),
+        }
+
+
+class Instrumentation:
+    """Thread-safe collection of span measurements keyed by span name"""
+
+    def __init__(self, reservoir_size: int = DEFAULT_RESERVOIR_SIZE):
+        self.reservoir_size = reservoir_size
+        self._lock = threading.Lock()
+        self._spans: dict[str, SpanStats] = {}
+
+    def record(
+        self,
+        name: str,
+        seconds: float,
+        nbytes: int = 0,
+        error: bool = False,
+        status_code: Optional[int] = None,
+    ) -> None:
+        """Add one measurement to a span name"""
+        with self._lock:
+            stats = self._spans.get(name)
+            if stats is None:
+                stats = self._spans[name] = SpanStats(self.reservoir_size)
+            stats.add(seconds, nbytes, error, status_code)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Stats for every span name, sorted by name"""
+        with self._lock:
+            return {name: self._spans[name].to_dict() for name in sorted(self._spans)}
+
+    def histograms(self) -> dict[str, dict[str, Any]]:
+        """
+        Cumulative latency buckets per span name, for Prometheus export:
+        {name: {"buckets": [(bound, count)], "total_seconds", "count",
+        "errors", "throttled", "bytes"}}
+        """
+        with self._lock:
+            return {
+                name: {
+                    "buckets": list(zip(LATENCY_BUCKETS, stats.bucket_counts)),
+                    "total_seconds": stats.total_seconds,
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "throttled": stats.throttled,
+                    "bytes": stats.bytes,
+                }
+                for name, stats in sorted(self._spans.items())
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+class Span:
+    """An in-progress measurement; callers attach response details to it"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.bytes = 0
+        self.error = False
+        self.status_code: Optional[int] = None
+
+    def record_response(self, response: Any) -> None:
+        """Take bytes and status from an HTTP response; 4xx/5xx count as errors"""
+        status_code = getattr(response, "status_code", None)
+        content = getattr(response, "content", None)
+        if isinstance(status_code, int):
+            self.status_code = status_code
+            self.error = self.error or status_code >= 400
+        if isinstance(content, (bytes, str)):
+            self.bytes += len(content)
+
+
+# Every span in the process, across runs
+_process_instrumentation = Instrumentation()
+
+
+def process_instrumentation() -> Instrumentation:
+    """The process-wide aggregate of all spans"""
+    return _process_instrumentation
+
+
+@contextmanager
+def span(name: str) -> Iterator[Span]:
+    """
+    Time the enclosed block as span `name`.
+
+    Exceptions are counted as errors and re-raised. The measurement goes to
+    the process-wide aggregate and to every run collecting in this context.
+    """
+    current = Span(name)
+    started = time.perf_counter()
+    try:
+        yield current
+    except BaseException:
+        current.error = True
+        raise
+    finally:
+        seconds = time.perf_counter() - started
+        for recorder in (_process_instrumentation, *_run_recorders.get()):
+            recorder.record(name, seconds, current.bytes, current.error, current.status_code)
+
+
+def start_collecting(recorder: Instrumentation) -> contextvars.Token:
+    """
+    Also record spans made in this context (and contexts copied from it) into
+    recorder, until stop_collecting(token) is called in the same context.
+    """
+    return _run_recorders.set((*_run_recorders.get(), recorder))
+
+
+def stop_collecting(token: contextvars.Token) -> None:
+    _run_recorders.reset(token)
+
+
+@contextmanager
+def collect(recorder: Optional[Instrumentation] = None) -> Iterator[Instrumentation]:
+    """Context-manager form of start_collecting/stop_collecting"""
+    recorder = recorder or Instrumentation()
+    token = start_collecting(recorder)
+    try:
+        yield recorder
+    finally:
+        stop_collecting(token)
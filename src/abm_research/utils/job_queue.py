@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Background job queue with a persistent SQLite job table
+
+Long-running work (e.g. the 5-phase account research pipeline) is submitted
+as a job and runs on a bounded thread pool, so HTTP handlers return a job id
+immediately instead of holding a worker for minutes. Runners report
+per-phase progress through a callback; status, progress, result and error
+are written to SQLite so they can be polled from any request and survive a
+process restart. Jobs that were queued or running when the process stopped
+are re-submitted by recover() if their kind has a registered runner.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# progress(phase, status, **details) - called by runners as work advances
+ProgressCallback = Callable[..., None]
+JobRunner = Callable[[dict, ProgressCallback], Any]
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+ACTIVE_STATUSES = (JOB_QUEUED, JOB_RUNNING)
+
+
+class JobQueueFull(Exception):
+    """Raised when too many jobs are already waiting"""
+
+
+class JobQueue:
+    """Bounded background executor whose jobs are tracked in SQLite"""
+
+    def __init__(self, db_path: str, max_workers: int = 2, max_pending: int = 100):
+        """
+        Args:
+            db_path: SQLite file for the job table
+            max_workers: Jobs that may run at the same time
+            max_pending: Queued + running jobs allowed before submit() refuses
+        """
+        self.db_path = db_path
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._runners: dict[str, JobRunner] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._init_db()
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    params TEXT,
+                    progress TEXT,
+                    current_phase TEXT,
+                    result TEXT,
+                    error TEXT,
+                    attempts INTEGER DEFAULT 0,
+                    created_at TEXT,
+                    started_at TEXT,
+                    finished_at TEXT
+                )
+            """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)")
+
+    def register(self, kind: str, runner: JobRunner) -> None:
+        """Register the function that executes jobs of this kind"""
+        self._runners[kind] = runner
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Submission and lookup
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def submit(
+        self, kind: str, params: Optional[dict] = None, dedup_key: Optional[str] = None
+    ) -> dict:
+        """
+        Record a job and schedule it.
+
+        Args:
+            kind: Registered job kind
+            params: JSON-serializable parameters passed to the runner
+            dedup_key: Param name; if a job of this kind with the same value for
+                       it is already queued or running, that job is returned
+                       instead of starting another. The check and the insert
+                       are one SQLite transaction, so concurrent submits (from
+                       any process) can't both start a job.
+
+        Returns:
+            The job record (status 'queued', or the active duplicate's status)
+
+        Raises:
+            KeyError: If no runner is registered for kind
+            JobQueueFull: If max_pending jobs are already queued or running
+        """
+        if kind not in self._runners:
+            raise KeyError(f"No runner registered for job kind '{kind}'")
+
+        params = params or {}
+        job_id = uuid.uuid4().hex
+        with self._lock, self._connect() as conn:
+            # Take the write lock before reading so the check can't go stale
+            conn.execute("BEGIN IMMEDIATE")
+            if dedup_key is not None:
+                existing = self._find_active(conn, kind, dedup_key, params.get(dedup_key))
+                if existing:
+                    logger.info(f"♻️ Reusing active {kind} job {existing['id']}")
+                    return existing
+            active = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status IN (?, ?)", ACTIVE_STATUSES
+            ).fetchone()[0]
+            if active >= self.max_pending:
+                raise JobQueueFull(f"{self.max_pending} jobs already pending")
+            conn.execute(
+                """
+                INSERT INTO jobs (id, kind, status, params, progress, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    job_id,
+                    kind,
+                    JOB_QUEUED,
+                    json.dumps(params),
+                    json.dumps({}),
+                    datetime.now().isoformat(),
+                ),
+            )
+
+        # Read the record before scheduling: a fast job could otherwise finish first
+        job = self.get(job_id)
+        self._executor.submit(self._run, job_id)
+        logger.info(f"📥 Queued {kind} job {job_id}")
+        return job
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """Job record with params/progress/result decoded, or None"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._decode(row) if row else None
+
+    def find_active(self, kind: str, key: str, value: Any) -> Optional[dict]:
+        """Queued or running job of this kind whose params[key] == value"""
+        with self._connect() as conn:
+            return self._find_active(conn, kind, key, value)
+
+    def _find_active(
+        self, conn: sqlite3.Connection, kind: str, key: str, value: Any
+    ) -> Optional[dict]:
+        rows = conn.execute(
+            "SELECT * FROM jobs WHERE kind = ? AND status IN (?, ?) ORDER BY created_at",
+            (kind, *ACTIVE_STATUSES),
+        ).fetchall()
+        for row in rows:
+            job = self._decode(row)
+            if job["params"].get(key) == value:
+                return job
+        return None
+
+    def list_jobs(self, kind: Optional[str] = None, limit: int = 50) -> list[dict]:
+        """Most recent jobs first"""
+        query = "SELECT * FROM jobs"
+        params: list[Any] = []
+        if kind:
+            query += " WHERE kind = ?"
+            params.append(kind)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [self._decode(row) for row in rows]
+
+    def count(self, *statuses: str) -> int:
+        with self._connect() as conn:
+            if not statuses:
+                return conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+            placeholders = ",".join("?" for _ in statuses)
+            return conn.execute(
+                f"SELECT COUNT(*) FROM jobs WHERE status IN ({placeholders})", statuses
+            ).fetchone()[0]
+
+    @staticmethod
+    def _decode(row: sqlite3.Row) -> dict:
+        job = dict(row)
+        for field in ("params", "progress", "result"):
+            job[field] = json.loads(job[field]) if job[field] else None
+        job["params"] = job["params"] or {}
+        job["progress"] = job["progress"] or {}
+        return job
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Execution
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._connect() as conn:
+            conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*fields.values(), job_id))
+
+    def update_progress(self, job_id: str, phase: str, status: str, **details: Any) -> None:
+        """
+        Record a phase transition (e.g. 'phase_2', 'completed', contacts=12).
+
+        'running' stamps the phase start; 'completed' adds duration_seconds.
+        """
+        with self._lock:
+            job = self.get(job_id)
+            if not job:
+                return
+            progress = job["progress"]
+            entry = progress.get(phase, {})
+            entry.update(details)
+            now = datetime.now()
+            if status == "running":
+                entry["started_at"] = now.isoformat()
+            elif status == "completed" and entry.get("started_at"):
+                started = datetime.fromisoformat(entry["started_at"])
+                entry["duration_seconds"] = round((now - started).total_seconds(), 3)
+            entry["status"] = status
+            entry["updated_at"] = now.isoformat()
+            progress[phase] = entry
+            self._update(job_id, progress=json.dumps(progress, default=str), current_phase=phase)
+
+    def _run(self, job_id: str) -> None:
+        job = self.get(job_id)
+        if not job or job["status"] not in ACTIVE_STATUSES:
+            return
+
+        runner = self._runners[job["kind"]]
+        self._update(
+            job_id,
+            status=JOB_RUNNING,
+            started_at=datetime.now().isoformat(),
+            attempts=(job["attempts"] or 0) + 1,
+        )
+
+        def progress(phase: str, status: str, **details: Any) -> None:
+            try:
+                self.update_progress(job_id, phase, status, **details)
+            except Exception as e:  # progress must never break the job
+                logger.warning(f"⚠️ Could not record progress for job {job_id}: {e}")
+
+        try:
+            result = runner(job["params"], progress)
+            self._update(
+                job_id,
+                status=JOB_SUCCEEDED,
+                result=json.dumps(result, default=str),
+                finished_at=datetime.now().isoformat(),
+            )
+            logger.info(f"✅ {job['kind']} job {job_id} succeeded")
+        except Exception as e:
+            logger.error(f"❌ {job['kind']} job {job_id} failed: {e}")
+            self._update(
+                job_id,
+                status=JOB_FAILED,
+                error=json.dumps({"message": str(e), "type": type(e).__name__}),
+                finished_at=datetime.now().isoformat(),
+            )
+
+    def recover(self) -> int:
+        """
+        Re-schedule jobs left queued or running by a previous process.
+
+        Jobs whose kind has no registered runner are marked failed.
+
+        Returns:
+            Number of jobs re-scheduled
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, kind FROM jobs WHERE status IN (?, ?) ORDER BY created_at",
+                ACTIVE_STATUSES,
+            ).fetchall()
+
+        resumed = 0
+        for row in rows:
+            if row["kind"] in self._runners:
+                self._update(row["id"], status=JOB_QUEUED)
+                self._executor.submit(self._run, row["id"])
+                resumed += 1
+            else:
+                self._update(
+                    row["id"],
+                    status=JOB_FAILED,
+                    error=json.dumps({"message": "Interrupted by restart", "type": "Interrupted"}),
+                    finished_at=datetime.now().isoformat(),
+                )
+        if resumed:
+            logger.info(f"🔁 Re-queued {resumed} jobs from a previous run")
+        return resumed
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
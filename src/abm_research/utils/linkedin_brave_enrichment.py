@@ -8,12 +8,11 @@ Uses Brave Search to discover posts, activity, and professional insights.
 import logging
 import os
 import re
-import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
-import requests
+from .brave_client import get_brave_client
 
 logger = logging.getLogger(__name__)
 
@@ -53,12 +52,6 @@ class LinkedInBraveEnrichment:
         if not self.brave_api_key:
             logger.warning("BRAVE_API_KEY not set - LinkedIn enrichment via Brave disabled")
 
-        self.brave_base_url = "https://api.search.brave.com/res/v1/web/search"
-
-        # Rate limiting
-        self.last_request_time = 0
-        self.request_delay = 1.0
-
         # Topic keywords for champion scoring
         self.champion_topics = [
             "infrastructure",
@@ -148,8 +141,6 @@ class LinkedInBraveEnrichment:
     ) -> Optional[str]:
         """Find LinkedIn profile URL via Brave Search"""
         try:
-            self._apply_rate_limit()
-
             # Build targeted search query
             query_parts = [f'site:linkedin.com/in "{person_name}"']
             if company_name:
@@ -160,18 +151,10 @@ class LinkedInBraveEnrichment:
             query = " ".join(query_parts)
             logger.debug(f"LinkedIn profile search: {query}")
 
-            response = requests.get(
-                self.brave_base_url,
-                params={"q": query, "count": 5},
-                headers={"X-Subscription-Token": self.brave_api_key, "Accept": "application/json"},
-                timeout=15,
-            )
-
-            if response.status_code != 200:
-                logger.warning(f"Brave search failed: {response.status_code}")
+            data = get_brave_client().search(query, {"count": 5})
+            if data is None:
                 return None
 
-            data = response.json()
             web_results = data.get("web", {}).get("results", [])
 
             for result in web_results:
@@ -192,24 +175,15 @@ class LinkedInBraveEnrichment:
         posts = []
 
         try:
-            self._apply_rate_limit()
-
             # Search for LinkedIn posts
             query = f'site:linkedin.com "{person_name}" (post OR article OR shared)'
             if company_name:
                 query += f' "{company_name}"'
 
-            response = requests.get(
-                self.brave_base_url,
-                params={"q": query, "count": 10},
-                headers={"X-Subscription-Token": self.brave_api_key, "Accept": "application/json"},
-                timeout=15,
-            )
-
-            if response.status_code != 200:
+            data = get_brave_client().search(query, {"count": 10})
+            if data is None:
                 return posts
 
-            data = response.json()
             web_results = data.get("web", {}).get("results", [])
 
             for result in web_results:
@@ -241,24 +215,15 @@ class LinkedInBraveEnrichment:
         topics = []
 
         try:
-            self._apply_rate_limit()
-
             # Search for their writing/speaking topics
             query = f'"{person_name}" (article OR keynote OR talk OR webinar OR podcast)'
             if company_name:
                 query += f' "{company_name}"'
 
-            response = requests.get(
-                self.brave_base_url,
-                params={"q": query, "count": 10},
-                headers={"X-Subscription-Token": self.brave_api_key, "Accept": "application/json"},
-                timeout=15,
-            )
-
-            if response.status_code != 200:
+            data = get_brave_client().search(query, {"count": 10})
+            if data is None:
                 return topics
 
-            data = response.json()
             web_results = data.get("web", {}).get("results", [])
 
             # Extract topics from search results
@@ -288,24 +253,15 @@ class LinkedInBraveEnrichment:
         signals = []
 
         try:
-            self._apply_rate_limit()
-
             # Search for mentions, interviews, features
             query = f'"{person_name}" (interview OR featured OR speaker OR panelist OR quoted)'
             if company_name:
                 query += f' "{company_name}"'
 
-            response = requests.get(
-                self.brave_base_url,
-                params={"q": query, "count": 10, "freshness": "pm"},  # Past month
-                headers={"X-Subscription-Token": self.brave_api_key, "Accept": "application/json"},
-                timeout=15,
-            )
-
-            if response.status_code != 200:
+            data = get_brave_client().search(query, {"count": 10, "freshness": "pm"})  # Past month
+            if data is None:
                 return signals
 
-            data = response.json()
             web_results = data.get("web", {}).get("results", [])
 
             for result in web_results:
@@ -334,24 +290,15 @@ class LinkedInBraveEnrichment:
         updates = []
 
         try:
-            self._apply_rate_limit()
-
             # Search for professional updates
             query = f'"{person_name}" (promoted OR joined OR appointed OR award OR recognized)'
             if company_name:
                 query += f' "{company_name}"'
 
-            response = requests.get(
-                self.brave_base_url,
-                params={"q": query, "count": 10, "freshness": "py"},  # Past year
-                headers={"X-Subscription-Token": self.brave_api_key, "Accept": "application/json"},
-                timeout=15,
-            )
-
-            if response.status_code != 200:
+            data = get_brave_client().search(query, {"count": 10, "freshness": "py"})  # Past year
+            if data is None:
                 return updates
 
-            data = response.json()
             web_results = data.get("web", {}).get("results", [])
 
             for result in web_results:
@@ -452,13 +399,6 @@ class LinkedInBraveEnrichment:
 
         return min(100, score)
 
-    def _apply_rate_limit(self):
-        """Apply rate limiting between API requests"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.request_delay:
-            time.sleep(self.request_delay - elapsed)
-        self.last_request_time = time.time()
-
 
 # Export singleton instance
 linkedin_brave_enrichment = LinkedInBraveEnrichment()
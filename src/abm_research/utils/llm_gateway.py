@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Shared gateway for OpenAI chat completions with an on-disk response cache
+
+Every completion goes through the OpenAI rate limiter and an openai.chat
+span. Responses are cached in SQLite keyed by a hash of (model, messages,
+temperature, max_tokens, response_format), so re-researching an unchanged
+account replays earlier completions instead of paying for them again.
+Entries expire after a TTL and the least recently used are evicted once
+the cache holds max_entries. Callers can bypass the cache per call (or
+process-wide with ABM_LLM_CACHE_BYPASS=1); hits and misses are counted
+for /metrics.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+
+from .instrumentation import span
+from .metrics import counter
+from .rate_limiter import provider_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# Project root, where the default cache database lives (like the job-queue database)
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+DEFAULT_LLM_CACHE_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_LLM_CACHE_MAX_ENTRIES = 10000
+
+LLM_CACHE_REQUESTS = counter(
+    "abm_llm_cache_requests_total", "LLM completions by cache result", ("result",)
+)
+
+
+def completion_key(
+    model: str,
+    messages: list[dict],
+    temperature: float,
+    max_tokens: int,
+    response_format: Optional[dict] = None,
+) -> str:
+    """Content hash identifying a completion request"""
+    payload = json.dumps(
+        {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "response_format": response_format,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite store of completion texts with TTL and LRU eviction"""
+
+    def __init__(
+        self,
+        db_path: str,
+        ttl_seconds: float = DEFAULT_LLM_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_LLM_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            db_path: SQLite file for the cache table
+            ttl_seconds: Age after which a cached completion is ignored and purged
+            max_entries: Entries kept; the least recently used are evicted beyond it
+            clock: Wall-clock source (injectable for tests)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._init_db()
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_used ON llm_cache(last_used)")
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached completion text, or None if missing or expired"""
+        now = self._clock()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT content FROM llm_cache WHERE key = ? AND created_at >= ?",
+                (key, now - self.ttl_seconds),
+            ).fetchone()
+            if row:
+                conn.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (now, key))
+        return row[0] if row else None
+
+    def set(self, key: str, model: str, content: str) -> None:
+        """Store a completion, then purge expired and least recently used entries"""
+        now = self._clock()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?)",
+                (key, model, content, now, now),
+            )
+            conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+            conn.execute(
+                """
+                DELETE FROM llm_cache WHERE key NOT IN (
+                    SELECT key FROM llm_cache ORDER BY last_used DESC LIMIT ?
+                )
+            """,
+                (self.max_entries,),
+            )
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM llm_cache")
+
+
+class LLMGateway:
+    """Rate-limited, instrumented and cached access to OpenAI chat completions"""
+
+    def __init__(self, cache: Optional[LLMResponseCache] = None, bypass: bool = False):
+        """
+        Args:
+            cache: Response cache; None disables caching
+            bypass: Skip the cache for every call (responses aren't stored either)
+        """
+        self.cache = cache
+        self.bypass = bypass
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "bypassed": 0}
+
+    def complete(
+        self,
+        messages: list[dict],
+        client: Callable[[], Any],
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.3,
+        max_tokens: int = 500,
+        response_format: Optional[dict] = None,
+        bypass_cache: bool = False,
+    ) -> str:
+        """
+        Message content of a chat completion, from the cache when possible.
+
+        Args:
+            messages: Chat messages, as for chat.completions.create
+            client: Returns the OpenAI client; only called on a cache miss, so
+                    cached completions replay without credentials
+            model, temperature, max_tokens, response_format: Completion parameters
+                    (all part of the cache key)
+            bypass_cache: Always call the API and don't store the response
+
+        Raises:
+            Whatever the OpenAI client raises; failures are never cached
+        """
+        use_cache = self.cache is not None and not (self.bypass or bypass_cache)
+        key = completion_key(model, messages, temperature, max_tokens, response_format)
+
+        if use_cache:
+            try:
+                cached = self.cache.get(key)
+            except Exception as e:
+                logger.warning(f"⚠️  LLM cache lookup failed, calling the API: {e}")
+                cached = None
+            if cached is not None:
+                self._count("hits", "hit")
+                return cached
+            self._count("misses", "miss")
+        else:
+            self._count("bypassed", "bypass")
+
+        params: dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        if response_format is not None:
+            params["response_format"] = response_format
+
+        provider_rate_limiter("openai").acquire()
+        with span("openai.chat"):
+            response = client().chat.completions.create(**params)
+        content = response.choices[0].message.content or ""
+
+        if use_cache and content.strip():
+            # The completion is already paid for; a cache write failure mustn't lose it
+            try:
+                self.cache.set(key, model, content)
+            except Exception as e:
+                logger.warning(f"⚠️  LLM cache write failed, completion not cached: {e}")
+        return content
+
+    def _count(self, stat: str, result: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+        LLM_CACHE_REQUESTS.inc(result=result)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        stats["entries"] = len(self.cache) if self.cache is not None else 0
+        return stats
+
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """
+    The process-wide gateway, created on first use from the environment:
+    ABM_LLM_CACHE_DB (default llm_cache.db in the project root), ABM_LLM_CACHE_TTL (seconds),
+    ABM_LLM_CACHE_MAX_ENTRIES and ABM_LLM_CACHE_BYPASS.
+    """
+    global _gateway
+    with _gateway_lock:
+        if _gateway is None:
+            cache = None
+            try:
+                cache = LLMResponseCache(
+                    os.environ.get("ABM_LLM_CACHE_DB", os.path.join(project_root, "llm_cache.db")),
+                    ttl_seconds=float(
+                        os.environ.get("ABM_LLM_CACHE_TTL", DEFAULT_LLM_CACHE_TTL_SECONDS)
+                    ),
+                    max_entries=int(
+                        os.environ.get("ABM_LLM_CACHE_MAX_ENTRIES", DEFAULT_LLM_CACHE_MAX_ENTRIES)
+                    ),
+                )
+            except Exception as e:
+                logger.warning(f"⚠️  LLM response cache unavailable: {e}")
+            bypass = os.environ.get("ABM_LLM_CACHE_BYPASS", "").lower() in ("1", "true", "yes")
+            _gateway = LLMGateway(cache, bypass=bypass)
+        return _gateway
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Prometheus text-format metrics
+
+Minimal counters and histograms with labels, registered process-wide by
+name through counter() / histogram() (like get_rate_limiter, the first
+registration wins), plus render helpers that turn them - and the timing
+spans from utils.instrumentation - into the Prometheus exposition format
+served by the API's /metrics endpoint. No client library is required.
+"""
+
+import logging
+import math
+import threading
+from collections.abc import Iterable
+from typing import Any, Union
+
+from .instrumentation import LATENCY_BUCKETS, Instrumentation
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# API requests are much faster than external calls
+HTTP_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = tuple[str, ...]
+Sample = tuple[str, dict[str, str], float]  # (metric name, labels, value)
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def format_family(name: str, kind: str, help_text: str, samples: Iterable[Sample]) -> str:
+    """One metric family: HELP and TYPE lines followed by its samples"""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for sample_name, labels, value in samples:
+        label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+        label_text = f"{{{label_text}}}" if label_text else ""
+        lines.append(f"{sample_name}{label_text} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def histogram_samples(
+    name: str,
+    labels: dict[str, str],
+    bucket_counts: Iterable[tuple[float, int]],
+    total: float,
+    count: int,
+) -> list[Sample]:
+    """_bucket (cumulative counts, ending with +Inf), _sum and _count samples"""
+    samples = [
+        (f"{name}_bucket", {**labels, "le": _format_value(bound)}, cumulative)
+        for bound, cumulative in bucket_counts
+    ]
+    samples.append((f"{name}_bucket", {**labels, "le": "+Inf"}, count))
+    samples.append((f"{name}_sum", labels, total))
+    samples.append((f"{name}_count", labels, count))
+    return samples
+
+
+class Counter:
+    """Monotonic counter with optional labels"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._lock = threading.Lock()
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = tuple(str(labels.get(label, "")) for label in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        key = tuple(str(labels.get(label, "")) for label in self.label_names)
+        with self._lock:
+            return self._values.get(key, 0)
+
+    def samples(self) -> list[Sample]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [(self.name, dict(zip(self.label_names, key)), value) for key, value in items]
+
+
+class Histogram:
+    """Latency-style histogram with optional labels"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # label values -> [per-bucket counts..., sum, count]
+        self._series: dict[LabelValues, list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels.get(label, "")) for label in self.label_names)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * len(self.buckets) + [0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def samples(self) -> list[Sample]:
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        samples = []
+        for key, series in items:
+            samples.extend(
+                histogram_samples(
+                    self.name,
+                    dict(zip(self.label_names, key)),
+                    zip(self.buckets, series[: len(self.buckets)]),
+                    series[-2],
+                    series[-1],
+                )
+            )
+        return samples
+
+
+Metric = Union[Counter, Histogram]
+
+# Process-wide metrics keyed by name
+_metrics: dict[str, Metric] = {}
+_metrics_lock = threading.Lock()
+
+
+def _register(metric: Metric) -> Metric:
+    with _metrics_lock:
+        existing = _metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric):
+                raise ValueError(f"Metric '{metric.name}' already registered as {existing.kind}")
+            return existing
+        _metrics[metric.name] = metric
+        return metric
+
+
+def counter(name: str, help_text: str, label_names: tuple[str, ...] = ()) -> Counter:
+    """Get (or create) the shared counter called name"""
+    return _register(Counter(name, help_text, label_names))
+
+
+def histogram(
+    name: str,
+    help_text: str,
+    label_names: tuple[str, ...] = (),
+    buckets: tuple[float, ...] = LATENCY_BUCKETS,
+) -> Histogram:
+    """Get (or create) the shared histogram called name"""
+    return _register(Histogram(name, help_text, label_names, buckets))
+
+
+# Apollo bills enrichment (people match, organization enrich) per record revealed
+APOLLO_CREDITS = counter(
+    "abm_apollo_credits_consumed_total", "Apollo credits consumed", ("operation",)
+)
+
+
+def render_registered() -> str:
+    """Every registered counter and histogram, sorted by name"""
+    with _metrics_lock:
+        metrics = [_metrics[name] for name in sorted(_metrics)]
+    return "".join(
+        format_family(metric.name, metric.kind, metric.help_text, metric.samples())
+        for metric in metrics
+    )
+
+
+def render_spans(instrumentation: Instrumentation) -> str:
+    """
+    Timing spans as metrics.
+
+    phase.* spans become abm_research_phase_duration_seconds{phase}; every
+    other span is an external call, split into provider and operation at
+    the first dot (e.g. brave.search), with duration, error, throttled (429)
+    and byte totals.
+    """
+    phases: list[Sample] = []
+    durations: list[Sample] = []
+    errors: list[Sample] = []
+    throttled: list[Sample] = []
+    received: list[Sample] = []
+
+    for name, data in instrumentation.histograms().items():
+        provider, _, operation = name.partition(".")
+        if provider == "phase":
+            phases.extend(
+                histogram_samples(
+                    "abm_research_phase_duration_seconds",
+                    {"phase": operation},
+                    data["buckets"],
+                    data["total_seconds"],
+                    data["count"],
+                )
+            )
+            continue
+        labels = {"provider": provider, "operation": operation}
+        durations.extend(
+            histogram_samples(
+                "abm_external_call_duration_seconds",
+                labels,
+                data["buckets"],
+                data["total_seconds"],
+                data["count"],
+            )
+        )
+        errors.append(("abm_external_call_errors_total", labels, data["errors"]))
+        throttled.append(("abm_external_call_throttled_total", labels, data["throttled"]))
+        received.append(("abm_external_call_response_bytes_total", labels, data["bytes"]))
+
+    return "".join(
+        [
+            format_family(
+                "abm_research_phase_duration_seconds",
+                "histogram",
+                "Research phase wall-clock duration",
+                phases,
+            ),
+            format_family(
+                "abm_external_call_duration_seconds",
+                "histogram",
+                "External API call latency",
+                durations,
+            ),
+            format_family(
+                "abm_external_call_errors_total",
+                "counter",
+                "External API calls that raised or returned HTTP 4xx/5xx",
+                errors,
+            ),
+            format_family(
+                "abm_external_call_throttled_total",
+                "counter",
+                "External API calls answered with HTTP 429",
+                throttled,
+            ),
+            format_family(
+                "abm_external_call_response_bytes_total",
+                "counter",
+                "Response bytes received from external APIs",
+                received,
+            ),
+        ]
+    )
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Dependency-aware phase runner
+
+Runs named phases on a thread pool as soon as the phases they depend on have
+finished, so independent branches of a pipeline overlap and wall-clock time
+approaches the longest dependency chain. Each phase receives a snapshot of
+the results completed so far; the returned mapping is ordered by phase
+declaration regardless of completion order, so merging is deterministic.
+Phases run in a copy of the caller's context, so context variables (e.g.
+the run's instrumentation) carry over to the worker threads.
+"""
+
+import contextvars
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Phase:
+    """A unit of pipeline work and the phases whose results it needs"""
+
+    name: str
+    run: Callable[[dict[str, Any]], Any]
+    depends_on: tuple[str, ...] = ()
+
+
+def _validate(phases: list[Phase]) -> None:
+    names = [phase.name for phase in phases]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate phase names in {names}")
+    for phase in phases:
+        unknown = [dep for dep in phase.depends_on if dep not in names]
+        if unknown:
+            raise ValueError(f"Phase '{phase.name}' depends on unknown phases {unknown}")
+
+
+def run_phase_graph(phases: list[Phase], max_workers: int = 2) -> dict[str, Any]:
+    """
+    Run phases in dependency order, concurrently where possible.
+
+    Args:
+        phases: Phases in declaration order (also the tie-break for scheduling)
+        max_workers: Phases that may run at the same time; 1 runs them serially
+
+    Returns:
+        {phase name: result}, in declaration order
+
+    Raises:
+        ValueError: On duplicate names, unknown or circular dependencies
+        Exception: The error of the first-declared phase that failed; phases
+                   not yet started are skipped
+    """
+    _validate(phases)
+    order = {phase.name: index for index, phase in enumerate(phases)}
+    results: dict[str, Any] = {}
+    pending = list(phases)
+    running: dict = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="phase") as executor:
+        while pending or running:
+            ready = [p for p in pending if all(dep in results for dep in p.depends_on)]
+            for phase in ready:
+                pending.remove(phase)
+                context = contextvars.copy_context()
+                running[executor.submit(context.run, phase.run, dict(results))] = phase
+
+            if not running:
+                stuck = [phase.name for phase in pending]
+                raise ValueError(f"Circular phase dependencies among {stuck}")
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            failures = []
+            for future in done:
+                phase = running.pop(future)
+                try:
+                    results[phase.name] = future.result()
+                except Exception as e:
+                    failures.append((order[phase.name], phase.name, e))
+
+            if failures:
+                for future in running:
+                    future.cancel()
+                _, name, error = min(failures, key=lambda failure: failure[0])
+                logger.error(f"❌ Phase '{name}' failed: {error}")
+                raise error
+
+    return {phase.name: results[phase.name] for phase in phases}
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Token-bucket rate limiting for external APIs
+
+A bucket refills at `rate` tokens per second up to `burst` tokens. Callers
+reserve tokens under a lock and then sleep outside it, so waiters are served
+in arrival order and no thread holds the lock while sleeping. The same bucket
+can be used from threads (acquire) and from asyncio code (acquire_async).
+
+Buckets are shared process-wide through get_rate_limiter() so that every
+client of one provider (e.g. all NotionClient instances) draws from a single
+budget instead of each keeping its own fixed delay. provider_rate_limiter()
+returns the bucket for a known external provider with its default budget,
+overridable per deployment through <PROVIDER>_RATE_LIMIT / _RATE_BURST.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket with blocking and async acquire"""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1,
+        name: str = "",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            rate: Average requests per second allowed
+            burst: Maximum tokens that can accumulate (short bursts above rate)
+            name: Label used in logs and stats
+            clock: Monotonic time source (injectable for tests)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.name = name
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+
+        self._acquired = 0
+        self._waited = 0
+        self._wait_seconds = 0.0
+
+    def _refill_locked(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def _reserve(self, tokens: float, max_wait: Optional[float]) -> Optional[float]:
+        """
+        Take tokens now (possibly going into debt) and return how long the
+        caller must wait before using them, or None if that exceeds max_wait.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill_locked(now)
+
+            deficit = tokens - self._tokens
+            wait = deficit / self.rate if deficit > 0 else 0.0
+            if max_wait is not None and wait > max_wait:
+                return None
+
+            self._tokens -= tokens
+            self._acquired += 1
+            if wait > 0:
+                self._waited += 1
+                self._wait_seconds += wait
+            return wait
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """Take tokens only if available immediately"""
+        return self._reserve(tokens, max_wait=0) is not None
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> float:
+        """
+        Block until tokens are available.
+
+        Args:
+            tokens: Tokens to take (1 per request)
+            timeout: Give up (without taking tokens) if the wait would exceed this
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            TimeoutError: If the required wait exceeds timeout
+        """
+        wait = self._reserve(tokens, timeout)
+        if wait is None:
+            raise TimeoutError(f"Rate limiter '{self.name}' wait exceeds {timeout}s")
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1, timeout: Optional[float] = None) -> float:
+        """asyncio variant of acquire(); sleeps without blocking the event loop"""
+        wait = self._reserve(tokens, timeout)
+        if wait is None:
+            raise TimeoutError(f"Rate limiter '{self.name}' wait exceeds {timeout}s")
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back every caller for at least `seconds` (e.g. a server Retry-After).
+
+        Existing debt is kept if it already reaches further out.
+        """
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._refill_locked(self._clock())
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for monitoring"""
+        with self._lock:
+            self._refill_locked(self._clock())
+            return {
+                "name": self.name,
+                "rate": self.rate,
+                "burst": self.burst,
+                "available_tokens": round(self._tokens, 3),
+                "acquired": self._acquired,
+                "waited": self._waited,
+                "wait_seconds_total": round(self._wait_seconds, 3),
+            }
+
+
+# Default budgets (requests/second, burst) for the external providers the
+# research pipeline calls
+PROVIDER_RATE_LIMITS: dict[str, tuple[float, float]] = {
+    "apollo": (1.0, 2),
+    "brave": (1.0, 1),
+    "openai": (5.0, 5),
+    "notion": (3.0, 3),
+}
+
+# Process-wide buckets keyed by provider name
+_limiters: dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, rate: float, burst: float = 1) -> TokenBucket:
+    """
+    Get (or create) the shared bucket for a provider.
+
+    The first caller's rate/burst win; later callers with different values
+    get the existing bucket so the budget stays global.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = TokenBucket(rate, burst, name=name)
+            _limiters[name] = limiter
+            logger.info(f"⏱️  Rate limiter '{name}': {rate}/s, burst {burst}")
+        elif (limiter.rate, limiter.burst) != (float(rate), float(burst)):
+            logger.debug(
+                f"Rate limiter '{name}' already configured at {limiter.rate}/s "
+                f"burst {limiter.burst}; ignoring {rate}/s burst {burst}"
+            )
+        return limiter
+
+
+def all_rate_limiter_stats() -> dict[str, dict[str, Any]]:
+    """Stats for every shared bucket, keyed by name"""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.name: limiter.stats() for limiter in limiters}
+
+
+def provider_rate_limiter(provider: str) -> TokenBucket:
+    """
+    Shared bucket for an external provider ('apollo', 'brave', 'openai', 'notion').
+
+    The budget comes from PROVIDER_RATE_LIMITS unless overridden by the
+    <PROVIDER>_RATE_LIMIT and <PROVIDER>_RATE_BURST environment variables
+    (e.g. BRAVE_RATE_LIMIT=20 on a paid plan).
+
+    Raises:
+        KeyError: If the provider has no default budget
+    """
+    rate, burst = PROVIDER_RATE_LIMITS[provider]
+    prefix = provider.upper()
+    return get_rate_limiter(
+        provider,
+        rate=float(os.getenv(f"{prefix}_RATE_LIMIT", rate)),
+        burst=float(os.getenv(f"{prefix}_RATE_BURST", burst)),
+    )
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Per-phase checkpoints for account research runs
+
+Each research phase's output is written to SQLite keyed by (domain, run_id,
+phase) as soon as the phase finishes. A run that fails later (e.g. Phase 4
+or Notion persistence) can be resumed: completed phases are loaded instead
+of re-spending Apollo credits and Brave/OpenAI calls. Checkpoints expire
+after a TTL so stale research is never reused.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_TTL_SECONDS = 24 * 3600
+
+
+class ResearchCheckpointStore:
+    """SQLite store of phase outputs for resumable research runs"""
+
+    def __init__(
+        self,
+        db_path: str,
+        ttl_seconds: float = DEFAULT_CHECKPOINT_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            db_path: SQLite file for the checkpoint table
+            ttl_seconds: Age after which a checkpoint is ignored and purged
+            clock: Wall-clock source (injectable for tests)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._init_db()
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS research_checkpoints (
+                    domain TEXT NOT NULL,
+                    run_id TEXT NOT NULL,
+                    phase TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (domain, run_id, phase)
+                )
+            """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_checkpoints_created "
+                "ON research_checkpoints(created_at)"
+            )
+
+    @staticmethod
+    def _key(domain: str) -> str:
+        return (domain or "").strip().lower()
+
+    def _cutoff(self) -> float:
+        return self._clock() - self.ttl_seconds
+
+    def save(self, domain: str, run_id: str, phase: str, result: Any) -> None:
+        """Checkpoint one phase's output, replacing any earlier one"""
+        payload = json.dumps(result, default=str)
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO research_checkpoints VALUES (?, ?, ?, ?, ?)",
+                (self._key(domain), run_id, phase, payload, self._clock()),
+            )
+            conn.execute("DELETE FROM research_checkpoints WHERE created_at < ?", (self._cutoff(),))
+
+    def load(self, domain: str, run_id: str) -> dict[str, Any]:
+        """Unexpired checkpoints of a run as {phase: result}"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT phase, payload FROM research_checkpoints
+                WHERE domain = ? AND run_id = ? AND created_at >= ?
+            """,
+                (self._key(domain), run_id, self._cutoff()),
+            ).fetchall()
+        return {phase: json.loads(payload) for phase, payload in rows}
+
+    def latest_run(self, domain: str) -> Optional[str]:
+        """The most recently checkpointed unexpired run for a domain"""
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT run_id FROM research_checkpoints
+                WHERE domain = ? AND created_at >= ?
+                ORDER BY created_at DESC LIMIT 1
+            """,
+                (self._key(domain), self._cutoff()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def clear(self, domain: str, run_id: Optional[str] = None) -> int:
+        """Delete a run's checkpoints (or all of a domain's); returns rows removed"""
+        query = "DELETE FROM research_checkpoints WHERE domain = ?"
+        params: list[Any] = [self._key(domain)]
+        if run_id:
+            query += " AND run_id = ?"
+            params.append(run_id)
+        with self._lock, self._connect() as conn:
+            return conn.execute(query, params).rowcount
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Persistent search result cache
+
+A SQLite key/value store for search results that outlives the process, so
+API requests (which build a fresh discovery instance each time) and batch
+scripts (separate processes) reuse searches answered earlier instead of
+spending Brave quota on them again. Each entry carries its own TTL, chosen
+by the caller (e.g. per query template), and the least recently used
+entries are evicted once the cache holds max_entries.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_CACHE_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_SEARCH_CACHE_MAX_ENTRIES = 20000
+
+
+class PersistentSearchCache:
+    """SQLite store of JSON values with per-entry TTL and LRU eviction"""
+
+    def __init__(
+        self,
+        db_path: str,
+        max_entries: int = DEFAULT_SEARCH_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            db_path: SQLite file for the cache table
+            max_entries: Entries kept; the least recently used are evicted beyond it
+            clock: Wall-clock source (injectable for tests)
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._init_db()
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_search_cache_used ON search_cache(last_used)"
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value, or None if missing or expired"""
+        now = self._clock()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM search_cache WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row:
+                self._hits += 1
+                conn.execute("UPDATE search_cache SET last_used = ? WHERE key = ?", (now, key))
+            else:
+                self._misses += 1
+        return json.loads(row[0]) if row else None
+
+    def set(
+        self, key: str, value: Any, ttl_seconds: float = DEFAULT_SEARCH_CACHE_TTL_SECONDS
+    ) -> None:
+        """Store a value for ttl_seconds, then purge expired and least recently used entries"""
+        now = self._clock()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, default=str), now + ttl_seconds, now),
+            )
+            conn.execute("DELETE FROM search_cache WHERE expires_at <= ?", (now,))
+            conn.execute(
+                """
+                DELETE FROM search_cache WHERE key NOT IN (
+                    SELECT key FROM search_cache ORDER BY last_used DESC LIMIT ?
+                )
+            """,
+                (self.max_entries,),
+            )
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM search_cache")
+
+    def stats(self) -> dict[str, Any]:
+        """Lookups through this instance, plus the entries stored"""
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self),
+        }
@@ -8,12 +8,11 @@ Designed to save results directly to Notion's Trigger Events database.
 import logging
 import os
 import re
-import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 
-import requests
+from .brave_client import get_brave_client
 
 logger = logging.getLogger(__name__)
 
@@ -174,12 +173,6 @@ class TriggerEventDiscovery:
         if not self.brave_api_key:
             logger.warning("BRAVE_API_KEY not set - trigger event discovery disabled")
 
-        self.brave_base_url = "https://api.search.brave.com/res/v1/web/search"
-
-        # Rate limiting
-        self.last_request_time = 0
-        self.request_delay = 1.0
-
     def discover_events(
         self,
         company_name: str,
@@ -241,8 +234,6 @@ class TriggerEventDiscovery:
         config = self.EVENT_TYPES[event_type]
 
         try:
-            self._apply_rate_limit()
-
             # Build search query
             keywords = config["keywords"][:3]  # Use top 3 keywords
             keyword_query = " OR ".join(keywords)
@@ -260,19 +251,10 @@ class TriggerEventDiscovery:
 
             logger.debug(f"Searching: {event_type} for {company_name}")
 
-            response = requests.get(
-                self.brave_base_url,
-                params={"q": query, "count": 10, "freshness": freshness},
-                headers={"X-Subscription-Token": self.brave_api_key, "Accept": "application/json"},
-                timeout=15,
-            )
-
-            if response.status_code != 200:
-                logger.warning(f"Brave search failed: {response.status_code}")
+            data = get_brave_client().search(query, {"count": 10, "freshness": freshness})
+            if data is None:
                 return events
 
-            data = response.json()
-
             # Check for news results first
             news_results = data.get("news", {}).get("results", [])
             web_results = data.get("web", {}).get("results", [])
@@ -505,13 +487,6 @@ class TriggerEventDiscovery:
 
         return unique
 
-    def _apply_rate_limit(self):
-        """Apply rate limiting between API requests"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.request_delay:
-            time.sleep(self.request_delay - elapsed)
-        self.last_request_time = time.time()
-
     def to_notion_properties(
         self, event: DiscoveredTriggerEvent, account_page_id: Optional[str] = None
     ) -> dict:
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Thread-safe TTL cache for the ABM Research API
+
+Used as a read-through cache in front of Notion-backed collections so that
+dashboard reads don't re-query (and re-score) whole databases on every request.
+
+- Per-entry TTL with a default configured on the cache
+- get_or_load() coalesces concurrent misses for the same key into one load
+- Targeted invalidation by key or key prefix for write endpoints
+"""
+
+import threading
+import time
+from typing import Any, Callable, Optional
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Small in-process key/value cache with per-entry expiry"""
+
+    def __init__(self, default_ttl: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._load_locks: dict[str, threading.Lock] = {}
+        self._stats = {"hits": 0, "misses": 0, "loads": 0, "invalidations": 0}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing/expired"""
+        with self._lock:
+            value = self._get_locked(key)
+            if value is _MISSING:
+                self._stats["misses"] += 1
+                return default
+            self._stats["hits"] += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key for ttl seconds (default_ttl when None)"""
+        ttl = self.default_ttl if ttl is None else ttl
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+
+    def get_or_load(self, key: str, loader: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """
+        Return the cached value for key, calling loader() on a miss.
+
+        Concurrent callers missing on the same key wait for a single load
+        instead of each hitting the backing store.
+
+        Args:
+            key: Cache key
+            loader: Zero-arg callable producing the value; exceptions propagate
+                    and nothing is cached
+            ttl: Entry lifetime in seconds (default_ttl when None)
+        """
+        with self._lock:
+            value = self._get_locked(key)
+            if value is not _MISSING:
+                self._stats["hits"] += 1
+                return value
+            self._stats["misses"] += 1
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            # Another thread may have filled the entry while we waited
+            with self._lock:
+                value = self._get_locked(key)
+            if value is not _MISSING:
+                return value
+
+            value = loader()
+            with self._lock:
+                self._stats["loads"] += 1
+            self.set(key, value, ttl)
+            return value
+
+    def invalidate(self, *keys: str) -> int:
+        """Drop the given keys; returns how many entries were removed"""
+        removed = 0
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    removed += 1
+            self._stats["invalidations"] += removed
+        return removed
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Drop every key starting with prefix; returns how many were removed"""
+        with self._lock:
+            keys = [k for k in self._entries if k.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+            self._stats["invalidations"] += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._stats["invalidations"] += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Counters plus current size and hit ratio"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        return stats
+
+    def _get_locked(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            return _MISSING
+        return value
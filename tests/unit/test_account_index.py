@@ -0,0 +1,78 @@
+"""
+Unit tests for the API account index.
+
+Tests that accounts resolve by synthetic id, Notion UUID, domain, and name,
+and that the index is cached together with the account list.
+
+Run with: pytest tests/unit/test_account_index.py -v
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def server():
+    """Import the server module, skipping if unavailable."""
+    try:
+        from src.abm_research.api import server
+    except ImportError:
+        pytest.skip("Server module not importable")
+    server.notion_cache.clear()
+    yield server
+    server.notion_cache.clear()
+
+
+@pytest.fixture
+def accounts():
+    """Two transformed accounts in API format."""
+    return [
+        {
+            "id": "acc_1a2b3c4d",
+            "notion_id": "1a2b3c4d-0000-1111-2222-333344445555",
+            "name": "Acme Cloud",
+            "domain": "https://www.AcmeCloud.com/",
+        },
+        {
+            "id": "acc_9f8e7d6c",
+            "notion_id": "9f8e7d6c-0000-1111-2222-333344445555",
+            "name": "Genesis",
+            "domain": "genesis.ai",
+        },
+    ]
+
+
+class TestAccountIndex:
+    """Tests for AccountIndex lookups."""
+
+    def test_lookup_by_every_key(self, server, accounts):
+        """Each supported identifier resolves to the same account."""
+        index = server.AccountIndex(accounts)
+        acme = accounts[0]
+
+        assert index.get("acc_1a2b3c4d") is acme
+        assert index.get("1a2b3c4d-0000-1111-2222-333344445555") is acme
+        assert index.get("1a2b3c4d000011112222333344445555") is acme
+        assert index.get("1a2b3c4d") is acme
+        assert index.get("acmecloud.com") is acme
+        assert index.get("http://acmecloud.com") is acme
+        assert index.get("ACME CLOUD") is acme
+
+    def test_unknown_identifier_returns_none(self, server, accounts):
+        """Misses return None rather than raising."""
+        index = server.AccountIndex(accounts)
+        assert index.get("acc_deadbeef") is None
+        assert index.get("") is None
+
+    def test_index_is_cached_with_accounts(self, server, accounts):
+        """One Notion load serves both the list and lookups until invalidated."""
+        with patch.object(server, "NOTION_AVAILABLE", True):
+            with patch.object(server, "_load_notion_accounts", return_value=accounts) as loader:
+                assert server.find_account("genesis.ai")["id"] == "acc_9f8e7d6c"
+                assert len(server.get_notion_accounts()) == 2
+                assert loader.call_count == 1
+
+                server.invalidate_account_cache()
+                server.find_account("acc_1a2b3c4d")
+                assert loader.call_count == 2
@@ -0,0 +1,118 @@
+"""
+Unit tests for the batch research engine.
+
+Tests priority ordering by account score, bounded concurrency, duplicate
+skipping, failure capture and the summary report, plus validation of the
+enrich-all endpoint's workers setting.
+
+Run with: pytest tests/unit/test_batch_research.py -v
+"""
+
+import threading
+
+import pytest
+
+from abm_research.core.batch_research import BatchResearchEngine, account_priority
+
+
+def account(name, score=None, **fields):
+    """Build an account dict with an optional account score."""
+    acc = {"name": name, "domain": f"{name.lower()}.com", **fields}
+    if score is not None:
+        acc["account_score"] = score
+    return acc
+
+
+class TestBatchResearchEngine:
+    """Tests for BatchResearchEngine."""
+
+    def test_highest_scored_accounts_run_first(self):
+        """With one worker, accounts are researched in descending score order."""
+        order = []
+        engine = BatchResearchEngine(lambda acc: order.append(acc["name"]) or {}, max_workers=1)
+
+        engine.run([account("Low", 40), account("High", 90), account("Mid", 70), account("None")])
+
+        assert order == ["High", "Mid", "Low", "None"]
+
+    def test_accounts_run_concurrently(self):
+        """Up to max_workers accounts are in flight at the same time."""
+        both_running = threading.Barrier(2, timeout=2)
+
+        def research(acc):
+            both_running.wait()  # times out if accounts run one at a time
+            return {"success": True}
+
+        report = BatchResearchEngine(research, max_workers=2).run([account("A"), account("B")])
+
+        assert report["succeeded"] == 2
+
+    def test_failures_are_reported_per_account(self):
+        """Exceptions and unsuccessful results fail only their own account."""
+
+        def research(acc):
+            if acc["name"] == "Broken":
+                raise RuntimeError("Apollo unavailable")
+            if acc["name"] == "Partial":
+                return {"success": False, "research_summary": {"error": "Phase 4 failed"}}
+            return {"success": True, "research_summary": {"contacts_discovered": 3}}
+
+        report = BatchResearchEngine(research, max_workers=2).run(
+            [account("Good", 80), account("Broken", 70), account("Partial", 60)]
+        )
+        results = {result["name"]: result for result in report["results"]}
+
+        assert (report["succeeded"], report["failed"]) == (1, 2)
+        assert results["Good"]["summary"] == {"contacts_discovered": 3}
+        assert results["Broken"]["error"] == "Apollo unavailable"
+        assert results["Partial"]["error"] == "Phase 4 failed"
+
+    def test_duplicate_domains_are_skipped(self):
+        """An account repeating an earlier domain is researched once."""
+        calls = []
+        engine = BatchResearchEngine(lambda acc: calls.append(acc["name"]) or {}, max_workers=1)
+
+        report = engine.run([account("Acme"), {"name": "Acme Corp", "domain": "ACME.com"}])
+
+        assert calls == ["Acme"]
+        assert report["skipped"] == 1
+
+    def test_report_includes_throughput_and_provider_usage(self):
+        """The summary carries timing, progress events and every provider budget."""
+        progress = []
+        report = BatchResearchEngine(lambda acc: {}, max_workers=1).run(
+            [account("Acme", 50)],
+            progress_callback=lambda name, status, **details: progress.append((name, status)),
+        )
+
+        assert progress == [("Acme", "running"), ("Acme", "completed")]
+        assert set(report["provider_usage"]) == {"apollo", "brave", "openai", "notion"}
+        assert report["results"][0]["priority"] == 50.0
+        assert report["duration_seconds"] >= 0
+
+    def test_account_priority_falls_back_to_icp_score(self):
+        """Accounts without an account score are ordered by ICP fit score."""
+        assert account_priority({"icp_fit_score": 65}) == 65.0
+        assert account_priority({"account_score": None, "icp_fit_score": 65}) == 65.0
+        assert account_priority({}) == 0.0
+
+
+class TestEnrichAllEndpoint:
+    """Tests for /api/accounts/enrich-all request validation."""
+
+    @pytest.fixture
+    def client(self):
+        """A test client for the API server, skipping if unavailable."""
+        try:
+            from src.abm_research.api import server
+        except ImportError:
+            pytest.skip("Server module not importable")
+        return server.app.test_client()
+
+    @pytest.mark.parametrize("workers", ["4", 0, -1, 2.5, True])
+    def test_invalid_workers_are_rejected(self, client, workers):
+        """workers must be a positive integer."""
+        response = client.post("/api/accounts/enrich-all", json={"workers": workers})
+
+        assert response.status_code == 400
+        assert response.get_json()["error"] == "Invalid workers"
@@ -0,0 +1,182 @@
+"""
+Unit tests for the shared Brave Search client.
+
+Tests the response cache, single-flight coalescing of identical in-flight
+searches, 429 back-off through the shared rate limiter, error reporting,
+and searching on when the cache database fails.
+
+Run with: pytest tests/unit/test_brave_client.py -v
+"""
+
+import sqlite3
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from abm_research.utils import brave_client
+from abm_research.utils.brave_client import (
+    BraveResponseCache,
+    BraveSearchClient,
+    BraveSearchError,
+)
+
+BODY = {"web": {"results": [{"title": "Acme expands", "url": "https://acme.com/news"}]}}
+
+
+class FakeLimiter:
+    """Rate limiter that admits immediately and records pauses."""
+
+    def __init__(self):
+        self.acquired = 0
+        self.pauses = []
+
+    def acquire(self, tokens=1):
+        self.acquired += 1
+        return 0.0
+
+    def pause(self, seconds):
+        self.pauses.append(seconds)
+
+
+def http_response(status_code, body=None, headers=None):
+    """A requests.Response stand-in."""
+    response = MagicMock(status_code=status_code, content=b"{}", headers=headers or {})
+    response.json.return_value = body
+    return response
+
+
+@pytest.fixture
+def limiter():
+    """A limiter that never waits."""
+    return FakeLimiter()
+
+
+@pytest.fixture
+def client(tmp_path, limiter):
+    """A client with a temporary cache and a fake API key."""
+    cache = BraveResponseCache(str(tmp_path / "brave_cache.db"))
+    return BraveSearchClient(api_key="test-key", cache=cache, rate_limiter=limiter)
+
+
+class TestBraveSearchClient:
+    """Tests for BraveSearchClient.search."""
+
+    def test_repeated_searches_hit_the_cache(self, client, monkeypatch):
+        """The same query and params are fetched once; other params are fetched again."""
+        get = MagicMock(return_value=http_response(200, BODY))
+        monkeypatch.setattr(brave_client.requests, "get", get)
+
+        first = client.search('"Acme" expansion', {"count": 10})
+        second = client.search('"Acme" expansion', {"count": 10})
+        client.search('"Acme" expansion', {"count": 5})
+
+        assert first == second == BODY
+        assert get.call_count == 2
+        assert client.stats()["hits"] == 1
+
+    def test_identical_inflight_searches_are_coalesced(self, client, monkeypatch):
+        """Concurrent callers of the same search share one HTTP request."""
+        release = threading.Event()
+        get = MagicMock(side_effect=lambda *a, **k: release.wait(2) and http_response(200, BODY))
+        monkeypatch.setattr(brave_client.requests, "get", get)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(client.search("Acme"))) for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        while client.stats()["coalesced"] < 2:
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert get.call_count == 1
+        assert results == [BODY, BODY, BODY]
+
+    def test_rate_limited_searches_back_off_and_retry(self, client, limiter, monkeypatch):
+        """A 429 pauses the shared limiter for Retry-After before retrying."""
+        get = MagicMock(
+            side_effect=[
+                http_response(429, headers={"Retry-After": "3"}),
+                http_response(200, BODY),
+            ]
+        )
+        monkeypatch.setattr(brave_client.requests, "get", get)
+
+        assert client.search("Acme") == BODY
+        assert limiter.pauses == [3.0]
+        assert limiter.acquired == 2
+
+    def test_failures_are_reported_and_not_cached(self, client, monkeypatch):
+        """Errors return None, or raise with an error code when asked; nothing is cached."""
+        get = MagicMock(return_value=http_response(500))
+        monkeypatch.setattr(brave_client.requests, "get", get)
+
+        assert client.search("Acme") is None
+        with pytest.raises(BraveSearchError) as error:
+            client.search("Acme", raise_errors=True)
+
+        assert error.value.error_code == "BRAVE_HTTP_500"
+        assert len(client.cache) == 0
+
+    def test_invalid_bodies_are_coded_errors(self, client, monkeypatch):
+        """A 200 whose body isn't JSON fails with BRAVE_INVALID_RESPONSE."""
+        response = http_response(200)
+        response.json.side_effect = ValueError("Expecting value")
+        monkeypatch.setattr(brave_client.requests, "get", lambda *a, **k: response)
+
+        assert client.search("Acme") is None
+        with pytest.raises(BraveSearchError) as error:
+            client.search("Acme", raise_errors=True)
+
+        assert error.value.error_code == "BRAVE_INVALID_RESPONSE"
+        assert len(client.cache) == 0
+
+    def test_cache_failures_fall_back_to_searching(self, client, monkeypatch):
+        """A broken cache database doesn't fail the search."""
+        monkeypatch.setattr(brave_client.requests, "get", lambda *a, **k: http_response(200, BODY))
+        monkeypatch.setattr(client.cache, "get", MagicMock(side_effect=sqlite3.OperationalError))
+        monkeypatch.setattr(client.cache, "set", MagicMock(side_effect=sqlite3.OperationalError))
+
+        assert client.search("Acme", raise_errors=True) == BODY
+
+    def test_exhausted_retries_suggest_waiting(self, client, monkeypatch):
+        """Still rate limited after every retry gives BRAVE_RATE_LIMITED with a retry hint."""
+        monkeypatch.setattr(brave_client.requests, "get", lambda *a, **k: http_response(429))
+
+        with pytest.raises(BraveSearchError) as error:
+            client.search("Acme", raise_errors=True)
+
+        assert error.value.error_code == "BRAVE_RATE_LIMITED"
+        assert error.value.retry_after == 60
+        assert client.stats()["throttled"] == client.max_retries + 1
+
+    def test_missing_api_key_skips_the_request(self, limiter, monkeypatch):
+        """Without a key no request is made."""
+        monkeypatch.delenv("BRAVE_API_KEY", raising=False)
+        get = MagicMock()
+        monkeypatch.setattr(brave_client.requests, "get", get)
+
+        assert BraveSearchClient(rate_limiter=limiter).search("Acme") is None
+        get.assert_not_called()
+
+
+class TestGetBraveClient:
+    """Tests for the process-wide client."""
+
+    def test_default_cache_lives_in_the_project_root(self, tmp_path, monkeypatch):
+        """The default database doesn't depend on the working directory."""
+        monkeypatch.delenv("ABM_BRAVE_CACHE_DB", raising=False)
+        monkeypatch.setattr(brave_client, "project_root", str(tmp_path / "root"))
+        monkeypatch.setattr(brave_client, "_client", None)
+        (tmp_path / "root").mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        client = brave_client.get_brave_client()
+
+        assert client.cache.db_path == str(tmp_path / "root" / "brave_cache.db")
+        assert not (tmp_path / "brave_cache.db").exists()
@@ -0,0 +1,106 @@
+"""
+Unit tests for batched contact deduplication in NotionClient.save_contacts.
+
+Tests identifier precedence and normalization in ContactDedupIndex, and that
+save_contacts resolves a whole batch from one OR query instead of querying
+per contact.
+
+Run with: pytest tests/unit/test_contact_dedup.py -v
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from abm_research.integrations.notion_client import ContactDedupIndex, NotionClient
+
+
+def make_page(page_id, name="", email="", linkedin_url="", apollo_id=""):
+    """Build a Notion contact page with the properties used for matching."""
+    return {
+        "id": page_id,
+        "properties": {
+            "Name": {"title": [{"plain_text": name}] if name else []},
+            "Email": {"email": email or None},
+            "LinkedIn URL": {"url": linkedin_url or None},
+            "Apollo Person ID": {"rich_text": [{"plain_text": apollo_id}] if apollo_id else []},
+        },
+    }
+
+
+class TestContactDedupIndex:
+    """Tests for ContactDedupIndex matching."""
+
+    def test_apollo_id_beats_name(self):
+        """The most reliable identifier wins when several match different pages."""
+        index = ContactDedupIndex()
+        index.add_page(make_page("by-name", name="Jane Doe"))
+        index.add_page(make_page("by-apollo", name="J. Doe", apollo_id="ap_1"))
+
+        assert index.find({"apollo_person_id": "ap_1", "name": "Jane Doe"}) == "by-apollo"
+
+    def test_normalized_email_and_linkedin(self):
+        """Email case and LinkedIn trailing slashes don't prevent a match."""
+        index = ContactDedupIndex()
+        index.add_page(
+            make_page("p1", email="Jane@Acme.com", linkedin_url="https://linkedin.com/in/jane/")
+        )
+
+        assert index.find({"email": "jane@acme.com"}) == "p1"
+        assert index.find({"linkedin_url": "https://LinkedIn.com/in/jane"}) == "p1"
+
+    def test_placeholder_emails_never_match(self):
+        """Apollo placeholder emails are ignored as identifiers."""
+        index = ContactDedupIndex()
+        index.add("p1", {"email": "email_not_unlocked@domain.com"})
+
+        assert index.find({"email": "email_not_unlocked@domain.com"}) is None
+        assert len(index) == 0
+
+
+class TestSaveContactsDedup:
+    """Tests for save_contacts using the batch index."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Create a NotionClient with fake credentials and database IDs."""
+        monkeypatch.setenv("NOTION_CONTACTS_DB_ID", "contacts-db")
+        monkeypatch.setenv("NOTION_ACCOUNTS_DB_ID", "accounts-db")
+        return NotionClient(api_key="test-key")
+
+    def test_batch_uses_one_query_and_dedups_within_batch(self, client):
+        """Existing pages are updated, and in-batch duplicates reuse the created page."""
+        contacts = [
+            {"name": "Jane Doe", "email": "jane@acme.com", "lead_score": 80},
+            {"name": "New Person", "linkedin_url": "https://linkedin.com/in/new", "lead_score": 70},
+            {"name": "New P.", "linkedin_url": "https://linkedin.com/in/new/", "lead_score": 70},
+            {"name": "Unscored"},
+        ]
+        existing = [[make_page("existing-jane", name="Jane Doe", email="jane@acme.com")]]
+
+        with patch.object(client, "iter_database_pages", return_value=iter(existing)) as query:
+            with patch.object(client, "_find_existing_account", return_value="acct-1") as account:
+                with patch.object(client, "_create_contact", return_value="created-1") as create:
+                    with patch.object(
+                        client, "_update_contact", side_effect=lambda page_id, c: page_id
+                    ) as update:
+                        results = client.save_contacts(contacts, account_name="Acme")
+
+        assert query.call_count == 1
+        conditions = query.call_args.args[1]["filter"]["or"]
+        assert {"property": "Email", "email": {"equals": "jane@acme.com"}} in conditions
+
+        assert account.call_count == 1
+        create.assert_called_once()
+        assert create.call_args.kwargs["account_id"] == "acct-1"
+        assert [call.args[0] for call in update.call_args_list] == ["existing-jane", "created-1"]
+        assert results["saved"] == 3
+        assert results["skipped"] == 1
+
+    def test_no_identifiers_skips_index_query(self, client):
+        """A batch with nothing to match doesn't query Notion for the index."""
+        with patch.object(client, "iter_database_pages") as query:
+            index = client._build_contact_index([{"lead_score": 50}])
+
+        query.assert_not_called()
+        assert len(index) == 0
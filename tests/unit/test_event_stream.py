@@ -0,0 +1,152 @@
+"""
+Unit tests for Server-Sent Events streaming.
+
+Tests SSE frame encoding, EventStream's phase/partial/result events and
+heartbeats, and the research job event stream read from the job table.
+
+Run with: pytest tests/unit/test_event_stream.py -v
+"""
+
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from abm_research.utils.event_stream import HEARTBEAT_FRAME, EventStream, format_sse
+
+
+def parse(frames):
+    """Decode SSE frames into (event, data) pairs, skipping comments."""
+    events = []
+    for frame in frames:
+        if frame.startswith(":"):
+            continue
+        fields = dict(line.split(": ", 1) for line in frame.strip().split("\n"))
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestEventStream:
+    """Tests for EventStream."""
+
+    def test_format_sse(self):
+        """Frames carry id, event name and JSON data, ending in a blank line."""
+        frame = format_sse("partial", {"vendors": 2}, event_id=3)
+        assert frame == 'id: 3\nevent: partial\ndata: {"vendors": 2}\n\n'
+
+    def test_progress_then_result(self):
+        """Phases, partial results and the final payload arrive in order."""
+        clock = FakeClock()
+
+        def work(stream):
+            stream.progress("search", "running", queries=2)
+            clock.now += 1.5
+            stream.progress("search", "partial", results=10)
+            clock.now += 1.0
+            stream.progress("search", "completed", results=20)
+            return {"status": "success"}, 200
+
+        events = parse(EventStream(clock=clock).run(work))
+
+        assert [name for name, _ in events] == [
+            "phase_start",
+            "partial",
+            "phase_complete",
+            "result",
+        ]
+        assert events[1][1]["results"] == 10
+        assert events[1][1]["elapsed"] == 1.5
+        assert events[2][1]["duration"] == 2.5
+        assert events[3][1] == {"status": "success", "status_code": 200, "elapsed": 2.5}
+
+    def test_exception_becomes_error_event(self):
+        """A failure in the work is sent as an error event and ends the stream."""
+
+        def work(stream):
+            raise ValueError("Brave unavailable")
+
+        events = parse(EventStream().run(work))
+
+        assert len(events) == 1
+        assert events[0][0] == "error"
+        assert events[0][1]["message"] == "Brave unavailable"
+        assert events[0][1]["type"] == "ValueError"
+
+    def test_heartbeat_while_work_is_quiet(self):
+        """Comment frames are sent while no events are produced."""
+        release = threading.Event()
+
+        def work(stream):
+            release.wait(5)
+            return {}, 200
+
+        frames = EventStream(heartbeat=0.01).run(work)
+        assert next(frames) == HEARTBEAT_FRAME
+        release.set()
+        assert parse(frames)[-1][0] == "result"
+
+
+class TestResearchJobStream:
+    """Tests for the research job SSE stream in the API server."""
+
+    @pytest.fixture
+    def server(self):
+        """Import the server module, skipping if unavailable."""
+        try:
+            from src.abm_research.api import server
+        except ImportError:
+            pytest.skip("Server module not importable")
+        return server
+
+    def job(self, status, progress, result=None):
+        """Build a decoded job record."""
+        return {
+            "id": "job-1",
+            "status": status,
+            "params": {"account_id": "acc_1"},
+            "progress": progress,
+            "current_phase": None,
+            "created_at": None,
+            "started_at": None,
+            "finished_at": None,
+            "result": result,
+            "error": None,
+        }
+
+    def test_phase_changes_stream_until_result(self, server):
+        """Each recorded phase transition is sent once, then the job result."""
+        snapshots = [
+            self.job("running", {"phase_1": {"status": "running"}}),
+            self.job("running", {"phase_1": {"status": "running"}}),
+            self.job(
+                "succeeded",
+                {
+                    "phase_1": {"status": "completed", "trigger_events": 4},
+                    "phase_2": {"status": "completed", "contacts": 12},
+                },
+                result={"status": "success"},
+            ),
+        ]
+        with patch.object(server.get_research_jobs(), "get", side_effect=snapshots):
+            with patch.object(server, "RESEARCH_STREAM_POLL_SECONDS", 0):
+                events = parse(server._research_job_frames("job-1"))
+
+        assert [(name, data.get("phase")) for name, data in events] == [
+            ("phase_start", "phase_1"),
+            ("phase_complete", "phase_1"),
+            ("phase_complete", "phase_2"),
+            ("result", None),
+        ]
+        assert events[2][1]["contacts"] == 12
+        assert events[-1][1] == {"status": "success", "status_code": 200}
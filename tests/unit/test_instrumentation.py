@@ -0,0 +1,127 @@
+"""
+Unit tests for timing spans.
+
+Tests span statistics (percentiles, bytes, errors, 429s), run-level
+collection across phase threads, Notion request naming, and the
+instrumentation attached to research results.
+
+Run with: pytest tests/unit/test_instrumentation.py -v
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from abm_research.utils.instrumentation import (
+    Instrumentation,
+    collect,
+    process_instrumentation,
+    span,
+)
+from abm_research.utils.phase_graph import Phase, run_phase_graph
+
+
+class TestInstrumentation:
+    """Tests for Instrumentation and span."""
+
+    def test_percentiles_and_totals(self):
+        """Latency percentiles use nearest rank over the recorded samples."""
+        recorder = Instrumentation()
+        for ms in range(1, 101):
+            recorder.record("brave.search", ms / 1000, nbytes=10)
+
+        stats = recorder.snapshot()["brave.search"]
+
+        assert stats["count"] == 100
+        assert stats["bytes"] == 1000
+        assert stats["p50_seconds"] == 0.05
+        assert stats["p90_seconds"] == 0.09
+        assert stats["p99_seconds"] == 0.099
+        assert stats["max_seconds"] == 0.1
+
+    def test_span_records_response_and_errors(self):
+        """HTTP error statuses and exceptions count as errors; 429s as throttled."""
+        with collect() as recorder:
+            with span("apollo.search") as call:
+                call.record_response(SimpleNamespace(status_code=200, content=b"12345"))
+            with span("apollo.search") as call:
+                call.record_response(SimpleNamespace(status_code=429, content=b""))
+            with pytest.raises(TimeoutError):
+                with span("apollo.search"):
+                    raise TimeoutError("slow")
+
+        stats = recorder.snapshot()["apollo.search"]
+        assert (stats["count"], stats["errors"], stats["throttled"]) == (3, 2, 1)
+        assert stats["bytes"] == 5
+
+    def test_spans_reach_process_aggregate_and_active_runs(self):
+        """A span is recorded process-wide and only in runs collecting at the time."""
+        before = process_instrumentation().snapshot().get("test.span", {}).get("count", 0)
+        with span("test.span"):
+            pass
+        with collect() as recorder:
+            with span("test.span"):
+                pass
+
+        assert process_instrumentation().snapshot()["test.span"]["count"] == before + 2
+        assert recorder.snapshot()["test.span"]["count"] == 1
+
+    def test_phase_threads_inherit_the_run(self):
+        """Spans made inside phases on worker threads reach the run's recorder."""
+
+        def fetch(results):
+            with span("website.fetch"):
+                return "ok"
+
+        with collect() as recorder:
+            run_phase_graph([Phase("a", fetch), Phase("b", fetch)], max_workers=2)
+
+        assert recorder.snapshot()["website.fetch"]["count"] == 2
+
+
+class TestNotionSpanNames:
+    """Tests for NotionClient request span names."""
+
+    def test_span_names(self):
+        """Queries, page creates and updates get distinct span names."""
+        from abm_research.integrations.notion_client import NotionClient
+
+        base = "https://api.notion.com/v1"
+        assert NotionClient._span_name("POST", f"{base}/databases/db1/query") == "notion.query"
+        assert NotionClient._span_name("POST", f"{base}/pages") == "notion.create"
+        assert NotionClient._span_name("PATCH", f"{base}/pages/p1") == "notion.update"
+        assert NotionClient._span_name("GET", f"{base}/pages/p1") == "notion.retrieve"
+
+
+class TestResearchInstrumentation:
+    """Tests for instrumentation in ComprehensiveABMSystem results."""
+
+    def test_results_include_phase_and_call_spans(self, monkeypatch):
+        """Phase spans and calls made inside phases are attached to the results."""
+        from abm_research.core.abm_system import ComprehensiveABMSystem
+
+        system = ComprehensiveABMSystem.__new__(ComprehensiveABMSystem)
+        system.phase_workers = 2
+        system.notion_client = None
+        system.checkpoints = None
+
+        def enrich(contacts):
+            with span("linkedin.profile"):
+                return contacts
+
+        monkeypatch.setattr(system, "_phase_1_account_intelligence", lambda n, d: ({}, []))
+        monkeypatch.setattr(
+            system, "_phase_2_contact_discovery", lambda n, d, a: [{"name": "Jane"}]
+        )
+        monkeypatch.setattr(system, "_phase_3_contact_enrichment", enrich)
+        monkeypatch.setattr(system, "_phase_4_engagement_intelligence", lambda c, e, a: c)
+        monkeypatch.setattr(system, "_phase_5_partnership_intelligence", lambda n, d, e: {})
+
+        results = system.conduct_complete_account_research("Acme", "acme.com")
+
+        spans = results["instrumentation"]
+        assert {f"phase.phase_{n}" for n in range(1, 6)} <= set(spans)
+        assert spans["linkedin.profile"]["count"] == 1
+        assert set(results["research_summary"]["phase_seconds"]) == {
+            f"phase_{n}" for n in range(1, 6)
+        }
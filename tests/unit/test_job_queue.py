@@ -0,0 +1,187 @@
+"""
+Unit tests for the persistent background job queue.
+
+Tests job execution and progress recording, failure capture, the pending-job
+limit, de-duplicating submits, re-queueing unfinished jobs after a restart,
+and the server opening its queue on first use rather than at import.
+
+Run with: pytest tests/unit/test_job_queue.py -v
+"""
+
+import threading
+
+import pytest
+
+from abm_research.utils.job_queue import (
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_SUCCEEDED,
+    JobQueue,
+    JobQueueFull,
+)
+
+
+def wait_for(queue, job_id):
+    """Let the queue drain and return the finished job."""
+    queue.shutdown(wait=True)
+    return queue.get(job_id)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path to a throwaway job database."""
+    return str(tmp_path / "jobs.db")
+
+
+class TestJobQueue:
+    """Tests for JobQueue."""
+
+    def test_runs_job_and_records_progress(self, db_path):
+        """The runner's result and phase updates are stored on the job."""
+        queue = JobQueue(db_path, max_workers=1)
+
+        def runner(params, progress):
+            progress("phase_1", "running")
+            progress("phase_1", "completed", events=3)
+            return {"domain": params["domain"]}
+
+        queue.register("research", runner)
+        job = queue.submit("research", {"domain": "acme.com"})
+        assert job["status"] == JOB_QUEUED
+
+        done = wait_for(queue, job["id"])
+        assert done["status"] == JOB_SUCCEEDED
+        assert done["result"] == {"domain": "acme.com"}
+        assert done["progress"]["phase_1"]["status"] == "completed"
+        assert done["progress"]["phase_1"]["events"] == 3
+        assert done["current_phase"] == "phase_1"
+        assert done["attempts"] == 1
+
+    def test_runner_exception_marks_job_failed(self, db_path):
+        """An exception is captured as the job error."""
+        queue = JobQueue(db_path, max_workers=1)
+
+        def runner(params, progress):
+            raise RuntimeError("Apollo unavailable")
+
+        queue.register("research", runner)
+        done = wait_for(queue, queue.submit("research")["id"])
+
+        assert done["status"] == JOB_FAILED
+        assert "Apollo unavailable" in done["error"]
+        assert done["finished_at"]
+
+    def test_submit_refuses_beyond_max_pending(self, db_path):
+        """Submitting past max_pending raises JobQueueFull."""
+        release = threading.Event()
+        queue = JobQueue(db_path, max_workers=1, max_pending=1)
+        queue.register("research", lambda params, progress: release.wait(5))
+
+        queue.submit("research")
+        with pytest.raises(JobQueueFull):
+            queue.submit("research")
+        release.set()
+        queue.shutdown()
+
+    def test_unknown_kind_is_rejected(self, db_path):
+        """Submitting a kind without a runner raises KeyError."""
+        with pytest.raises(KeyError):
+            JobQueue(db_path).submit("missing")
+
+    def test_find_active_matches_params(self, db_path):
+        """A queued job is found by a params value until it finishes."""
+        release = threading.Event()
+        queue = JobQueue(db_path, max_workers=1)
+        queue.register("research", lambda params, progress: release.wait(5))
+
+        job = queue.submit("research", {"account_id": "acc_1"})
+        assert queue.find_active("research", "account_id", "acc_1")["id"] == job["id"]
+        assert queue.find_active("research", "account_id", "acc_2") is None
+
+        release.set()
+        wait_for(queue, job["id"])
+        assert queue.find_active("research", "account_id", "acc_1") is None
+
+    def test_dedup_key_reuses_the_active_job(self, db_path):
+        """Concurrent submits for the same key, even from two queues, start one job."""
+        release = threading.Event()
+        queues = [JobQueue(db_path, max_workers=1) for _ in range(2)]
+        for queue in queues:
+            queue.register("research", lambda params, progress: release.wait(5))
+
+        jobs = []
+        threads = [
+            threading.Thread(
+                target=lambda queue=queue: jobs.append(
+                    queue.submit("research", {"account_key": "page-1"}, dedup_key="account_key")
+                )
+            )
+            for queue in queues * 4
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        other = queues[0].submit("research", {"account_key": "page-2"}, dedup_key="account_key")
+
+        assert len({job["id"] for job in jobs}) == 1
+        assert other["id"] != jobs[0]["id"]
+        assert queues[0].count() == 2
+        release.set()
+        for queue in queues:
+            queue.shutdown()
+
+    def test_recover_requeues_interrupted_jobs(self, db_path):
+        """Jobs left running by a previous process run again after restart."""
+        first = JobQueue(db_path, max_workers=1)
+        first.register("research", lambda params, progress: None)
+        first.register("orphan", lambda params, progress: None)
+        interrupted = first.submit("research", {"domain": "acme.com"})
+        orphaned = first.submit("orphan")
+        first.shutdown()
+        # Simulate a crash mid-run
+        first._update(interrupted["id"], status="running", result=None)
+        first._update(orphaned["id"], status="queued", result=None)
+
+        second = JobQueue(db_path, max_workers=1)
+        second.register("research", lambda params, progress: {"resumed": params["domain"]})
+
+        assert second.recover() == 1
+        done = wait_for(second, interrupted["id"])
+        assert done["status"] == JOB_SUCCEEDED
+        assert done["result"] == {"resumed": "acme.com"}
+        assert done["attempts"] == 2
+        assert second.get(orphaned["id"])["status"] == JOB_FAILED
+
+
+class TestServerResearchJobs:
+    """Tests for the API server's research job queue."""
+
+    @pytest.fixture
+    def server(self, tmp_path, monkeypatch):
+        """Import the server with its job queue pointed at a temporary database."""
+        try:
+            from src.abm_research.api import server
+        except ImportError:
+            pytest.skip("Server module not importable")
+        monkeypatch.setattr(server, "RESEARCH_JOBS_DB", str(tmp_path / "research_jobs.db"))
+        monkeypatch.setattr(server, "_research_jobs", None)
+        return server
+
+    def test_queue_opens_on_first_use(self, server, tmp_path):
+        """Importing the server opens nothing; the first caller creates the queue."""
+        assert not (tmp_path / "research_jobs.db").exists()
+
+        queue = server.get_research_jobs()
+
+        assert server.get_research_jobs() is queue
+        assert queue.db_path == str(tmp_path / "research_jobs.db")
+        queue.shutdown()
+
+    def test_startup_recovers_interrupted_jobs(self, server, monkeypatch):
+        """start_research_jobs re-queues jobs left by a previous process."""
+        monkeypatch.setattr(server, "ABM_SYSTEM_AVAILABLE", True)
+        monkeypatch.setattr(server.JobQueue, "recover", lambda queue: 3)
+
+        assert server.start_research_jobs() == 3
+        server.get_research_jobs().shutdown()
@@ -0,0 +1,173 @@
+"""
+Unit tests for the LLM gateway and its on-disk response cache.
+
+Tests that identical completion requests are served from the cache, that
+every completion parameter is part of the key, TTL expiry, LRU eviction,
+bypassing, and hit/miss stats.
+
+Run with: pytest tests/unit/test_llm_gateway.py -v
+"""
+
+import sqlite3
+from unittest.mock import MagicMock
+
+import pytest
+
+from abm_research.utils import llm_gateway
+from abm_research.utils.llm_gateway import LLMGateway, LLMResponseCache, completion_key
+
+MESSAGES = [{"role": "user", "content": "Score this news item"}]
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def openai_client(*contents):
+    """An OpenAI client mock answering with contents in order."""
+    client = MagicMock()
+    responses = []
+    for content in contents:
+        response = MagicMock()
+        response.choices[0].message.content = content
+        responses.append(response)
+    client.chat.completions.create.side_effect = responses
+    return client
+
+
+@pytest.fixture
+def clock():
+    """A fake wall clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    """A response cache in a temporary database."""
+    return LLMResponseCache(str(tmp_path / "llm_cache.db"), ttl_seconds=60, clock=clock)
+
+
+class TestLLMGateway:
+    """Tests for LLMGateway.complete."""
+
+    def test_identical_requests_hit_the_cache(self, cache):
+        """The second identical request replays the first without the client."""
+        client = openai_client("Expansion|80|90")
+        gateway = LLMGateway(cache)
+
+        first = gateway.complete(MESSAGES, client=lambda: client, max_tokens=200)
+        second = gateway.complete(
+            MESSAGES, client=MagicMock(side_effect=AssertionError), max_tokens=200
+        )
+
+        assert first == second == "Expansion|80|90"
+        assert client.chat.completions.create.call_count == 1
+
+    def test_parameters_are_part_of_the_key(self, cache):
+        """A different temperature or max_tokens is a different completion."""
+        client = openai_client("a", "b", "c")
+        gateway = LLMGateway(cache)
+
+        gateway.complete(MESSAGES, client=lambda: client, temperature=0.3, max_tokens=200)
+        gateway.complete(MESSAGES, client=lambda: client, temperature=0.7, max_tokens=200)
+        gateway.complete(MESSAGES, client=lambda: client, temperature=0.3, max_tokens=300)
+
+        assert client.chat.completions.create.call_count == 3
+        assert completion_key("gpt-4o-mini", MESSAGES, 0.3, 200) != completion_key(
+            "gpt-4o", MESSAGES, 0.3, 200
+        )
+
+    def test_entries_expire_after_ttl(self, cache, clock):
+        """Completions older than the TTL are requested again."""
+        client = openai_client("old", "new")
+        gateway = LLMGateway(cache)
+
+        gateway.complete(MESSAGES, client=lambda: client)
+        clock.now += 61
+
+        assert gateway.complete(MESSAGES, client=lambda: client) == "new"
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path, clock):
+        """Beyond max_entries the entry used longest ago is dropped."""
+        cache = LLMResponseCache(str(tmp_path / "llm.db"), max_entries=2, clock=clock)
+        for key in ("a", "b"):
+            cache.set(key, "gpt-4o-mini", key)
+            clock.now += 1
+        cache.get("a")  # b is now least recently used
+        clock.now += 1
+        cache.set("c", "gpt-4o-mini", "c")
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == "a"
+
+    def test_bypass_skips_lookup_and_store(self, cache):
+        """Bypassed calls always reach the API and leave the cache untouched."""
+        client = openai_client("a", "b")
+        gateway = LLMGateway(cache)
+
+        gateway.complete(MESSAGES, client=lambda: client, bypass_cache=True)
+        gateway.complete(MESSAGES, client=lambda: client, bypass_cache=True)
+
+        assert client.chat.completions.create.call_count == 2
+        assert len(cache) == 0
+        assert gateway.stats()["bypassed"] == 2
+
+    def test_failures_and_empty_replies_are_not_cached(self, cache):
+        """Errors propagate and empty content is requested again next time."""
+        client = openai_client("", "Expansion|80|90")
+        gateway = LLMGateway(cache)
+
+        assert gateway.complete(MESSAGES, client=lambda: client) == ""
+        assert gateway.complete(MESSAGES, client=lambda: client) == "Expansion|80|90"
+
+        failing = MagicMock()
+        failing.chat.completions.create.side_effect = RuntimeError("rate limited")
+        with pytest.raises(RuntimeError):
+            gateway.complete([{"role": "user", "content": "other"}], client=lambda: failing)
+        assert len(cache) == 1
+
+    def test_stats(self, cache):
+        """Hit ratio and entry count reflect cache use."""
+        client = openai_client("a")
+        gateway = LLMGateway(cache)
+
+        gateway.complete(MESSAGES, client=lambda: client)
+        gateway.complete(MESSAGES, client=lambda: client)
+
+        stats = gateway.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+        assert stats["hit_ratio"] == 0.5
+
+    def test_cache_failures_still_return_the_completion(self, cache, monkeypatch):
+        """A broken cache database degrades to an uncached call."""
+        client = openai_client("Expansion|80|90")
+        gateway = LLMGateway(cache)
+        monkeypatch.setattr(cache, "get", MagicMock(side_effect=sqlite3.OperationalError("locked")))
+        monkeypatch.setattr(cache, "set", MagicMock(side_effect=sqlite3.OperationalError("locked")))
+
+        assert gateway.complete(MESSAGES, client=lambda: client) == "Expansion|80|90"
+        assert client.chat.completions.create.call_count == 1
+
+
+class TestGetLLMGateway:
+    """Tests for the process-wide gateway."""
+
+    def test_default_cache_lives_in_the_project_root(self, tmp_path, monkeypatch):
+        """The default database doesn't depend on the working directory."""
+        monkeypatch.delenv("ABM_LLM_CACHE_DB", raising=False)
+        monkeypatch.setattr(llm_gateway, "project_root", str(tmp_path / "root"))
+        monkeypatch.setattr(llm_gateway, "_gateway", None)
+        (tmp_path / "root").mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        gateway = llm_gateway.get_llm_gateway()
+
+        assert gateway.cache.db_path == str(tmp_path / "root" / "llm_cache.db")
+        assert not (tmp_path / "llm_cache.db").exists()
@@ -0,0 +1,108 @@
+"""
+Unit tests for Prometheus metrics.
+
+Tests counter/histogram exposition, external-call metrics rendered from
+timing spans, and the API server's /metrics endpoint.
+
+Run with: pytest tests/unit/test_metrics.py -v
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from abm_research.utils.instrumentation import Instrumentation
+from abm_research.utils.metrics import Counter, Histogram, format_family, render_spans
+
+
+def samples(text):
+    """Parse exposition text into {sample with labels: value}, skipping comments."""
+    parsed = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            parsed[name] = float(value)
+    return parsed
+
+
+class TestMetricTypes:
+    """Tests for Counter, Histogram and format_family."""
+
+    def test_counter_exposition(self):
+        """Counters are rendered per label set with HELP and TYPE lines."""
+        requests_total = Counter("abm_test_total", "Test requests", ("route",))
+        requests_total.inc(route="/api/accounts")
+        requests_total.inc(2, route="/api/accounts")
+
+        text = format_family(
+            requests_total.name,
+            requests_total.kind,
+            requests_total.help_text,
+            requests_total.samples(),
+        )
+
+        assert "# TYPE abm_test_total counter" in text
+        assert samples(text) == {'abm_test_total{route="/api/accounts"}': 3}
+        with pytest.raises(ValueError):
+            requests_total.inc(-1)
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Each bucket counts observations at or below its bound, ending with +Inf."""
+        latency = Histogram("abm_test_seconds", "Test latency", ("route",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            latency.observe(value, route="/x")
+
+        parsed = samples(format_family(latency.name, latency.kind, "", latency.samples()))
+
+        assert parsed['abm_test_seconds_bucket{route="/x",le="0.1"}'] == 1
+        assert parsed['abm_test_seconds_bucket{route="/x",le="1"}'] == 2
+        assert parsed['abm_test_seconds_bucket{route="/x",le="+Inf"}'] == 3
+        assert parsed['abm_test_seconds_sum{route="/x"}'] == 5.55
+        assert parsed['abm_test_seconds_count{route="/x"}'] == 3
+
+    def test_spans_become_provider_metrics(self):
+        """External spans are labelled by provider/operation; phases get their own family."""
+        spans = Instrumentation()
+        spans.record("brave.search", 0.2, nbytes=100)
+        spans.record("brave.search", 0.3, error=True, status_code=429)
+        spans.record("phase.phase_1", 12.0)
+
+        parsed = samples(render_spans(spans))
+        labels = '{provider="brave",operation="search"}'
+
+        assert parsed[f"abm_external_call_duration_seconds_count{labels}"] == 2
+        assert parsed[f"abm_external_call_errors_total{labels}"] == 1
+        assert parsed[f"abm_external_call_throttled_total{labels}"] == 1
+        assert parsed[f"abm_external_call_response_bytes_total{labels}"] == 100
+        assert parsed['abm_research_phase_duration_seconds_count{phase="phase_1"}'] == 1
+
+
+class TestMetricsEndpoint:
+    """Tests for /metrics in the API server."""
+
+    @pytest.fixture
+    def server(self):
+        """Import the server module, skipping if unavailable."""
+        try:
+            from src.abm_research.api import server
+        except ImportError:
+            pytest.skip("Server module not importable")
+        return server
+
+    def test_metrics_endpoint(self, server, monkeypatch):
+        """Request latency, cache, job and Apollo credit metrics are exported."""
+        monkeypatch.setattr(
+            server.get_research_jobs(), "count", lambda status: {"running": 2}.get(status, 0)
+        )
+        client = server.app.test_client()
+        client.get("/api/health")
+
+        response = client.get("/metrics")
+        parsed = samples(response.get_data(as_text=True))
+
+        assert response.status_code == 200
+        assert response.content_type.startswith("text/plain; version=0.0.4")
+        assert parsed['abm_http_requests_total{method="GET",route="/api/health",status="200"}'] >= 1
+        assert parsed['abm_research_jobs{status="running"}'] == 2
+        assert 'abm_cache_hit_ratio{cache="notion"}' in parsed
+        assert "# TYPE abm_apollo_credits_consumed_total counter" in response.get_data(as_text=True)
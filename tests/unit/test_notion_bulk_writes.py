@@ -0,0 +1,159 @@
+"""
+Unit tests for concurrent Notion bulk saves.
+
+Tests that save_trigger_events / save_partnerships / save_contacts run writes
+on the worker pool while keeping the per-item result shape, input ordering,
+duplicate serialization, fail_fast behaviour, and per-contact lookups when
+the contact index can't be built.
+
+Run with: pytest tests/unit/test_notion_bulk_writes.py -v
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from abm_research.integrations.notion_client import NotionClient, NotionError
+
+
+class TestBulkWrites:
+    """Tests for _run_writes and the save_* methods built on it."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Create a NotionClient with fake credentials, database IDs and 4 workers."""
+        for db in ["ACCOUNTS", "CONTACTS", "TRIGGER_EVENTS", "PARTNERSHIPS"]:
+            monkeypatch.setenv(f"NOTION_{db}_DB_ID", f"{db.lower()}-db")
+        monkeypatch.setenv("NOTION_WRITE_WORKERS", "4")
+        client = NotionClient(api_key="test-key")
+        monkeypatch.setattr(client, "_find_existing_account", lambda name: "acct-1")
+        return client
+
+    def test_group_by_keys_is_transitive(self):
+        """Items linked through a shared key land in one ordered group."""
+        groups = NotionClient._group_by_keys([["a"], ["b"], ["b", "c"], ["c", "a"], []])
+        assert sorted(groups) == [[0, 1, 2, 3], [4]]
+
+    def test_events_written_concurrently_in_input_order(self, client):
+        """Writes overlap in time but results keep the input order and shape."""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def create(event, account_name, account_id=None):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+            return f"page-{event['description']}"
+
+        events = [{"description": f"e{i}"} for i in range(8)]
+        with patch.object(client, "_create_trigger_event", side_effect=create):
+            results = client.save_trigger_events(events, "Acme")
+
+        assert max(peak) > 1
+        assert list(results["results"]) == [f"e{i}" for i in range(8)]
+        assert results["saved"] == 8
+        assert results["failed"] == 0
+        assert results["errors"] == []
+
+    def test_partial_failure_is_reported_per_item(self, client):
+        """One failing write is recorded without stopping the rest."""
+
+        def create(partnership, account_name, account_id=None):
+            if partnership["partner_name"] == "Bad":
+                raise NotionError("boom", operation="create_partnership")
+            return f"page-{partnership['partner_name']}"
+
+        partnerships = [{"partner_name": n} for n in ["NVIDIA", "Bad", "Vertiv"]]
+        with patch.object(client, "_create_partnership", side_effect=create):
+            results = client.save_partnerships(partnerships, "Acme")
+
+        assert results["saved"] == 2
+        assert results["failed"] == 1
+        assert results["results"]["Bad"]["status"] == "failed"
+        assert results["errors"][0]["partner"] == "Bad"
+
+    def test_same_vendor_rows_are_serialized(self, client):
+        """Rows for one vendor run in order on one worker so dedup sees the first."""
+        order = []
+
+        def create(partnership, account_name, account_id=None):
+            order.append(partnership["note"])
+            time.sleep(0.01)
+            return "page"
+
+        partnerships = [
+            {"partner_name": "NVIDIA", "note": 1},
+            {"partner_name": "nvidia", "note": 2},
+            {"partner_name": "NVIDIA", "note": 3},
+        ]
+        with patch.object(client, "_create_partnership", side_effect=create):
+            client.save_partnerships(partnerships, "Acme")
+
+        assert order == [1, 2, 3]
+
+    def test_fail_fast_raises_and_stops_new_writes(self, client):
+        """fail_fast raises the first error and leaves unstarted items unwritten."""
+        client.write_workers = 1
+        calls = []
+
+        def create(event, account_name, account_id=None):
+            calls.append(event["description"])
+            if event["description"] == "e1":
+                raise NotionError("boom", operation="create_trigger_event")
+            return "page"
+
+        events = [{"description": f"e{i}"} for i in range(4)]
+        with patch.object(client, "_create_trigger_event", side_effect=create):
+            with pytest.raises(NotionError):
+                client.save_trigger_events(events, "Acme", fail_fast=True)
+
+        assert calls == ["e0", "e1"]
+
+    def test_contacts_with_shared_identifier_create_once(self, client):
+        """Concurrent contacts that are the same person create one page."""
+        contacts = [
+            {"name": "Jane Doe", "email": "jane@acme.com", "lead_score": 80},
+            {"name": "Someone Else", "email": "else@acme.com", "lead_score": 80},
+            {"name": "Jane D.", "email": "JANE@acme.com", "lead_score": 80},
+        ]
+        with patch.object(client, "iter_database_pages", return_value=iter([])):
+            with patch.object(
+                client, "_create_contact", side_effect=lambda c, *a, **k: f"new-{c['name']}"
+            ) as create:
+                with patch.object(
+                    client, "_update_contact", side_effect=lambda page_id, c: page_id
+                ) as update:
+                    results = client.save_contacts(contacts, "Acme")
+
+        assert create.call_count == 2
+        assert update.call_args.args[0] == "new-Jane Doe"
+        assert results["saved"] == 3
+
+    def test_contact_index_failure_falls_back_to_single_lookups(self, client):
+        """If the batched lookup fails, each contact is looked up and reported on its own."""
+        contacts = [
+            {"name": "Jane Doe", "email": "jane@acme.com", "lead_score": 80},
+            {"name": "John Roe", "email": "john@acme.com", "lead_score": 80},
+        ]
+
+        def find(email="", **identifiers):
+            if email == "john@acme.com":
+                raise NotionError("query failed")
+            return "page-jane"
+
+        with patch.object(client, "iter_database_pages", side_effect=NotionError("timed out")):
+            with patch.object(client, "_find_existing_contact", side_effect=find):
+                with patch.object(
+                    client, "_update_contact", side_effect=lambda page_id, c: page_id
+                ):
+                    results = client.save_contacts(contacts, "Acme")
+
+        assert results["results"]["Jane Doe"] == {"status": "saved", "page_id": "page-jane"}
+        assert results["results"]["John Roe"]["status"] == "failed"
+        assert (results["saved"], results["failed"]) == (1, 1)
@@ -0,0 +1,186 @@
+"""
+Unit tests for Notion delta sync.
+
+Tests the last_edited_time query built by iter_changed_pages, PageMirror's
+delta upserts, periodic full reconciliation and reads during a sync, and
+property flattening.
+
+Run with: pytest tests/unit/test_notion_delta_sync.py -v
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from abm_research.integrations.notion_client import (
+    NotionClient,
+    PageMirror,
+    flatten_page_properties,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def page(page_id, edited, **extra):
+    """Build a minimal Notion page."""
+    return {"id": page_id, "last_edited_time": edited, "properties": {}, **extra}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Create a NotionClient with fake credentials and database IDs."""
+    monkeypatch.setenv("NOTION_ACCOUNTS_DB_ID", "accounts-db")
+    return NotionClient(api_key="test-key")
+
+
+class TestIterChangedPages:
+    """Tests for the delta query body."""
+
+    def test_since_adds_filter_and_ascending_sort(self, client):
+        """A high-water mark becomes an on_or_after filter, oldest edits first."""
+        with patch.object(client, "iter_database_pages", return_value=iter([])) as query:
+            client.iter_changed_pages("accounts-db", "2025-01-01T10:00:00.000Z")
+
+        body = query.call_args.args[1]
+        assert body["filter"] == {
+            "timestamp": "last_edited_time",
+            "last_edited_time": {"on_or_after": "2025-01-01T10:00:00.000Z"},
+        }
+        assert body["sorts"] == [{"timestamp": "last_edited_time", "direction": "ascending"}]
+
+    def test_existing_filter_is_combined(self, client):
+        """A caller's filter is AND-ed with the time filter."""
+        relation = {"property": "Account", "relation": {"contains": "a1"}}
+        with patch.object(client, "iter_database_pages", return_value=iter([])) as query:
+            client.iter_changed_pages("db", "2025-01-01", query={"filter": relation})
+
+        assert query.call_args.args[1]["filter"]["and"][0] == relation
+
+    def test_no_mark_is_full_scan(self, client):
+        """Without a high-water mark no time filter is sent."""
+        with patch.object(client, "iter_database_pages", return_value=iter([])) as query:
+            client.iter_changed_pages("db", None)
+
+        assert "filter" not in query.call_args.args[1]
+
+
+class TestPageMirror:
+    """Tests for PageMirror sync modes."""
+
+    @pytest.fixture
+    def clock(self):
+        """Provide a controllable clock."""
+        return FakeClock()
+
+    def test_delta_upserts_changed_pages_only(self, client, clock):
+        """After a full sync, only edited pages are fetched and upserted."""
+        mirror = PageMirror(full_sync_interval=3600, clock=clock)
+        full = [[page("p1", "2025-01-01T10:00"), page("p2", "2025-01-01T11:00")]]
+        delta = [[page("p2", "2025-01-02T09:00"), page("p3", "2025-01-02T09:30")]]
+
+        with patch.object(client, "iter_changed_pages", side_effect=[iter(full), iter(delta)]) as q:
+            assert mirror.sync(client, "accounts-db")["mode"] == "full"
+            stats = mirror.sync(client, "accounts-db")
+
+        assert q.call_args_list[0].args[1] is None
+        assert q.call_args_list[1].args[1] == "2025-01-01T11:00"
+        assert stats == {"mode": "delta", "fetched": 2, "removed": 0}
+        assert set(mirror.items) == {"p1", "p2", "p3"}
+        assert mirror.items["p2"]["last_edited_time"] == "2025-01-02T09:00"
+        assert mirror.high_water_mark == "2025-01-02T09:30"
+
+    def test_full_reconciliation_drops_deleted_pages(self, client, clock):
+        """A periodic full scan removes pages that no longer exist."""
+        mirror = PageMirror(full_sync_interval=3600, clock=clock)
+        first = [[page("p1", "t1"), page("p2", "t2")]]
+        later = [[page("p2", "t2")]]
+
+        with patch.object(client, "iter_changed_pages", side_effect=[iter(first), iter(later)]):
+            mirror.sync(client, "accounts-db")
+            clock.now += 3600
+            stats = mirror.sync(client, "accounts-db")
+
+        assert stats["mode"] == "full"
+        assert stats["removed"] == 1
+        assert list(mirror.items) == ["p2"]
+
+    def test_archived_pages_are_removed_in_delta(self, client, clock):
+        """Archived pages returned by a delta are dropped from the mirror."""
+        mirror = PageMirror(clock=clock, transform=lambda p: p["id"].upper())
+        first = [[page("p1", "t1")]]
+        delta = [[page("p1", "t2", archived=True)]]
+
+        with patch.object(client, "iter_changed_pages", side_effect=[iter(first), iter(delta)]):
+            mirror.sync(client, "accounts-db")
+            assert mirror.values() == ["P1"]
+            mirror.sync(client, "accounts-db")
+
+        assert mirror.values() == []
+
+    def test_values_are_served_while_a_sync_fetches(self, client, clock):
+        """Readers get the last synced values instead of waiting on Notion."""
+        mirror = PageMirror(clock=clock, transform=lambda p: p["id"])
+        fetching, release = threading.Event(), threading.Event()
+
+        def slow_delta():
+            fetching.set()
+            release.wait(5)
+            yield [page("p2", "t2")]
+
+        with patch.object(
+            client, "iter_changed_pages", side_effect=[iter([[page("p1", "t1")]]), slow_delta()]
+        ):
+            mirror.sync(client, "accounts-db")
+            sync = threading.Thread(target=mirror.sync, args=(client, "accounts-db"))
+            sync.start()
+            fetching.wait(5)
+            during = mirror.values()
+            release.set()
+            sync.join()
+
+        assert during == ["p1"]
+        assert mirror.values() == ["p1", "p2"]
+
+
+class TestFlattenPageProperties:
+    """Tests for flatten_page_properties."""
+
+    def test_common_property_types(self):
+        """Each property type becomes a scalar value."""
+        flat = flatten_page_properties(
+            {
+                "id": "p1",
+                "last_edited_time": "t1",
+                "properties": {
+                    "Name": {"type": "title", "title": [{"plain_text": "Acme"}]},
+                    "Score": {"type": "number", "number": 82},
+                    "Stage": {"type": "select", "select": {"name": "Growth"}},
+                    "Tags": {
+                        "type": "multi_select",
+                        "multi_select": [{"name": "a"}, {"name": "b"}],
+                    },
+                    "Account": {"type": "relation", "relation": [{"id": "r1"}, {"id": "r2"}]},
+                    "Seen": {"type": "date", "date": None},
+                },
+            }
+        )
+
+        assert flat == {
+            "id": "p1",
+            "last_edited_time": "t1",
+            "Name": "Acme",
+            "Score": 82,
+            "Stage": "Growth",
+            "Tags": "a, b",
+            "Account": "r1,r2",
+            "Seen": None,
+        }
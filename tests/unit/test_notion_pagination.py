@@ -0,0 +1,106 @@
+"""
+Unit tests for Notion database query pagination.
+
+Tests that NotionClient follows next_cursor across pages, honours
+max_pages, and keeps the account relation filter and property projection
+on every request.
+
+Run with: pytest tests/unit/test_notion_pagination.py -v
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from abm_research.integrations.notion_client import NotionClient
+
+
+def make_response(results, next_cursor=None):
+    """Build a fake requests.Response for a database query page."""
+    response = MagicMock()
+    response.json.return_value = {
+        "object": "list",
+        "results": results,
+        "has_more": next_cursor is not None,
+        "next_cursor": next_cursor,
+    }
+    return response
+
+
+class TestNotionPagination:
+    """Tests for iter_database_pages and the query_all_* helpers."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Create a NotionClient with fake credentials and database IDs."""
+        monkeypatch.setenv("NOTION_ACCOUNTS_DB_ID", "accounts-db")
+        monkeypatch.setenv("NOTION_CONTACTS_DB_ID", "contacts-db")
+        return NotionClient(api_key="test-key")
+
+    @pytest.fixture
+    def three_pages(self):
+        """Three pages of rows linked by cursors."""
+        return [
+            make_response([{"id": "a1"}, {"id": "a2"}], next_cursor="c1"),
+            make_response([{"id": "a3"}], next_cursor="c2"),
+            make_response([{"id": "a4"}]),
+        ]
+
+    def test_query_all_follows_cursors(self, client, three_pages):
+        """All pages are fetched and concatenated in order."""
+        with patch.object(client, "_make_request", side_effect=three_pages) as request:
+            rows = client.query_all_accounts()
+
+        assert [r["id"] for r in rows] == ["a1", "a2", "a3", "a4"]
+        bodies = [call.kwargs["json"] for call in request.call_args_list]
+        assert bodies[0] == {"page_size": 100}
+        assert bodies[1]["start_cursor"] == "c1"
+        assert bodies[2]["start_cursor"] == "c2"
+
+    def test_iterator_yields_one_batch_per_request(self, client, three_pages):
+        """The generator interface yields each page lazily."""
+        with patch.object(client, "_make_request", side_effect=three_pages) as request:
+            pages = client.iter_all_accounts()
+            first = next(pages)
+            assert [r["id"] for r in first] == ["a1", "a2"]
+            assert request.call_count == 1
+            assert len(list(pages)) == 2
+
+    def test_max_pages_stops_early(self, client, three_pages):
+        """max_pages bounds the number of requests."""
+        with patch.object(client, "_make_request", side_effect=three_pages) as request:
+            rows = client.query_all_accounts(max_pages=2)
+
+        assert [r["id"] for r in rows] == ["a1", "a2", "a3"]
+        assert request.call_count == 2
+
+    def test_account_filter_kept_across_pages(self, client):
+        """The relation filter is sent with every page request."""
+        pages = [make_response([{"id": "c1"}], next_cursor="x"), make_response([{"id": "c2"}])]
+        with patch.object(client, "_make_request", side_effect=pages) as request:
+            rows = client.query_all_contacts(account_id="acct-1")
+
+        assert len(rows) == 2
+        for call in request.call_args_list:
+            assert call.kwargs["json"]["filter"]["relation"]["contains"] == "acct-1"
+
+    def test_filter_properties_sent_as_ids_on_every_page(self, client):
+        """Property names are resolved to IDs once and sent with each page request."""
+        schema = MagicMock()
+        schema.json.return_value = {
+            "object": "database",
+            "properties": {"Account": {"id": "a%3Dx"}, "Name": {"id": "title"}},
+        }
+        pages = [make_response([{"id": "c1"}], next_cursor="x"), make_response([{"id": "c2"}])]
+        with patch.object(client, "_make_request", side_effect=[schema] + pages) as request:
+            rows = client.query_all_contacts(filter_properties=["Account", "Missing"])
+
+        assert len(rows) == 2
+        assert request.call_args_list[0].args[0] == "GET"
+        for call in request.call_args_list[1:]:
+            assert call.kwargs["params"] == [("filter_properties", "a%3Dx")]
+
+        # Schema is cached per database
+        with patch.object(client, "_make_request", side_effect=[make_response([])]) as request:
+            client.query_all_contacts(filter_properties=["Account"])
+        assert request.call_count == 1
@@ -0,0 +1,152 @@
+"""
+Unit tests for NotionClient retry handling.
+
+Tests that transient failures (429, 502/503/504, network errors) are retried
+with backoff, that Retry-After is honoured, and that non-idempotent requests
+(unless the connection was never made) and permanent errors fail fast.
+
+Run with: pytest tests/unit/test_notion_retry.py -v
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from abm_research.integrations import notion_client
+from abm_research.integrations.notion_client import (
+    NotionAPIError,
+    NotionClient,
+    NotionError,
+    NotionErrorCode,
+)
+from abm_research.utils.rate_limiter import TokenBucket
+
+QUERY_URL = "https://api.notion.com/v1/databases/db/query"
+PAGES_URL = "https://api.notion.com/v1/pages"
+
+
+def make_response(status_code, headers=None):
+    """Build a fake response with the given status."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.text = "{}"
+    return response
+
+
+class TestNotionRetry:
+    """Tests for _make_request retry behaviour."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a client with an unthrottled limiter on the requests transport."""
+        client = NotionClient(api_key="test-key", use_http2=False)
+        client.rate_limiter = TokenBucket(rate=1000, burst=1000, name="test")
+        return client
+
+    @pytest.fixture
+    def sleeps(self):
+        """Record backoff sleeps instead of sleeping."""
+        with patch.object(notion_client.time, "sleep") as sleep:
+            yield sleep
+
+    def test_retries_server_error_then_succeeds(self, client, sleeps):
+        """A 503 is retried and the eventual success is returned."""
+        ok = make_response(200)
+        with patch.object(
+            client.session, "request", side_effect=[make_response(503), ok]
+        ) as request:
+            assert client._make_request("POST", QUERY_URL) is ok
+
+        assert request.call_count == 2
+        assert sleeps.call_count == 1
+
+    def test_honours_retry_after(self, client, sleeps):
+        """A 429 waits at least Retry-After seconds and pauses the shared limiter."""
+        responses = [make_response(429, {"Retry-After": "7"}), make_response(200)]
+        with patch.object(client.session, "request", side_effect=responses):
+            with patch.object(client.rate_limiter, "pause") as pause:
+                client._make_request("GET", PAGES_URL + "/p1")
+
+        assert sleeps.call_args.args[0] >= 7
+        pause.assert_called_once_with(7.0)
+
+    def test_gives_up_after_max_retries(self, client, sleeps):
+        """Persistent 429s raise RATE_LIMITED after max_retries extra attempts."""
+        client.max_retries = 2
+        before = notion_client.get_retry_stats()["gave_up"]
+        with patch.object(
+            client.session, "request", return_value=make_response(429, {"Retry-After": "1"})
+        ) as request:
+            with pytest.raises(NotionError) as exc_info:
+                client._make_request("GET", PAGES_URL + "/p1")
+
+        assert exc_info.value.code == NotionErrorCode.RATE_LIMITED
+        assert exc_info.value.details["attempts"] == 3
+        assert request.call_count == 3
+        assert notion_client.get_retry_stats()["gave_up"] == before + 1
+
+    def test_retry_budget_caps_total_wait(self, client, sleeps):
+        """A Retry-After beyond the per-call budget is not waited out."""
+        client.retry_budget = 5
+        with patch.object(
+            client.session, "request", return_value=make_response(429, {"Retry-After": "30"})
+        ) as request:
+            with pytest.raises(NotionError):
+                client._make_request("GET", PAGES_URL + "/p1")
+
+        assert request.call_count == 1
+        sleeps.assert_not_called()
+
+    def test_server_errors_not_retried_for_page_create(self, client, sleeps):
+        """POST /pages may have been applied, so a 502/503/504 is surfaced immediately."""
+        for status in (502, 503, 504):
+            with patch.object(
+                client.session, "request", return_value=make_response(status)
+            ) as request:
+                with pytest.raises(NotionAPIError):
+                    client._make_request("POST", PAGES_URL)
+
+            assert request.call_count == 1
+
+    def test_failed_connect_is_retried(self, client, sleeps):
+        """A connect timeout never reached Notion and is retried even for a create."""
+        ok = make_response(200)
+        with patch.object(
+            client.session, "request", side_effect=[requests.exceptions.ConnectTimeout(), ok]
+        ):
+            assert client._make_request("POST", PAGES_URL) is ok
+
+    def test_dropped_connection_retried_only_when_idempotent(self, client, sleeps):
+        """A connection lost mid-request is retried for a read but not for a create."""
+        ok = make_response(200)
+        with patch.object(
+            client.session, "request", side_effect=[requests.exceptions.ConnectionError(), ok]
+        ):
+            assert client._make_request("GET", PAGES_URL + "/p1") is ok
+
+        with patch.object(
+            client.session, "request", side_effect=requests.exceptions.ConnectionError()
+        ) as request:
+            with pytest.raises(NotionError):
+                client._make_request("POST", PAGES_URL)
+
+        assert request.call_count == 1
+
+    def test_client_errors_fail_fast(self, client, sleeps):
+        """A 400 is raised on the first attempt."""
+        with patch.object(client.session, "request", return_value=make_response(400)) as request:
+            with pytest.raises(NotionAPIError) as exc_info:
+                client._make_request("PATCH", PAGES_URL + "/p1")
+
+        assert exc_info.value.status_code == 400
+        assert request.call_count == 1
+        sleeps.assert_not_called()
+
+    def test_parse_retry_after_formats(self):
+        """Retry-After accepts delta-seconds and rejects junk."""
+        assert NotionClient._parse_retry_after("2.5") == 2.5
+        assert NotionClient._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert NotionClient._parse_retry_after("soon") is None
+        assert NotionClient._parse_retry_after(None) is None
@@ -0,0 +1,149 @@
+"""
+Unit tests for dependency-aware phase execution.
+
+Tests that run_phase_graph overlaps independent phases, passes upstream
+results, returns results in declaration order, and surfaces failures, and
+that the research pipeline runs Phase 2 alongside Phase 5.
+
+Run with: pytest tests/unit/test_phase_graph.py -v
+"""
+
+import threading
+import time
+
+import pytest
+
+from abm_research.utils.phase_graph import Phase, run_phase_graph
+
+
+class TestRunPhaseGraph:
+    """Tests for run_phase_graph."""
+
+    def test_independent_phases_overlap(self):
+        """Two phases depending only on the root run at the same time."""
+        both_running = threading.Barrier(2, timeout=2)
+
+        def branch(name):
+            def run(results):
+                both_running.wait()  # deadlocks (and times out) if run serially
+                return f"{name}:{results['root']}"
+
+            return run
+
+        results = run_phase_graph(
+            [
+                Phase("root", lambda r: "r"),
+                Phase("left", branch("left"), depends_on=("root",)),
+                Phase("right", branch("right"), depends_on=("root",)),
+            ],
+            max_workers=2,
+        )
+
+        assert results == {"root": "r", "left": "left:r", "right": "right:r"}
+
+    def test_results_follow_declaration_order(self):
+        """The slower phase finishing last doesn't change the result order."""
+        results = run_phase_graph(
+            [
+                Phase("slow", lambda r: time.sleep(0.05) or "slow"),
+                Phase("fast", lambda r: "fast"),
+            ]
+        )
+
+        assert list(results) == ["slow", "fast"]
+
+    def test_dependents_wait_for_all_dependencies(self):
+        """A phase sees the results of every phase it depends on."""
+        seen = {}
+
+        def join(results):
+            seen.update(results)
+            return "joined"
+
+        run_phase_graph(
+            [
+                Phase("a", lambda r: 1),
+                Phase("b", lambda r: 2, depends_on=("a",)),
+                Phase("c", join, depends_on=("a", "b")),
+            ]
+        )
+
+        assert seen == {"a": 1, "b": 2}
+
+    def test_failure_skips_downstream_phases(self):
+        """A failing phase raises its error and its dependents never run."""
+        ran = []
+
+        def fail(results):
+            raise RuntimeError("Apollo down")
+
+        with pytest.raises(RuntimeError, match="Apollo down"):
+            run_phase_graph(
+                [
+                    Phase("root", lambda r: "r"),
+                    Phase("contacts", fail, depends_on=("root",)),
+                    Phase("enrich", lambda r: ran.append("enrich"), depends_on=("contacts",)),
+                ]
+            )
+
+        assert ran == []
+
+    def test_invalid_graphs_are_rejected(self):
+        """Unknown and circular dependencies raise ValueError."""
+        with pytest.raises(ValueError, match="unknown"):
+            run_phase_graph([Phase("a", lambda r: 1, depends_on=("missing",))])
+
+        with pytest.raises(ValueError, match="Circular"):
+            run_phase_graph(
+                [
+                    Phase("a", lambda r: 1, depends_on=("b",)),
+                    Phase("b", lambda r: 2, depends_on=("a",)),
+                ]
+            )
+
+
+class TestResearchPipelineGraph:
+    """Tests for the phase graph in ComprehensiveABMSystem."""
+
+    @pytest.fixture
+    def system(self):
+        """A research system with stubbed phases and no Notion client."""
+        from abm_research.core.abm_system import ComprehensiveABMSystem
+
+        system = ComprehensiveABMSystem.__new__(ComprehensiveABMSystem)
+        system.phase_workers = 2
+        system.notion_client = None
+        system.checkpoints = None
+        return system
+
+    def test_phase_2_and_phase_5_run_concurrently(self, system, monkeypatch):
+        """Contacts and partnerships overlap after Phase 1 and merge in order."""
+        both_running = threading.Barrier(2, timeout=2)
+        account = {"name": "Acme"}
+        events = [{"description": "expansion"}]
+
+        def contacts(name, domain, account_data):
+            assert account_data is account
+            both_running.wait()
+            return [{"name": "Jane"}]
+
+        def partnerships(name, domain, trigger_events):
+            assert trigger_events is events
+            both_running.wait()
+            return {"strategic_partnerships": [{"partner_name": "NVIDIA"}]}
+
+        monkeypatch.setattr(system, "_phase_1_account_intelligence", lambda n, d: (account, events))
+        monkeypatch.setattr(system, "_phase_2_contact_discovery", contacts)
+        monkeypatch.setattr(system, "_phase_3_contact_enrichment", lambda c: c)
+        monkeypatch.setattr(system, "_phase_4_engagement_intelligence", lambda c, e, a: c)
+        monkeypatch.setattr(system, "_phase_5_partnership_intelligence", partnerships)
+
+        progress = []
+        results = system.conduct_complete_account_research(
+            "Acme", "acme.com", progress_callback=lambda phase, status, **d: progress.append(phase)
+        )
+
+        assert results["success"] is True
+        assert results["contacts"] == [{"name": "Jane"}]
+        assert results["partnerships"] == [{"partner_name": "NVIDIA"}]
+        assert progress.index("phase_5") < progress.index("phase_3")
@@ -0,0 +1,130 @@
+"""
+Unit tests for the shared token-bucket rate limiter.
+
+Tests burst capacity, average-rate waits, timeouts, async acquisition,
+and the process-wide limiter registry.
+
+Run with: pytest tests/unit/test_rate_limiter.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from abm_research.utils import rate_limiter
+from abm_research.utils.rate_limiter import TokenBucket, get_rate_limiter, provider_rate_limiter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    @pytest.fixture
+    def clock(self):
+        """Provide a controllable clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch, clock):
+        """Record sleeps and advance the fake clock instead of sleeping."""
+        recorded = []
+
+        def fake_sleep(seconds):
+            recorded.append(seconds)
+            clock.now += seconds
+
+        monkeypatch.setattr(rate_limiter.time, "sleep", fake_sleep)
+        return recorded
+
+    def test_burst_is_available_immediately(self, clock):
+        """Up to `burst` requests go through without waiting."""
+        bucket = TokenBucket(rate=3, burst=3, clock=clock)
+        assert all(bucket.try_acquire() for _ in range(3))
+        assert not bucket.try_acquire()
+
+    def test_waits_follow_average_rate(self, clock, sleeps):
+        """Once the burst is spent, each request waits 1/rate seconds."""
+        bucket = TokenBucket(rate=2, burst=1, clock=clock)
+
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert sleeps == [pytest.approx(0.5), pytest.approx(0.5)]
+
+    def test_tokens_refill_while_idle(self, clock):
+        """Idle time refills tokens up to burst, never beyond."""
+        bucket = TokenBucket(rate=1, burst=2, clock=clock)
+        bucket.try_acquire()
+        bucket.try_acquire()
+
+        clock.now += 10
+        assert bucket.stats()["available_tokens"] == 2
+
+    def test_timeout_does_not_consume_tokens(self, clock):
+        """A wait longer than timeout raises and leaves the bucket untouched."""
+        bucket = TokenBucket(rate=1, burst=1, clock=clock)
+        bucket.try_acquire()
+
+        with pytest.raises(TimeoutError):
+            bucket.acquire(timeout=0.1)
+
+        clock.now += 1
+        assert bucket.try_acquire()
+
+    def test_async_acquire_uses_same_budget(self, clock, monkeypatch):
+        """acquire_async waits on the event loop and shares tokens with acquire."""
+        bucket = TokenBucket(rate=4, burst=1, clock=clock)
+        waits = []
+
+        async def fake_sleep(seconds):
+            waits.append(seconds)
+            clock.now += seconds
+
+        monkeypatch.setattr(rate_limiter.asyncio, "sleep", fake_sleep)
+
+        async def run():
+            await bucket.acquire_async()
+            await bucket.acquire_async()
+
+        asyncio.run(run())
+        assert waits == [pytest.approx(0.25)]
+        assert bucket.stats()["acquired"] == 2
+
+    def test_invalid_configuration(self):
+        """Rate and burst must be positive."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, burst=0)
+
+
+class TestRateLimiterRegistry:
+    """Tests for get_rate_limiter."""
+
+    def test_same_name_returns_shared_bucket(self):
+        """Every caller for one provider shares a single bucket."""
+        first = get_rate_limiter("test-provider", rate=5, burst=2)
+        second = get_rate_limiter("test-provider", rate=50, burst=20)
+
+        assert first is second
+        assert second.rate == 5
+        assert "test-provider" in rate_limiter.all_rate_limiter_stats()
+
+    def test_provider_budget_defaults_and_env_override(self, monkeypatch):
+        """Known providers get their default budget unless the environment overrides it."""
+        monkeypatch.setattr(rate_limiter, "_limiters", {})
+        monkeypatch.setenv("BRAVE_RATE_LIMIT", "20")
+
+        assert provider_rate_limiter("apollo").rate == 1.0
+        assert provider_rate_limiter("brave").rate == 20.0
+        with pytest.raises(KeyError):
+            provider_rate_limiter("unknown")
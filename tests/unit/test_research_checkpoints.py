@@ -0,0 +1,125 @@
+"""
+Unit tests for resumable research runs.
+
+Tests the SQLite checkpoint store (round trip, TTL expiry, latest run) and
+that a resumed research run only re-executes the phases that didn't finish.
+
+Run with: pytest tests/unit/test_research_checkpoints.py -v
+"""
+
+import pytest
+
+from abm_research.utils.research_checkpoints import ResearchCheckpointStore
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Checkpoint store with a one-hour TTL and a fake clock."""
+    return ResearchCheckpointStore(
+        str(tmp_path / "checkpoints.db"), ttl_seconds=3600, clock=FakeClock()
+    )
+
+
+class TestResearchCheckpointStore:
+    """Tests for ResearchCheckpointStore."""
+
+    def test_save_and_load_run(self, store):
+        """Phase outputs round-trip through JSON, keyed case-insensitively by domain."""
+        store.save("Acme.com", "run-1", "phase_1", [{"name": "Acme"}, []])
+        store.save("acme.com", "run-1", "phase_2", [{"name": "Jane"}])
+        store.save("acme.com", "run-2", "phase_1", [{"name": "Other"}, []])
+
+        assert store.load("acme.com", "run-1") == {
+            "phase_1": [{"name": "Acme"}, []],
+            "phase_2": [{"name": "Jane"}],
+        }
+
+    def test_expired_checkpoints_are_ignored(self, store):
+        """Checkpoints older than the TTL are neither loaded nor the latest run."""
+        store.save("acme.com", "run-1", "phase_1", {"ok": True})
+        store._clock.now += 3601
+
+        assert store.load("acme.com", "run-1") == {}
+        assert store.latest_run("acme.com") is None
+
+    def test_latest_run_and_clear(self, store):
+        """The most recently checkpointed run is found; clear removes a run."""
+        store.save("acme.com", "run-1", "phase_1", {})
+        store._clock.now += 10
+        store.save("acme.com", "run-2", "phase_1", {})
+
+        assert store.latest_run("acme.com") == "run-2"
+        assert store.clear("acme.com", "run-2") == 1
+        assert store.latest_run("acme.com") == "run-1"
+
+
+class TestResumeResearch:
+    """Tests for resuming ComprehensiveABMSystem runs from checkpoints."""
+
+    @pytest.fixture
+    def system(self, store):
+        """A research system with a temporary checkpoint store and no Notion client."""
+        from abm_research.core.abm_system import ComprehensiveABMSystem
+
+        system = ComprehensiveABMSystem.__new__(ComprehensiveABMSystem)
+        system.phase_workers = 2
+        system.notion_client = None
+        system.checkpoints = store
+        return system
+
+    def test_resume_reruns_only_failed_phases(self, system, monkeypatch):
+        """After Phase 4 fails, a resumed run reuses Phases 1-3 and 5."""
+        calls = []
+        fail_engagement = [True]
+
+        def record(name, result):
+            def run(*args):
+                calls.append(name)
+                return result
+
+            return run
+
+        def engagement(contacts, events, account):
+            calls.append("phase_4")
+            if fail_engagement[0]:
+                raise RuntimeError("OpenAI timeout")
+            return [{**contact, "engaged": True} for contact in contacts]
+
+        monkeypatch.setattr(
+            system, "_phase_1_account_intelligence", record("phase_1", ({"name": "Acme"}, []))
+        )
+        monkeypatch.setattr(
+            system, "_phase_2_contact_discovery", record("phase_2", [{"name": "Jane"}])
+        )
+        monkeypatch.setattr(
+            system, "_phase_3_contact_enrichment", lambda c: calls.append("phase_3") or c
+        )
+        monkeypatch.setattr(system, "_phase_4_engagement_intelligence", engagement)
+        monkeypatch.setattr(
+            system,
+            "_phase_5_partnership_intelligence",
+            record("phase_5", {"strategic_partnerships": []}),
+        )
+
+        first = system.conduct_complete_account_research("Acme", "acme.com", run_id="run-1")
+        assert first["success"] is False
+
+        calls.clear()
+        fail_engagement[0] = False
+        resumed = system.conduct_complete_account_research("Acme", "acme.com", resume=True)
+
+        assert calls == ["phase_4"]
+        assert resumed["success"] is True
+        assert resumed["run_id"] == "run-1"
+        assert sorted(resumed["resumed_phases"]) == ["phase_1", "phase_2", "phase_3", "phase_5"]
+        assert resumed["contacts"] == [{"name": "Jane", "engaged": True}]
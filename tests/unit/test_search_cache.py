@@ -0,0 +1,154 @@
+"""
+Unit tests for the persistent search cache and its use by vendor discovery.
+
+Tests TTL expiry, LRU eviction and hit/miss stats of PersistentSearchCache,
+and that VendorRelationshipDiscovery reuses searches answered by an earlier
+instance (a later batch run), never caches failed searches, and reports
+cache stats in its results.
+
+Run with: pytest tests/unit/test_search_cache.py -v
+"""
+
+import pytest
+
+from abm_research.intelligence import vendor_relationship_discovery
+from abm_research.intelligence.vendor_relationship_discovery import VendorRelationshipDiscovery
+from abm_research.utils.search_cache import PersistentSearchCache
+
+RESULTS = [{"title": "Acme case study", "url": "https://example.com/acme", "description": "x"}]
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """A fake wall clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path of a temporary cache database."""
+    return str(tmp_path / "search_cache.db")
+
+
+def discovery(db_path, responses):
+    """A discovery instance over a cache at db_path whose searches return responses."""
+    instance = VendorRelationshipDiscovery(
+        notion_client=object(), search_cache=PersistentSearchCache(db_path)
+    )
+    instance.brave_api_key = "test-key"
+    instance.searches = []
+
+    def fake_search(query):
+        instance.searches.append(query)
+        return responses(query)
+
+    instance._brave_search = fake_search
+    return instance
+
+
+class TestPersistentSearchCache:
+    """Tests for PersistentSearchCache."""
+
+    def test_values_round_trip_until_their_ttl(self, db_path, clock):
+        """A value is served until its own TTL passes."""
+        cache = PersistentSearchCache(db_path, clock=clock)
+        cache.set("short", RESULTS, ttl_seconds=10)
+        cache.set("long", RESULTS, ttl_seconds=100)
+
+        clock.now += 50
+
+        assert cache.get("short") is None
+        assert cache.get("long") == RESULTS
+
+    def test_least_recently_used_entries_are_evicted(self, db_path, clock):
+        """Beyond max_entries the entry used longest ago goes first."""
+        cache = PersistentSearchCache(db_path, max_entries=2, clock=clock)
+        cache.set("a", 1)
+        clock.now += 1
+        cache.set("b", 2)
+        clock.now += 1
+        cache.get("a")
+        clock.now += 1
+        cache.set("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+
+    def test_stats_count_hits_and_misses(self, db_path):
+        """stats() reports lookups through the instance and the entries stored."""
+        cache = PersistentSearchCache(db_path)
+        cache.set("a", RESULTS)
+        cache.get("a")
+        cache.get("missing")
+
+        assert cache.stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5, "entries": 1}
+
+
+class TestVendorDiscoverySearchCache:
+    """Tests for VendorRelationshipDiscovery's use of the persistent cache."""
+
+    def test_later_run_reuses_earlier_searches(self, db_path):
+        """A second instance on the same database doesn't search again."""
+        first = discovery(db_path, lambda query: {"results": RESULTS, "error": None})
+        first.discover_relationships(["Acme"], ["Initech"])
+
+        second = discovery(db_path, lambda query: {"results": RESULTS, "error": None})
+        result = second.discover_relationships(["Acme"], ["Initech"])
+
+        assert len(first.searches) == 4
+        assert second.searches == []
+        assert result["search_cache"] == {"hits": 4, "misses": 0, "hit_ratio": 1.0}
+
+    def test_failed_searches_are_not_cached(self, db_path):
+        """A search that errored is retried by the next run."""
+        failing = discovery(
+            db_path,
+            lambda query: {"results": [], "error": "timed out", "error_code": "BRAVE_TIMEOUT"},
+        )
+        result = failing.discover_relationships(["Acme"], ["Initech"])
+
+        retry = discovery(db_path, lambda query: {"results": RESULTS, "error": None})
+        retry.discover_relationships(["Acme"], ["Initech"])
+
+        assert len(result["search_failures"]) == 4
+        assert result["search_cache"]["misses"] == 4
+        assert len(retry.searches) == 4
+
+    def test_templates_have_their_own_ttl(self, db_path, clock):
+        """Event-driven templates expire before case study searches do."""
+        instance = discovery(db_path, lambda query: {"results": RESULTS, "error": None})
+        instance._search_cache = PersistentSearchCache(db_path, clock=clock)
+        instance._search_vendor_customer("Acme", "Initech")
+
+        clock.now += 3 * 24 * 3600
+        instance.searches.clear()
+        result = instance._search_vendor_customer("Acme", "Initech")
+
+        assert instance.searches == [
+            '"Acme" "Initech" webinar',
+            '"Acme" "Initech" contract awarded',
+        ]
+        assert result["search_cache"] == {"hits": 2, "misses": 2}
+
+    def test_default_cache_lives_in_the_project_root(self, tmp_path, monkeypatch):
+        """The default database doesn't depend on the working directory."""
+        monkeypatch.delenv("ABM_SEARCH_CACHE_DB", raising=False)
+        monkeypatch.setattr(vendor_relationship_discovery, "project_root", str(tmp_path / "root"))
+        (tmp_path / "root").mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        cache = VendorRelationshipDiscovery(notion_client=object()).search_cache
+
+        assert cache.db_path == str(tmp_path / "root" / "search_cache.db")
+        assert not (tmp_path / "search_cache.db").exists()
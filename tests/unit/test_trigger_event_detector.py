@@ -0,0 +1,237 @@
+"""
+Unit tests for EnhancedTriggerEventDetector.
+
+Tests that sources and website paths are searched concurrently within the
+detection deadline and per-host cap, that Brave news results are scored with
+one LLM call per batch, that items missing or malformed in the JSON response
+fall back to single-item analysis, and that Brave results become complete
+TriggerEvents.
+
+Run with: pytest tests/unit/test_trigger_event_detector.py -v
+"""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from abm_research.phases import enhanced_trigger_event_detector as detector_module
+from abm_research.phases.enhanced_trigger_event_detector import (
+    EnhancedTriggerEventDetector,
+    TriggerEvent,
+)
+from abm_research.utils import llm_gateway
+from abm_research.utils.llm_gateway import LLMGateway
+
+
+def completion(content):
+    """A chat completion response whose message content is content."""
+    response = MagicMock()
+    response.choices[0].message.content = content
+    return response
+
+
+def event(description):
+    """A trigger event identified by its description."""
+    return TriggerEvent(
+        description=description,
+        event_type="expansion",
+        confidence="High",
+        confidence_score=80,
+        relevance_score=80,
+        source_url=f"https://acme.com/{description}",
+        source_type="News Article",
+        detected_date="",
+        occurred_date="",
+        urgency_level="High",
+    )
+
+
+@pytest.fixture
+def detector(monkeypatch):
+    """A detector with a mocked OpenAI client and no LLM response cache."""
+    monkeypatch.setattr(llm_gateway, "_gateway", LLMGateway(cache=None))
+    detector = EnhancedTriggerEventDetector()
+    detector._openai_client = MagicMock()
+    return detector
+
+
+def stub_sources(detector, monkeypatch, **sources):
+    """Replace the four search sources, defaulting to ones that find nothing."""
+    for name in ("brave_news", "company_website", "linkedin_company", "job_postings"):
+        monkeypatch.setattr(detector, f"_search_{name}", sources.get(name, lambda *a: []))
+
+
+class TestDetectTriggerEvents:
+    """Tests for concurrent source fan-out in detect_trigger_events."""
+
+    def test_sources_run_concurrently(self, detector, monkeypatch):
+        """News and website searches overlap instead of running back to back."""
+        both_running = threading.Barrier(2, timeout=2)
+
+        def source(description):
+            def search(*args):
+                both_running.wait()  # times out if the sources run serially
+                return [event(description)]
+
+            return search
+
+        stub_sources(
+            detector, monkeypatch, brave_news=source("news"), company_website=source("website")
+        )
+
+        events = detector.detect_trigger_events("Acme", "acme.com")
+
+        assert sorted(event.description for event in events) == ["news", "website"]
+
+    def test_slow_sources_are_dropped_at_deadline(self, detector, monkeypatch):
+        """A source still running at the deadline doesn't hold up the others."""
+        release = threading.Event()
+
+        def hung(*args):
+            release.wait(5)
+            return [event("late")]
+
+        stub_sources(
+            detector,
+            monkeypatch,
+            company_website=hung,
+            job_postings=lambda *a: [event("jobs")],
+        )
+
+        started = time.monotonic()
+        events = detector.detect_trigger_events("Acme", "acme.com", deadline_seconds=0.2)
+        release.set()
+
+        assert time.monotonic() - started < 2
+        assert [event.description for event in events] == ["jobs"]
+
+    def test_zero_deadline_is_not_the_default(self, detector, monkeypatch):
+        """An explicit zero deadline returns at once instead of waiting the default."""
+        release = threading.Event()
+
+        def hung(*args):
+            release.wait(5)
+            return [event("late")]
+
+        stub_sources(detector, monkeypatch, company_website=hung)
+
+        started = time.monotonic()
+        events = detector.detect_trigger_events("Acme", "acme.com", deadline_seconds=0)
+        release.set()
+
+        assert time.monotonic() - started < 2
+        assert events == []
+
+
+class TestSearchCompanyWebsite:
+    """Tests for concurrent news-path probing in _search_company_website."""
+
+    def test_requests_per_host_are_capped(self, detector, monkeypatch):
+        """At most WEBSITE_HOST_CONCURRENCY paths are fetched at once."""
+        lock = threading.Lock()
+        in_flight, peak = [0], [0]
+
+        def get(url, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return MagicMock(status_code=404, content=b"")
+
+        monkeypatch.setattr(detector_module.requests, "get", get)
+
+        assert detector._search_company_website("Acme", "capped.example", 90) == []
+        assert 1 < peak[0] <= detector_module.WEBSITE_HOST_CONCURRENCY
+
+    def test_unreachable_host_skips_remaining_paths(self, detector, monkeypatch):
+        """A connection failure stops the other paths from being tried."""
+        get = MagicMock(side_effect=requests.ConnectionError("no route to host"))
+        monkeypatch.setattr(detector_module.requests, "get", get)
+
+        assert detector._search_company_website("Acme", "dead.example", 90) == []
+        assert get.call_count <= detector_module.WEBSITE_HOST_CONCURRENCY
+
+
+class TestAnalyzeNewsBatch:
+    """Tests for _analyze_news_batch."""
+
+    def test_one_call_per_batch(self, detector, monkeypatch):
+        """Items are scored in batches and returned in input order."""
+        monkeypatch.setattr(detector_module, "NEWS_ANALYSIS_BATCH_SIZE", 2)
+        items = [(f"Title {i}", "snippet", "expansion") for i in range(3)]
+
+        def create(**kwargs):
+            count = kwargs["messages"][0]["content"].count("Title ")
+            return completion(
+                json.dumps(
+                    {
+                        f"ITEM_{i}": {"description": f"d{i}", "confidence": 80, "relevance": 90}
+                        for i in range(count)
+                    }
+                )
+            )
+
+        detector._openai_client.chat.completions.create.side_effect = create
+
+        analyses = detector._analyze_news_batch(items, "Acme")
+
+        assert detector._openai_client.chat.completions.create.call_count == 2
+        assert analyses == [("d0", 80, 90), ("d1", 80, 90), ("d0", 80, 90)]
+
+    def test_malformed_items_fall_back_individually(self, detector, monkeypatch):
+        """Only the items the batch response got wrong are re-analyzed alone."""
+        detector._openai_client.chat.completions.create.return_value = completion(
+            json.dumps(
+                {
+                    "ITEM_0": {"description": "Expands campus", "confidence": 85, "relevance": 95},
+                    "ITEM_1": {"description": "No scores"},
+                }
+            )
+        )
+        fallback = MagicMock(return_value=("single", 70, 60))
+        monkeypatch.setattr(detector, "_analyze_news_content", fallback)
+
+        analyses = detector._analyze_news_batch(
+            [("A", "a", "expansion"), ("B", "b", "ai_workload"), ("C", "c", "incident")], "Acme"
+        )
+
+        assert analyses == [("Expands campus", 85, 95), ("single", 70, 60), ("single", 70, 60)]
+        assert [call.args[0] for call in fallback.call_args_list] == ["B", "C"]
+
+    def test_failed_batch_falls_back_per_item(self, detector, monkeypatch):
+        """An unparseable response re-analyzes every item in the batch."""
+        detector._openai_client.chat.completions.create.return_value = completion("not json")
+        monkeypatch.setattr(detector, "_analyze_news_content", lambda title, *args: (title, 70, 60))
+
+        analyses = detector._analyze_news_batch(
+            [("A", "a", "expansion"), ("B", "b", "expansion")], "Acme"
+        )
+
+        assert analyses == [("A", 70, 60), ("B", 70, 60)]
+
+
+class TestBraveResultEvents:
+    """Tests for _create_event_from_brave_result."""
+
+    def test_uses_precomputed_analysis(self, detector, monkeypatch):
+        """A batch analysis is used as-is and produces a complete TriggerEvent."""
+        monkeypatch.setattr(detector, "_analyze_news_content", MagicMock())
+
+        event = detector._create_event_from_brave_result(
+            {"title": "Acme expands", "url": "https://reuters.com/acme", "age": ""},
+            "expansion",
+            "Acme",
+            analysis=("Acme adds 50MW", 85, 95),
+        )
+
+        assert event.description == "Acme adds 50MW"
+        assert (event.confidence_score, event.relevance_score) == (85, 95)
+        assert event.confidence == "Medium"
+        assert event.source_type == "News Article"
+        detector._analyze_news_content.assert_not_called()
@@ -0,0 +1,171 @@
+"""
+Unit tests for the TTL read-through cache used by the API server.
+
+Tests expiry, single-flight loading, targeted invalidation, and that
+server-side invalidation only drops the entries a write affects.
+
+Run with: pytest tests/unit/test_ttl_cache.py -v
+"""
+
+import threading
+import time
+
+import pytest
+
+from abm_research.utils.ttl_cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Tests for TTLCache behaviour."""
+
+    @pytest.fixture
+    def clock(self):
+        """Provide a controllable clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def cache(self, clock):
+        """Provide a cache with a 60 second default TTL."""
+        return TTLCache(default_ttl=60, clock=clock)
+
+    def test_get_returns_value_until_expiry(self, cache, clock):
+        """Entries are served until their TTL elapses."""
+        cache.set("accounts", [1, 2, 3])
+        assert cache.get("accounts") == [1, 2, 3]
+
+        clock.now += 59
+        assert cache.get("accounts") == [1, 2, 3]
+
+        clock.now += 1
+        assert cache.get("accounts") is None
+
+    def test_per_entry_ttl_overrides_default(self, cache, clock):
+        """An explicit ttl wins over the cache default."""
+        cache.set("contacts:abc", ["c1"], ttl=5)
+        clock.now += 6
+        assert cache.get("contacts:abc", "missing") == "missing"
+
+    def test_get_or_load_calls_loader_once(self, cache):
+        """A miss loads; later calls are hits."""
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return "value"
+
+        assert cache.get_or_load("k", loader) == "value"
+        assert cache.get_or_load("k", loader) == "value"
+        assert len(calls) == 1
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["loads"] == 1
+
+    def test_loader_errors_are_not_cached(self, cache):
+        """A failing loader propagates and leaves the key empty."""
+
+        def failing():
+            raise RuntimeError("notion down")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_load("accounts", failing)
+
+        assert cache.get_or_load("accounts", lambda: "ok") == "ok"
+
+    def test_concurrent_misses_share_one_load(self):
+        """Threads missing on the same key wait for a single load."""
+        cache = TTLCache(default_ttl=60)
+        calls = []
+        start = threading.Event()
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return "loaded"
+
+        results = []
+
+        def worker():
+            start.wait()
+            results.append(cache.get_or_load("accounts", loader))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        start.set()
+        for t in threads:
+            t.join()
+
+        assert results == ["loaded"] * 8
+        assert len(calls) == 1
+
+    def test_invalidate_and_prefix(self, cache):
+        """Invalidation removes only the targeted entries."""
+        cache.set("accounts", 1)
+        cache.set("contacts:a", 2)
+        cache.set("contacts:b", 3)
+        cache.set("partnerships:*", 4)
+
+        assert cache.invalidate("accounts", "missing") == 1
+        assert cache.invalidate_prefix("contacts:") == 2
+        assert cache.get("partnerships:*") == 4
+        assert cache.stats()["size"] == 1
+
+
+class TestServerCacheInvalidation:
+    """Tests for invalidate_account_cache in server.py."""
+
+    @pytest.fixture
+    def server(self):
+        """Import the server module, skipping if unavailable."""
+        try:
+            from src.abm_research.api import server
+        except ImportError:
+            pytest.skip("Server module not importable")
+        server.notion_cache.clear()
+        yield server
+        server.notion_cache.clear()
+
+    def test_enrich_drops_accounts_and_own_contacts(self, server):
+        """Enrichment invalidates the account list and that account's contacts only."""
+        cache = server.notion_cache
+        for key in ["accounts", "contacts:a1", "contacts:a2", "trigger_events:a1"]:
+            cache.set(key, [])
+
+        server.invalidate_account_cache("a1", contacts=True)
+
+        assert cache.get("accounts") is None
+        assert cache.get("contacts:a1") is None
+        assert cache.get("contacts:a2") == []
+        assert cache.get("trigger_events:a1") == []
+
+    def test_research_drops_scoped_and_global_lists(self, server):
+        """Research invalidates all of the account's collections and the global lists."""
+        cache = server.notion_cache
+        keys = [
+            "accounts",
+            "contacts:a1",
+            "trigger_events:a1",
+            "trigger_events:*",
+            "partnerships:a1",
+            "partnerships:*",
+            "contacts:a2",
+        ]
+        for key in keys:
+            cache.set(key, [])
+
+        server.invalidate_account_cache("a1", contacts=True, trigger_events=True, partnerships=True)
+
+        assert cache.stats()["size"] == 1
+        assert cache.get("contacts:a2") == []
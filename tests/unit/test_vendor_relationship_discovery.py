@@ -0,0 +1,406 @@
+"""
+Unit tests for VendorRelationshipDiscovery search and vendor matching.
+
+Tests that vendor x customer pairs are searched highest account score
+first, that pairs answered by the search cache aren't searched again, that
+a deadline returns partial results with the unsearched pairs, and that the
+compiled VendorMatcher finds whole-word vendor mentions, including vendors
+added after it was built, and that batched LLM vendor extraction packs
+texts by size and token budget, re-extracts only the texts a reply
+failed to answer, and retries a failed request as a batch. Also checks the API server loads vendor discovery.
+
+Run with: pytest tests/unit/test_vendor_relationship_discovery.py -v
+"""
+
+import json
+import re
+import sys
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from abm_research.intelligence import vendor_relationship_discovery as discovery_module
+from abm_research.intelligence.vendor_relationship_discovery import (
+    VendorMatcher,
+    VendorRelationshipDiscovery,
+)
+from abm_research.utils.search_cache import PersistentSearchCache
+
+
+def search_result(query):
+    """A Brave search result mentioning the query's vendor and customer."""
+    return {
+        "title": f"{query} case study",
+        "url": f"https://example.com/{abs(hash(query))}",
+        "description": f"{query} case study",
+    }
+
+
+@pytest.fixture
+def discovery(tmp_path):
+    """A discovery instance with a temporary cache and a recording fake search."""
+    instance = VendorRelationshipDiscovery(
+        notion_client=object(),
+        search_cache=PersistentSearchCache(str(tmp_path / "search_cache.db")),
+    )
+    instance.brave_api_key = "test-key"
+    instance.searches = []
+
+    def fake_search(query):
+        instance.searches.append(query)
+        return {"results": [search_result(query)], "error": None}
+
+    instance._brave_search = fake_search
+    return instance
+
+
+class TestDiscoverRelationships:
+    """Tests for the concurrent vendor x customer search."""
+
+    def test_pairs_are_searched_highest_account_score_first(self, discovery, monkeypatch):
+        """Customers with higher account scores are searched before the rest."""
+        monkeypatch.setattr(discovery_module, "RELATIONSHIP_SEARCH_WORKERS", 1)
+
+        discovery.discover_relationships(
+            ["Acme"],
+            ["Initech", "Globex", "Umbrella"],
+            customer_scores={"Initech": 40, "Globex": 90, "Umbrella": 70},
+        )
+
+        customers = [query.split('"')[3] for query in discovery.searches[::4]]
+        assert customers == ["Globex", "Umbrella", "Initech"]
+
+    def test_cached_pairs_are_not_searched(self, discovery):
+        """A pair answered by an earlier run is served from the cache."""
+        discovery.discover_relationships(["Acme"], ["Initech"])
+        discovery.searches.clear()
+
+        result = discovery.discover_relationships(["Acme"], ["Initech", "Globex"])
+
+        assert discovery.searches
+        assert all('"Globex"' in query for query in discovery.searches)
+        assert result["search_cache"] == {"hits": 4, "misses": 4, "hit_ratio": 0.5}
+        assert {signal.customer for signal in result["signals"]} == {"Initech", "Globex"}
+
+    def test_deadline_returns_partial_results(self, discovery):
+        """Pairs still searching at the deadline are reported as pending."""
+        release = threading.Event()
+        fast_search = discovery._brave_search
+
+        def slow_for_globex(query):
+            if "Globex" in query:
+                release.wait(5)
+            return fast_search(query)
+
+        discovery._brave_search = slow_for_globex
+        try:
+            result = discovery.discover_relationships(
+                ["Acme"], ["Initech", "Globex"], deadline_seconds=0.2
+            )
+        finally:
+            release.set()
+
+        assert result["pending_pairs"] == [{"vendor": "Acme", "customer": "Globex"}]
+        assert {signal.customer for signal in result["signals"]} == {"Initech"}
+        assert [score.vendor_name for score in result["vendor_scores"]] == ["Acme"]
+
+    def test_zero_deadline_is_not_the_default(self, discovery):
+        """A zero deadline returns at once instead of waiting the default budget."""
+        release = threading.Event()
+        fast_search = discovery._brave_search
+
+        def slow_search(query):
+            release.wait(5)
+            return fast_search(query)
+
+        discovery._brave_search = slow_search
+        try:
+            result = discovery.discover_relationships(["Acme"], ["Initech"], deadline_seconds=0)
+        finally:
+            release.set()
+
+        assert result["pending_pairs"] == [{"vendor": "Acme", "customer": "Initech"}]
+
+
+class TestVendorMatcher:
+    """Tests for the compiled vendor catalog matcher."""
+
+    @pytest.fixture
+    def matcher(self, discovery):
+        """A matcher over a small catalog, normalizing like vendor discovery."""
+        return VendorMatcher(
+            {
+                "competitors_power": ["Schneider Electric", "ABB", "Vertiv"],
+                "complementary_cooling": ["Vertiv", "Acme Cooling Inc"],
+            },
+            normalize=discovery._normalize_company,
+        )
+
+    def test_finds_every_vendor_in_one_pass(self, matcher):
+        """All mentioned vendors are returned with their first category."""
+        hits = matcher.find("Vertiv and Schneider Electric power the new hall")
+
+        assert hits == {"Vertiv": "competitors_power", "Schneider Electric": "competitors_power"}
+
+    def test_matches_whole_words_only(self, matcher):
+        """A vendor name inside a longer word isn't a mention."""
+        assert matcher.find("Abbott Labs expands its campus") == {}
+        assert matcher.find("ABB's switchgear") == {"ABB": "competitors_power"}
+
+    def test_matches_normalized_names(self, matcher):
+        """A vendor is found without its legal suffix."""
+        assert matcher.find("cooled by acme cooling") == {
+            "Acme Cooling Inc": "complementary_cooling"
+        }
+        assert matcher.category("ACME COOLING") == "complementary_cooling"
+        assert matcher.category("Unknown Corp") is None
+
+    def test_added_vendors_are_matched(self, matcher):
+        """Vendors added after a search are found by the next one."""
+        assert matcher.find("Lambda picks Nlyte") == {}
+
+        assert matcher.add("Nlyte", "complementary_software")
+        assert not matcher.add("Nlyte", "other")
+
+        assert matcher.find("Lambda picks Nlyte") == {"Nlyte": "complementary_software"}
+        assert len(matcher) == 5
+
+
+class TestDiscoverAccountVendors:
+    """Tests for pattern-matched vendor discovery."""
+
+    def test_counts_catalog_vendors_mentioned_with_the_account(self, discovery):
+        """Catalog vendors in results mentioning the account are counted once per result."""
+        discovery._vendor_matcher.add("Stackgrid", "complementary_software")
+
+        def fake_search(query):
+            return {
+                "results": [
+                    {
+                        "title": "CoreWeave deploys Vertiv cooling",
+                        "url": f"https://example.com/{abs(hash(query))}",
+                        "description": "CoreWeave runs Stackgrid DCIM with Vertiv",
+                    },
+                    {
+                        "title": "Vertiv quarterly results",
+                        "url": "https://example.com/earnings",
+                        "description": "No account mentioned",
+                    },
+                ],
+                "error": None,
+            }
+
+        discovery._brave_search = fake_search
+        result = discovery.discover_account_vendors("CoreWeave")
+
+        vendors = {vendor.vendor_name: vendor for vendor in result["discovered_vendors"]}
+        assert set(vendors) == {"Vertiv", "Stackgrid"}
+        templates = len(VendorRelationshipDiscovery.VENDOR_DISCOVERY_TEMPLATES)
+        assert vendors["Vertiv"].mention_count == templates
+        assert vendors["Stackgrid"].category == "complementary_software"
+
+
+class FakeGateway:
+    """LLM gateway answering extraction prompts: each TEXT_i 'uses <Vendor>'."""
+
+    def __init__(self, skip_indexes=(), failures=0):
+        self.skip_indexes = set(skip_indexes)
+        self.failures = failures
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def complete(self, messages, client, **params):
+        with self._lock:
+            self.calls.append(params)
+            failing = len(self.calls) <= self.failures
+        if failing:
+            raise RuntimeError("upstream error")
+        prompt = messages[-1]["content"]
+        texts = re.findall(r"\[TEXT_(\d+)\]\n.*? uses (\w+)", prompt)
+        return json.dumps(
+            {
+                "texts": [
+                    {
+                        "index": int(index),
+                        "vendors": [
+                            {
+                                "name": vendor,
+                                "category": "discovered_unknown",
+                                "confidence": 0.9,
+                                "evidence": f"uses {vendor}",
+                            }
+                        ],
+                    }
+                    for index, vendor in texts
+                    if int(index) not in self.skip_indexes
+                ]
+            }
+        )
+
+
+def extraction_texts(count):
+    """Search result texts for CoreWeave, each naming one vendor."""
+    return [
+        {"text": f"CoreWeave uses Vendor{i}", "url": f"https://example.com/{i}"}
+        for i in range(count)
+    ]
+
+
+class TestExtractVendorsFromTextsBatch:
+    """Tests for batched, concurrent LLM vendor extraction."""
+
+    @pytest.fixture
+    def extractor(self, discovery, monkeypatch):
+        """Discovery with an OpenAI client, a fake gateway and recorded single extractions."""
+        discovery.openai_client = MagicMock()
+        discovery.gateway = FakeGateway()
+        monkeypatch.setattr(discovery_module, "get_llm_gateway", lambda: discovery.gateway)
+        discovery.single_extractions = []
+
+        def extract_single(text, account_name):
+            discovery.single_extractions.append(text)
+            return [{"name": "Single", "category": "discovered_unknown", "confidence": 0.5}]
+
+        discovery.extract_vendors_from_text = extract_single
+        return discovery
+
+    def test_texts_are_packed_by_size_and_token_budget(self):
+        """A batch closes when it's full or the next text would exceed the budget."""
+        texts = [{"text": "x" * 396, "url": str(i)} for i in range(5)]  # 100 tokens each
+
+        by_size = VendorRelationshipDiscovery._pack_extraction_batches(texts, 2, 10_000)
+        by_tokens = VendorRelationshipDiscovery._pack_extraction_batches(texts, 10, 300)
+
+        assert [len(batch) for batch in by_size] == [2, 2, 1]
+        assert [len(batch) for batch in by_tokens] == [3, 2]
+
+    def test_vendors_are_mapped_back_to_urls(self, extractor):
+        """Every text's vendors come back under its URL, one schema call per batch."""
+        results = extractor.extract_vendors_from_texts_batch(
+            extraction_texts(5), "CoreWeave", batch_size=2, max_workers=2
+        )
+
+        assert {url: [v["name"] for v in vendors] for url, vendors in results.items()} == {
+            f"https://example.com/{i}": [f"Vendor{i}"] for i in range(5)
+        }
+        assert len(extractor.gateway.calls) == 3
+        assert all(
+            call["response_format"]["type"] == "json_schema" for call in extractor.gateway.calls
+        )
+        assert extractor.single_extractions == []
+
+    def test_only_unanswered_texts_are_extracted_again(self, extractor):
+        """A text missing from a batch response is retried alone; the rest keep their answers."""
+        extractor.gateway.skip_indexes = {1}
+
+        results = extractor.extract_vendors_from_texts_batch(extraction_texts(3), "CoreWeave")
+
+        assert extractor.single_extractions == ["CoreWeave uses Vendor1"]
+        assert results["https://example.com/0"][0]["name"] == "Vendor0"
+        assert results["https://example.com/1"][0]["name"] == "Single"
+
+    def test_failed_batch_is_retried_as_a_batch(self, extractor):
+        """A batch request that fails is sent again once, bypassing the cache."""
+        extractor.gateway.failures = 1
+
+        results = extractor.extract_vendors_from_texts_batch(extraction_texts(2), "CoreWeave")
+
+        assert [call["bypass_cache"] for call in extractor.gateway.calls] == [False, True]
+        assert extractor.single_extractions == []
+        assert results["https://example.com/1"][0]["name"] == "Vendor1"
+
+    def test_failing_batch_does_not_fan_out(self, extractor):
+        """During an outage a batch's texts get no vendors instead of one call each."""
+        extractor.gateway.failures = 99
+
+        results = extractor.extract_vendors_from_texts_batch(extraction_texts(3), "CoreWeave")
+
+        assert len(extractor.gateway.calls) == 2
+        assert extractor.single_extractions == []
+        assert results == {f"https://example.com/{i}": [] for i in range(3)}
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Import the server module with a Brave key set, skipping if unavailable."""
+    monkeypatch.setenv("BRAVE_API_KEY", "test-key")
+    try:
+        from src.abm_research.api import server
+    except ImportError:
+        pytest.skip("Server module not importable")
+    return server
+
+
+class FakeBraveClient:
+    """Shared Brave client stand-in whose every web result names the query's parties."""
+
+    def __init__(self):
+        self.queries = []
+        self._lock = threading.Lock()
+
+    def search(self, query, params=None, timeout=15, bypass_cache=False, raise_errors=False):
+        with self._lock:
+            self.queries.append(query)
+        return {"web": {"results": [search_result(query)]}}
+
+
+@pytest.fixture
+def vendor_api(server, monkeypatch, tmp_path):
+    """The server's vendor discovery on a fake Brave client and a temporary search cache."""
+    discovery = server.vendor_discovery
+    module = sys.modules[type(discovery).__module__]
+    brave = FakeBraveClient()
+    monkeypatch.setattr(module, "get_brave_client", lambda: brave)
+    monkeypatch.setattr(discovery, "brave_api_key", "test-key")
+    monkeypatch.setattr(
+        discovery, "_search_cache", module.PersistentSearchCache(str(tmp_path / "search.db"))
+    )
+    return server.app.test_client(), brave
+
+
+class TestVendorEndpoints:
+    """Tests for the vendor discovery API endpoints."""
+
+    def test_server_loads_vendor_discovery(self, server):
+        """The vendor endpoints are available, with or without Notion configured."""
+        assert server.VENDOR_DISCOVERY_AVAILABLE is True
+        assert type(server.vendor_discovery).__name__ == "VendorRelationshipDiscovery"
+
+    def test_intro_power_searches_through_the_shared_brave_client(self, vendor_api):
+        """Vendor searches from the API go through the process-wide Brave client."""
+        client, brave = vendor_api
+
+        response = client.post(
+            "/api/vendor-intro-power", json={"vendors": ["Acme"], "accounts": ["Initech"]}
+        )
+
+        assert response.status_code == 200
+        assert len(brave.queries) == 4
+        assert response.get_json()["total_signals_found"] == 4
+
+    def test_repeat_requests_are_served_from_the_search_cache(self, vendor_api):
+        """A repeated intro-power request reuses the persisted searches and reports it."""
+        client, brave = vendor_api
+        body = {"vendors": ["Acme"], "accounts": ["Initech"]}
+
+        first = client.post("/api/vendor-intro-power", json=body).get_json()
+        second = client.post("/api/vendor-intro-power", json=body).get_json()
+
+        assert len(brave.queries) == 4
+        assert first["search_cache"] == {"hits": 0, "misses": 4, "hit_ratio": 0.0}
+        assert second["search_cache"] == {"hits": 4, "misses": 0, "hit_ratio": 1.0}
+        assert second["total_signals_found"] == first["total_signals_found"]
+
+    @pytest.mark.parametrize("deadline", [0, -5, "soon"])
+    def test_intro_power_rejects_invalid_deadlines(self, vendor_api, deadline):
+        """deadline_seconds must be a positive number."""
+        client, brave = vendor_api
+
+        response = client.post(
+            "/api/vendor-intro-power",
+            json={"vendors": ["Acme"], "accounts": ["Initech"], "deadline_seconds": deadline},
+        )
+
+        assert response.status_code == 400
+        assert brave.queries == []